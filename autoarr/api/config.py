@@ -56,6 +56,11 @@ class Settings(BaseSettings):
     # ============================================================================
 
     secret_key: str = "dev_secret_key_change_in_production"
+
+    # Token for admin-only endpoints such as the profiler, sent as X-Admin-Token
+    # (empty disables those endpoints)
+    admin_token: str = ""
+
     # Note: These accept comma-separated strings from .env (e.g., "http://a,http://b")
     cors_origins: str = "http://localhost:3000,http://localhost:5173,http://localhost:9080"
     cors_allow_credentials: bool = True
@@ -141,6 +146,19 @@ class Settings(BaseSettings):
 
     redis_url: Optional[str] = None
 
+    # ============================================================================
+    # Web Search Cache Settings
+    # ============================================================================
+
+    # Entries kept in the in-process search/metadata cache
+    web_search_cache_size: int = 1024
+
+    # Total size of values in that cache (extracted pages can be ~2 MB each)
+    web_search_cache_max_bytes: int = 32_000_000
+
+    # Optional SQLite file for a search cache that survives restarts
+    web_search_cache_path: Optional[str] = None
+
     # ============================================================================
     # MCP Orchestrator Settings
     # ============================================================================
@@ -177,6 +195,122 @@ class Settings(BaseSettings):
     # Cooldown period (seconds) between alerts for the same failed download
     monitoring_failure_alert_cooldown: int = 3600  # 1 hour
 
+    # ============================================================================
+    # Plex Library Sync Settings
+    # ============================================================================
+
+    # Keep a local copy of Plex libraries for browse/search/recently-added
+    plex_sync_enabled: bool = True
+
+    # Seconds between incremental (updatedAt/addedAt delta) sync passes
+    plex_sync_interval: int = 300
+
+    # Seconds between full reconciles of each section (catches deletions)
+    plex_sync_full_interval: int = 86400  # 24 hours
+
+    # ============================================================================
+    # Request Tracking Settings
+    # ============================================================================
+
+    # Advance content requests through downloading/importing/available
+    request_tracking_enabled: bool = True
+
+    # Seconds between Radarr/Sonarr queue snapshots
+    request_tracking_interval: int = 60
+
+    # Seconds status transitions are collected before a batched database write
+    request_tracking_flush_interval: float = 2.0
+
+    # ============================================================================
+    # Bulk Import Settings
+    # ============================================================================
+
+    # Maximum titles in one import
+    bulk_import_max_items: int = 5000
+
+    # Per-stage workers and external calls per second (0 = unlimited)
+    bulk_import_classify_concurrency: int = 4
+    bulk_import_classify_rate: float = 5.0
+    bulk_import_lookup_concurrency: int = 4
+    bulk_import_lookup_rate: float = 5.0
+    bulk_import_add_concurrency: int = 2
+    bulk_import_add_rate: float = 2.0
+
+    # Running jobs refresh a heartbeat; another worker resumes a job only once
+    # its heartbeat is older than bulk_import_stale_after seconds
+    bulk_import_heartbeat_interval: float = 15.0
+    bulk_import_stale_after: float = 60.0
+
+    # ============================================================================
+    # Multi-Worker Settings
+    # ============================================================================
+
+    # Elect one worker to run background services (automatic when workers > 1;
+    # enable explicitly when running several processes by other means)
+    leader_election_enabled: bool = False
+
+    # Lock file used for the leader lease when the database is not PostgreSQL
+    # (defaults to a file next to the SQLite database, or the temp directory)
+    leader_lock_path: Optional[str] = None
+
+    # Seconds between lease attempts by followers / lease checks by the leader
+    leader_retry_interval: float = 5.0
+
+    # Redis channel used to fan events out to every worker (needs redis_url)
+    event_fanout_channel: str = "autoarr:events"
+
+    # ============================================================================
+    # WebSocket Settings
+    # ============================================================================
+
+    # Pending messages per client before it is evicted as a slow consumer
+    websocket_send_queue_size: int = 256
+
+    # Maximum time (seconds) a single WebSocket send may take
+    websocket_send_timeout: float = 10.0
+
+    # Oldest pending message age (seconds) before a client is evicted
+    websocket_max_lag: float = 30.0
+
+    # Upper bound on frames sent to each client per second (0 = unlimited)
+    websocket_max_frames_per_second: float = 20.0
+
+    # Window (seconds) for merging download progress events per nzo_id (0 = off)
+    websocket_progress_window: float = 1.0
+
+    # ============================================================================
+    # Request Timing Settings
+    # ============================================================================
+
+    # Report DB/MCP/service/LLM time per request in a Server-Timing header
+    server_timing_enabled: bool = True
+
+    # Requests slower than this (seconds) go to the slow request log (0 = off)
+    slow_request_threshold: float = 2.0
+
+    # Export request spans to OpenTelemetry (needs opentelemetry-api and an SDK)
+    otel_enabled: bool = False
+
+    # ============================================================================
+    # Event Loop Monitor Settings
+    # ============================================================================
+
+    # Sample event loop scheduling delay (reported in /health/monitoring and /metrics)
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval: float = 0.5
+
+    # Run with asyncio debug mode to report the callbacks that block the loop
+    # (slows every callback down; enable while investigating lag)
+    loop_monitor_debug: bool = False
+    loop_monitor_slow_callback_threshold: float = 0.1
+
+    # ============================================================================
+    # Metrics Settings
+    # ============================================================================
+
+    # Serve runtime metrics in OpenMetrics format at /metrics
+    metrics_enabled: bool = True
+
     # ============================================================================
     # API Settings
     # ============================================================================
@@ -23,14 +23,29 @@ for persisting application settings, best practices, and audit results.
 """
 
 import logging
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import AsyncGenerator, Optional
-
-from sqlalchemy import JSON, Boolean, DateTime, Float, Index, Integer, String, Text, select
+from typing import Any, AsyncGenerator, Optional
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+    or_,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from autoarr.shared.core.metrics import DB_SESSION_DURATION
+from autoarr.shared.core.request_timing import span
+
 logger = logging.getLogger(__name__)
 
 
@@ -277,6 +292,15 @@ class ContentRequest(Base):
         Index("ix_content_requests_type_created", "content_type", "created_at"),
     )
 
+    @property
+    def external_id(self) -> Optional[str]:
+        """Service-prefixed Radarr/Sonarr ID (e.g. "radarr_123"), once added."""
+        if self.radarr_id is not None:
+            return f"radarr_{self.radarr_id}"
+        if self.sonarr_id is not None:
+            return f"sonarr_{self.sonarr_id}"
+        return None
+
 
 # ============================================================================
 # Recovery Attempts Model
@@ -396,6 +420,126 @@ class PremiumWaitlist(Base):
     source: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
 
+# ============================================================================
+# Plex Library Sync Models
+# ============================================================================
+
+
+class PlexLibraryItem(Base):
+    """
+    Local copy of a Plex library item, maintained by the Plex sync service.
+
+    Queryable columns are stored explicitly; the full (projected) Plex item is
+    kept in ``data`` so API responses keep Plex's field names.
+    """
+
+    __tablename__ = "plex_library_items"
+
+    # Plex ratingKey (unique per server)
+    rating_key: Mapped[str] = mapped_column(String(50), primary_key=True)
+    section_key: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+
+    item_type: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    title: Mapped[str] = mapped_column(String(500), nullable=False, default="")
+    year: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    # Plex epoch timestamps
+    added_at: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
+    updated_at: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    data: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+
+    # When the item was last written by a sync pass (used to sweep deletions)
+    synced_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (Index("ix_plex_library_items_section_title", "section_key", "title"),)
+
+
+class PlexSyncState(Base):
+    """Per-section sync watermarks for the Plex sync service."""
+
+    __tablename__ = "plex_sync_state"
+
+    section_key: Mapped[str] = mapped_column(String(50), primary_key=True)
+    title: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    section_type: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+
+    # High-water marks (Plex epoch seconds) of items seen so far
+    max_updated_at: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    max_added_at: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    item_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_sync_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_full_sync_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+# ============================================================================
+# Bulk Import Models
+# ============================================================================
+
+
+class ImportJob(Base):
+    """
+    A bulk content import job.
+
+    Items are stored up front and advanced stage by stage by the import
+    pipeline, so an interrupted job can be resumed where it stopped.
+    """
+
+    __tablename__ = "import_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # pending, running, completed or failed
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending", index=True)
+    source_format: Mapped[str] = mapped_column(String(10), nullable=False)
+    options: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    total_items: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Worker processing the job and when it last said so; another worker only
+    # resumes the job once the heartbeat is stale
+    owner: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class ImportJobItem(Base):
+    """One title in a bulk import job and how far the pipeline has taken it."""
+
+    __tablename__ = "import_job_items"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    job_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    query: Mapped[str] = mapped_column(Text, nullable=False)
+
+    # Next stage to run (classify, lookup, dedupe, add) or "done"
+    stage: Mapped[str] = mapped_column(String(20), nullable=False, default="classify")
+    # Set once done: added, duplicate, not_found or failed
+    outcome: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Filled in by the classify and lookup stages (or given in the input)
+    content_type: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    title: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    year: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    season: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    tmdb_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    tvdb_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    # Set by the add stage
+    service_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    request_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    __table_args__ = (Index("ix_import_job_items_job_stage", "job_id", "stage"),)
+
+
 # ============================================================================
 # Content Request Repository
 # ============================================================================
@@ -566,12 +710,14 @@ class ContentRequestRepository:
 
             if request:
                 request.status = status
-                # Note: external_id field doesn't exist in ContentRequest model
-                # if external_id:
-                #     request.external_id = external_id
+                if external_id:
+                    # "radarr_123" / "sonarr_45" -> radarr_id / sonarr_id
+                    service, _, raw_id = external_id.partition("_")
+                    if service in ("radarr", "sonarr") and raw_id.isdigit():
+                        setattr(request, f"{service}_id", int(raw_id))
                 if completed_at:
                     request.completed_at = completed_at
-                elif status == "completed":
+                elif status in ("completed", "available"):
                     request.completed_at = datetime.utcnow()
 
                 await session.commit()
@@ -580,6 +726,56 @@ class ContentRequestRepository:
 
             return None
 
+    async def update_statuses(self, updates: dict[int, str]) -> list[ContentRequest]:
+        """
+        Update the status of several requests in one transaction.
+
+        Args:
+            updates: Mapping of request ID to new status
+
+        Returns:
+            Updated ContentRequests (IDs that no longer exist are skipped)
+        """
+        if not updates:
+            return []
+
+        async with self.db.session() as session:
+            result = await session.execute(
+                select(ContentRequest).where(ContentRequest.id.in_(list(updates)))
+            )
+            requests = list(result.scalars().all())
+
+            now = datetime.utcnow()
+            for request in requests:
+                request.status = updates[request.id]
+                if request.status in ("completed", "available") and not request.completed_at:
+                    request.completed_at = now
+
+            await session.commit()
+            return requests
+
+    async def get_tracked(self, statuses: list[str]) -> list[ContentRequest]:
+        """
+        Get requests linked to Radarr/Sonarr that are in one of the given statuses.
+
+        Args:
+            statuses: Statuses to include
+
+        Returns:
+            List of matching ContentRequests
+        """
+        async with self.db.session() as session:
+            result = await session.execute(
+                select(ContentRequest).where(
+                    ContentRequest.status.in_(statuses),
+                    or_(
+                        ContentRequest.radarr_id.is_not(None),
+                        ContentRequest.sonarr_id.is_not(None),
+                    ),
+                )
+            )
+            return list(result.scalars().all())
+
     async def update_metadata(
         self,
         request_id: int,
@@ -723,13 +919,17 @@ class Database:
         Yields:
             AsyncSession: Database session
         """
-        async with self.session_maker() as session:
-            try:
-                yield session
-                await session.commit()
-            except Exception:
-                await session.rollback()
-                raise
+        started = time.perf_counter()
+        with span("db"):
+            async with self.session_maker() as session:
+                try:
+                    yield session
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    DB_SESSION_DURATION.labels("rollback").observe(time.perf_counter() - started)
+                    raise
+        DB_SESSION_DURATION.labels("commit").observe(time.perf_counter() - started)
 
 
 # ============================================================================
@@ -2213,3 +2413,489 @@ class PremiumWaitlistRepository:
                 return True
 
             return False
+
+
+# ============================================================================
+# Plex Library Repository
+# ============================================================================
+
+
+class PlexLibraryRepository:
+    """
+    Repository for the local Plex library copy and its sync watermarks.
+
+    Written by the Plex sync service, read by the media endpoints so browse,
+    search and recently-added views do not have to query Plex.
+    """
+
+    def __init__(self, db: Database):
+        """
+        Initialize repository.
+
+        Args:
+            db: Database instance
+        """
+        self.db = db
+
+    async def upsert_items(
+        self, section_key: str, items: list[dict], synced_at: Optional[datetime] = None
+    ) -> int:
+        """
+        Insert or update a batch of Plex items.
+
+        Args:
+            section_key: Library section the items belong to
+            items: Plex item dicts (must contain ratingKey)
+            synced_at: Sync pass timestamp recorded on every row
+
+        Returns:
+            Number of rows written
+        """
+        rows = {str(item["ratingKey"]): item for item in items if item.get("ratingKey")}
+        if not rows:
+            return 0
+        synced_at = synced_at or datetime.utcnow()
+
+        async with self.db.session() as session:
+            result = await session.execute(
+                select(PlexLibraryItem).where(PlexLibraryItem.rating_key.in_(list(rows)))
+            )
+            existing = {row.rating_key: row for row in result.scalars()}
+
+            for rating_key, item in rows.items():
+                row = existing.get(rating_key)
+                if row is None:
+                    row = PlexLibraryItem(rating_key=rating_key)
+                    session.add(row)
+                row.section_key = section_key
+                row.item_type = item.get("type")
+                row.title = str(item.get("title") or "")
+                row.year = _optional_int(item.get("year"))
+                row.added_at = _optional_int(item.get("addedAt"))
+                row.updated_at = _optional_int(item.get("updatedAt"))
+                row.data = item
+                row.synced_at = synced_at
+
+        return len(rows)
+
+    async def delete_stale(self, section_key: str, before: datetime) -> int:
+        """
+        Delete items in a section that a full sync pass did not see.
+
+        Args:
+            section_key: Library section key
+            before: Start time of the full pass; rows synced earlier are removed
+
+        Returns:
+            Number of rows deleted
+        """
+        from sqlalchemy import delete
+
+        async with self.db.session() as session:
+            result = await session.execute(
+                delete(PlexLibraryItem).where(
+                    PlexLibraryItem.section_key == section_key,
+                    PlexLibraryItem.synced_at < before,
+                )
+            )
+            return result.rowcount or 0
+
+    async def delete_section(self, section_key: str) -> int:
+        """
+        Remove a section's items and sync state.
+
+        Args:
+            section_key: Library section key
+
+        Returns:
+            Number of item rows deleted
+        """
+        from sqlalchemy import delete
+
+        async with self.db.session() as session:
+            result = await session.execute(
+                delete(PlexLibraryItem).where(PlexLibraryItem.section_key == section_key)
+            )
+            await session.execute(
+                delete(PlexSyncState).where(PlexSyncState.section_key == section_key)
+            )
+            return result.rowcount or 0
+
+    async def browse(
+        self, section_key: str, limit: int = 50, offset: int = 0, sort: str = "title"
+    ) -> list[PlexLibraryItem]:
+        """
+        Get a page of items in a section.
+
+        Args:
+            section_key: Library section key
+            limit: Maximum number of items
+            offset: Offset for pagination
+            sort: "title", "year" or "added" (newest first)
+
+        Returns:
+            List of PlexLibraryItem rows
+        """
+        order_by = {
+            "year": (PlexLibraryItem.year.desc(), PlexLibraryItem.title),
+            "added": (PlexLibraryItem.added_at.desc(),),
+        }.get(sort, (PlexLibraryItem.title,))
+
+        async with self.db.session() as session:
+            result = await session.execute(
+                select(PlexLibraryItem)
+                .where(PlexLibraryItem.section_key == section_key)
+                .order_by(*order_by)
+                .limit(limit)
+                .offset(offset)
+            )
+            return list(result.scalars().all())
+
+    async def search(
+        self, query: str, limit: int = 50, section_key: Optional[str] = None
+    ) -> list[PlexLibraryItem]:
+        """
+        Search items by title (case-insensitive substring match).
+
+        Args:
+            query: Search text
+            limit: Maximum number of results
+            section_key: Optional section to restrict the search to
+
+        Returns:
+            List of matching PlexLibraryItem rows
+        """
+        stmt = select(PlexLibraryItem).where(PlexLibraryItem.title.ilike(f"%{query}%"))
+        if section_key is not None:
+            stmt = stmt.where(PlexLibraryItem.section_key == section_key)
+
+        async with self.db.session() as session:
+            result = await session.execute(stmt.order_by(PlexLibraryItem.title).limit(limit))
+            return list(result.scalars().all())
+
+    async def get_recently_added(self, limit: int = 20) -> list[PlexLibraryItem]:
+        """
+        Get the most recently added items across all sections.
+
+        Args:
+            limit: Maximum number of items
+
+        Returns:
+            List of PlexLibraryItem rows, newest first
+        """
+        async with self.db.session() as session:
+            result = await session.execute(
+                select(PlexLibraryItem)
+                .where(PlexLibraryItem.added_at.is_not(None))
+                .order_by(PlexLibraryItem.added_at.desc())
+                .limit(limit)
+            )
+            return list(result.scalars().all())
+
+    async def count(self, section_key: Optional[str] = None) -> int:
+        """
+        Count items, optionally within one section.
+
+        Args:
+            section_key: Optional library section key
+
+        Returns:
+            Item count
+        """
+        from sqlalchemy import func
+
+        stmt = select(func.count(PlexLibraryItem.rating_key))
+        if section_key is not None:
+            stmt = stmt.where(PlexLibraryItem.section_key == section_key)
+
+        async with self.db.session() as session:
+            result = await session.execute(stmt)
+            return result.scalar_one()  # type: ignore[no-any-return]
+
+    async def get_sync_states(self) -> list[PlexSyncState]:
+        """
+        Get the sync state of every section.
+
+        Returns:
+            List of PlexSyncState rows
+        """
+        async with self.db.session() as session:
+            result = await session.execute(select(PlexSyncState))
+            return list(result.scalars().all())
+
+    async def get_sync_state(self, section_key: str) -> Optional[PlexSyncState]:
+        """
+        Get a section's sync state.
+
+        Args:
+            section_key: Library section key
+
+        Returns:
+            PlexSyncState or None if the section was never synced
+        """
+        async with self.db.session() as session:
+            result = await session.execute(
+                select(PlexSyncState).where(PlexSyncState.section_key == section_key)
+            )
+            return result.scalar_one_or_none()
+
+    async def save_sync_state(self, section_key: str, **fields: Any) -> PlexSyncState:
+        """
+        Create or update a section's sync state.
+
+        Args:
+            section_key: Library section key
+            **fields: PlexSyncState columns to set
+
+        Returns:
+            Saved PlexSyncState
+        """
+        async with self.db.session() as session:
+            result = await session.execute(
+                select(PlexSyncState).where(PlexSyncState.section_key == section_key)
+            )
+            state = result.scalar_one_or_none()
+            if state is None:
+                state = PlexSyncState(section_key=section_key)
+                session.add(state)
+            for name, value in fields.items():
+                setattr(state, name, value)
+            return state
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    """Convert a Plex attribute (int or numeric string) to int, or None."""
+    try:
+        return int(value) if value is not None and value != "" else None
+    except (TypeError, ValueError):
+        return None
+
+
+# ============================================================================
+# Bulk Import Repository
+# ============================================================================
+
+
+class ImportJobRepository:
+    """Repository for bulk import jobs and their items."""
+
+    def __init__(self, db: Database):
+        """
+        Initialize repository.
+
+        Args:
+            db: Database instance
+        """
+        self.db = db
+
+    async def create_job(
+        self,
+        source_format: str,
+        items: list[dict],
+        options: Optional[dict] = None,
+        owner: Optional[str] = None,
+    ) -> ImportJob:
+        """
+        Create a job and all of its items in one transaction.
+
+        Args:
+            source_format: Input format ("csv" or "json")
+            items: Parsed items (query plus optional known fields)
+            options: Job options (quality profile, root folder, ...)
+            owner: Worker that will process the job (claims it up front)
+
+        Returns:
+            Created ImportJob
+        """
+        async with self.db.session() as session:
+            job = ImportJob(
+                source_format=source_format,
+                options=options or {},
+                total_items=len(items),
+                owner=owner,
+                heartbeat_at=datetime.utcnow() if owner else None,
+            )
+            session.add(job)
+            await session.flush()
+            session.add_all(
+                ImportJobItem(job_id=job.id, position=position, **item)
+                for position, item in enumerate(items)
+            )
+            return job
+
+    async def get_job(self, job_id: int) -> Optional[ImportJob]:
+        """
+        Get a job by ID.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            ImportJob if found, None otherwise
+        """
+        async with self.db.session() as session:
+            result = await session.execute(select(ImportJob).where(ImportJob.id == job_id))
+            return result.scalar_one_or_none()
+
+    async def get_jobs(
+        self, statuses: Optional[list[str]] = None, limit: int = 50
+    ) -> list[ImportJob]:
+        """
+        Get jobs, newest first.
+
+        Args:
+            statuses: Optional statuses to include
+            limit: Maximum number of jobs
+
+        Returns:
+            List of ImportJob rows
+        """
+        stmt = select(ImportJob)
+        if statuses:
+            stmt = stmt.where(ImportJob.status.in_(statuses))
+
+        async with self.db.session() as session:
+            result = await session.execute(stmt.order_by(ImportJob.id.desc()).limit(limit))
+            return list(result.scalars().all())
+
+    async def update_job(self, job_id: int, **fields: Any) -> None:
+        """
+        Update job columns.
+
+        Args:
+            job_id: Job ID
+            **fields: ImportJob columns to set
+        """
+        async with self.db.session() as session:
+            result = await session.execute(select(ImportJob).where(ImportJob.id == job_id))
+            job = result.scalar_one_or_none()
+            if job is not None:
+                for name, value in fields.items():
+                    setattr(job, name, value)
+
+    async def claim_job(self, job_id: int, owner: str, stale_before: datetime) -> bool:
+        """
+        Take ownership of an unfinished job unless another worker is alive on it.
+
+        The check and the update are one statement, so two workers racing
+        for the same job cannot both win.
+
+        Args:
+            job_id: Job ID
+            owner: Claiming worker
+            stale_before: Heartbeats older than this count as a dead owner
+
+        Returns:
+            True if the job is now owned by ``owner``
+        """
+        from sqlalchemy import update
+
+        async with self.db.session() as session:
+            result = await session.execute(
+                update(ImportJob)
+                .where(
+                    ImportJob.id == job_id,
+                    ImportJob.status != "completed",
+                    or_(
+                        ImportJob.owner.is_(None),
+                        ImportJob.owner == owner,
+                        ImportJob.heartbeat_at.is_(None),
+                        ImportJob.heartbeat_at < stale_before,
+                    ),
+                )
+                .values(owner=owner, heartbeat_at=datetime.utcnow())
+            )
+            return (result.rowcount or 0) == 1
+
+    async def heartbeat_job(self, job_id: int, owner: str) -> bool:
+        """
+        Refresh a job's heartbeat if ``owner`` still owns it.
+
+        Args:
+            job_id: Job ID
+            owner: Worker processing the job
+
+        Returns:
+            False if another worker has taken the job over
+        """
+        from sqlalchemy import update
+
+        async with self.db.session() as session:
+            result = await session.execute(
+                update(ImportJob)
+                .where(
+                    ImportJob.id == job_id,
+                    or_(ImportJob.owner.is_(None), ImportJob.owner == owner),
+                )
+                .values(owner=owner, heartbeat_at=datetime.utcnow())
+            )
+            return (result.rowcount or 0) == 1
+
+    async def release_job(self, job_id: int, owner: str) -> None:
+        """
+        Give up ownership so any worker can resume the job right away.
+
+        Args:
+            job_id: Job ID
+            owner: Worker releasing the job (no-op if it no longer owns it)
+        """
+        from sqlalchemy import update
+
+        async with self.db.session() as session:
+            await session.execute(
+                update(ImportJob)
+                .where(ImportJob.id == job_id, ImportJob.owner == owner)
+                .values(owner=None, heartbeat_at=None)
+            )
+
+    async def get_items(self, job_id: int, unfinished_only: bool = False) -> list[ImportJobItem]:
+        """
+        Get a job's items in input order.
+
+        Args:
+            job_id: Job ID
+            unfinished_only: Only items the pipeline has not finished
+
+        Returns:
+            List of ImportJobItem rows
+        """
+        stmt = select(ImportJobItem).where(ImportJobItem.job_id == job_id)
+        if unfinished_only:
+            stmt = stmt.where(ImportJobItem.stage != "done")
+
+        async with self.db.session() as session:
+            result = await session.execute(stmt.order_by(ImportJobItem.position))
+            return list(result.scalars().all())
+
+    async def save_items(self, items: list[ImportJobItem]) -> None:
+        """
+        Write a batch of (detached) items back in one transaction.
+
+        Args:
+            items: Items previously loaded with get_items()
+        """
+        if not items:
+            return
+        async with self.db.session() as session:
+            for item in items:
+                await session.merge(item)
+
+    async def count_outcomes(self, job_id: int) -> dict[str, int]:
+        """
+        Count a job's finished items by outcome.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Dict of outcome -> item count
+        """
+        from sqlalchemy import func
+
+        async with self.db.session() as session:
+            result = await session.execute(
+                select(ImportJobItem.outcome, func.count(ImportJobItem.id))
+                .where(ImportJobItem.job_id == job_id, ImportJobItem.stage == "done")
+                .group_by(ImportJobItem.outcome)
+            )
+            return {outcome: count for outcome, count in result.all()}
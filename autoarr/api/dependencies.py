@@ -25,11 +25,14 @@ managing the MCP Orchestrator lifecycle and providing it to endpoints.
 """
 
 import logging
+import secrets
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Optional
 
 if TYPE_CHECKING:
     from .services.monitoring_service import MonitoringService
 
+from fastapi import Header, HTTPException, status
+
 from autoarr.shared.core.config import MCPOrchestratorConfig, ServerConfig
 from autoarr.shared.core.mcp_orchestrator import MCPOrchestrator
 
@@ -334,3 +337,26 @@ def reset_monitoring_service() -> None:
     """
     global _monitoring_service
     _monitoring_service = None
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """
+    Allow a request only if it carries the configured admin token.
+
+    Args:
+        x_admin_token: Value of the X-Admin-Token header
+
+    Raises:
+        HTTPException: 403 if no admin token is configured, 401 if the header
+            is missing or wrong
+    """
+    admin_token = get_settings().admin_token
+    if not admin_token:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin endpoints are disabled; set ADMIN_TOKEN to enable them",
+        )
+    if not x_admin_token or not secrets.compare_digest(
+        x_admin_token.encode(), admin_token.encode()
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin token")
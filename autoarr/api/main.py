@@ -34,7 +34,9 @@ from fastapi.staticfiles import StaticFiles
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
-from .config import get_settings
+from autoarr.shared.core.request_timing import enable_opentelemetry
+
+from .config import Settings, get_settings
 from .database import get_database, init_database
 from .dependencies import get_orchestrator, shutdown_orchestrator
 from .middleware import ErrorHandlerMiddleware, RequestLoggingMiddleware, add_security_headers
@@ -48,18 +50,18 @@ from .routers import (
     logs,
     mcp,
     media,
+    metrics,
     movies,
     onboarding,
     optimize,
     requests,
 )
 from .routers import settings as settings_router
-from .routers import (
-    shows,
-)
+from .routers import shows
 from .routers.logs import setup_log_buffer_handler
-from .services.event_bus import get_event_bus
+from .services.event_bus import DispatchMode, Event, EventBus, EventType, get_event_bus
 from .services.websocket_bridge import initialize_websocket_bridge, shutdown_websocket_bridge
+from .services.websocket_manager import get_websocket_manager
 
 # Configure logging
 logging.basicConfig(
@@ -69,6 +71,212 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def start_background_services() -> None:
+    """
+    Start the background services that must run in a single worker.
+
+    Runs at startup in single-worker mode, or when this worker is elected
+    leader in multi-worker mode.
+    """
+    settings = get_settings()
+
+    # Probe service health here and share the snapshot with the other workers
+    # (without fan-out each worker polls for itself, see _start_health_checks)
+    from .services.event_fanout import get_event_fanout
+
+    if get_event_fanout() is not None:
+        try:
+            async for orchestrator in get_orchestrator():
+                orchestrator.start_periodic_health_checks(on_checked=_publish_health_snapshot)
+                break
+        except Exception as e:
+            logger.warning(f"Shared health checks failed to start (non-critical): {e}")
+
+    # Start monitoring service if enabled
+    if settings.monitoring_enabled:
+        try:
+            logger.info("Starting monitoring service...")
+            from .dependencies import get_monitoring_service
+
+            async for monitoring_service in get_monitoring_service():
+                # Start monitoring in background task
+                import asyncio
+
+                monitoring_task = asyncio.create_task(monitoring_service.start_monitoring())
+                monitoring_service._monitoring_task = monitoring_task
+                logger.info("Monitoring service started successfully")
+                break  # Only need first yield
+        except Exception as e:
+            logger.warning(f"Monitoring service initialization failed (non-critical): {e}")
+            # Don't fail startup - monitoring can be started later
+    else:
+        logger.info("Monitoring service disabled (monitoring_enabled=False)")
+
+    # Start Plex library sync (serves media browse/search from the database)
+    if settings.plex_sync_enabled and settings.database_url:
+        try:
+            from .services.plex_sync import initialize_plex_sync
+            from .services.tool_providers import PlexToolProvider
+
+            await initialize_plex_sync(
+                get_database(),
+                PlexToolProvider(),
+                interval=settings.plex_sync_interval,
+                full_reconcile_interval=settings.plex_sync_full_interval,
+            )
+        except Exception as e:
+            logger.warning(f"Plex sync initialization failed (non-critical): {e}")
+
+    # Start request tracking (advances requests from the *arr queues and SABnzbd)
+    if settings.request_tracking_enabled and settings.database_url:
+        try:
+            from .services.request_tracker import initialize_request_tracker
+            from .services.tool_providers import RadarrToolProvider, SonarrToolProvider
+
+            await initialize_request_tracker(
+                get_database(),
+                get_event_bus(),
+                radarr_provider=RadarrToolProvider(),
+                sonarr_provider=SonarrToolProvider(),
+                interval=settings.request_tracking_interval,
+                flush_interval=settings.request_tracking_flush_interval,
+            )
+        except Exception as e:
+            logger.warning(f"Request tracker initialization failed (non-critical): {e}")
+
+    # Resume bulk imports interrupted by a restart (jobs a live worker still
+    # owns are skipped)
+    from .services.bulk_import import get_bulk_import_service
+
+    bulk_import = get_bulk_import_service()
+    if bulk_import:
+        try:
+            await bulk_import.resume_incomplete()
+        except Exception as e:
+            logger.warning(f"Failed to resume import jobs (non-critical): {e}")
+
+
+async def stop_background_services() -> None:
+    """Stop the background services started by start_background_services()."""
+    # Stop shared health checks (a new leader takes them over)
+    from .services.event_fanout import get_event_fanout
+
+    if get_event_fanout() is not None:
+        try:
+            async for orchestrator in get_orchestrator():
+                orchestrator.stop_periodic_health_checks()
+                break
+        except Exception as e:
+            logger.error(f"Error stopping shared health checks: {e}")
+
+    # Stop monitoring service
+    try:
+        from .dependencies import shutdown_monitoring_service
+
+        await shutdown_monitoring_service()
+    except Exception as e:
+        logger.error(f"Error shutting down monitoring service: {e}")
+
+    # Stop Plex library sync
+    try:
+        from .services.plex_sync import shutdown_plex_sync
+
+        await shutdown_plex_sync()
+    except Exception as e:
+        logger.error(f"Error shutting down Plex sync: {e}")
+
+    # Stop request tracking
+    try:
+        from .services.request_tracker import shutdown_request_tracker
+
+        await shutdown_request_tracker()
+    except Exception as e:
+        logger.error(f"Error shutting down request tracker: {e}")
+
+
+async def _publish_health_snapshot(snapshot: dict) -> None:
+    """Publish the leader's health snapshot so every worker's GET /health sees it."""
+    await get_event_bus().publish(
+        Event(
+            event_type=EventType.SERVICE_HEALTH_CHECKED,
+            data={"services": snapshot},
+            source="mcp_orchestrator",
+        )
+    )
+
+
+async def _start_health_checks() -> None:
+    """
+    Keep the health snapshot served by GET /health fresh in the background.
+
+    With event fan-out, only the leader probes the services (see
+    start_background_services) and every worker merges the snapshots it
+    publishes. Without fan-out the results cannot be shared, so each worker
+    polls for itself.
+    """
+    from .services.event_fanout import get_event_fanout
+
+    try:
+        async for orchestrator in get_orchestrator():
+            if get_event_fanout() is None:
+                orchestrator.start_periodic_health_checks()
+            else:
+                get_event_bus().subscribe(
+                    EventType.SERVICE_HEALTH_CHECKED,
+                    lambda event: orchestrator.merge_health_snapshot(event.data["services"]),
+                    dispatch_mode=DispatchMode.INLINE,
+                )
+            break
+    except Exception as e:
+        logger.warning(f"Health check startup failed (non-critical): {e}")
+
+
+async def _start_multi_worker(settings: Settings, event_bus: EventBus) -> None:
+    """
+    Join leader election and cross-worker event fan-out.
+
+    Args:
+        settings: Application settings
+        event_bus: Local event bus
+    """
+    from .services.leader_election import create_lease, initialize_leader_election
+
+    if settings.redis_url:
+        try:
+            from redis.asyncio import Redis
+
+            from .services.event_fanout import initialize_event_fanout
+
+            await initialize_event_fanout(
+                event_bus, Redis.from_url(settings.redis_url), settings.event_fanout_channel
+            )
+        except Exception as e:
+            logger.error(f"Event fan-out initialization failed: {e}")
+    else:
+        logger.warning(
+            "Multi-worker mode without REDIS_URL: events from background services "
+            "only reach WebSocket clients connected to the leader worker"
+        )
+
+    engine = None
+    if settings.database_url:
+        try:
+            engine = get_database().engine
+        except RuntimeError:
+            pass
+    lease = create_lease(settings.database_url, engine, settings.leader_lock_path)
+    elector = await initialize_leader_election(
+        lease,
+        on_elected=start_background_services,
+        on_demoted=stop_background_services,
+        retry_interval=settings.leader_retry_interval,
+    )
+    if not elector.is_leader:
+        logger.info(
+            f"Running as follower; background services run in the leader ({lease.description})"
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
@@ -87,6 +295,16 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Set up log buffer handler for UI log viewer
     setup_log_buffer_handler()
 
+    # Measure event loop lag in every worker
+    if settings.loop_monitor_enabled:
+        from .services.loop_monitor import start_loop_monitor
+
+        start_loop_monitor(
+            interval=settings.loop_monitor_interval,
+            debug=settings.loop_monitor_debug,
+            slow_callback_threshold=settings.loop_monitor_slow_callback_threshold,
+        )
+
     # Initialize database
     if settings.database_url:
         try:
@@ -100,11 +318,45 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     else:
         logger.warning("No DATABASE_URL configured, settings will not persist")
 
+    # Bulk content import (jobs run in the worker that received them, which
+    # keeps a heartbeat on them so no other worker resumes them meanwhile)
+    if settings.database_url:
+        try:
+            from .services.bulk_import import StageLimit, initialize_bulk_import
+            from .services.tool_providers import RadarrToolProvider, SonarrToolProvider
+
+            initialize_bulk_import(
+                db,
+                await requests.get_request_handler(),
+                radarr_provider=RadarrToolProvider(),
+                sonarr_provider=SonarrToolProvider(),
+                stage_limits={
+                    "classify": StageLimit(
+                        settings.bulk_import_classify_concurrency,
+                        settings.bulk_import_classify_rate,
+                    ),
+                    "lookup": StageLimit(
+                        settings.bulk_import_lookup_concurrency, settings.bulk_import_lookup_rate
+                    ),
+                    "dedupe": StageLimit(1),
+                    "add": StageLimit(
+                        settings.bulk_import_add_concurrency, settings.bulk_import_add_rate
+                    ),
+                },
+                max_items=settings.bulk_import_max_items,
+                heartbeat_interval=settings.bulk_import_heartbeat_interval,
+                stale_after=settings.bulk_import_stale_after,
+            )
+        except Exception as e:
+            logger.warning(f"Bulk import initialization failed (non-critical): {e}")
+
     # Initialize WebSocket-EventBus bridge for real-time updates
     try:
         logger.info("Initializing WebSocket-EventBus bridge...")
         event_bus = get_event_bus()
-        await initialize_websocket_bridge(event_bus, manager)
+        await initialize_websocket_bridge(
+            event_bus, manager, progress_window=settings.websocket_progress_window
+        )
         logger.info("WebSocket bridge initialized successfully")
     except Exception as e:
         logger.error(f"Warning: WebSocket bridge initialization failed: {e}")
@@ -139,38 +391,45 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         logger.warning(f"MCP orchestrator initialization failed (non-critical): {e}")
         # Don't fail startup - services can still be configured later
 
-    # Start monitoring service if enabled
-    if settings.monitoring_enabled:
-        try:
-            logger.info("Starting monitoring service...")
-            from .dependencies import get_monitoring_service
-
-            async for monitoring_service in get_monitoring_service():
-                # Start monitoring in background task
-                import asyncio
-
-                monitoring_task = asyncio.create_task(monitoring_service.start_monitoring())
-                monitoring_service._monitoring_task = monitoring_task
-                logger.info("Monitoring service started successfully")
-                break  # Only need first yield
-        except Exception as e:
-            logger.warning(f"Monitoring service initialization failed (non-critical): {e}")
-            # Don't fail startup - monitoring can be started later
+    # Background services run in one worker only when several are running
+    if settings.workers > 1 or settings.leader_election_enabled:
+        await _start_multi_worker(settings, get_event_bus())
     else:
-        logger.info("Monitoring service disabled (monitoring_enabled=False)")
+        await start_background_services()
+    await _start_health_checks()
 
     yield
 
     # Shutdown
     logger.info("Shutting down AutoArr FastAPI Gateway...")
 
-    # Stop monitoring service
+    # Stop background services, then release the leader lease (in that order,
+    # so a follower cannot start its copies while this worker's still run)
+    from .services.leader_election import get_leader_elector, shutdown_leader_election
+
+    if get_leader_elector() is not None:
+        try:
+            await shutdown_leader_election(before_release=stop_background_services)
+        except Exception as e:
+            logger.error(f"Error shutting down leader election: {e}")
+    else:
+        await stop_background_services()
+
+    # Stop cross-worker event fan-out
     try:
-        from .dependencies import shutdown_monitoring_service
+        from .services.event_fanout import shutdown_event_fanout
 
-        await shutdown_monitoring_service()
+        await shutdown_event_fanout()
     except Exception as e:
-        logger.error(f"Error shutting down monitoring service: {e}")
+        logger.error(f"Error shutting down event fan-out: {e}")
+
+    # Stop running import jobs (they resume on the next start)
+    try:
+        from .services.bulk_import import shutdown_bulk_import
+
+        await shutdown_bulk_import()
+    except Exception as e:
+        logger.error(f"Error shutting down bulk import: {e}")
 
     # Shutdown WebSocket bridge
     try:
@@ -178,8 +437,22 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except Exception as e:
         logger.error(f"Error shutting down WebSocket bridge: {e}")
 
+    # Close WebSocket clients and their writer tasks
+    await manager.close_all()
+
+    # Stop queued event bus subscribers
+    try:
+        await get_event_bus().shutdown()
+    except Exception as e:
+        logger.error(f"Error shutting down event bus: {e}")
+
     await shutdown_orchestrator()
 
+    # Stop the event loop lag monitor
+    from .services.loop_monitor import stop_loop_monitor
+
+    await stop_loop_monitor()
+
     # Close database connections
     try:
         db = get_database()
@@ -227,8 +500,16 @@ app.add_middleware(
 # Error handling middleware
 app.add_middleware(ErrorHandlerMiddleware)
 
-# Request logging middleware
-app.add_middleware(RequestLoggingMiddleware)
+# Request logging middleware (also reports Server-Timing and slow requests)
+app.add_middleware(
+    RequestLoggingMiddleware,
+    server_timing=_settings.server_timing_enabled,
+    slow_request_threshold=_settings.slow_request_threshold,
+)
+
+# Optional OpenTelemetry span export
+if _settings.otel_enabled:
+    enable_opentelemetry()
 
 # Security headers middleware
 app.middleware("http")(add_security_headers)
@@ -244,6 +525,13 @@ app.include_router(
     tags=["health"],
 )
 
+# Metrics endpoint for Prometheus-compatible scrapers (no prefix)
+if _settings.metrics_enabled:
+    app.include_router(
+        metrics.router,
+        tags=["metrics"],
+    )
+
 # MCP proxy endpoints
 app.include_router(
     mcp.router,
@@ -392,46 +680,8 @@ async def ping() -> dict:
 # ============================================================================
 
 
-class ConnectionManager:
-    """Manages WebSocket connections."""
-
-    def __init__(self) -> None:
-        """Initialize connection manager."""
-        self.active_connections: list[WebSocket] = []
-
-    async def connect(self, websocket: WebSocket) -> None:
-        """Accept and store new connection."""
-        await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"WebSocket connected. Active connections: {len(self.active_connections)}")
-
-    def disconnect(self, websocket: WebSocket) -> None:
-        """Remove connection from list."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        logger.info(f"WebSocket disconnected. Active connections: {len(self.active_connections)}")
-
-    async def send_personal_message(self, message: dict, websocket: WebSocket) -> None:
-        """Send message to specific connection."""
-        await websocket.send_json(message)
-
-    async def broadcast(self, message: dict) -> None:
-        """Send message to all active connections."""
-        dead_connections = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to WebSocket: {e}")
-                dead_connections.append(connection)
-
-        # Remove failed connections to prevent memory leaks
-        for connection in dead_connections:
-            self.disconnect(connection)
-
-
 # Global connection manager
-manager = ConnectionManager()
+manager = get_websocket_manager()
 
 
 @app.websocket(f"{_settings.api_v1_prefix}/ws")
@@ -444,26 +694,28 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     - Download status updates
     - Content request status changes
     - Activity log entries
+
+    Clients may narrow what they receive by sending subscribe/unsubscribe
+    commands filtering on event type, correlation ID and service.
     """
     await manager.connect(websocket)
     try:
-        # Send welcome message
-        await websocket.send_json(
+        # Send welcome message (queued so it is ordered with broadcasts)
+        await manager.send_personal_message(
             {
                 "type": "connection",
                 "status": "connected",
                 "message": "Connected to AutoArr WebSocket",
-            }
+            },
+            websocket,
         )
 
         # Keep connection alive and handle incoming messages
         while True:
-            # Receive and echo any client messages (for future use)
+            # Receive subscription commands (other messages are acknowledged)
             data = await websocket.receive_text()
             logger.debug(f"WebSocket received: {data}")
-
-            # For now, just acknowledge receipt
-            await websocket.send_json({"type": "ack", "message": "Message received"})
+            await manager.handle_client_message(websocket, data)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
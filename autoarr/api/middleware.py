@@ -32,6 +32,7 @@ from typing import Callable
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
 
 from autoarr.shared.core.exceptions import (
     CircuitBreakerOpenError,
@@ -40,8 +41,15 @@ from autoarr.shared.core.exceptions import (
     MCPTimeoutError,
     MCPToolError,
 )
+from autoarr.shared.core.request_timing import (
+    RequestTiming,
+    end_request_timing,
+    otel_request_span,
+    start_request_timing,
+)
 
 from .models import ErrorResponse
+from .routers.logs import SlowRequestEntry, SlowRequestSpan, get_slow_request_buffer
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -154,7 +162,32 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
 
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging incoming requests and responses."""
+    """
+    Middleware for logging incoming requests and responses.
+
+    Also times each request's database, MCP, service and LLM calls (see
+    autoarr.shared.core.request_timing), reports the breakdown in a
+    Server-Timing header and records slow requests in the slow request log.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        server_timing: bool = True,
+        slow_request_threshold: float = 0.0,
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            server_timing: Add a Server-Timing header to responses
+            slow_request_threshold: Seconds after which a request is recorded in
+                the slow request log (0 disables the log)
+        """
+        super().__init__(app)
+        self.server_timing = server_timing
+        self.slow_request_threshold = slow_request_threshold
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """
@@ -173,9 +206,14 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
         # Track timing
         start_time = time.time()
+        timing, token = start_request_timing()
 
         # Process request
-        response = await call_next(request)
+        try:
+            with otel_request_span(f"{request.method} {request.url.path}"):
+                response = await call_next(request)
+        finally:
+            end_request_timing(token)
 
         # Calculate duration
         duration = time.time() - start_time
@@ -186,12 +224,53 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             f"[Status: {response.status_code}] [Duration: {duration:.3f}s] [ID: {request_id}]"
         )
 
+        if self.slow_request_threshold and duration >= self.slow_request_threshold:
+            self._record_slow_request(request, response, timing, duration, request_id)
+
         # Add custom headers
         response.headers["X-Request-ID"] = request_id
         response.headers["X-Process-Time"] = f"{duration:.3f}"
+        if self.server_timing:
+            response.headers["Server-Timing"] = timing.server_timing(duration * 1000)
 
         return response
 
+    def _record_slow_request(
+        self,
+        request: Request,
+        response: Response,
+        timing: RequestTiming,
+        duration: float,
+        request_id: str,
+    ) -> None:
+        """Add a request to the slow request log and log its breakdown."""
+        breakdown = {name: round(total, 1) for name, (_, total) in timing.summary().items()}
+        get_slow_request_buffer().add(
+            SlowRequestEntry(
+                timestamp=datetime.utcnow().isoformat() + "Z",
+                method=request.method,
+                path=request.url.path,
+                status_code=response.status_code,
+                duration_ms=round(duration * 1000, 1),
+                request_id=request_id,
+                breakdown=breakdown,
+                spans=[
+                    SlowRequestSpan(
+                        name=span.name,
+                        detail=span.detail,
+                        start_ms=round(span.start_ms, 1),
+                        duration_ms=round(span.duration_ms, 1),
+                    )
+                    for span in timing.spans
+                ],
+            )
+        )
+        summary = ", ".join(f"{name}={total}ms" for name, total in breakdown.items()) or "no spans"
+        logger.warning(
+            f"Slow request: {request.method} {request.url.path} took {duration:.3f}s "
+            f"({summary}) [ID: {request_id}]"
+        )
+
 
 async def add_security_headers(request: Request, call_next: Callable) -> Response:
     """
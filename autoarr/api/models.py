@@ -91,6 +91,33 @@ class BatchToolCallRequest(BaseModel):
     return_partial: bool = Field(False, description="Return partial results if some calls fail")
 
 
+class BatchToolCallStreamRequest(BaseModel):
+    """Request model for a streamed batch of MCP tool calls."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "calls": [
+                    {"server": "sabnzbd", "tool": "get_queue", "params": {}},
+                    {"server": "sonarr", "tool": "get_series", "params": {}},
+                ],
+                "deadline": 10.0,
+            }
+        }
+    )
+
+    calls: List[ToolCallRequest] = Field(..., description="List of tool calls to execute")
+    deadline: Optional[float] = Field(
+        None, gt=0, description="Optional time budget for the whole batch in seconds"
+    )
+
+
+class BatchToolCallResult(ToolCallResponse):
+    """One streamed batch result, tagged with the position of its call."""
+
+    index: int = Field(..., description="Position of the call in the batch request")
+
+
 class ToolListResponse(BaseModel):
     """Response model for listing available tools."""
 
@@ -131,10 +158,15 @@ class ServiceHealth(BaseModel):
     healthy: bool = Field(..., description="Whether the service is healthy")
     latency_ms: Optional[float] = Field(None, description="Response latency in milliseconds")
     error: Optional[str] = Field(None, description="Error message if unhealthy")
-    last_check: str = Field(..., description="ISO timestamp of last health check")
+    last_check: Optional[str] = Field(
+        None, description="ISO timestamp of last health check (None if never checked)"
+    )
     circuit_breaker_state: Optional[str] = Field(
         None, description="Circuit breaker state (closed, open, half_open)"
     )
+    stale_seconds: Optional[float] = Field(
+        None, description="Age of a cached health result in seconds"
+    )
 
 
 class HealthCheckResponse(BaseModel):
@@ -158,7 +190,7 @@ class HealthCheckResponse(BaseModel):
         }
     )
 
-    status: str = Field(..., description="Overall status (healthy, degraded, unhealthy)")
+    status: str = Field(..., description="Overall status (healthy, degraded, unhealthy, unknown)")
     services: Dict[str, ServiceHealth] = Field(..., description="Individual service health")
     timestamp: str = Field(..., description="ISO timestamp of health check")
 
@@ -24,12 +24,14 @@ This module provides health check endpoints for monitoring the overall
 system health and individual service health.
 """
 
+import asyncio
+import json
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from autoarr.shared.core.mcp_orchestrator import MCPOrchestrator
 
@@ -43,6 +45,10 @@ logger = logging.getLogger(__name__)
 _warmup_complete = False
 _warmup_timestamp: str | None = None
 
+# Pre-encoded probe bodies (liveness/readiness must stay constant-time)
+_LIVE_BODY = b'{"alive":true}'
+_ready_body: bytes | None = None
+
 # LLM health cache (avoid hitting OpenRouter API on every request)
 _llm_health_cache: Dict[str, Any] | None = None
 _llm_health_cache_time: float = 0
@@ -51,13 +57,19 @@ _LLM_HEALTH_CACHE_TTL = 60  # Cache for 60 seconds
 
 @router.get("/health", response_model=HealthCheckResponse, tags=["health"])
 async def health_check(
+    deep: bool = Query(
+        False, description="Probe every service now instead of reading the cached snapshot"
+    ),
     orchestrator: MCPOrchestrator = Depends(get_orchestrator),
 ) -> HealthCheckResponse:
     """
     Overall system health check.
 
-    This endpoint checks the health of all connected MCP servers and returns
-    an overall system status.
+    By default this reports the orchestrator's cached health snapshot, which
+    the periodic background health checks keep up to date, so it never waits
+    on a slow service. Each service's result carries its age in
+    ``stale_seconds``. Pass ``deep=true`` to probe every connected service
+    concurrently instead.
 
     Returns:
         HealthCheckResponse: Overall system health status
@@ -73,7 +85,8 @@ async def health_check(
                     "latency_ms": 45.2,
                     "error": null,
                     "last_check": "2025-01-15T10:30:00Z",
-                    "circuit_breaker_state": "closed"
+                    "circuit_breaker_state": "closed",
+                    "stale_seconds": 12.4
                 }
             },
             "timestamp": "2025-01-15T10:30:00Z"
@@ -81,7 +94,6 @@ async def health_check(
         ```
     """
     services = {}
-    all_healthy = True
 
     # Get list of connected servers
     connected_servers = orchestrator.get_connected_servers()
@@ -95,39 +107,79 @@ async def health_check(
             timestamp=datetime.utcnow().isoformat() + "Z",
         )
 
-    # Check each server
-    for server_name in connected_servers:
+    if deep:
+        services = await _probe_services(orchestrator, connected_servers)
+    else:
+        snapshot = orchestrator.get_health_snapshot()
+        now = time.time()
+        for server_name in connected_servers:
+            cb_state = orchestrator.get_circuit_breaker_state(server_name)
+            entry = snapshot.get(server_name)
+            if entry is None:
+                services[server_name] = ServiceHealth(
+                    healthy=False,
+                    error="Not checked yet",
+                    circuit_breaker_state=cb_state.get("state", "unknown"),
+                )
+                continue
+            is_healthy = entry["healthy"]
+            services[server_name] = ServiceHealth(
+                healthy=is_healthy,
+                latency_ms=entry["latency_ms"] if is_healthy else None,
+                error=None if is_healthy else "Service unhealthy",
+                last_check=datetime.utcfromtimestamp(entry["checked_at"]).isoformat() + "Z",
+                circuit_breaker_state=cb_state.get("state", "unknown"),
+                stale_seconds=round(now - entry["checked_at"], 1),
+            )
+
+    # Determine overall status from the services that have been checked
+    checked = [s for s in services.values() if s.last_check is not None]
+    if not checked:
+        overall_status = "unknown"
+    elif all(s.healthy for s in checked):
+        overall_status = "healthy"
+    elif any(s.healthy for s in checked):
+        overall_status = "degraded"
+    else:
+        overall_status = "unhealthy"
+
+    return HealthCheckResponse(
+        status=overall_status,
+        services=services,
+        timestamp=datetime.utcnow().isoformat() + "Z",
+    )
+
+
+async def _probe_services(
+    orchestrator: MCPOrchestrator, servers: List[str]
+) -> Dict[str, ServiceHealth]:
+    """
+    Probe the given servers concurrently.
+
+    Args:
+        orchestrator: MCP orchestrator
+        servers: Server names to probe
+
+    Returns:
+        Dict mapping server names to fresh health results
+    """
+
+    async def _probe(server_name: str) -> ServiceHealth:
         start_time = time.time()
         is_healthy = await orchestrator.health_check(server_name)
         latency = (time.time() - start_time) * 1000  # Convert to milliseconds
-
-        # Get circuit breaker state
         cb_state = orchestrator.get_circuit_breaker_state(server_name)
-
-        services[server_name] = ServiceHealth(
+        return ServiceHealth(
             healthy=is_healthy,
             latency_ms=round(latency, 2) if is_healthy else None,
             error=None if is_healthy else "Service unhealthy",
             last_check=datetime.utcnow().isoformat() + "Z",
             circuit_breaker_state=cb_state.get("state", "unknown"),
+            stale_seconds=0.0,
         )
 
-        if not is_healthy:
-            all_healthy = False
-
-    # Determine overall status
-    if all_healthy:
-        overall_status = "healthy"
-    elif any(s.healthy for s in services.values()):
-        overall_status = "degraded"
-    else:
-        overall_status = "unhealthy"
-
-    return HealthCheckResponse(
-        status=overall_status,
-        services=services,
-        timestamp=datetime.utcnow().isoformat() + "Z",
-    )
+    results = await asyncio.gather(*(_probe(server_name) for server_name in servers))
+    return dict(zip(servers, results))
 
 
 @router.get("/health/database", tags=["health"])
@@ -256,7 +308,7 @@ async def perform_warmup() -> Dict[str, Any]:
     Returns:
         dict: Warmup results with timing information
     """
-    global _warmup_complete, _warmup_timestamp
+    global _warmup_complete, _warmup_timestamp, _ready_body
 
     start_time = time.time()
     results: Dict[str, Any] = {
@@ -367,6 +419,7 @@ async def perform_warmup() -> Dict[str, Any]:
     # Mark warmup as complete
     _warmup_complete = True
     _warmup_timestamp = results["timestamp"]
+    _ready_body = None
 
     logger.info(f"Warmup completed in {results['total_duration_ms']}ms")
 
@@ -374,15 +427,16 @@ async def perform_warmup() -> Dict[str, Any]:
 
 
 @router.get("/health/ready", tags=["health"])
-async def readiness_check() -> Dict[str, Any]:
+async def readiness_check() -> Response:
     """
     Kubernetes-style readiness probe.
 
     Returns 200 only when the application is fully warmed up and ready
-    to serve requests. Use this for load balancer health checks.
+    to serve requests. Use this for load balancer health checks. Never
+    contacts upstream services.
 
     Returns:
-        dict: Readiness status
+        Response: Readiness status
 
     Example:
         ```
@@ -394,43 +448,47 @@ async def readiness_check() -> Dict[str, Any]:
         }
         ```
     """
+    global _ready_body
+
     if not _warmup_complete:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Application is still warming up",
         )
 
-    return {
-        "ready": True,
-        "warmup_complete": _warmup_complete,
-        "warmup_timestamp": _warmup_timestamp,
-    }
+    if _ready_body is None:
+        _ready_body = json.dumps(
+            {
+                "ready": True,
+                "warmup_complete": _warmup_complete,
+                "warmup_timestamp": _warmup_timestamp,
+            }
+        ).encode()
+    return Response(content=_ready_body, media_type="application/json")
 
 
 @router.get("/health/live", tags=["health"])
-async def liveness_check() -> Dict[str, Any]:
+async def liveness_check() -> Response:
     """
     Kubernetes-style liveness probe.
 
     Returns 200 if the application is running (even if not fully ready).
-    Use this to detect if the application is stuck and needs restart.
+    Use this to detect if the application is stuck and needs restart. The
+    body is a constant and the probe never contacts upstream services, so
+    it is safe for frequent container health checks.
 
     Returns:
-        dict: Liveness status
+        Response: Liveness status
 
     Example:
         ```
         GET /health/live
         {
-            "alive": true,
-            "timestamp": "2025-01-15T10:30:00Z"
+            "alive": true
         }
         ```
     """
-    return {
-        "alive": True,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-    }
+    return Response(content=_LIVE_BODY, media_type="application/json")
 
 
 @router.post("/health/warmup", tags=["health"])
@@ -629,7 +687,9 @@ async def monitoring_health_check() -> Dict[str, Any]:
     Monitoring service health check.
 
     Returns the current health status of the monitoring service, including
-    whether it's running, last poll time, and tracked download counts.
+    whether it's running, last poll time, and tracked download counts, plus
+    event loop lag percentiles (and slow callbacks when the loop monitor runs
+    in debug mode).
 
     Returns:
         Dict with monitoring service health information
@@ -644,17 +704,27 @@ async def monitoring_health_check() -> Dict[str, Any]:
             "alerted_failures_count": 2,
             "last_error": null,
             "poll_interval_seconds": 60,
-            "failure_detection_enabled": true
+            "failure_detection_enabled": true,
+            "event_loop": {
+                "is_running": true,
+                "lag_ms": {"p50": 0.4, "p90": 1.2, "p99": 35.0, "max": 80.1},
+                ...
+            }
         }
         ```
     """
+    from ..services.loop_monitor import get_loop_monitor
+
+    loop_monitor = get_loop_monitor()
+    event_loop = loop_monitor.get_status() if loop_monitor else {"is_running": False}
+
     try:
         from ..dependencies import get_monitoring_service
 
         # Try to get monitoring service
         async for monitoring_service in get_monitoring_service():
             health_status = monitoring_service.get_health_status()
-            return health_status
+            return {**health_status, "event_loop": event_loop}
     except Exception as e:
         logger.error(f"Error getting monitoring service health: {e}")
         return {
@@ -665,9 +735,82 @@ async def monitoring_health_check() -> Dict[str, Any]:
             "last_error": "Failed to get monitoring service status",
             "poll_interval_seconds": 0,
             "failure_detection_enabled": False,
+            "event_loop": event_loop,
         }
 
 
+@router.get("/health/websocket", tags=["health"])
+async def websocket_health_check() -> Dict[str, Any]:
+    """
+    WebSocket fan-out health check.
+
+    Returns connection counts, slow-consumer evictions, per-connection
+    send queue depth and lag, and download progress coalescing counters.
+
+    Returns:
+        Dict with WebSocket manager statistics
+    """
+    from ..services.websocket_bridge import get_websocket_bridge
+    from ..services.websocket_manager import get_websocket_manager
+
+    stats = get_websocket_manager().get_stats()
+    bridge = get_websocket_bridge()
+    if bridge is not None and bridge.progress_coalescer is not None:
+        stats["progress_coalescer"] = bridge.progress_coalescer.get_stats()
+    return stats
+
+
+@router.get("/health/web-search", tags=["health"])
+async def web_search_health_check() -> Dict[str, Any]:
+    """
+    Web search cache and page extraction statistics.
+
+    Reports the chat agent's web search cache (hits per tier, misses, hit
+    rate, memory tier usage and page content counters) and page extraction
+    timings (parser, truncations, parse times and recent per-URL timings).
+
+    Returns:
+        Dict with cache and extraction statistics, or {"enabled": False}
+        before the first web search
+    """
+    from ..services.web_search_service import get_web_search_service
+
+    service = get_web_search_service()
+    if service is None:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        "cache": service.get_cache_stats(),
+        "extraction": service.get_extraction_stats(),
+    }
+
+
+@router.get("/health/workers", tags=["health"])
+async def workers_health_check() -> Dict[str, Any]:
+    """
+    Multi-worker status for this worker.
+
+    Reports whether leader election is active, whether this worker holds
+    the leader lease (and so runs the background services), the
+    cross-worker event fan-out counters, and the queue depth and handler
+    latency of this worker's queued event bus subscribers.
+
+    Returns:
+        Dict with leader election, event fan-out and event bus subscriber status
+    """
+    from ..services.event_bus import get_event_bus
+    from ..services.event_fanout import get_event_fanout
+    from ..services.leader_election import get_leader_elector
+
+    elector = get_leader_elector()
+    fanout = get_event_fanout()
+    return {
+        "leader_election": elector.get_status() if elector is not None else None,
+        "event_fanout": fanout.get_stats() if fanout is not None else None,
+        "event_subscribers": get_event_bus().get_subscriber_stats(),
+    }
+
+
 # NOTE: This dynamic route MUST come AFTER all specific /health/* routes
 # to prevent FastAPI from matching "ready", "live", "database", etc. as service names
 @router.get("/health/{service}", response_model=ServiceHealth, tags=["health"])
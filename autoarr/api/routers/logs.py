@@ -14,6 +14,8 @@ This module provides endpoints for:
 - Fetching recent logs from a circular buffer
 - Streaming logs via WebSocket
 - Clearing the log buffer
+- Viewing recent slow requests with their timing breakdown
+- Running an on-demand sampling profile (admin only)
 - Changing log level dynamically
 """
 
@@ -21,11 +23,15 @@ import asyncio
 import logging
 from collections import deque
 from datetime import datetime
-from typing import Deque, List, Optional
+from typing import Deque, Dict, List, Optional
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import PlainTextResponse, Response
 from pydantic import BaseModel, Field
 
+from ..dependencies import require_admin
+from ..services.profiler import ProfilerBusyError, run_profile
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -131,6 +137,70 @@ def get_log_buffer() -> LogBuffer:
     return _log_buffer
 
 
+# ============================================================================
+# Slow Request Log - Circular buffer of slow requests with timing breakdowns
+# ============================================================================
+
+MAX_SLOW_REQUESTS = 100  # Keep the last 100 slow requests in memory
+
+
+class SlowRequestSpan(BaseModel):
+    """A timed operation within a slow request."""
+
+    name: str
+    detail: Optional[str] = None
+    start_ms: float
+    duration_ms: float
+
+
+class SlowRequestEntry(BaseModel):
+    """A request that took longer than the slow request threshold."""
+
+    timestamp: str
+    method: str
+    path: str
+    status_code: int
+    duration_ms: float
+    request_id: Optional[str] = None
+    breakdown: Dict[str, float] = Field(
+        default_factory=dict, description="Total milliseconds per span name (db, llm, ...)"
+    )
+    spans: List[SlowRequestSpan] = Field(default_factory=list)
+
+
+class SlowRequestBuffer:
+    """Circular buffer for the most recent slow requests."""
+
+    def __init__(self, max_size: int = MAX_SLOW_REQUESTS):
+        self._buffer: Deque[SlowRequestEntry] = deque(maxlen=max_size)
+
+    def add(self, entry: SlowRequestEntry) -> None:
+        """Add a slow request to the buffer."""
+        self._buffer.append(entry)
+
+    def get_recent(self, limit: int = 50) -> List[SlowRequestEntry]:
+        """Get the most recent slow requests, newest first."""
+        return list(reversed(self._buffer))[:limit]
+
+    def clear(self) -> int:
+        """Clear the buffer. Returns count of cleared entries."""
+        count = len(self._buffer)
+        self._buffer.clear()
+        return count
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+
+# Global slow request buffer instance
+_slow_request_buffer = SlowRequestBuffer()
+
+
+def get_slow_request_buffer() -> SlowRequestBuffer:
+    """Get the global slow request buffer instance."""
+    return _slow_request_buffer
+
+
 # ============================================================================
 # Custom Log Handler to capture logs
 # ============================================================================
@@ -197,6 +267,36 @@ class ClearLogsResponse(BaseModel):
     message: str
 
 
+class SlowRequestsResponse(BaseModel):
+    """Response containing slow requests."""
+
+    requests: List[SlowRequestEntry]
+    total_in_buffer: int
+    returned_count: int
+
+
+class SlowCallbackEntry(BaseModel):
+    """Callbacks that blocked the event loop during a profile."""
+
+    callback: str
+    count: int
+    total_ms: float
+    max_ms: float
+
+
+class ProfileResponse(BaseModel):
+    """Result of a sampling profile."""
+
+    started_at: str
+    duration: float
+    interval: float
+    sample_count: int
+    stack_count: int
+    collapsed: str = Field(..., description="Collapsed stacks for flamegraph tools")
+    slow_callbacks: List[SlowCallbackEntry]
+    slow_callback_report: str
+
+
 class LogLevelRequest(BaseModel):
     """Request to change log level."""
 
@@ -265,6 +365,111 @@ async def clear_logs() -> ClearLogsResponse:
     )
 
 
+@router.get("/slow-requests", response_model=SlowRequestsResponse)
+async def get_slow_requests(limit: int = 50) -> SlowRequestsResponse:
+    """
+    Get recent slow requests with their timing breakdown.
+
+    Args:
+        limit: Maximum number of requests to return (default 50, max 100)
+
+    Returns:
+        Slow requests, newest first
+    """
+    buffer = get_slow_request_buffer()
+    requests = buffer.get_recent(limit=min(limit, MAX_SLOW_REQUESTS))
+
+    return SlowRequestsResponse(
+        requests=requests,
+        total_in_buffer=len(buffer),
+        returned_count=len(requests),
+    )
+
+
+@router.delete("/slow-requests", response_model=ClearLogsResponse)
+async def clear_slow_requests() -> ClearLogsResponse:
+    """
+    Clear the slow request log.
+
+    Returns:
+        Count of cleared entries
+    """
+    count = get_slow_request_buffer().clear()
+    logger.info(f"Slow request log cleared: {count} entries removed")
+
+    return ClearLogsResponse(
+        cleared_count=count,
+        message=f"Cleared {count} slow requests",
+    )
+
+
+@router.post(
+    "/profile",
+    response_model=ProfileResponse,
+    dependencies=[Depends(require_admin)],
+)
+async def profile(
+    duration: float = Query(10.0, gt=0, le=60, description="Seconds to profile for"),
+    interval: float = Query(0.01, ge=0.001, le=1.0, description="Seconds between samples"),
+    slow_callback_threshold: float = Query(
+        0.1, ge=0.001, le=10, description="Report callbacks blocking the loop this long (s)"
+    ),
+    format: str = Query("json", pattern="^(json|collapsed|slow-callbacks)$"),
+) -> Response:
+    """
+    Run a sampling profile of the event loop (admin only).
+
+    Args:
+        duration: Seconds to profile for (max 60)
+        interval: Seconds between stack samples
+        slow_callback_threshold: Seconds a callback may block the loop before
+            it is reported
+        format: json, or collapsed / slow-callbacks to download just that file
+
+    Returns:
+        Profile result, or the requested file as an attachment
+
+    Raises:
+        HTTPException: 409 if a profile is already running
+    """
+    try:
+        result = await run_profile(duration, interval, slow_callback_threshold)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    stamp = result.started_at.strftime("%Y%m%d-%H%M%S")
+    if format == "collapsed":
+        return PlainTextResponse(
+            result.collapsed(),
+            headers={"Content-Disposition": f'attachment; filename="autoarr-{stamp}.folded"'},
+        )
+    if format == "slow-callbacks":
+        return PlainTextResponse(
+            result.slow_callback_report(),
+            headers={
+                "Content-Disposition": f'attachment; filename="autoarr-{stamp}-slow-callbacks.txt"'
+            },
+        )
+    return ProfileResponse(
+        started_at=result.started_at.isoformat() + "Z",
+        duration=result.duration,
+        interval=result.interval,
+        sample_count=result.sample_count,
+        stack_count=len(result.stacks),
+        collapsed=result.collapsed(),
+        slow_callbacks=[
+            SlowCallbackEntry(
+                callback=entry.callback,
+                count=entry.count,
+                total_ms=round(entry.total_seconds * 1000, 1),
+                max_ms=round(entry.max_seconds * 1000, 1),
+            )
+            for entry in result.slow_callbacks
+        ],
+        slow_callback_report=result.slow_callback_report(),
+    )
+
+
 @router.get("/level", response_model=LogLevelResponse)
 async def get_log_level() -> LogLevelResponse:
     """Get current log level."""
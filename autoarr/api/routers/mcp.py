@@ -24,14 +24,22 @@ This module provides endpoints for directly interacting with MCP tools,
 allowing clients to call any tool on any server.
 """
 
-from typing import List
+from typing import AsyncIterator, List
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from autoarr.shared.core.mcp_orchestrator import MCPOrchestrator
 
 from ..dependencies import get_orchestrator
-from ..models import BatchToolCallRequest, ToolCallRequest, ToolCallResponse, ToolListResponse
+from ..models import (
+    BatchToolCallRequest,
+    BatchToolCallResult,
+    BatchToolCallStreamRequest,
+    ToolCallRequest,
+    ToolCallResponse,
+    ToolListResponse,
+)
 
 router = APIRouter()
 
@@ -198,6 +206,62 @@ async def call_tools_batch(
     return responses
 
 
+@router.post("/batch/stream", tags=["mcp"])
+async def call_tools_batch_stream(
+    request: BatchToolCallStreamRequest,
+    orchestrator: MCPOrchestrator = Depends(get_orchestrator),
+) -> StreamingResponse:
+    """
+    Call multiple MCP tools in parallel, streaming each result as it completes.
+
+    Results are emitted as newline-delimited JSON in completion order, each
+    tagged with the index of its call in the request. Identical calls (same
+    server, tool and params) are executed once. When the optional deadline
+    passes, calls still running are reported as failed and the stream ends.
+
+    Args:
+        request: Batch of tool calls and optional deadline
+
+    Returns:
+        StreamingResponse: One BatchToolCallResult per line (application/x-ndjson)
+
+    Example:
+        ```
+        POST /api/v1/mcp/batch/stream
+        {
+            "calls": [
+                {"server": "sabnzbd", "tool": "get_queue", "params": {}},
+                {"server": "sonarr", "tool": "get_series", "params": {}}
+            ],
+            "deadline": 10.0
+        }
+        ```
+
+        Response:
+        ```
+        {"index": 0, "success": true, "data": {"queue": [...]}, "error": null, ...}
+        {"index": 1, "success": true, "data": {"series": [...]}, "error": null, ...}
+        ```
+    """
+
+    async def generate() -> AsyncIterator[str]:
+        async for index, result in orchestrator.iter_tools_parallel(
+            request.calls, deadline=request.deadline
+        ):
+            call = request.calls[index]
+            data = result.get("data")
+            line = BatchToolCallResult(
+                index=index,
+                success=result.get("success", False),
+                data=data if isinstance(data, dict) or data is None else {"result": data},
+                error=result.get("error"),
+                metadata={"server": call.server, "tool": call.tool},
+            )
+            yield line.model_dump_json() + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/tools", response_model=ToolListResponse, tags=["mcp"])
 async def list_tools(
     orchestrator: MCPOrchestrator = Depends(get_orchestrator),
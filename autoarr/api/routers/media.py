@@ -23,15 +23,22 @@ Media endpoints (Plex).
 This module provides endpoints for accessing Plex media libraries.
 """
 
-from typing import Any, Dict, List
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
+from autoarr.api.services.plex_sync import get_local_library, get_plex_sync_service
+from autoarr.api.services.tool_providers import PlexToolProvider
 from autoarr.shared.core.mcp_orchestrator import MCPOrchestrator
 
 from ..dependencies import get_orchestrator
 from ..models import ScanLibraryRequest
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -104,6 +111,147 @@ async def get_library(
     return result
 
 
+@router.get("/libraries/{library_key}/items", tags=["media"])
+async def stream_library_items(
+    library_key: str,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated item fields to return (e.g. ratingKey,title,year)"
+    ),
+    limit: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+) -> StreamingResponse:
+    """
+    Stream the items of a Plex library as newline-delimited JSON.
+
+    Items are fetched from Plex page by page, so large sections (tens of
+    thousands of tracks) are never held in memory at once. If Plex fails
+    part-way through, the stream ends with an {"error": ...} record.
+
+    Args:
+        library_key: Library section key
+        fields: Optional comma-separated field projection
+        limit: Maximum number of items to return
+        offset: Number of items to skip
+
+    Returns:
+        StreamingResponse: One JSON item per line (application/x-ndjson)
+
+    Example:
+        ```
+        GET /api/v1/media/libraries/1/items?fields=ratingKey,title
+        {"ratingKey": "12345", "title": "The Matrix"}
+        {"ratingKey": "12346", "title": "Inception"}
+        ```
+    """
+    provider = PlexToolProvider()
+    if not await provider.is_available():
+        await provider.close()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Plex is not configured or not reachable",
+        )
+
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+
+    async def generate() -> AsyncIterator[str]:
+        try:
+            async for item in provider.iter_library_items(
+                library_key, fields=field_list, limit=limit, offset=offset
+            ):
+                yield json.dumps(item, default=str) + "\n"
+        except Exception as e:
+            # Headers are already sent, so report the failure as a final record
+            logger.error(f"Streaming library {library_key} failed: {e}")
+            yield json.dumps({"error": str(e)}) + "\n"
+        finally:
+            await provider.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@router.get("/libraries/{library_key}/browse", tags=["media"])
+async def browse_library(
+    library_key: str,
+    limit: int = Query(50, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    sort: str = Query("title", pattern="^(title|year|added)$"),
+) -> Dict[str, Any]:
+    """
+    Browse a library from the locally synced copy.
+
+    Args:
+        library_key: Library section key
+        limit: Page size (default: 50)
+        offset: Number of items to skip
+        sort: "title", "year" or "added" (newest first)
+
+    Returns:
+        dict: Page of items and the section's item count
+
+    Example:
+        ```
+        GET /api/v1/media/libraries/1/browse?sort=added&limit=2
+        {
+            "items": [{"ratingKey": "12346", "title": "Inception", ...}],
+            "total": 2314,
+            "limit": 2,
+            "offset": 0
+        }
+        ```
+    """
+    sync = await get_local_library()
+    if sync is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Plex library has not been synced yet",
+        )
+
+    rows = await sync.repository.browse(library_key, limit=limit, offset=offset, sort=sort)
+    return {
+        "items": [row.data for row in rows],
+        "total": await sync.repository.count(library_key),
+        "limit": limit,
+        "offset": offset,
+    }
+
+
+@router.get("/sync", tags=["media"])
+async def get_sync_status() -> Dict[str, Any]:
+    """
+    Get Plex library sync status.
+
+    Returns:
+        dict: Sync loop state, counters and per-section watermarks
+    """
+    sync = get_plex_sync_service()
+    if sync is None:
+        return {"enabled": False}
+    return {"enabled": True, **await sync.get_status()}
+
+
+@router.post("/sync", tags=["media"])
+async def trigger_sync(full: bool = False) -> Dict[str, Any]:
+    """
+    Run a Plex library sync pass now.
+
+    Args:
+        full: Force a full reconcile of every section
+
+    Returns:
+        dict: Per-section sync results
+    """
+    sync = get_plex_sync_service()
+    if sync is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Plex sync is disabled",
+        )
+    try:
+        return await sync.sync(full=full)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(e))
+
+
 @router.get("/recently-added", tags=["media"])
 async def get_recently_added(
     limit: int = 20,
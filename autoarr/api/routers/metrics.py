@@ -0,0 +1,42 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Metrics endpoint.
+
+Serves the in-process metrics registry (tool call latency, retries,
+timeouts, circuit breaker transitions, event bus throughput, monitoring
+poll duration, database session time and WebSocket clients) in the
+OpenMetrics text format for Prometheus-compatible scrapers.
+"""
+
+from fastapi import APIRouter, Response
+
+from autoarr.shared.core.metrics import OPENMETRICS_CONTENT_TYPE, get_metrics_registry
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """
+    Render all registered metrics.
+
+    Returns:
+        Response: OpenMetrics exposition text
+    """
+    return Response(get_metrics_registry().render(), media_type=OPENMETRICS_CONTENT_TYPE)
@@ -22,12 +22,21 @@ This module provides API endpoints for assessing service configurations
 and providing optimization recommendations.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
+from autoarr.api.services.event_bus import (
+    DispatchMode,
+    Event,
+    EventBus,
+    EventType,
+    get_event_bus,
+)
 from autoarr.api.services.tool_providers import (
     PlexToolProvider,
     RadarrToolProvider,
@@ -117,104 +126,217 @@ class ApplyFixResponse(BaseModel):
 # ============================================================================
 
 
+# Providers and assessment tools per service, in display order
+SERVICE_ASSESSMENTS = {
+    "sabnzbd": (SABnzbdToolProvider, "sabnzbd_assess_optimization"),
+    "sonarr": (SonarrToolProvider, "sonarr_assess_optimization"),
+    "radarr": (RadarrToolProvider, "radarr_assess_optimization"),
+    "plex": (PlexToolProvider, "plex_assess_optimization"),
+}
+
+
+async def _run_assessment(service_name: str) -> ServiceOptimizationResult:
+    """
+    Run one service's optimization assessment against the live service.
+
+    Never raises: connection problems and failures are reported as
+    "not_connected" / "error" results.
+
+    Args:
+        service_name: Service name (key of SERVICE_ASSESSMENTS)
+
+    Returns:
+        Assessment result for the service
+    """
+    provider_class, assessment_tool = SERVICE_ASSESSMENTS[service_name]
+    try:
+        provider = provider_class()
+        if not await provider.is_available():
+            # Service not connected - add placeholder
+            return ServiceOptimizationResult(
+                service=service_name,
+                version=None,
+                overall_status="not_connected",
+                overall_score=0,
+                summary=OptimizationSummary(total_checks=0),
+                checks=[],
+            )
+
+        result = await provider.execute(assessment_tool, {})
+        if result.success and result.data:
+            data = result.data
+            return ServiceOptimizationResult(
+                service=data.get("service", service_name),
+                version=data.get("version"),
+                overall_status=data.get("overall_status", "unknown"),
+                overall_score=data.get("overall_score", 0),
+                summary=OptimizationSummary(**data.get("summary", {})),
+                checks=[OptimizationCheck(**c) for c in data.get("checks", [])],
+            )
+
+        # Assessment failed but service is connected
+        return ServiceOptimizationResult(
+            service=service_name,
+            version=None,
+            overall_status="error",
+            overall_score=0,
+            summary=OptimizationSummary(total_checks=0),
+            checks=[
+                OptimizationCheck(
+                    id="assessment_error",
+                    category="system",
+                    status="warning",
+                    title="Assessment Error",
+                    description=result.error or "Unknown error during assessment",
+                    auto_fix=False,
+                )
+            ],
+        )
+    except Exception as e:
+        logger.error(f"Failed to assess {service_name}: {e}")
+        return ServiceOptimizationResult(
+            service=service_name,
+            version=None,
+            overall_status="error",
+            overall_score=0,
+            summary=OptimizationSummary(total_checks=0),
+            checks=[
+                OptimizationCheck(
+                    id="assessment_error",
+                    category="system",
+                    status="critical",
+                    title="Assessment Failed",
+                    description=str(e),
+                    auto_fix=False,
+                )
+            ],
+        )
+
+
+class AssessmentCache:
+    """
+    TTL cache of per-service assessment results.
+
+    Concurrent requests for the same service share one in-flight assessment.
+    Entries are dropped when a fix is applied or a CONFIG_CHANGED event is
+    published; error results are never cached.
+
+    Args:
+        ttl: Seconds a result is reused
+    """
+
+    def __init__(self, ttl: float = 300.0) -> None:
+        """Initialize the cache."""
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, ServiceOptimizationResult]] = {}
+        self._inflight: Dict[str, "asyncio.Future[ServiceOptimizationResult]"] = {}
+        self._generation = 0
+        self._event_bus: Optional[EventBus] = None
+
+    async def get(self, service_name: str, refresh: bool = False) -> ServiceOptimizationResult:
+        """
+        Get a service's assessment, running it if not cached.
+
+        Args:
+            service_name: Service name
+            refresh: Ignore any cached result
+
+        Returns:
+            Assessment result
+        """
+        self._ensure_subscribed()
+        if not refresh:
+            entry = self._entries.get(service_name)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            inflight = self._inflight.get(service_name)
+            if inflight is not None:
+                return await asyncio.shield(inflight)
+
+        task = asyncio.ensure_future(self._assess(service_name, self._generation))
+        self._inflight[service_name] = task
+        return await asyncio.shield(task)
+
+    async def _assess(self, service_name: str, generation: int) -> ServiceOptimizationResult:
+        """Run an assessment and cache it unless invalidated meanwhile."""
+        try:
+            result = await _run_assessment(service_name)
+            if generation == self._generation and result.overall_status != "error":
+                self._entries[service_name] = (time.monotonic() + self.ttl, result)
+            return result
+        finally:
+            if self._inflight.get(service_name) is asyncio.current_task():
+                del self._inflight[service_name]
+
+    def invalidate(self, service_name: Optional[str] = None) -> None:
+        """
+        Drop cached results.
+
+        Args:
+            service_name: Service to drop, or None for all services
+        """
+        self._generation += 1
+        if service_name is None:
+            self._entries.clear()
+            self._inflight.clear()
+        else:
+            self._entries.pop(service_name, None)
+            self._inflight.pop(service_name, None)
+
+    def _on_config_changed(self, event: Event) -> None:
+        """Invalidate the affected service (or everything) on CONFIG_CHANGED."""
+        service = event.data.get("service")
+        self.invalidate(service if service in SERVICE_ASSESSMENTS else None)
+
+    def _ensure_subscribed(self) -> None:
+        """Subscribe to CONFIG_CHANGED on the current event bus."""
+        event_bus = get_event_bus()
+        if event_bus is not self._event_bus:
+            event_bus.subscribe(
+                EventType.CONFIG_CHANGED,
+                self._on_config_changed,
+                dispatch_mode=DispatchMode.INLINE,
+            )
+            self._event_bus = event_bus
+
+
+_assessment_cache = AssessmentCache()
+
+
+def get_assessment_cache() -> AssessmentCache:
+    """
+    Get the optimization assessment cache.
+
+    Returns:
+        Assessment cache shared by the optimize endpoints
+    """
+    return _assessment_cache
+
+
 @router.get(
     "/assess",
     response_model=AllServicesOptimizationResult,
     summary="Assess all services",
     description="Run optimization assessment on all connected services",
 )
-async def assess_all_services() -> AllServicesOptimizationResult:
+async def assess_all_services(refresh: bool = False) -> AllServicesOptimizationResult:
     """
     Assess optimization for all connected services.
 
     Returns health check results for each service including:
     - SABnzbd configuration optimization
-    - (Future) Sonarr configuration
-    - (Future) Radarr configuration
-    - (Future) Plex configuration
-    """
-    services: List[ServiceOptimizationResult] = []
-
-    # Define all service providers and their assessment tools
-    service_configs = [
-        ("sabnzbd", SABnzbdToolProvider, "sabnzbd_assess_optimization"),
-        ("sonarr", SonarrToolProvider, "sonarr_assess_optimization"),
-        ("radarr", RadarrToolProvider, "radarr_assess_optimization"),
-        ("plex", PlexToolProvider, "plex_assess_optimization"),
-    ]
+    - Sonarr configuration
+    - Radarr configuration
+    - Plex configuration
 
-    # Assess each service
-    for service_name, provider_class, assessment_tool in service_configs:
-        try:
-            provider = provider_class()
-            if await provider.is_available():
-                result = await provider.execute(assessment_tool, {})
-                if result.success and result.data:
-                    data = result.data
-                    services.append(
-                        ServiceOptimizationResult(
-                            service=data.get("service", service_name),
-                            version=data.get("version"),
-                            overall_status=data.get("overall_status", "unknown"),
-                            overall_score=data.get("overall_score", 0),
-                            summary=OptimizationSummary(**data.get("summary", {})),
-                            checks=[OptimizationCheck(**c) for c in data.get("checks", [])],
-                        )
-                    )
-                else:
-                    # Assessment failed but service is connected
-                    services.append(
-                        ServiceOptimizationResult(
-                            service=service_name,
-                            version=None,
-                            overall_status="error",
-                            overall_score=0,
-                            summary=OptimizationSummary(total_checks=0),
-                            checks=[
-                                OptimizationCheck(
-                                    id="assessment_error",
-                                    category="system",
-                                    status="warning",
-                                    title="Assessment Error",
-                                    description=result.error or "Unknown error during assessment",
-                                    auto_fix=False,
-                                )
-                            ],
-                        )
-                    )
-            else:
-                # Service not connected - add placeholder
-                services.append(
-                    ServiceOptimizationResult(
-                        service=service_name,
-                        version=None,
-                        overall_status="not_connected",
-                        overall_score=0,
-                        summary=OptimizationSummary(total_checks=0),
-                        checks=[],
-                    )
-                )
-        except Exception as e:
-            logger.error(f"Failed to assess {service_name}: {e}")
-            services.append(
-                ServiceOptimizationResult(
-                    service=service_name,
-                    version=None,
-                    overall_status="error",
-                    overall_score=0,
-                    summary=OptimizationSummary(total_checks=0),
-                    checks=[
-                        OptimizationCheck(
-                            id="assessment_error",
-                            category="system",
-                            status="critical",
-                            title="Assessment Failed",
-                            description=str(e),
-                            auto_fix=False,
-                        )
-                    ],
-                )
-            )
+    Services are assessed concurrently and results are cached for a few
+    minutes; pass refresh=true to re-query every service.
+    """
+    services: List[ServiceOptimizationResult] = list(
+        await asyncio.gather(
+            *(_assessment_cache.get(name, refresh=refresh) for name in SERVICE_ASSESSMENTS)
+        )
+    )
 
     # Calculate overall score
     connected_services = [s for s in services if s.overall_status not in ["not_connected", "error"]]
@@ -251,62 +373,36 @@ async def assess_all_services() -> AllServicesOptimizationResult:
     summary="Assess single service",
     description="Run optimization assessment on a specific service",
 )
-async def assess_service(service: str) -> ServiceOptimizationResult:
+async def assess_service(service: str, refresh: bool = False) -> ServiceOptimizationResult:
     """
     Assess optimization for a specific service.
 
     Args:
         service: Service name (sabnzbd, sonarr, radarr, plex)
+        refresh: Ignore any cached result
     """
-    # Map service names to providers and assessment tools
-    service_map = {
-        "sabnzbd": (SABnzbdToolProvider, "sabnzbd_assess_optimization"),
-        "sonarr": (SonarrToolProvider, "sonarr_assess_optimization"),
-        "radarr": (RadarrToolProvider, "radarr_assess_optimization"),
-        "plex": (PlexToolProvider, "plex_assess_optimization"),
-    }
-
     service_lower = service.lower()
-    if service_lower not in service_map:
+    if service_lower not in SERVICE_ASSESSMENTS:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Service '{service}' not supported. Available: {', '.join(service_map.keys())}",
+            detail=(
+                f"Service '{service}' not supported. "
+                f"Available: {', '.join(SERVICE_ASSESSMENTS.keys())}"
+            ),
         )
 
-    provider_class, assessment_tool = service_map[service_lower]
-
-    try:
-        provider = provider_class()
-        if not await provider.is_available():
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"{service.capitalize()} is not connected. Please configure it in Settings.",
-            )
-
-        result = await provider.execute(assessment_tool, {})
-        if not result.success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=result.error or "Assessment failed",
-            )
-
-        data = result.data
-        return ServiceOptimizationResult(
-            service=data.get("service", service_lower),
-            version=data.get("version"),
-            overall_status=data.get("overall_status", "unknown"),
-            overall_score=data.get("overall_score", 0),
-            summary=OptimizationSummary(**data.get("summary", {})),
-            checks=[OptimizationCheck(**c) for c in data.get("checks", [])],
+    result = await _assessment_cache.get(service_lower, refresh=refresh)
+    if result.overall_status == "not_connected":
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"{service.capitalize()} is not connected. Please configure it in Settings.",
         )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"{service} assessment error: {e}")
+    if result.overall_status == "error":
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
+            detail=result.checks[0].description if result.checks else "Assessment failed",
         )
+    return result
 
 
 @router.post(
@@ -321,23 +417,15 @@ async def apply_fix(request: ApplyFixRequest) -> ApplyFixResponse:
 
     This endpoint executes the fix_action specified in the optimization check.
     """
-    # Map service names to providers
-    service_map = {
-        "sabnzbd": SABnzbdToolProvider,
-        "sonarr": SonarrToolProvider,
-        "radarr": RadarrToolProvider,
-        "plex": PlexToolProvider,
-    }
-
     service_lower = request.service.lower()
-    if service_lower not in service_map:
+    if service_lower not in SERVICE_ASSESSMENTS:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Service '{request.service}' not supported. "
-            f"Available: {', '.join(service_map.keys())}",
+            f"Available: {', '.join(SERVICE_ASSESSMENTS.keys())}",
         )
 
-    provider_class = service_map[service_lower]
+    provider_class, _ = SERVICE_ASSESSMENTS[service_lower]
 
     try:
         provider = provider_class()
@@ -354,6 +442,15 @@ async def apply_fix(request: ApplyFixRequest) -> ApplyFixResponse:
         )
 
         if result.success:
+            # The service's configuration changed; its assessment is stale
+            _assessment_cache.invalidate(service_lower)
+            await get_event_bus().publish(
+                Event(
+                    event_type=EventType.CONFIG_CHANGED,
+                    data={"service": service_lower, "fix_action": request.fix_action},
+                    source="optimize.apply_fix",
+                )
+            )
             return ApplyFixResponse(
                 success=True,
                 message=f"Successfully applied fix: {request.fix_action}",
@@ -22,20 +22,25 @@ This module provides RESTful API endpoints for content requests,
 allowing users to request movies and TV shows through natural language.
 """
 
+import json
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from autoarr.api.database import ContentRequestRepository, get_database
+from autoarr.api.services.bulk_import import BulkImportService, get_bulk_import_service
 from autoarr.api.services.content_integration import ContentIntegrationService
 from autoarr.api.services.request_handler import (
     ContentClassification,
     ContentSearchResult,
     RequestHandler,
 )
+from autoarr.api.services.request_tracker import get_request_tracker
 
 # Create router
 router = APIRouter(prefix="/api/v1/requests", tags=["requests"])
@@ -177,10 +182,17 @@ class ConfirmRequestInput(BaseModel):
 # ============================================================================
 
 
+# Shared handler so the classification memo and stats persist across requests
+_request_handler: Optional[RequestHandler] = None
+
+
 async def get_request_handler() -> RequestHandler:
     """Get request handler instance."""
+    global _request_handler
     # TODO: Initialize with LLM agent and web search service from dependencies
-    return RequestHandler()
+    if _request_handler is None:
+        _request_handler = RequestHandler()
+    return _request_handler
 
 
 async def get_content_integration() -> ContentIntegrationService:
@@ -198,6 +210,17 @@ async def get_request_repository() -> ContentRequestRepository:
     return ContentRequestRepository(db)
 
 
+async def get_bulk_import() -> BulkImportService:
+    """Get the bulk import service (needs a configured database)."""
+    service = get_bulk_import_service()
+    if service is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Bulk import requires a configured database",
+        )
+    return service
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -272,6 +295,151 @@ async def submit_content_request(
         )
 
 
+@router.get(
+    "/classification/stats",
+    summary="Get classification stats",
+    description="Get hit rates and latency for each content classification tier",
+)
+async def get_classification_stats(
+    handler: RequestHandler = Depends(get_request_handler),
+) -> Dict[str, Any]:
+    """
+    Get classification tier statistics.
+
+    Shows how many classifications were answered by the rule-based stage,
+    the memo, coalesced in-flight calls, the LLM, or the simple fallback.
+    """
+    return handler.get_classification_stats()
+
+
+@router.post(
+    "/import",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Bulk import content",
+    description="Import a CSV or JSON watchlist as a background job",
+)
+async def import_content(
+    request: Request,
+    source_format: Optional[Literal["csv", "json"]] = Query(
+        None, alias="format", description="Input format (default: from Content-Type)"
+    ),
+    movie_quality_profile_id: Optional[int] = Query(None, description="Radarr quality profile"),
+    movie_root_folder: Optional[str] = Query(None, description="Radarr root folder"),
+    tv_quality_profile_id: Optional[int] = Query(None, description="Sonarr quality profile"),
+    tv_root_folder: Optional[str] = Query(None, description="Sonarr root folder"),
+    service: BulkImportService = Depends(get_bulk_import),
+) -> Dict[str, Any]:
+    """
+    Start a bulk import.
+
+    The body is the raw file: CSV with a title/query column (optional type,
+    year, season, tmdb_id, tvdb_id columns) or a JSON list of titles/objects.
+    Each title is classified, looked up, checked against the library and
+    added; follow progress with GET /import/{job_id}/stream. Quality profile
+    and root folder default to the first configured in Radarr/Sonarr.
+    """
+    try:
+        content = (await request.body()).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Import must be UTF-8 text"
+        )
+
+    if source_format is None:
+        content_type = request.headers.get("content-type", "")
+        source_format = "csv" if "csv" in content_type or "text/plain" in content_type else "json"
+
+    options = {
+        name: value
+        for name, value in {
+            "movie_quality_profile_id": movie_quality_profile_id,
+            "movie_root_folder": movie_root_folder,
+            "tv_quality_profile_id": tv_quality_profile_id,
+            "tv_root_folder": tv_root_folder,
+        }.items()
+        if value is not None
+    }
+
+    try:
+        job = await service.create_job(content, source_format, options)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return await service.get_job_status(job.id)  # type: ignore[return-value]
+
+
+@router.get(
+    "/import/{job_id}",
+    summary="Get import job status",
+    description="Get the status and per-outcome counts of a bulk import job",
+)
+async def get_import_job(
+    job_id: int,
+    service: BulkImportService = Depends(get_bulk_import),
+) -> Dict[str, Any]:
+    """Get import job status."""
+    job_status = await service.get_job_status(job_id)
+    if job_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Import job {job_id} not found"
+        )
+    return job_status
+
+
+@router.get(
+    "/import/{job_id}/stream",
+    summary="Stream import progress",
+    description="Stream bulk import progress as newline-delimited JSON",
+)
+async def stream_import_job(
+    job_id: int,
+    service: BulkImportService = Depends(get_bulk_import),
+) -> StreamingResponse:
+    """
+    Stream import progress.
+
+    The first line is the job status; while the job runs, one line follows
+    per item stage (type "item") and a final type "job" line when it ends.
+    """
+    if await service.get_job_status(job_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Import job {job_id} not found"
+        )
+
+    async def generate() -> AsyncIterator[str]:
+        async for message in service.stream(job_id):
+            yield json.dumps(message) + "\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/import/{job_id}/resume",
+    summary="Resume import job",
+    description="Resume an interrupted or failed bulk import from where it stopped",
+)
+async def resume_import_job(
+    job_id: int,
+    service: BulkImportService = Depends(get_bulk_import),
+) -> Dict[str, Any]:
+    """Resume an import job; finished items are not processed again."""
+    job_status = await service.get_job_status(job_id)
+    if job_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Import job {job_id} not found"
+        )
+    if job_status["status"] == "completed":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Import job {job_id} already completed"
+        )
+    if not await service.resume(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Import job {job_id} is still running",
+        )
+    return await service.get_job_status(job_id)  # type: ignore[return-value]
+
+
 @router.get(
     "/{request_id}/status",
     response_model=RequestStatusResponse,
@@ -286,7 +454,7 @@ async def get_request_status(
     Get request status.
 
     Returns the current status of a content request including:
-    - Current status (submitted, searching, downloading, completed, failed)
+    - Current status (submitted, searching, downloading, importing, available, failed)
     - External service ID (Radarr/Sonarr)
     - Timestamps
     """
@@ -466,6 +634,11 @@ async def confirm_request(
             external_id=external_id,
         )
 
+        # Follow the download from here; status changes are pushed over WebSocket
+        tracker = get_request_tracker()
+        if tracker and updated_request:
+            tracker.track(updated_request)
+
         return RequestStatusResponse(
             id=updated_request.id,
             correlation_id=updated_request.correlation_id,
@@ -42,6 +42,7 @@ from ..database import (
     get_database,
 )
 from ..dependencies import get_orchestrator
+from ..services.event_bus import Event, EventType, get_event_bus
 
 if TYPE_CHECKING:
     from autoarr.shared.core.mcp_orchestrator import MCPOrchestrator
@@ -274,6 +275,28 @@ async def get_service_status(service_name: str, orchestrator: "MCPOrchestrator")
 # ============================================================================
 
 
+async def publish_config_changed(service: Optional[str]) -> None:
+    """
+    Announce that service connection settings changed.
+
+    Lets caches of per-service state (e.g. optimization assessments) drop
+    stale entries. Publishing failures are logged and ignored.
+
+    Args:
+        service: Service whose settings changed, or None for several services
+    """
+    try:
+        await get_event_bus().publish(
+            Event(
+                event_type=EventType.CONFIG_CHANGED,
+                data={"service": service},
+                source="settings",
+            )
+        )
+    except Exception as e:
+        logger.warning(f"Failed to publish config change for {service}: {e}")
+
+
 @router.get("", response_model=AllServicesConfigResponse)
 @router.get("/", response_model=AllServicesConfigResponse)
 async def get_all_settings(
@@ -790,6 +813,7 @@ async def update_service_settings(
         settings.plex_url = config.url or ""
         settings.plex_token = api_key_to_save
         settings.plex_timeout = config.timeout
+    await publish_config_changed(service)
 
     # Schedule reconnection as background task (non-blocking)
     # This allows the API to respond immediately while reconnection happens in background
@@ -1007,6 +1031,7 @@ async def save_all_settings(
         settings.plex_url = config.plex.url or ""
         settings.plex_token = resolved_keys.get("plex", settings.plex_token)
         settings.plex_timeout = config.plex.timeout
+    await publish_config_changed(None)
 
     # Reconnect to enabled services
     reconnect_errors = []
@@ -0,0 +1,950 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Bulk content import pipeline.
+
+Imports a watchlist (CSV or JSON) in one job instead of one
+request/confirm round trip per title. The input is parsed and stored as an
+ImportJob up front; each item then flows through the stages:
+
+1. classify - movie vs TV and title/year extraction through the request
+   handler (rules, then the LLM when one is configured, then simple keyword
+   classification; skipped when the input already says)
+2. lookup   - resolve the TMDB (movie) / TVDB (series) ID through
+   Radarr/Sonarr's lookup endpoints (skipped when the input has the ID)
+3. dedupe   - drop titles already in the library snapshot or earlier in
+   the same job
+4. add      - add to Radarr/Sonarr and create a tracked ContentRequest
+
+Each stage has its own worker pool and rate limiter, so a slow LLM does not
+hold back lookups and adds never exceed what Radarr/Sonarr tolerate. Item
+progress is written back in batches; an interrupted job resumes from each
+item's last recorded stage.
+
+A job runs in the worker that received it, which records itself as the
+job's owner and refreshes a heartbeat while the pipeline runs. Other workers
+(e.g. a newly elected leader) only resume a job once that heartbeat is
+stale, so the same job never runs two pipelines at once.
+"""
+
+import asyncio
+import csv
+import json
+import logging
+import os
+import re
+import socket
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from autoarr.api.database import (
+    ContentRequestRepository,
+    Database,
+    ImportJob,
+    ImportJobItem,
+    ImportJobRepository,
+)
+from autoarr.api.services.request_handler import RequestHandler
+from autoarr.api.services.request_tracker import get_request_tracker
+
+if TYPE_CHECKING:
+    from autoarr.api.services.tool_providers import RadarrToolProvider, SonarrToolProvider
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages, in order
+STAGES = ("classify", "lookup", "dedupe", "add")
+
+# Finished item outcomes
+OUTCOMES = ("added", "duplicate", "not_found", "failed")
+
+# Per content type: which service, tools and ID field each stage uses
+SERVICE_TOOLS: Dict[str, Dict[str, str]] = {
+    "movie": {
+        "service": "radarr",
+        "id_attr": "tmdb_id",
+        "id_field": "tmdbId",
+        "lookup": "radarr_search_movie_lookup",
+        "library": "radarr_get_movies",
+        "library_key": "movies",
+        "add": "radarr_add_movie",
+        "profiles": "radarr_get_quality_profiles",
+        "folders": "radarr_get_root_folders",
+    },
+    "tv": {
+        "service": "sonarr",
+        "id_attr": "tvdb_id",
+        "id_field": "tvdbId",
+        "lookup": "sonarr_search_series",
+        "library": "sonarr_get_series",
+        "library_key": "series",
+        "add": "sonarr_add_series",
+        "profiles": "sonarr_get_quality_profiles",
+        "folders": "sonarr_get_root_folders",
+    },
+}
+
+_CONTENT_TYPES = {
+    "movie": "movie",
+    "movies": "movie",
+    "film": "movie",
+    "tv": "tv",
+    "show": "tv",
+    "series": "tv",
+    "tv show": "tv",
+}
+_TITLE_NORMALIZE = re.compile(r"[^a-z0-9]+")
+_LEADING_ARTICLE = re.compile(r"^(?:the|a|an)\s+")
+
+
+# ============================================================================
+# Parsing
+# ============================================================================
+
+
+def parse_import(content: str, source_format: str, max_items: int = 5000) -> List[Dict[str, Any]]:
+    """
+    Parse a CSV or JSON watchlist into import items.
+
+    JSON is a list (or ``{"items": [...]}``) of query strings or objects;
+    CSV needs a header row with a ``title`` or ``query`` column, or is read
+    as one title per line. Recognised optional fields: type, year, season,
+    tmdb_id, tvdb_id.
+
+    Args:
+        content: Raw file content
+        source_format: "csv" or "json"
+        max_items: Maximum number of items accepted
+
+    Returns:
+        Item dicts (ImportJobItem column values)
+
+    Raises:
+        ValueError: If the content cannot be parsed or is empty/too large
+    """
+    if source_format == "json":
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}")
+        if isinstance(data, dict):
+            data = data.get("items")
+        if not isinstance(data, list):
+            raise ValueError("JSON import must be a list of titles or {'items': [...]}")
+        rows: List[Any] = data
+    elif source_format == "csv":
+        rows = _read_csv(content)
+    else:
+        raise ValueError(f"Unsupported import format: {source_format}")
+
+    items = []
+    for number, row in enumerate(rows, start=1):
+        item = _normalize_row(row)
+        if item is None:
+            raise ValueError(f"Row {number} has no title or query")
+        items.append(item)
+
+    if not items:
+        raise ValueError("Import contains no titles")
+    if len(items) > max_items:
+        raise ValueError(f"Import has {len(items)} titles; the limit is {max_items}")
+    return items
+
+
+def _read_csv(content: str) -> List[Any]:
+    """Read CSV rows as dicts (with a header) or single titles (without)."""
+    lines = [line for line in content.splitlines() if line.strip()]
+    if not lines:
+        return []
+    header = [column.strip().lower() for column in next(csv.reader([lines[0]]))]
+    if {"title", "query", "name"} & set(header):
+        reader = csv.DictReader(lines[1:], fieldnames=header)
+        return [{k: v for k, v in row.items() if k and v not in (None, "")} for row in reader]
+    return [row[0] for row in csv.reader(lines) if row and row[0].strip()]
+
+
+def _normalize_row(row: Any) -> Optional[Dict[str, Any]]:
+    """Turn a string or dict row into ImportJobItem column values."""
+    if isinstance(row, str):
+        return {"query": row.strip()} if row.strip() else None
+    if not isinstance(row, dict):
+        return None
+
+    row = {str(key).strip().lower(): value for key, value in row.items()}
+    title = str(row.get("title") or row.get("name") or "").strip() or None
+    year = _optional_int(row.get("year"))
+    query = str(row.get("query") or "").strip() or (f"{title} {year}" if title and year else title)
+    if not query:
+        return None
+
+    content_type = _CONTENT_TYPES.get(
+        str(row.get("type") or row.get("content_type") or "").strip().lower()
+    )
+    return {
+        "query": query,
+        "content_type": content_type,
+        "title": title,
+        "year": year,
+        "season": _optional_int(row.get("season")),
+        "tmdb_id": _optional_int(row.get("tmdb_id") or row.get("tmdbid")),
+        "tvdb_id": _optional_int(row.get("tvdb_id") or row.get("tvdbid")),
+    }
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    """Convert an input field to int, or None."""
+    try:
+        return int(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _normalize_title(title: Any) -> str:
+    """Lowercase a title and strip punctuation and a leading article for matching."""
+    normalized = _TITLE_NORMALIZE.sub(" ", str(title or "").lower()).strip()
+    return _LEADING_ARTICLE.sub("", normalized)
+
+
+# ============================================================================
+# Pipeline
+# ============================================================================
+
+
+@dataclass
+class StageLimit:
+    """Concurrency and rate limit for one pipeline stage."""
+
+    # Worker tasks running the stage
+    concurrency: int = 4
+    # Maximum external calls per second (0 = unlimited)
+    rate: float = 0.0
+
+
+class RateLimiter:
+    """
+    Spaces out calls to at most ``rate`` per second.
+
+    Args:
+        rate: Calls per second (0 = unlimited)
+    """
+
+    def __init__(self, rate: float) -> None:
+        """Initialize the limiter."""
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for the next call slot."""
+        if not self.interval:
+            return
+        async with self._lock:
+            wait = self._next - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next = max(time.monotonic(), self._next) + self.interval
+
+
+class ImportPipeline:
+    """
+    Runs one job's unfinished items through the import stages.
+
+    Args:
+        job: Import job
+        repository: Import job repository
+        request_repository: Content request repository (for added titles)
+        handler: Request handler used for classification
+        providers: Content type -> Radarr/Sonarr tool provider
+        stage_limits: Stage name -> StageLimit
+        batch_size: Item updates written per database batch
+        on_progress: Called with every progress message
+    """
+
+    def __init__(
+        self,
+        job: ImportJob,
+        repository: ImportJobRepository,
+        request_repository: ContentRequestRepository,
+        handler: RequestHandler,
+        providers: Dict[str, Any],
+        stage_limits: Dict[str, StageLimit],
+        batch_size: int = 25,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        """Initialize the pipeline."""
+        self.job = job
+        self.repository = repository
+        self.request_repository = request_repository
+        self.handler = handler
+        self.providers = providers
+        self.stage_limits = stage_limits
+        self.batch_size = batch_size
+        self.on_progress = on_progress or (lambda message: None)
+
+        self._queues: Dict[str, "asyncio.Queue[ImportJobItem]"] = {
+            stage: asyncio.Queue() for stage in STAGES
+        }
+        self._limiters = {
+            stage: RateLimiter(stage_limits.get(stage, StageLimit()).rate) for stage in STAGES
+        }
+        self._remaining = 0
+        self._finished = asyncio.Event()
+        self._error: Optional[Exception] = None
+
+        self._dirty: Dict[int, ImportJobItem] = {}
+        self._write_lock = asyncio.Lock()
+
+        # Library snapshot (content type -> IDs) and IDs claimed by this job
+        self._library: Dict[str, Set[int]] = {}
+        self._library_lock = asyncio.Lock()
+        self._claimed: Dict[Tuple[str, int], int] = {}
+
+        # Quality profile / root folder per content type
+        self._add_defaults: Dict[str, Tuple[Any, Any]] = {}
+        self._defaults_lock = asyncio.Lock()
+
+        self.outcomes: Counter = Counter()
+
+    def progress(self) -> Dict[str, Any]:
+        """
+        Get job progress counters.
+
+        Returns:
+            Dict with total, done and per-outcome counts
+        """
+        counts = {outcome: self.outcomes.get(outcome, 0) for outcome in OUTCOMES}
+        return {"total": self.job.total_items, "done": sum(counts.values()), **counts}
+
+    async def run(self, items: List[ImportJobItem], done: Dict[str, int]) -> None:
+        """
+        Process items until every one has finished.
+
+        Args:
+            items: Unfinished items (from the job's last recorded stages)
+            done: Outcome counts of items finished before this run
+        """
+        self.outcomes.update(done)
+        self._remaining = len(items)
+        if not items:
+            return
+
+        for item in items:
+            if item.stage == "add":
+                # The add may have happened before the crash; the fresh
+                # library snapshot catches it instead of adding twice
+                item.stage = "dedupe"
+            self._queues[item.stage].put_nowait(item)
+
+        workers = [
+            asyncio.create_task(self._worker(stage))
+            for stage in STAGES
+            for _ in range(max(1, self.stage_limits.get(stage, StageLimit()).concurrency))
+        ]
+        try:
+            await self._finished.wait()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await self._write()
+        if self._error is not None:
+            raise self._error
+
+    async def _worker(self, stage: str) -> None:
+        """Take items from a stage's queue and run the stage on them."""
+        run_stage = getattr(self, f"_{stage}")
+        queue = self._queues[stage]
+        while True:
+            item = await queue.get()
+            try:
+                await run_stage(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Import job {self.job.id} item {item.position} failed: {e}")
+                self._finish(item, "failed", str(e))
+            try:
+                await self._after_stage(item)
+            except Exception as e:
+                # Progress could not be saved; end the run so the job is marked failed
+                self._error = e
+                self._finished.set()
+                return
+
+    async def _after_stage(self, item: ImportJobItem) -> None:
+        """Record an item's progress and hand it to its next stage."""
+        self._dirty[item.id] = item
+        self.on_progress(
+            {
+                "type": "item",
+                "job_id": self.job.id,
+                "position": item.position,
+                "query": item.query,
+                "title": item.title,
+                "content_type": item.content_type,
+                "stage": item.stage,
+                "outcome": item.outcome,
+                "error": item.error,
+                "progress": self.progress(),
+            }
+        )
+
+        if item.stage != "done":
+            self._queues[item.stage].put_nowait(item)
+        else:
+            self._remaining -= 1
+
+        if item.outcome == "added" or len(self._dirty) >= self.batch_size:
+            await self._write()
+        if self._remaining <= 0:
+            self._finished.set()
+
+    async def _write(self) -> None:
+        """Write pending item updates in one transaction."""
+        async with self._write_lock:
+            batch = list(self._dirty.values())
+            self._dirty = {}
+            try:
+                await self.repository.save_items(batch)
+            except BaseException:
+                # Keep the updates for the next write (e.g. the final one in run())
+                for item in batch:
+                    self._dirty.setdefault(item.id, item)
+                raise
+
+    def _finish(self, item: ImportJobItem, outcome: str, error: Optional[str] = None) -> None:
+        """Mark an item done with an outcome."""
+        item.stage = "done"
+        item.outcome = outcome
+        item.error = error
+        self.outcomes[outcome] += 1
+
+    async def _call(self, content_type: str, tool: str, arguments: Dict[str, Any]) -> Any:
+        """Run a Radarr/Sonarr tool, raising on failure."""
+        provider = self.providers.get(content_type)
+        if provider is None:
+            raise RuntimeError(f"No provider configured for {content_type}")
+        result = await provider.execute(SERVICE_TOOLS[content_type][tool], arguments)
+        if not result.success:
+            raise RuntimeError(result.error or f"{SERVICE_TOOLS[content_type][tool]} failed")
+        return result.data
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    async def _classify(self, item: ImportJobItem) -> None:
+        """Fill in content type, title, year and season."""
+        if not (item.content_type and item.title):
+            await self._limiters["classify"].acquire()
+            classification = await self.handler.classify_content(item.query)
+            item.content_type = item.content_type or classification.content_type
+            item.title = item.title or classification.title
+            item.year = item.year or classification.year
+            item.season = item.season if item.season is not None else classification.season
+        item.stage = "lookup"
+
+    async def _lookup(self, item: ImportJobItem) -> None:
+        """Resolve the TMDB/TVDB ID Radarr/Sonarr add by."""
+        tools = SERVICE_TOOLS.get(item.content_type or "")
+        if tools is None:
+            self._finish(item, "failed", f"Unknown content type: {item.content_type}")
+            return
+        if getattr(item, tools["id_attr"]) is None:
+            await self._limiters["lookup"].acquire()
+            data = await self._call(item.content_type, "lookup", {"term": item.title})
+            match = _best_match(data.get("results", []), item.title, item.year)
+            if match is None or match.get(tools["id_field"]) is None:
+                self._finish(item, "not_found")
+                return
+            setattr(item, tools["id_attr"], match[tools["id_field"]])
+            item.title = match.get("title") or item.title
+            item.year = item.year or match.get("year")
+        item.stage = "dedupe"
+
+    async def _dedupe(self, item: ImportJobItem) -> None:
+        """Drop titles already in the library or earlier in this job."""
+        tools = SERVICE_TOOLS[item.content_type]
+        external_id = getattr(item, tools["id_attr"])
+        library = await self._get_library(item.content_type)
+
+        key = (item.content_type, external_id)
+        if external_id in library:
+            self._finish(item, "duplicate", f"Already in {tools['service'].capitalize()}")
+        elif key in self._claimed and self._claimed[key] != item.position:
+            self._finish(item, "duplicate", f"Same title as row {self._claimed[key] + 1}")
+        else:
+            self._claimed[key] = item.position
+            item.stage = "add"
+
+    async def _add(self, item: ImportJobItem) -> None:
+        """Add the title to Radarr/Sonarr and create a tracked request."""
+        tools = SERVICE_TOOLS[item.content_type]
+        quality_profile_id, root_folder = await self._get_add_defaults(item.content_type)
+
+        await self._limiters["add"].acquire()
+        added = await self._call(
+            item.content_type,
+            "add",
+            {
+                tools["id_attr"]: getattr(item, tools["id_attr"]),
+                "quality_profile_id": quality_profile_id,
+                "root_folder_path": root_folder,
+                "monitored": True,
+                "title": item.title,
+            },
+        )
+        item.service_id = added.get("id")
+
+        request = await self.request_repository.create(
+            correlation_id=f"import_{self.job.id}_{item.position}",
+            query=item.query,
+            content_type=item.content_type,
+            title=item.title or item.query,
+            status="searching",
+            year=item.year,
+            season=item.season,
+            tmdb_id=item.tmdb_id,
+        )
+        if item.service_id is not None:
+            request = await self.request_repository.update_status(
+                request.id, "searching", external_id=f"{tools['service']}_{item.service_id}"
+            )
+            tracker = get_request_tracker()
+            if tracker and request:
+                tracker.track(request)
+        item.request_id = request.id if request else None
+        self._finish(item, "added")
+
+    async def _get_library(self, content_type: str) -> Set[int]:
+        """Load the Radarr/Sonarr library snapshot once per run."""
+        async with self._library_lock:
+            if content_type not in self._library:
+                tools = SERVICE_TOOLS[content_type]
+                data = await self._call(content_type, "library", {})
+                self._library[content_type] = {
+                    entry[tools["id_field"]]
+                    for entry in data.get(tools["library_key"], [])
+                    if entry.get(tools["id_field"]) is not None
+                }
+            return self._library[content_type]
+
+    async def _get_add_defaults(self, content_type: str) -> Tuple[Any, Any]:
+        """Quality profile and root folder from the job options, else the first configured."""
+        async with self._defaults_lock:
+            if content_type not in self._add_defaults:
+                options = self.job.options or {}
+                profile = options.get(f"{content_type}_quality_profile_id")
+                folder = options.get(f"{content_type}_root_folder")
+                if profile is None:
+                    profiles = (await self._call(content_type, "profiles", {})).get("profiles")
+                    if not profiles:
+                        raise RuntimeError(f"No quality profiles configured for {content_type}")
+                    profile = profiles[0]["id"]
+                if folder is None:
+                    folders = (await self._call(content_type, "folders", {})).get("folders")
+                    if not folders:
+                        raise RuntimeError(f"No root folders configured for {content_type}")
+                    folder = folders[0]["path"]
+                self._add_defaults[content_type] = (profile, folder)
+            return self._add_defaults[content_type]
+
+
+def _best_match(
+    results: List[Dict[str, Any]], title: Optional[str], year: Optional[int]
+) -> Optional[Dict[str, Any]]:
+    """
+    Pick the first lookup result that actually is the requested title.
+
+    The normalized title must match exactly, and so must the year when one
+    is known. Looser results (e.g. "El Camino: A Breaking Bad Movie" for
+    "Breaking Bad") are rejected so the item finishes as not_found instead
+    of adding something unrelated.
+    """
+    wanted = _normalize_title(title)
+    if not wanted:
+        return None
+    for result in results[:10]:
+        if _normalize_title(result.get("title")) != wanted:
+            continue
+        if year and result.get("year") != year:
+            continue
+        return result
+    return None
+
+
+# ============================================================================
+# Service
+# ============================================================================
+
+
+class BulkImportService:
+    """
+    Creates import jobs and runs them in the background.
+
+    Args:
+        db: Database instance
+        handler: Request handler used for classification
+        radarr_provider: Radarr tool provider
+        sonarr_provider: Sonarr tool provider
+        stage_limits: Stage name -> StageLimit (defaults per stage otherwise)
+        max_items: Maximum titles per import
+        batch_size: Item updates written per database batch
+        heartbeat_interval: Seconds between heartbeats of a running job
+        stale_after: Seconds without a heartbeat before another worker may resume a job
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        handler: RequestHandler,
+        radarr_provider: Optional["RadarrToolProvider"] = None,
+        sonarr_provider: Optional["SonarrToolProvider"] = None,
+        stage_limits: Optional[Dict[str, StageLimit]] = None,
+        max_items: int = 5000,
+        batch_size: int = 25,
+        heartbeat_interval: float = 15.0,
+        stale_after: float = 60.0,
+    ) -> None:
+        """Initialize the service."""
+        self.repository = ImportJobRepository(db)
+        self.request_repository = ContentRequestRepository(db)
+        self.handler = handler
+        self.providers = {"movie": radarr_provider, "tv": sonarr_provider}
+        self.stage_limits = stage_limits or {}
+        self.max_items = max_items
+        self.batch_size = batch_size
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+
+        # Unique per process, so a restarted worker does not pass for its predecessor
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._lost: Set[int] = set()
+        self._pipelines: Dict[int, ImportPipeline] = {}
+        self._listeners: Dict[int, Set["asyncio.Queue[Dict[str, Any]]"]] = {}
+
+    async def create_job(
+        self, content: str, source_format: str, options: Optional[Dict[str, Any]] = None
+    ) -> ImportJob:
+        """
+        Parse an import, store it as a job and start processing it.
+
+        Args:
+            content: Raw CSV/JSON content
+            source_format: "csv" or "json"
+            options: Job options (e.g. movie_quality_profile_id, tv_root_folder)
+
+        Returns:
+            Created ImportJob
+
+        Raises:
+            ValueError: If the content cannot be parsed
+        """
+        items = parse_import(content, source_format, self.max_items)
+        job = await self.repository.create_job(source_format, items, options, owner=self.owner)
+        logger.info(f"Created import job {job.id} with {job.total_items} titles")
+        self.start(job.id)
+        return job
+
+    def is_running(self, job_id: int) -> bool:
+        """Whether a job is being processed by this worker."""
+        task = self._tasks.get(job_id)
+        return task is not None and not task.done()
+
+    def start(self, job_id: int) -> bool:
+        """
+        Start processing a job this worker owns in the background.
+
+        Use resume() for jobs another worker may still be processing.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            False if the job is already running
+        """
+        if self.is_running(job_id):
+            return False
+        self._tasks[job_id] = asyncio.create_task(self._run(job_id))
+        return True
+
+    async def resume(self, job_id: int) -> bool:
+        """
+        Claim an unfinished job and resume it in this worker.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            False if the job is already running here, or another worker's
+            heartbeat on it is still fresh
+        """
+        if self.is_running(job_id):
+            return False
+        stale_before = datetime.utcnow() - timedelta(seconds=self.stale_after)
+        if not await self.repository.claim_job(job_id, self.owner, stale_before):
+            return False
+        return self.start(job_id)
+
+    async def resume_incomplete(self) -> List[int]:
+        """
+        Resume pending/running jobs whose owner is gone (stale heartbeat).
+
+        Returns:
+            IDs of resumed jobs
+        """
+        jobs = await self.repository.get_jobs(statuses=["pending", "running"])
+        resumed = [job.id for job in jobs if await self.resume(job.id)]
+        if resumed:
+            logger.info(f"Resuming import jobs: {resumed}")
+        return resumed
+
+    async def _heartbeat(self, job_id: int) -> None:
+        """Refresh a running job's heartbeat; stop the job if another worker took it."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                owned = await self.repository.heartbeat_job(job_id, self.owner)
+            except Exception as e:
+                logger.warning(f"Import job {job_id} heartbeat failed: {e}")
+                continue
+            if not owned:
+                logger.warning(f"Import job {job_id} was resumed by another worker; stopping")
+                self._lost.add(job_id)
+                task = self._tasks.get(job_id)
+                if task is not None:
+                    task.cancel()
+                return
+
+    async def _run(self, job_id: int) -> None:
+        """Run a job's pipeline and record the result."""
+        pipeline: Optional[ImportPipeline] = None
+        status, error = "completed", None
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            job = await self.repository.get_job(job_id)
+            if job is None:
+                raise ValueError(f"Import job {job_id} not found")
+            pipeline = ImportPipeline(
+                job,
+                self.repository,
+                self.request_repository,
+                self.handler,
+                self.providers,
+                self.stage_limits,
+                batch_size=self.batch_size,
+                on_progress=lambda message: self._notify(job_id, message),
+            )
+            self._pipelines[job_id] = pipeline
+            await self.repository.update_job(job_id, status="running", error=None)
+            items = await self.repository.get_items(job_id, unfinished_only=True)
+            done = await self.repository.count_outcomes(job_id)
+            await pipeline.run(items, done)
+        except asyncio.CancelledError:
+            # Shutdown - the job stays "running" and is resumed on next start
+            status = "running"
+            raise
+        except Exception as e:
+            status, error = "failed", str(e)
+            logger.error(f"Import job {job_id} failed: {e}", exc_info=True)
+        finally:
+            heartbeat.cancel()
+            if status == "running" and job_id not in self._lost:
+                # Let the next leader resume it without waiting for the heartbeat to go stale
+                try:
+                    await self.repository.release_job(job_id, self.owner)
+                except Exception as e:
+                    logger.warning(f"Failed to release import job {job_id}: {e}")
+            progress = pipeline.progress() if pipeline is not None else None
+            if status != "running" and pipeline is not None:
+                try:
+                    await self.repository.update_job(
+                        job_id, status=status, error=error, completed_at=datetime.utcnow()
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to record import job {job_id} result: {e}")
+                logger.info(f"Import job {job_id} {status}: {progress}")
+            self._notify(
+                job_id,
+                {
+                    "type": "job",
+                    "job_id": job_id,
+                    "status": status,
+                    "error": error,
+                    "progress": progress,
+                },
+            )
+            self._pipelines.pop(job_id, None)
+            self._tasks.pop(job_id, None)
+            self._lost.discard(job_id)
+
+    def _notify(self, job_id: int, message: Dict[str, Any]) -> None:
+        """Deliver a progress message to the job's stream listeners."""
+        for queue in self._listeners.get(job_id, ()):
+            queue.put_nowait(message)
+
+    async def get_job_status(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a job's status and progress.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Status dict, or None if the job does not exist
+        """
+        job = await self.repository.get_job(job_id)
+        if job is None:
+            return None
+        pipeline = self._pipelines.get(job_id)
+        if pipeline is not None:
+            progress = pipeline.progress()
+        else:
+            counts = await self.repository.count_outcomes(job_id)
+            progress = {
+                "total": job.total_items,
+                "done": sum(counts.values()),
+                **{outcome: counts.get(outcome, 0) for outcome in OUTCOMES},
+            }
+        return {
+            "type": "job",
+            "job_id": job.id,
+            "status": job.status,
+            "running": self.is_running(job_id),
+            "source_format": job.source_format,
+            "error": job.error,
+            "progress": progress,
+            "created_at": job.created_at.isoformat(),
+            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        }
+
+    async def stream(self, job_id: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a job's progress: its current status, then every update until it ends.
+
+        Args:
+            job_id: Job ID
+
+        Yields:
+            Progress messages (the last one has type "job")
+        """
+        queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self._listeners.setdefault(job_id, set()).add(queue)
+        try:
+            status = await self.get_job_status(job_id)
+            if status is None:
+                return
+            yield status
+            if not self.is_running(job_id):
+                return
+            while True:
+                message = await queue.get()
+                yield message
+                if message["type"] == "job":
+                    return
+        finally:
+            listeners = self._listeners.get(job_id)
+            if listeners is not None:
+                listeners.discard(queue)
+                if not listeners:
+                    del self._listeners[job_id]
+
+    async def stop(self) -> None:
+        """Stop running jobs; they are resumed on the next start."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# Global service instance (initialized on startup when a database is configured)
+_service: Optional[BulkImportService] = None
+
+
+def get_bulk_import_service() -> Optional[BulkImportService]:
+    """
+    Get the global bulk import service.
+
+    Returns:
+        Bulk import service or None if not initialized
+    """
+    return _service
+
+
+def initialize_bulk_import(
+    db: Database,
+    handler: RequestHandler,
+    radarr_provider: Optional["RadarrToolProvider"] = None,
+    sonarr_provider: Optional["SonarrToolProvider"] = None,
+    stage_limits: Optional[Dict[str, StageLimit]] = None,
+    max_items: int = 5000,
+    heartbeat_interval: float = 15.0,
+    stale_after: float = 60.0,
+) -> BulkImportService:
+    """
+    Create and register the bulk import service.
+
+    Args:
+        db: Database instance
+        handler: Request handler used for classification
+        radarr_provider: Radarr tool provider
+        sonarr_provider: Sonarr tool provider
+        stage_limits: Stage name -> StageLimit
+        max_items: Maximum titles per import
+        heartbeat_interval: Seconds between heartbeats of a running job
+        stale_after: Seconds without a heartbeat before another worker may resume a job
+
+    Returns:
+        Bulk import service
+    """
+    global _service
+    _service = BulkImportService(
+        db,
+        handler,
+        radarr_provider=radarr_provider,
+        sonarr_provider=sonarr_provider,
+        stage_limits=stage_limits,
+        max_items=max_items,
+        heartbeat_interval=heartbeat_interval,
+        stale_after=stale_after,
+    )
+    return _service
+
+
+async def shutdown_bulk_import() -> None:
+    """Stop running import jobs."""
+    global _service
+    if _service is not None:
+        await _service.stop()
+        _service = None
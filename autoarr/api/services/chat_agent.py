@@ -26,6 +26,7 @@ This service provides an intelligent chat assistant that:
 - Uses tool/function calling to interact with connected services
 """
 
+import asyncio
 import json
 import logging
 import random
@@ -36,6 +37,9 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from autoarr.api.services.conversation_context import ContextBudget, ConversationContextManager
+from autoarr.api.services.llm_agent import TokenUsageTracker
+
 # Import tool provider system
 from autoarr.api.services.tool_provider import ToolRegistry, get_tool_registry
 from autoarr.shared.llm import BaseLLMProvider, LLMMessage, LLMProviderFactory, LLMResponseWithTools
@@ -188,6 +192,9 @@ class ChatResponse(BaseModel):
     confidence: float = Field(default=0.8, description="Response confidence")
     service_required: Optional[str] = Field(None, description="Service needed but not connected")
     setup_link: Optional[str] = Field(None, description="Link to setup the required service")
+    token_usage: Optional[Dict[str, Any]] = Field(
+        None, description="Per-request token accounting for tool-calling responses"
+    )
 
 
 class ChatAgent:
@@ -344,6 +351,12 @@ class ChatAgent:
         QueryTopic.AUTOARR: None,  # Internal knowledge
     }
 
+    # Deadline (seconds) for fetching documentation pages; slower pages use snippets
+    DOC_FETCH_TIMEOUT = 4.0
+
+    # Maximum characters of page content passed to the LLM per document
+    DOC_CONTENT_MAX_CHARS = 2000
+
     # System prompt for the chat agent
     # Note: This is a multi-line string literal - line length is checked per logical line
     SYSTEM_PROMPT = (  # noqa: E501
@@ -409,6 +422,7 @@ class ChatAgent:
         brave_api_key: Optional[str] = None,
         service_versions: Optional[Dict[str, str]] = None,
         tool_registry: Optional[ToolRegistry] = None,
+        context_budget: Optional[ContextBudget] = None,
     ) -> None:
         """
         Initialize chat agent.
@@ -420,6 +434,7 @@ class ChatAgent:
             brave_api_key: Optional Brave Search API key for docs retrieval
             service_versions: Optional dict of service versions user has configured
             tool_registry: Optional tool registry for service tools
+            context_budget: Optional token budget for the tool loop context
         """
         self._provider = provider
         self._api_key = api_key
@@ -430,6 +445,10 @@ class ChatAgent:
         self._web_search = None
         self._tool_registry = tool_registry
         self._tools_initialized = False
+        self._context_budget = context_budget or ContextBudget()
+
+        # Token usage across all requests handled by this agent
+        self.token_tracker = TokenUsageTracker()
 
         # AutoArr internal knowledge base
         self._autoarr_knowledge = self._build_autoarr_knowledge()
@@ -499,9 +518,27 @@ class ChatAgent:
             return self._web_search
 
         if self._brave_api_key:
-            from autoarr.api.services.web_search_service import WebSearchService
+            from autoarr.api.config import get_settings
+            from autoarr.api.services.web_search_service import (
+                WebSearchService,
+                set_web_search_service,
+            )
 
-            self._web_search = WebSearchService(brave_api_key=self._brave_api_key)
+            settings = get_settings()
+            redis_client = None
+            if settings.redis_url:
+                from redis.asyncio import Redis
+
+                redis_client = Redis.from_url(settings.redis_url)
+
+            self._web_search = WebSearchService(
+                brave_api_key=self._brave_api_key,
+                redis_client=redis_client,
+                memory_cache_size=settings.web_search_cache_size,
+                memory_cache_bytes=settings.web_search_cache_max_bytes,
+                cache_db_path=settings.web_search_cache_path,
+            )
+            set_web_search_service(self._web_search)
 
         return self._web_search
 
@@ -647,33 +684,43 @@ class ChatAgent:
                 )
             )
 
+            top_results = results[:3]
+            if not top_results:
+                return []
+
+            # Fetch pages concurrently; any that miss the deadline fall back to snippets
+            fetches = [
+                asyncio.ensure_future(web_search.extract_content(result.url))
+                for result in top_results
+            ]
+            _, pending = await asyncio.wait(fetches, timeout=self.DOC_FETCH_TIMEOUT)
+            for fetch in pending:
+                fetch.cancel()
+
             docs = []
-            for result in results[:3]:
-                # Try to extract content from top results
-                try:
-                    content = await web_search.extract_content(result.url)
-                    # Truncate content to avoid token limits
-                    content = content[:2000] if len(content) > 2000 else content
-
-                    docs.append(
-                        DocumentContext(
-                            source=result.source,
-                            url=result.url,
-                            content=content,
-                            relevance=result.relevance_score,
-                        )
+            for result, fetch in zip(top_results, fetches):
+                content = result.snippet
+                if fetch in pending:
+                    logger.warning(
+                        f"Content extraction from {result.url} exceeded "
+                        f"{self.DOC_FETCH_TIMEOUT}s, using snippet"
                     )
-                except Exception as e:
-                    logger.warning(f"Failed to extract content from {result.url}: {e}")
-                    # Use snippet as fallback
-                    docs.append(
-                        DocumentContext(
-                            source=result.source,
-                            url=result.url,
-                            content=result.snippet,
-                            relevance=result.relevance_score,
-                        )
+                elif fetch.exception() is not None:
+                    logger.warning(
+                        f"Failed to extract content from {result.url}: {fetch.exception()}"
+                    )
+                else:
+                    # Truncate content to avoid token limits
+                    content = fetch.result()[: self.DOC_CONTENT_MAX_CHARS]
+
+                docs.append(
+                    DocumentContext(
+                        source=result.source,
+                        url=result.url,
+                        content=content,
+                        relevance=result.relevance_score,
                     )
+                )
 
             return docs
 
@@ -779,27 +826,19 @@ CONTEXT (use this to provide accurate answers):
 
 Please answer the user's question using the context above when relevant."""
 
-        messages = [
-            LLMMessage(role="system", content=self.SYSTEM_PROMPT),
-        ]
-
-        # Add conversation history if provided
-        if conversation_history:
-            for msg in conversation_history[-6:]:  # Last 6 messages for context
-                messages.append(
-                    LLMMessage(
-                        role=msg.get("role", "user"),
-                        content=msg.get("content", ""),
-                    )
-                )
-
-        messages.append(LLMMessage(role="user", content=user_message))
+        context_manager = ConversationContextManager(
+            self.SYSTEM_PROMPT,
+            budget=self._context_budget,
+            usage_tracker=self.token_tracker,
+        )
+        messages = context_manager.build_messages(user_message, conversation_history)
 
         response = await provider.complete(
             messages=messages,
             temperature=0.7,
             max_tokens=1024,
         )
+        context_manager.record_usage(response.usage)
 
         # Step 8: Build response with sources
         sources = [{"title": doc.source, "url": doc.url} for doc in docs]
@@ -1129,11 +1168,27 @@ Please answer the user's question using the context above when relevant."""
             confidence=0.9,
         )
 
+    def get_token_usage_stats(self) -> Dict[str, Any]:
+        """
+        Get token usage statistics across all requests.
+
+        Returns:
+            Dict with token usage stats
+        """
+        return self.token_tracker.get_stats()
+
     async def close(self) -> None:
         """Close resources."""
         if self._provider and hasattr(self._provider, "close"):
             await self._provider.close()
         if self._web_search:
+            from autoarr.api.services.web_search_service import (
+                get_web_search_service,
+                set_web_search_service,
+            )
+
+            if get_web_search_service() is self._web_search:
+                set_web_search_service(None)
             await self._web_search.close()
 
     # =========================================================================
@@ -1216,22 +1271,13 @@ Please answer the user's question using the context above when relevant."""
 
         logger.info(f"Available tools: {[t['function']['name'] for t in tools_openai]}")
 
-        # Step 5: Build initial messages
-        messages: List[LLMMessage] = [
-            LLMMessage(role="system", content=self.SYSTEM_PROMPT_WITH_TOOLS),
-        ]
-
-        # Add conversation history
-        if conversation_history:
-            for msg in conversation_history[-6:]:
-                messages.append(
-                    LLMMessage(
-                        role=msg.get("role", "user"),
-                        content=msg.get("content", ""),
-                    )
-                )
-
-        messages.append(LLMMessage(role="user", content=query))
+        # Step 5: Build initial messages (stable prefix: system, history, query)
+        context_manager = ConversationContextManager(
+            self.SYSTEM_PROMPT_WITH_TOOLS,
+            budget=self._context_budget,
+            usage_tracker=self.token_tracker,
+        )
+        context_manager.build_messages(query, conversation_history)
 
         # Step 6: Agentic tool loop
         tool_results_for_response: List[Dict[str, Any]] = []
@@ -1251,11 +1297,13 @@ Please answer the user's question using the context above when relevant."""
                     return await self.chat(query, conversation_history)
 
                 response: LLMResponseWithTools = await provider.complete_with_tools(
-                    messages=messages,
+                    messages=context_manager.prepare_request(),
                     tools=tools_openai,
                     temperature=0.7,
                     max_tokens=1024,
                 )
+                context_manager.mark_consumed()
+                context_manager.record_usage(response.usage)
             except Exception as e:
                 logger.error(f"LLM call failed: {e}")
                 return ChatResponse(
@@ -1283,7 +1331,7 @@ Please answer the user's question using the context above when relevant."""
                     }
                     for tc in response.tool_calls
                 ]
-                messages.append(assistant_msg)
+                context_manager.add_message(assistant_msg)
 
                 # Execute each tool call
                 for tool_call in response.tool_calls:
@@ -1311,7 +1359,7 @@ Please answer the user's question using the context above when relevant."""
                     )
                     tool_msg.tool_call_id = tool_call.id
                     tool_msg.name = tool_call.name
-                    messages.append(tool_msg)
+                    context_manager.add_message(tool_msg)
 
                 # Continue the loop to let LLM process tool results
                 continue
@@ -1332,4 +1380,5 @@ Please answer the user's question using the context above when relevant."""
             sources=[],  # Tools don't produce URL sources
             suggestions=suggestions,
             confidence=classification.confidence,
+            token_usage=context_manager.get_stats(),
         )
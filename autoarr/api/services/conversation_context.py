@@ -0,0 +1,326 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Conversation Context Manager for the AutoArr Chat Agent.
+
+Keeps the message list sent to the LLM inside a token budget while the
+agentic tool loop runs:
+- Token estimation per message (cheap character heuristic, no tokenizer)
+- Budget-aware selection of conversation history instead of a fixed window
+- Compaction of tool results once the LLM has consumed them
+- A stable message prefix (system prompt, history, user query) that is never
+  rewritten, so provider-side prompt caching can apply across iterations
+- Per-request token accounting via TokenUsageTracker
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+from autoarr.api.services.llm_agent import TokenUsageTracker
+from autoarr.shared.llm import LLMMessage
+
+logger = logging.getLogger(__name__)
+
+# Rough average for English text and JSON across common tokenizers
+CHARS_PER_TOKEN = 4
+
+# Per-message framing overhead (role, separators) added by chat templates
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """
+    Estimate the number of tokens in a piece of text.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count (0 for empty text)
+    """
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def estimate_message_tokens(message: LLMMessage) -> int:
+    """
+    Estimate the number of tokens a message contributes to a request.
+
+    Args:
+        message: Message to estimate
+
+    Returns:
+        Estimated token count including framing overhead
+    """
+    tokens = MESSAGE_OVERHEAD_TOKENS + estimate_tokens(message.content)
+    if message.tool_calls:
+        tokens += estimate_tokens(json.dumps(message.tool_calls, default=str))
+    return tokens
+
+
+@dataclass
+class ContextBudget:
+    """Token budget for a single chat request."""
+
+    # Upper bound for the whole prompt sent on each iteration
+    max_context_tokens: int = 12000
+    # Share of the budget conversation history may use
+    max_history_tokens: int = 2000
+    # Hard cap on history messages regardless of their size
+    max_history_messages: int = 10
+    # Maximum length of a compacted tool result summary
+    tool_summary_chars: int = 300
+
+
+class ConversationContextManager:
+    """
+    Manages the LLM message list for one chat request.
+
+    The message list is split into a stable prefix (system prompt, selected
+    history and the user query) followed by tool rounds. Once the LLM has
+    responded to a round of tool results, those results are replaced by short
+    summaries so later iterations do not resend the full payloads.
+
+    Args:
+        system_prompt: System prompt placed at the start of every request
+        budget: Optional token budget (defaults to ContextBudget())
+        usage_tracker: Optional tracker that also receives every usage record,
+            e.g. an agent-wide TokenUsageTracker
+    """
+
+    def __init__(
+        self,
+        system_prompt: str,
+        budget: Optional[ContextBudget] = None,
+        usage_tracker: Optional[TokenUsageTracker] = None,
+    ) -> None:
+        """Initialize the context manager."""
+        self.system_prompt = system_prompt
+        self.budget = budget or ContextBudget()
+        self.usage = TokenUsageTracker()
+        self._shared_tracker = usage_tracker
+
+        self.messages: List[LLMMessage] = []
+        self._prefix_length = 0
+        # Index of the first tool message the LLM has not responded to yet
+        self._unconsumed_from = 0
+        self._compacted_indices: Set[int] = set()
+
+        self.compacted_messages = 0
+        self.tokens_saved = 0
+        self.estimated_prompt_tokens = 0
+
+    @property
+    def prefix_length(self) -> int:
+        """Number of leading messages that are never rewritten."""
+        return self._prefix_length
+
+    def select_history(self, conversation_history: Optional[List[Dict]]) -> List[LLMMessage]:
+        """
+        Select the most recent history messages that fit the history budget.
+
+        Args:
+            conversation_history: Previous messages as role/content dicts
+
+        Returns:
+            Selected messages in chronological order
+        """
+        if not conversation_history:
+            return []
+
+        selected: List[LLMMessage] = []
+        used_tokens = 0
+        for msg in reversed(conversation_history):
+            if len(selected) >= self.budget.max_history_messages:
+                break
+            content = msg.get("content", "")
+            if not content:
+                continue
+            message = LLMMessage(role=msg.get("role", "user"), content=content)
+            tokens = estimate_message_tokens(message)
+            if used_tokens + tokens > self.budget.max_history_tokens:
+                break
+            selected.append(message)
+            used_tokens += tokens
+
+        selected.reverse()
+        return selected
+
+    def build_messages(
+        self, query: str, conversation_history: Optional[List[Dict]] = None
+    ) -> List[LLMMessage]:
+        """
+        Build the stable prefix for a new request.
+
+        Args:
+            query: User's query
+            conversation_history: Optional previous messages for context
+
+        Returns:
+            The managed message list (system, history, user query)
+        """
+        self.messages = [LLMMessage(role="system", content=self.system_prompt)]
+        self.messages.extend(self.select_history(conversation_history))
+        self.messages.append(LLMMessage(role="user", content=query))
+        self._prefix_length = len(self.messages)
+        self._unconsumed_from = self._prefix_length
+        self._compacted_indices.clear()
+        return self.messages
+
+    def add_message(self, message: LLMMessage) -> None:
+        """
+        Append a message (assistant tool call or tool result) to the context.
+
+        Args:
+            message: Message to append
+        """
+        self.messages.append(message)
+
+    def prepare_request(self) -> List[LLMMessage]:
+        """
+        Get the message list for the next LLM call.
+
+        Compacts tool results the LLM has already responded to, and if the
+        estimate still exceeds the context budget, compacts the pending ones
+        as well.
+
+        Returns:
+            Message list to send to the provider
+        """
+        for index in range(self._prefix_length, self._unconsumed_from):
+            self._compact_at(index)
+
+        total = self.estimate_total_tokens()
+        if total > self.budget.max_context_tokens:
+            logger.debug(
+                f"Context estimate {total} exceeds budget "
+                f"{self.budget.max_context_tokens}, compacting pending tool results"
+            )
+            for index in range(self._unconsumed_from, len(self.messages)):
+                self._compact_at(index)
+            total = self.estimate_total_tokens()
+
+        self.estimated_prompt_tokens += total
+        return self.messages
+
+    def mark_consumed(self) -> None:
+        """Mark every message sent so far as consumed by the LLM."""
+        self._unconsumed_from = len(self.messages)
+
+    def estimate_total_tokens(self) -> int:
+        """
+        Estimate the prompt size of the current message list.
+
+        Returns:
+            Estimated token count
+        """
+        return sum(estimate_message_tokens(m) for m in self.messages)
+
+    def record_usage(self, usage: Optional[Dict[str, int]]) -> None:
+        """
+        Record provider-reported token usage for one LLM call.
+
+        Args:
+            usage: Usage dict with prompt_tokens/completion_tokens keys
+        """
+        if not usage:
+            return
+        input_tokens = int(usage.get("prompt_tokens", 0) or 0)
+        output_tokens = int(usage.get("completion_tokens", 0) or 0)
+        self.usage.record_usage(input_tokens=input_tokens, output_tokens=output_tokens)
+        if self._shared_tracker is not None:
+            self._shared_tracker.record_usage(
+                input_tokens=input_tokens, output_tokens=output_tokens
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get token accounting for this request.
+
+        Returns:
+            Dict with provider-reported usage and context management counters
+        """
+        stats = self.usage.get_stats()
+        stats.update(
+            {
+                "estimated_prompt_tokens": self.estimated_prompt_tokens,
+                "compacted_messages": self.compacted_messages,
+                "estimated_tokens_saved": self.tokens_saved,
+                "prefix_messages": self._prefix_length,
+            }
+        )
+        return stats
+
+    def _compact_at(self, index: int) -> None:
+        """Replace a tool result message with its summary, if not already compacted."""
+        message = self.messages[index]
+        if message.role != "tool" or index in self._compacted_indices:
+            return
+        self._compacted_indices.add(index)
+
+        summary = summarize_tool_result(message.content, self.budget.tool_summary_chars)
+        if len(summary) >= len(message.content):
+            return
+
+        compacted = LLMMessage(
+            role="tool",
+            content=summary,
+            tool_call_id=message.tool_call_id,
+            name=message.name,
+        )
+        self.tokens_saved += estimate_tokens(message.content) - estimate_tokens(summary)
+        self.compacted_messages += 1
+        self.messages[index] = compacted
+
+
+def summarize_tool_result(content: str, max_chars: int = 300) -> str:
+    """
+    Build a short JSON summary of a serialized ToolResult.
+
+    Args:
+        content: JSON-serialized ToolResult (success/data/error)
+        max_chars: Maximum length of the data preview
+
+    Returns:
+        JSON string with success flag, error and a truncated data preview
+    """
+    try:
+        parsed = json.loads(content)
+    except (TypeError, ValueError):
+        parsed = None
+
+    if not isinstance(parsed, dict):
+        preview = content[:max_chars]
+        return json.dumps({"compacted": True, "preview": preview})
+
+    summary: Dict[str, Any] = {"compacted": True, "success": parsed.get("success")}
+    if parsed.get("error"):
+        summary["error"] = str(parsed["error"])[:max_chars]
+
+    data = parsed.get("data")
+    if isinstance(data, dict):
+        summary["data_keys"] = list(data.keys())[:20]
+    elif isinstance(data, list):
+        summary["data_items"] = len(data)
+    if data is not None:
+        summary["preview"] = json.dumps(data, default=str)[:max_chars]
+
+    return json.dumps(summary, default=str)
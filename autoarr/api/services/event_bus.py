@@ -24,6 +24,8 @@ This service provides a publish-subscribe event system with:
 - Dead letter queue for failed events
 - Async event handlers with error handling
 - Event filtering and priority-based routing
+- Optional queued dispatch with a bounded queue and worker per subscriber
+- Precomputed per-event-type dispatch tables and inline (same-loop) handlers
 - Thread-safe operations
 
 The EventBus follows a singleton pattern to ensure a single global event bus
@@ -31,16 +33,28 @@ instance across the application.
 """
 
 import asyncio
+import bisect
+import heapq
 import inspect
+import itertools
 import logging
+import time
 import uuid
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
 
+from autoarr.shared.core.metrics import (
+    EVENT_DEAD_LETTERS,
+    EVENT_HANDLER_DURATION,
+    EVENT_HANDLER_FAILURES,
+    EVENT_SUBSCRIBER_QUEUE_DEPTH,
+    EVENTS_PUBLISHED,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,12 +92,14 @@ class EventType(str, Enum):
     REQUEST_CREATED = "request.created"
     REQUEST_PROCESSED = "request.processed"
     REQUEST_FAILED = "request.failed"
+    REQUEST_STATUS_CHANGED = "request.status_changed"
 
     # System events
     SYSTEM_ERROR = "system_error"
     SYSTEM_WARNING = "system_warning"
     SYSTEM_STARTUP = "system.startup"
     SYSTEM_SHUTDOWN = "system.shutdown"
+    SERVICE_HEALTH_CHECKED = "service.health_checked"
 
 
 class Event(BaseModel):
@@ -107,6 +123,28 @@ class Event(BaseModel):
 EventHandler = Callable[[Event], Union[None, asyncio.Future]]
 
 
+class DispatchMode(str, Enum):
+    """How the EventBus delivers events to a subscription."""
+
+    # Publisher awaits the handler before calling the next one
+    AWAIT = "await"
+    # Non-blocking callable invoked directly on the event loop (no thread hop)
+    INLINE = "inline"
+    # Event is put on the subscriber's queue and delivered by its worker task
+    QUEUED = "queued"
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when a queued subscriber's queue is full."""
+
+    # Publisher waits until the subscriber makes room
+    BLOCK = "block"
+    # Oldest pending event is discarded to make room
+    DROP_OLDEST = "drop_oldest"
+    # New event goes to the dead letter queue instead of the subscriber
+    DEAD_LETTER = "dead_letter"
+
+
 class EventSubscription(BaseModel):
     """
     Represents a subscription to an event type.
@@ -122,6 +160,7 @@ class EventSubscription(BaseModel):
         None, description="Optional filter function"
     )
     priority: int = Field(1, description="Handler priority (higher = executed first)")
+    dispatch_mode: DispatchMode = Field(DispatchMode.AWAIT, description="Delivery mode")
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -145,6 +184,180 @@ class DeadLetterEntry(BaseModel):
 DeadLetterQueue = DeadLetterEntry
 
 
+class SubscriberQueue:
+    """
+    Bounded delivery queue and worker task for one queued subscriber.
+
+    All QUEUED subscriptions that share a handler share one queue, so a
+    subscriber receives events one at a time in priority order (higher
+    subscription priority first, then publish order). A slow subscriber
+    only delays its own queue, never the publisher or other subscribers.
+
+    Args:
+        bus: Owning EventBus (used for handler calls and dead letters)
+        handler: Handler invoked by the worker
+        maxsize: Maximum number of pending events
+        overflow_policy: Behaviour when the queue is full
+    """
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        handler: EventHandler,
+        maxsize: int,
+        overflow_policy: OverflowPolicy,
+    ) -> None:
+        """Initialize subscriber queue."""
+        self.bus = bus
+        self.handler = handler
+        self.handler_name = bus._get_handler_name(handler)
+        self.maxsize = maxsize
+        self.overflow_policy = overflow_policy
+        self.subscriptions: List[EventSubscription] = []
+
+        # Heap of (-priority, sequence, event)
+        self._heap: List[Any] = []
+        self._sequence = itertools.count()
+        self._changed: Optional[asyncio.Condition] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._busy = False
+
+        # Statistics
+        self.enqueued = 0
+        self.processed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.dead_lettered = 0
+        self.max_depth = 0
+        self._latency_total = 0.0
+        self.max_latency_ms = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting for delivery."""
+        return len(self._heap)
+
+    @property
+    def idle(self) -> bool:
+        """Whether the queue is empty and no event is being handled."""
+        return not self._heap and not self._busy
+
+    def _ensure_worker(self) -> asyncio.Condition:
+        """Start the worker task on the running loop if needed."""
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+        return self._changed
+
+    async def put(self, event: Event, priority: int) -> bool:
+        """
+        Enqueue an event for delivery.
+
+        Args:
+            event: Event to deliver
+            priority: Priority of the subscription that matched
+
+        Returns:
+            True if the event was enqueued, False if it was dead-lettered
+        """
+        changed = self._ensure_worker()
+        async with changed:
+            if len(self._heap) >= self.maxsize:
+                if self.overflow_policy == OverflowPolicy.BLOCK:
+                    await changed.wait_for(lambda: len(self._heap) < self.maxsize)
+                elif self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+                    oldest = min(range(len(self._heap)), key=lambda i: self._heap[i][1])
+                    self._heap[oldest] = self._heap[-1]
+                    self._heap.pop()
+                    heapq.heapify(self._heap)
+                    self.dropped += 1
+                else:
+                    self.dead_lettered += 1
+                    await self.bus._add_to_dead_letter_queue(
+                        event, f"Subscriber queue full ({self.maxsize})", self.handler_name
+                    )
+                    return False
+
+            heapq.heappush(self._heap, (-priority, next(self._sequence), event))
+            self.enqueued += 1
+            self.max_depth = max(self.max_depth, len(self._heap))
+            changed.notify_all()
+        return True
+
+    async def _run(self) -> None:
+        """Deliver queued events to the handler until cancelled."""
+        changed = self._changed
+        assert changed is not None
+        while True:
+            async with changed:
+                await changed.wait_for(lambda: bool(self._heap))
+                _, _, event = heapq.heappop(self._heap)
+                self._busy = True
+                changed.notify_all()
+
+            started = time.perf_counter()
+            try:
+                await self.bus._call_handler(self.handler, event, timeout=self.bus._handler_timeout)
+                self.processed += 1
+            except Exception as e:
+                self.failed += 1
+                EVENT_HANDLER_FAILURES.labels(event.event_type).inc()
+                logger.error(
+                    f"Handler {self.handler_name} failed for event {event.event_type}: {e}",
+                    exc_info=True,
+                )
+                await self.bus._add_to_dead_letter_queue(event, str(e), self.handler_name)
+            finally:
+                elapsed = time.perf_counter() - started
+                EVENT_HANDLER_DURATION.labels(event.event_type).observe(elapsed)
+                elapsed_ms = elapsed * 1000
+                self._latency_total += elapsed_ms
+                self.max_latency_ms = max(self.max_latency_ms, elapsed_ms)
+                async with changed:
+                    self._busy = False
+                    changed.notify_all()
+
+    async def join(self) -> None:
+        """Wait until every queued event has been handled."""
+        if self._changed is None:
+            return
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.idle)
+
+    def stop(self) -> None:
+        """Cancel the worker task; pending events are discarded."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+        self._worker = None
+        self._heap.clear()
+        self._busy = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue depth and handler latency statistics.
+
+        Returns:
+            Dict with depth, counters and latency for this subscriber
+        """
+        handled = self.processed + self.failed
+        return {
+            "handler": self.handler_name,
+            "subscriptions": len(self.subscriptions),
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "maxsize": self.maxsize,
+            "overflow_policy": self.overflow_policy.value,
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "dead_lettered": self.dead_lettered,
+            "avg_latency_ms": self._latency_total / handled if handled else 0.0,
+            "max_latency_ms": self.max_latency_ms,
+        }
+
+
 # ============================================================================
 # EventBus Class
 # ============================================================================
@@ -159,6 +372,11 @@ class EventBus:
     - Handler subscription with filtering and priority
     - Dead letter queue for failed deliveries
     - Async/sync handler support
+    - Queued dispatch: per-subscriber bounded queues drained by worker tasks,
+      so publish() returns once the event is enqueued
+    - Inline dispatch: non-blocking callables run directly on the event loop
+    - Dispatch tables: per-event-type handler lists (wildcards merged in,
+      priority ordered) computed once and invalidated on (un)subscribe
     - Thread-safe operations
 
     Example:
@@ -190,12 +408,22 @@ class EventBus:
     # Default handler timeout (seconds)
     _DEFAULT_HANDLER_TIMEOUT = 0.5
 
-    def __init__(self, handler_timeout: float = 0.5):
+    # Default bounded queue size for queued subscribers
+    _DEFAULT_QUEUE_SIZE = 1000
+
+    def __init__(
+        self,
+        handler_timeout: float = 0.5,
+        queue_size: int = _DEFAULT_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ):
         """
         Initialize the EventBus.
 
         Args:
             handler_timeout: Maximum time to wait for each handler (seconds)
+            queue_size: Default queue size for queued subscribers
+            overflow_policy: Default overflow policy for queued subscribers
         """
         # Store subscriptions by event type
         # Structure: {EventType: [EventSubscription, ...]}
@@ -204,12 +432,24 @@ class EventBus:
         # Wildcard subscriptions (subscribe to all events)
         self._wildcard_subscriptions: List[EventSubscription] = []
 
+        # Precomputed dispatch lists per event type (wildcards merged in)
+        self._dispatch_tables: Dict[str, Tuple[EventSubscription, ...]] = {}
+
+        # Published counter and handler duration histogram per event type
+        # (looked up once instead of on every publish)
+        self._event_metrics: Dict[str, Tuple[Any, Any]] = {}
+
         # Dead letter queue for failed events
         self._dead_letter_queue: List[DeadLetterEntry] = []
 
         # Handler timeout
         self._handler_timeout = handler_timeout
 
+        # Queued dispatch: one SubscriberQueue per handler
+        self._queue_size = queue_size
+        self._overflow_policy = overflow_policy
+        self._subscriber_queues: Dict[Any, SubscriberQueue] = {}
+
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
 
@@ -221,6 +461,9 @@ class EventBus:
         handler: EventHandler,
         event_filter: Optional[Callable[[Event], bool]] = None,
         priority: int = 1,
+        dispatch_mode: DispatchMode = DispatchMode.AWAIT,
+        queue_size: Optional[int] = None,
+        overflow_policy: Optional[OverflowPolicy] = None,
     ) -> EventSubscription:
         """
         Subscribe a handler to an event type.
@@ -230,6 +473,11 @@ class EventBus:
             handler: Async or sync function to handle events
             event_filter: Optional filter function to selectively handle events
             priority: Handler priority (higher values execute first)
+            dispatch_mode: AWAIT (publisher awaits handler), INLINE (non-blocking
+                callable run on the loop) or QUEUED (delivered by the
+                subscriber's own worker task)
+            queue_size: Queue size for QUEUED mode (defaults to the bus default)
+            overflow_policy: Overflow policy for QUEUED mode (defaults to the bus default)
 
         Returns:
             EventSubscription object (used for unsubscribing)
@@ -252,11 +500,14 @@ class EventBus:
             handler=handler,
             event_filter=event_filter,
             priority=priority,
+            dispatch_mode=dispatch_mode,
         )
+        if dispatch_mode == DispatchMode.QUEUED:
+            self._attach_queue(subscription, queue_size, overflow_policy)
 
         # Add to subscriptions and sort by priority (highest first)
-        self._subscriptions[event_type].append(subscription)
-        self._subscriptions[event_type].sort(key=lambda s: s.priority, reverse=True)
+        self._insert_by_priority(self._subscriptions[event_type], subscription)
+        self._dispatch_tables.pop(event_type, None)
 
         logger.debug(
             f"Subscribed handler to {event_type} "
@@ -270,6 +521,9 @@ class EventBus:
         handler: EventHandler,
         event_filter: Optional[Callable[[Event], bool]] = None,
         priority: int = 1,
+        dispatch_mode: DispatchMode = DispatchMode.AWAIT,
+        queue_size: Optional[int] = None,
+        overflow_policy: Optional[OverflowPolicy] = None,
     ) -> EventSubscription:
         """
         Subscribe a handler to all event types (wildcard subscription).
@@ -278,6 +532,9 @@ class EventBus:
             handler: Async or sync function to handle events
             event_filter: Optional filter function
             priority: Handler priority
+            dispatch_mode: AWAIT, INLINE or QUEUED delivery
+            queue_size: Queue size for QUEUED mode
+            overflow_policy: Overflow policy for QUEUED mode
 
         Returns:
             EventSubscription object
@@ -287,10 +544,13 @@ class EventBus:
             handler=handler,
             event_filter=event_filter,
             priority=priority,
+            dispatch_mode=dispatch_mode,
         )
+        if dispatch_mode == DispatchMode.QUEUED:
+            self._attach_queue(subscription, queue_size, overflow_policy)
 
-        self._wildcard_subscriptions.append(subscription)
-        self._wildcard_subscriptions.sort(key=lambda s: s.priority, reverse=True)
+        self._insert_by_priority(self._wildcard_subscriptions, subscription)
+        self._dispatch_tables.clear()
 
         logger.debug(f"Subscribed wildcard handler (priority={priority})")
 
@@ -303,9 +563,13 @@ class EventBus:
         Args:
             subscription: The subscription to remove (returned from subscribe())
         """
+        if subscription.dispatch_mode == DispatchMode.QUEUED:
+            self._detach_queue(subscription)
+
         # Check wildcard subscriptions first
         if subscription in self._wildcard_subscriptions:
             self._wildcard_subscriptions.remove(subscription)
+            self._dispatch_tables.clear()
             logger.debug("Unsubscribed wildcard handler")
             return
 
@@ -314,6 +578,7 @@ class EventBus:
         if event_type in self._subscriptions:
             if subscription in self._subscriptions[event_type]:
                 self._subscriptions[event_type].remove(subscription)
+                self._dispatch_tables.pop(event_type, None)
                 logger.debug(f"Unsubscribed handler from {event_type}")
 
     async def publish(self, event: Event) -> None:
@@ -345,41 +610,61 @@ class EventBus:
         if event.correlation_id is None:
             event.correlation_id = str(uuid.uuid4())
 
-        logger.debug(
-            f"Publishing event: {event.event_type} "
-            f"(correlation_id={event.correlation_id}, source={event.source})"
-        )
-
-        # Get handlers for this event type
-        handlers_to_call: List[EventSubscription] = []
-
-        # Add wildcard subscriptions
-        handlers_to_call.extend(self._wildcard_subscriptions)
-
-        # Add specific subscriptions
-        if event.event_type in self._subscriptions:
-            handlers_to_call.extend(self._subscriptions[event.event_type])
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                f"Publishing event: {event.event_type} "
+                f"(correlation_id={event.correlation_id}, source={event.source})"
+            )
 
-        # Sort by priority (highest first) - ensure stable sort
-        handlers_to_call.sort(key=lambda s: s.priority, reverse=True)
+        event_metrics = self._event_metrics.get(event.event_type)
+        if event_metrics is None:
+            event_metrics = self._event_metrics[event.event_type] = (
+                EVENTS_PUBLISHED.labels(event.event_type),
+                EVENT_HANDLER_DURATION.labels(event.event_type),
+            )
+        published, handler_duration = event_metrics
+        published.inc()
 
-        # Filter based on event_filter functions
-        filtered_handlers = []
-        for subscription in handlers_to_call:
-            if subscription.event_filter is None or subscription.event_filter(event):
-                filtered_handlers.append(subscription)
+        dispatch_table = self._dispatch_tables.get(event.event_type)
+        if dispatch_table is None:
+            dispatch_table = self._build_dispatch_table(event.event_type)
 
-        if not filtered_handlers:
-            logger.debug(f"No handlers for event {event.event_type}")
+        if not dispatch_table:
+            if debug:
+                logger.debug(f"No handlers for event {event.event_type}")
             return
 
-        logger.debug(f"Calling {len(filtered_handlers)} handlers for {event.event_type}")
+        # Call all handlers (in priority order, with error handling)
+        for subscription in dispatch_table:
+            if subscription.event_filter is not None and not subscription.event_filter(event):
+                continue
+
+            if subscription.dispatch_mode == DispatchMode.QUEUED:
+                queue = self._subscriber_queues.get(subscription.handler)
+                if queue is not None:
+                    await queue.put(event, subscription.priority)
+                continue
 
-        # Call all handlers (in order, with error handling)
-        for subscription in filtered_handlers:
+            # Inline handlers are trivial by contract; timing them would cost
+            # more than running them, so only awaited handlers are observed
+            started = None
             try:
-                await self._call_handler(subscription.handler, event, timeout=self._handler_timeout)
+                if subscription.dispatch_mode == DispatchMode.INLINE:
+                    # Fast path: call on the loop, no executor or task
+                    result = subscription.handler(event)
+                    if inspect.isawaitable(result):
+                        await asyncio.wait_for(result, timeout=self._handler_timeout)
+                else:
+                    started = time.perf_counter()
+                    await self._call_handler(
+                        subscription.handler, event, timeout=self._handler_timeout
+                    )
             except Exception as e:
+                if started is not None:
+                    handler_duration.observe(time.perf_counter() - started)
+                EVENT_HANDLER_FAILURES.labels(event.event_type).inc()
+
                 # Log error and add to dead letter queue
                 handler_name = self._get_handler_name(subscription.handler)
                 logger.error(
@@ -389,6 +674,9 @@ class EventBus:
 
                 # Add to dead letter queue
                 await self._add_to_dead_letter_queue(event, str(e), handler_name)
+            else:
+                if started is not None:
+                    handler_duration.observe(time.perf_counter() - started)
 
     async def _call_handler(
         self, handler: EventHandler, event: Event, timeout: float = 30.0
@@ -407,13 +695,109 @@ class EventBus:
                 await asyncio.wait_for(handler(event), timeout=timeout)
             else:
                 # Sync handler - run in executor to avoid blocking (with timeout)
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 await asyncio.wait_for(loop.run_in_executor(None, handler, event), timeout=timeout)
         except asyncio.TimeoutError:
             # Handler exceeded timeout - raise as regular exception to be caught by publish
             handler_name = self._get_handler_name(handler)
             raise TimeoutError(f"Handler {handler_name} exceeded timeout of {timeout}s")
 
+    @staticmethod
+    def _insert_by_priority(
+        subscriptions: List[EventSubscription], subscription: EventSubscription
+    ) -> None:
+        """Insert keeping highest priority first (FIFO among equal priorities)."""
+        index = bisect.bisect_right(
+            subscriptions, -subscription.priority, key=lambda s: -s.priority
+        )
+        subscriptions.insert(index, subscription)
+
+    def _build_dispatch_table(self, event_type: str) -> Tuple[EventSubscription, ...]:
+        """
+        Build and cache the ordered dispatch list for an event type.
+
+        Wildcard subscriptions come before typed ones of equal priority.
+
+        Args:
+            event_type: Event type to build the table for
+
+        Returns:
+            Subscriptions to call, highest priority first
+        """
+        merged = list(self._wildcard_subscriptions)
+        merged.extend(self._subscriptions.get(event_type, ()))
+        merged.sort(key=lambda s: s.priority, reverse=True)
+        table = tuple(merged)
+        self._dispatch_tables[event_type] = table
+        return table
+
+    def _attach_queue(
+        self,
+        subscription: EventSubscription,
+        queue_size: Optional[int],
+        overflow_policy: Optional[OverflowPolicy],
+    ) -> None:
+        """Register a QUEUED subscription with its handler's queue."""
+        queue = self._subscriber_queues.get(subscription.handler)
+        if queue is None:
+            queue = SubscriberQueue(
+                self,
+                subscription.handler,
+                maxsize=queue_size or self._queue_size,
+                overflow_policy=overflow_policy or self._overflow_policy,
+            )
+            self._subscriber_queues[subscription.handler] = queue
+        queue.subscriptions.append(subscription)
+
+    def _detach_queue(self, subscription: EventSubscription) -> None:
+        """Remove a QUEUED subscription, stopping the worker after the last one."""
+        queue = self._subscriber_queues.get(subscription.handler)
+        if queue is None or subscription not in queue.subscriptions:
+            return
+        queue.subscriptions.remove(subscription)
+        if not queue.subscriptions:
+            queue.stop()
+            del self._subscriber_queues[subscription.handler]
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until all queued subscribers have handled their pending events.
+
+        Args:
+            timeout: Optional maximum time to wait (seconds)
+
+        Raises:
+            asyncio.TimeoutError: If the queues are not drained in time
+        """
+        queues = list(self._subscriber_queues.values())
+        if not queues:
+            return
+        await asyncio.wait_for(asyncio.gather(*(q.join() for q in queues)), timeout=timeout)
+
+    async def shutdown(self, drain_timeout: Optional[float] = 5.0) -> None:
+        """
+        Stop all queued subscriber workers.
+
+        Args:
+            drain_timeout: Time to let pending events drain first (None = no wait)
+        """
+        if drain_timeout:
+            try:
+                await self.drain(timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Timed out draining event bus subscriber queues")
+        for queue in self._subscriber_queues.values():
+            queue.stop()
+
+    def get_subscriber_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get queue depth and handler latency for each queued subscriber.
+
+        Returns:
+            List of per-subscriber statistics dicts
+        """
+        return [queue.get_stats() for queue in self._subscriber_queues.values()]
+
     def _get_handler_name(self, handler: EventHandler) -> str:
         """Get a readable name for a handler function."""
         if hasattr(handler, "__name__"):
@@ -494,3 +878,23 @@ def get_event_bus() -> EventBus:
     if _global_event_bus is None:
         _global_event_bus = EventBus()
     return _global_event_bus
+
+
+# Dead letter queue size of the global bus, read at scrape time
+EVENT_DEAD_LETTERS.set_function(
+    lambda: len(_global_event_bus._dead_letter_queue) if _global_event_bus else 0
+)
+
+
+def _subscriber_queue_depths() -> Dict[Tuple[str, ...], int]:
+    """Pending events per queued subscriber of the global bus."""
+    depths: Dict[Tuple[str, ...], int] = {}
+    if _global_event_bus is not None:
+        for queue in _global_event_bus._subscriber_queues.values():
+            key = (queue.handler_name,)
+            depths[key] = depths.get(key, 0) + queue.depth
+    return depths
+
+
+# Queue depth per queued subscriber of the global bus, read at scrape time
+EVENT_SUBSCRIBER_QUEUE_DEPTH.set_function(_subscriber_queue_depths)
@@ -0,0 +1,252 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Cross-worker event fan-out over Redis pub/sub.
+
+The EventBus is per process. In multi-worker mode, events published in one
+worker (e.g. download alerts from the leader's monitoring service) must reach
+WebSocket clients connected to every worker. EventFanout forwards each
+locally published event to a Redis channel and re-publishes events received
+from other workers on the local bus. Events received from Redis are never
+forwarded again. If the Redis subscription fails, it is re-established after
+a short delay.
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from autoarr.api.services.event_bus import (
+    DispatchMode,
+    Event,
+    EventBus,
+    EventSubscription,
+)
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+# Set while re-publishing an event received from another worker
+_inbound: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "event_fanout_inbound", default=False
+)
+
+
+class EventFanout:
+    """
+    Bridges the local EventBus to a Redis channel shared by all workers.
+
+    Args:
+        event_bus: Local event bus
+        redis_client: Redis client
+        channel: Pub/sub channel name
+        queue_size: Outbound events buffered before new ones are dropped
+        reconnect_delay: Seconds to wait before resubscribing after a Redis error
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        redis_client: "Redis",
+        channel: str = "autoarr:events",
+        queue_size: int = 1000,
+        reconnect_delay: float = 1.0,
+    ) -> None:
+        """Initialize the fan-out."""
+        self.event_bus = event_bus
+        self.redis_client = redis_client
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.worker_id = uuid.uuid4().hex
+        self._outbound: "asyncio.Queue[str]" = asyncio.Queue(maxsize=queue_size)
+        self._subscription: Optional[EventSubscription] = None
+        self._tasks: list[asyncio.Task] = []
+
+        # Statistics
+        self.sent = 0
+        self.received = 0
+        self.dropped = 0
+        self.errors = 0
+        self.reconnects = 0
+
+    async def start(self) -> None:
+        """Subscribe to the local bus and the Redis channel."""
+        pubsub = self.redis_client.pubsub()
+        await pubsub.subscribe(self.channel)
+        self._subscription = self.event_bus.subscribe_all(
+            self._forward, dispatch_mode=DispatchMode.INLINE
+        )
+        self._tasks = [
+            asyncio.create_task(self._send_loop()),
+            asyncio.create_task(self._receive_loop(pubsub)),
+        ]
+        logger.info(f"Event fan-out started on Redis channel {self.channel}")
+
+    async def stop(self) -> None:
+        """Stop forwarding and receiving events."""
+        if self._subscription is not None:
+            self.event_bus.unsubscribe(self._subscription)
+            self._subscription = None
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _forward(self, event: Event) -> None:
+        """Queue a locally published event for other workers."""
+        if _inbound.get():
+            return
+        message = json.dumps({"worker": self.worker_id, "event": event.model_dump(mode="json")})
+        try:
+            self._outbound.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def _send_loop(self) -> None:
+        """Publish queued events to Redis."""
+        while True:
+            message = await self._outbound.get()
+            try:
+                await self.redis_client.publish(self.channel, message)
+                self.sent += 1
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Failed to fan out event: {e}")
+
+    async def _receive_loop(self, pubsub: Any) -> None:
+        """Re-publish events from other workers, resubscribing after Redis errors."""
+        while True:
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    await self._handle_message(message["data"])
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Event fan-out subscription failed: {e}")
+            finally:
+                await self._close_pubsub(pubsub)
+            pubsub = await self._resubscribe()
+
+    async def _resubscribe(self) -> Any:
+        """Subscribe to the Redis channel again, retrying until it succeeds."""
+        while True:
+            await asyncio.sleep(self.reconnect_delay)
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Event fan-out resubscribe failed: {e}")
+                await self._close_pubsub(pubsub)
+                continue
+            self.reconnects += 1
+            logger.info(f"Event fan-out resubscribed to Redis channel {self.channel}")
+            return pubsub
+
+    async def _close_pubsub(self, pubsub: Any) -> None:
+        """Unsubscribe and close a pub/sub connection, ignoring errors."""
+        try:
+            await pubsub.unsubscribe(self.channel)
+            await pubsub.close()
+        except Exception:
+            pass
+
+    async def _handle_message(self, raw: Any) -> None:
+        """Decode one Redis message and publish it locally."""
+        try:
+            payload = json.loads(raw)
+            if payload.get("worker") == self.worker_id:
+                return
+            event = Event.model_validate(payload["event"])
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Ignoring malformed fan-out message: {e}")
+            return
+
+        self.received += 1
+        token = _inbound.set(True)
+        try:
+            await self.event_bus.publish(event)
+        finally:
+            _inbound.reset(token)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get fan-out counters.
+
+        Returns:
+            Dict with channel, worker id and sent/received/dropped/error/reconnect counts
+        """
+        return {
+            "channel": self.channel,
+            "worker_id": self.worker_id,
+            "sent": self.sent,
+            "received": self.received,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "reconnects": self.reconnects,
+            "pending": self._outbound.qsize(),
+        }
+
+
+# Global fan-out instance (only set in multi-worker mode with Redis)
+_fanout: Optional[EventFanout] = None
+
+
+def get_event_fanout() -> Optional[EventFanout]:
+    """
+    Get the global event fan-out.
+
+    Returns:
+        Event fan-out, or None if not running
+    """
+    return _fanout
+
+
+async def initialize_event_fanout(
+    event_bus: EventBus, redis_client: "Redis", channel: str = "autoarr:events"
+) -> EventFanout:
+    """
+    Create, start and register the event fan-out.
+
+    Args:
+        event_bus: Local event bus
+        redis_client: Redis client
+        channel: Pub/sub channel name
+
+    Returns:
+        Started event fan-out
+    """
+    global _fanout
+    _fanout = EventFanout(event_bus, redis_client, channel=channel)
+    await _fanout.start()
+    return _fanout
+
+
+async def shutdown_event_fanout() -> None:
+    """Stop the event fan-out."""
+    global _fanout
+    if _fanout is not None:
+        await _fanout.stop()
+        _fanout = None
@@ -0,0 +1,378 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Leader election for multi-worker deployments.
+
+When AutoArr runs several worker processes, background services (download
+monitoring, Plex library sync) must run in exactly one of them. Every worker
+competes for a leader lease; the winner starts the background services and
+the others retry periodically, so a follower takes over if the leader dies.
+
+Two lease backends are available:
+- PostgresAdvisoryLease: a session-level ``pg_try_advisory_lock`` held on a
+  dedicated connection (works across hosts/containers sharing the database)
+- FileLease: an exclusive ``flock`` on a lock file (workers on one host,
+  e.g. uvicorn ``--workers`` with SQLite)
+
+Both are released by the server/OS if the holding process dies.
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy import text
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock key shared by every AutoArr worker ("AARR" as an int)
+LEADER_LOCK_KEY = 0x41415252
+
+
+class FileLease:
+    """
+    Leader lease held as an exclusive, non-blocking flock on a lock file.
+
+    Args:
+        path: Lock file path (created if missing)
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the file lease."""
+        self.path = path
+        self._fd: Optional[int] = None
+
+    @property
+    def description(self) -> str:
+        """Human-readable lease backend description."""
+        return f"lock file {self.path}"
+
+    async def acquire(self) -> bool:
+        """
+        Try to take the lease without blocking.
+
+        Returns:
+            True if this process now holds the lease
+        """
+        if self._fd is not None:
+            return True
+        if not FCNTL_AVAILABLE:
+            # No flock on this platform - assume a single process
+            logger.warning("File locking unavailable; assuming a single worker")
+            self._fd = -1
+            return True
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    async def is_held(self) -> bool:
+        """Whether this process still holds the lease."""
+        return self._fd is not None
+
+    async def release(self) -> None:
+        """Release the lease if held."""
+        if self._fd is None:
+            return
+        if self._fd >= 0:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            finally:
+                os.close(self._fd)
+        self._fd = None
+
+
+class PostgresAdvisoryLease:
+    """
+    Leader lease held as a PostgreSQL session-level advisory lock.
+
+    The lock lives as long as the dedicated connection; if the connection is
+    lost the lease is lost with it, which is_held() detects.
+
+    Args:
+        engine: Async SQLAlchemy engine for the PostgreSQL database
+        key: Advisory lock key
+    """
+
+    def __init__(self, engine: "AsyncEngine", key: int = LEADER_LOCK_KEY) -> None:
+        """Initialize the advisory lock lease."""
+        self.engine = engine
+        self.key = key
+        self._conn: Optional["AsyncConnection"] = None
+
+    @property
+    def description(self) -> str:
+        """Human-readable lease backend description."""
+        return f"PostgreSQL advisory lock {self.key}"
+
+    async def acquire(self) -> bool:
+        """
+        Try to take the lease without blocking.
+
+        Returns:
+            True if this process now holds the lease
+        """
+        if self._conn is not None:
+            return True
+        conn = await self.engine.connect()
+        try:
+            result = await conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}
+            )
+            acquired = bool(result.scalar())
+        except Exception:
+            await conn.close()
+            raise
+        if not acquired:
+            await conn.close()
+            return False
+        self._conn = conn
+        return True
+
+    async def is_held(self) -> bool:
+        """Whether the lock's connection is still alive."""
+        if self._conn is None:
+            return False
+        try:
+            await self._conn.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logger.warning(f"Leader lock connection lost: {e}")
+            await self._discard_connection()
+            return False
+
+    async def release(self) -> None:
+        """Release the lease if held."""
+        if self._conn is None:
+            return
+        try:
+            await self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.key})
+        except Exception as e:
+            logger.debug(f"Failed to unlock leader lock: {e}")
+        await self._discard_connection()
+
+    async def _discard_connection(self) -> None:
+        """Close the lock connection, ignoring errors."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                await conn.close()
+            except Exception:
+                pass
+
+
+def create_lease(
+    database_url: Optional[str],
+    engine: Optional["AsyncEngine"] = None,
+    lock_path: Optional[str] = None,
+) -> Any:
+    """
+    Pick the lease backend for this deployment.
+
+    PostgreSQL databases use an advisory lock; everything else uses a lock
+    file (next to the SQLite database when there is one).
+
+    Args:
+        database_url: Configured database URL (may be None)
+        engine: Database engine, required for the PostgreSQL backend
+        lock_path: Explicit lock file path
+
+    Returns:
+        FileLease or PostgresAdvisoryLease
+    """
+    if database_url and database_url.startswith("postgresql") and engine is not None:
+        return PostgresAdvisoryLease(engine)
+
+    if lock_path is None:
+        if database_url and database_url.startswith("sqlite") and ":memory:" not in database_url:
+            lock_path = database_url.split("///", 1)[-1] + ".leader.lock"
+        else:
+            lock_path = os.path.join(tempfile.gettempdir(), "autoarr-leader.lock")
+    return FileLease(lock_path)
+
+
+class LeaderElector:
+    """
+    Competes for the leader lease and runs callbacks on election/demotion.
+
+    Args:
+        lease: Lease backend (FileLease or PostgresAdvisoryLease)
+        on_elected: Coroutine function called when this worker becomes leader
+        on_demoted: Coroutine function called when this worker loses the lease
+        retry_interval: Seconds between lease attempts / lease checks
+    """
+
+    def __init__(
+        self,
+        lease: Any,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Optional[Callable[[], Awaitable[None]]] = None,
+        retry_interval: float = 5.0,
+    ) -> None:
+        """Initialize the elector."""
+        self.lease = lease
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.retry_interval = retry_interval
+        self.is_leader = False
+        self.elections = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Make a first lease attempt now, then keep competing in the background."""
+        await self._step()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self, before_release: Optional[Callable[[], Awaitable[None]]] = None) -> None:
+        """
+        Stop competing and release the lease.
+
+        Args:
+            before_release: Awaited after the election loop stops but while the
+                lease is still held (e.g. to stop background services, so no
+                follower starts its copies while this worker's still run)
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            if before_release is not None:
+                await before_release()
+        finally:
+            await self.lease.release()
+            self.is_leader = False
+
+    async def _run(self) -> None:
+        """Election loop; errors are logged and retried."""
+        while True:
+            await asyncio.sleep(self.retry_interval)
+            try:
+                await self._step()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Leader election step failed: {e}", exc_info=True)
+
+    async def _step(self) -> None:
+        """Acquire the lease as a follower, or verify it as the leader."""
+        if not self.is_leader:
+            if await self.lease.acquire():
+                self.is_leader = True
+                self.elections += 1
+                logger.info(f"Worker {os.getpid()} elected leader ({self.lease.description})")
+                await self.on_elected()
+        elif not await self.lease.is_held():
+            self.is_leader = False
+            logger.warning(f"Worker {os.getpid()} lost the leader lease")
+            if self.on_demoted is not None:
+                await self.on_demoted()
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get election status for this worker.
+
+        Returns:
+            Dict with pid, leadership and lease backend
+        """
+        return {
+            "pid": os.getpid(),
+            "is_leader": self.is_leader,
+            "elections": self.elections,
+            "lease": self.lease.description,
+            "retry_interval_seconds": self.retry_interval,
+        }
+
+
+# Global elector instance (only set in multi-worker mode)
+_elector: Optional[LeaderElector] = None
+
+
+def get_leader_elector() -> Optional[LeaderElector]:
+    """
+    Get the global leader elector.
+
+    Returns:
+        Leader elector, or None when leader election is not in use
+    """
+    return _elector
+
+
+async def initialize_leader_election(
+    lease: Any,
+    on_elected: Callable[[], Awaitable[None]],
+    on_demoted: Optional[Callable[[], Awaitable[None]]] = None,
+    retry_interval: float = 5.0,
+) -> LeaderElector:
+    """
+    Create, start and register the leader elector.
+
+    Args:
+        lease: Lease backend
+        on_elected: Called when this worker becomes leader
+        on_demoted: Called when this worker loses the lease
+        retry_interval: Seconds between lease attempts
+
+    Returns:
+        Started leader elector
+    """
+    global _elector
+    _elector = LeaderElector(lease, on_elected, on_demoted, retry_interval=retry_interval)
+    await _elector.start()
+    return _elector
+
+
+async def shutdown_leader_election(
+    before_release: Optional[Callable[[], Awaitable[None]]] = None,
+) -> None:
+    """
+    Stop the leader elector and release the lease.
+
+    Args:
+        before_release: Awaited before the lease is released
+    """
+    global _elector
+    if _elector is not None:
+        await _elector.stop(before_release)
+        _elector = None
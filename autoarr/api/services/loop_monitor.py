@@ -0,0 +1,232 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Event loop lag monitor.
+
+A background task sleeps for a fixed interval and measures how late it
+wakes up. That scheduling delay is time the loop spent running other
+callbacks, i.e. how long CPU-bound or blocking code on the loop (HTML/XML
+parsing, large JSON serialization, synchronous logging handlers) held up
+every other request. Recent samples give lag percentiles, and every sample
+goes to the autoarr_event_loop_lag_seconds histogram.
+
+In debug mode the loop also runs with asyncio debug mode, which reports
+each callback or task step that ran longer than the slow callback
+threshold. Those reports identify the call site that blocked the loop.
+Debug mode slows every callback down, so it is off by default.
+"""
+
+import asyncio
+import logging
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from autoarr.shared.core.metrics import EVENT_LOOP_LAG, EVENT_LOOP_SLOW_CALLBACKS
+
+from .profiler import SlowCallbackRecorder
+
+logger = logging.getLogger(__name__)
+
+# Slow callbacks listed in the status report
+MAX_REPORTED_CALLBACKS = 20
+
+
+class _CountingSlowCallbackRecorder(SlowCallbackRecorder):
+    """Slow callback recorder that also counts reports in the metrics."""
+
+    def record(self, description: str, seconds: float) -> None:
+        """Add one slow callback."""
+        EVENT_LOOP_SLOW_CALLBACKS.inc()
+        super().record(description, seconds)
+
+
+class LoopLagMonitor:
+    """
+    Samples event loop scheduling delay in the background.
+
+    Args:
+        interval: Seconds between lag samples
+        window: Number of recent samples used for percentiles
+        debug: Run the loop in asyncio debug mode to capture slow callbacks
+        slow_callback_threshold: Seconds a callback may block the loop before
+            it is reported (debug mode only)
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.5,
+        window: int = 600,
+        debug: bool = False,
+        slow_callback_threshold: float = 0.1,
+    ) -> None:
+        """Initialize the monitor."""
+        self.interval = interval
+        self.debug = debug
+        self.slow_callback_threshold = slow_callback_threshold
+        self.sample_count = 0
+        self.max_lag = 0.0
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._recorder: Optional[SlowCallbackRecorder] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the sampling task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sampling on the running event loop."""
+        if self.is_running:
+            return
+        if self.debug:
+            self._recorder = _CountingSlowCallbackRecorder(self.slow_callback_threshold)
+            self._recorder.install(asyncio.get_running_loop())
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"Event loop lag monitor started (interval: {self.interval}s, debug: {self.debug})"
+        )
+
+    async def stop(self) -> None:
+        """Stop sampling and restore the loop's debug settings."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._recorder is not None:
+            self._recorder.uninstall()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            due = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, loop.time() - due))
+
+    def record(self, lag: float) -> None:
+        """
+        Record one lag sample.
+
+        Args:
+            lag: Seconds the probe ran after it was due
+        """
+        self._samples.append(lag)
+        self.sample_count += 1
+        self.max_lag = max(self.max_lag, lag)
+        EVENT_LOOP_LAG.observe(lag)
+
+    def percentiles(self) -> Dict[str, float]:
+        """
+        Lag percentiles over the recent samples.
+
+        Returns:
+            p50, p90, p99 and max lag in milliseconds (zeros before the first sample)
+        """
+        samples = sorted(self._samples)
+        if not samples:
+            return {"p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+
+        def nearest_rank(percent: float) -> float:
+            index = max(0, math.ceil(percent / 100 * len(samples)) - 1)
+            return round(samples[index] * 1000, 2)
+
+        return {
+            "p50": nearest_rank(50),
+            "p90": nearest_rank(90),
+            "p99": nearest_rank(99),
+            "max": round(samples[-1] * 1000, 2),
+        }
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get lag statistics and, in debug mode, the slowest callbacks.
+
+        Returns:
+            Dict with monitor state, lag percentiles and slow callbacks
+        """
+        status: Dict[str, Any] = {
+            "is_running": self.is_running,
+            "interval_seconds": self.interval,
+            "sample_count": self.sample_count,
+            "window_samples": len(self._samples),
+            "lag_ms": self.percentiles(),
+            "max_lag_ms_since_start": round(self.max_lag * 1000, 2),
+            "debug": self.debug,
+        }
+        if self._recorder is not None:
+            status["slow_callback_threshold_ms"] = round(self.slow_callback_threshold * 1000, 1)
+            status["slow_callbacks"] = [
+                {
+                    "callback": entry.callback,
+                    "count": entry.count,
+                    "total_ms": round(entry.total_seconds * 1000, 1),
+                    "max_ms": round(entry.max_seconds * 1000, 1),
+                }
+                for entry in self._recorder.report()[:MAX_REPORTED_CALLBACKS]
+            ]
+        return status
+
+
+# ============================================================================
+# Global Instance
+# ============================================================================
+
+_loop_monitor: Optional[LoopLagMonitor] = None
+
+
+def get_loop_monitor() -> Optional[LoopLagMonitor]:
+    """
+    Get the global loop lag monitor.
+
+    Returns:
+        Loop lag monitor or None if it is not running
+    """
+    return _loop_monitor
+
+
+def start_loop_monitor(
+    interval: float = 0.5,
+    debug: bool = False,
+    slow_callback_threshold: float = 0.1,
+) -> LoopLagMonitor:
+    """
+    Create, start and register the loop lag monitor.
+
+    Args:
+        interval: Seconds between lag samples
+        debug: Run the loop in asyncio debug mode to capture slow callbacks
+        slow_callback_threshold: Seconds a callback may block the loop before
+            it is reported (debug mode only)
+
+    Returns:
+        Started loop lag monitor
+    """
+    global _loop_monitor
+    _loop_monitor = LoopLagMonitor(
+        interval=interval, debug=debug, slow_callback_threshold=slow_callback_threshold
+    )
+    _loop_monitor.start()
+    return _loop_monitor
+
+
+async def stop_loop_monitor() -> None:
+    """Stop the loop lag monitor."""
+    global _loop_monitor
+    if _loop_monitor is not None:
+        await _loop_monitor.stop()
+        _loop_monitor = None
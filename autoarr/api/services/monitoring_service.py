@@ -36,6 +36,7 @@ proactive recovery and intelligent retry strategies.
 import asyncio
 import logging
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -44,6 +45,7 @@ from uuid import uuid4
 
 from autoarr.api.services.event_bus import Event, EventBus, EventType
 from autoarr.shared.core.mcp_orchestrator import MCPOrchestrator
+from autoarr.shared.core.metrics import MONITORING_POLL_DURATION, MONITORING_POLL_ERRORS
 
 logger = logging.getLogger(__name__)
 
@@ -709,6 +711,8 @@ class MonitoringService:
 
         while not self._stop_monitoring:
             try:
+                started = time.perf_counter()
+
                 # Poll queue
                 await self.poll_queue()
 
@@ -720,6 +724,8 @@ class MonitoringService:
                 if self.config.failure_detection_enabled:
                     await self.check_and_alert_failures()
 
+                MONITORING_POLL_DURATION.observe(time.perf_counter() - started)
+
                 # Wait for next poll
                 await asyncio.sleep(self.config.poll_interval)
 
@@ -728,6 +734,7 @@ class MonitoringService:
                 self._is_running = False
                 break
             except Exception as e:
+                MONITORING_POLL_ERRORS.inc()
                 logger.error(f"Error in monitoring loop: {e}", exc_info=True)
                 self._last_error = str(e)
                 # Continue monitoring even after errors
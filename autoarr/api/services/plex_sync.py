@@ -0,0 +1,412 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Plex Library Sync Service.
+
+Keeps a local copy of every Plex library section in the database so media
+browsing, search and recently-added views can be served without querying Plex.
+
+Each pass walks the library sections and, per section, either:
+- pulls only items changed since the section's updatedAt/addedAt high-water
+  marks (delta pass), or
+- walks the whole section and sweeps rows it did not see (full reconcile),
+  which also catches deletions that deltas cannot observe.
+
+A section is fully reconciled on its first sync and then every
+``full_reconcile_interval`` seconds.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from autoarr.api.database import Database, PlexLibraryRepository, PlexSyncState
+
+if TYPE_CHECKING:
+    from autoarr.api.services.tool_providers import PlexToolProvider
+
+logger = logging.getLogger(__name__)
+
+# Item fields kept in the local copy (nested Media/Part/Genre data is dropped)
+SYNC_FIELDS = (
+    "ratingKey",
+    "key",
+    "type",
+    "title",
+    "originalTitle",
+    "titleSort",
+    "year",
+    "addedAt",
+    "updatedAt",
+    "thumb",
+    "art",
+    "summary",
+    "duration",
+    "contentRating",
+    "rating",
+    "audienceRating",
+    "viewCount",
+    "leafCount",
+    "childCount",
+    "parentTitle",
+    "grandparentTitle",
+    "index",
+    "parentIndex",
+    "librarySectionID",
+)
+
+
+class PlexSyncService:
+    """
+    Background incremental sync of Plex libraries into the database.
+
+    Args:
+        db: Database holding the local library copy
+        provider: Plex tool provider used to reach Plex
+        interval: Seconds between sync passes
+        full_reconcile_interval: Seconds between full reconciles of a section
+        batch_size: Items written per database batch
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        provider: "PlexToolProvider",
+        interval: float = 300.0,
+        full_reconcile_interval: float = 86400.0,
+        batch_size: int = 500,
+    ) -> None:
+        """Initialize the sync service."""
+        self.repository = PlexLibraryRepository(db)
+        self.provider = provider
+        self.interval = interval
+        self.full_reconcile_interval = full_reconcile_interval
+        self.batch_size = batch_size
+
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._has_data = False
+
+        # Statistics
+        self.passes = 0
+        self.full_syncs = 0
+        self.delta_syncs = 0
+        self.items_written = 0
+        self.items_deleted = 0
+        self.last_pass_at: Optional[datetime] = None
+        self.last_pass_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background loop is running."""
+        return self._task is not None and not self._task.done()
+
+    async def has_data(self) -> bool:
+        """
+        Check whether the local copy can serve queries.
+
+        Returns:
+            True once at least one section has been synced
+        """
+        if not self._has_data:
+            self._has_data = bool(await self.repository.get_sync_states())
+        return self._has_data
+
+    def start(self) -> None:
+        """Start the background sync loop."""
+        if self.is_running:
+            logger.warning("Plex sync already running")
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"Plex sync started (interval: {self.interval}s, "
+            f"full reconcile: {self.full_reconcile_interval}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the background sync loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Plex sync stopped")
+
+    async def _run(self) -> None:
+        """Sync loop; errors are logged and retried on the next pass."""
+        while True:
+            try:
+                if await self.provider.is_available():
+                    await self.sync()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"Plex sync pass failed: {e}", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+    async def sync(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Run one sync pass over every library section.
+
+        Args:
+            full: Force a full reconcile of every section
+
+        Returns:
+            Dict with per-section results and pass duration
+        """
+        async with self._lock:
+            started = time.perf_counter()
+            result = await self.provider.execute("plex_get_libraries", {})
+            if not result.success:
+                raise RuntimeError(f"Could not list Plex libraries: {result.error}")
+            libraries = [lib for lib in result.data.get("libraries", []) if lib.get("key")]
+
+            # Drop sections that no longer exist in Plex
+            current = {str(lib["key"]) for lib in libraries}
+            for state in await self.repository.get_sync_states():
+                if state.section_key not in current:
+                    self.items_deleted += await self.repository.delete_section(state.section_key)
+                    logger.info(f"Removed local copy of deleted Plex section {state.section_key}")
+
+            sections = []
+            for library in libraries:
+                sections.append(await self._sync_section(library, full))
+
+            self.passes += 1
+            self.last_pass_at = datetime.utcnow()
+            self.last_pass_duration = time.perf_counter() - started
+            self.last_error = None
+            self._has_data = True
+            return {"duration_seconds": self.last_pass_duration, "sections": sections}
+
+    async def _sync_section(self, library: Dict[str, Any], force_full: bool) -> Dict[str, Any]:
+        """
+        Sync one library section (delta or full).
+
+        Args:
+            library: Plex library section dict
+            force_full: Force a full reconcile
+
+        Returns:
+            Dict with section key, mode and item counts
+        """
+        section_key = str(library["key"])
+        state = await self.repository.get_sync_state(section_key)
+        now = datetime.utcnow()
+        full = force_full or self._needs_full_sync(state, now)
+
+        max_updated = None if full or state is None else state.max_updated_at
+        max_added = None if full or state is None else state.max_added_at
+        filters = self._delta_filters(max_updated, max_added) if not full else None
+        if not full and filters is None:
+            full = True
+
+        written = 0
+        batch: List[Dict[str, Any]] = []
+        async for item in self.provider.iter_library_items(
+            section_key, fields=list(SYNC_FIELDS), filters=filters
+        ):
+            batch.append(item)
+            max_updated = _max(max_updated, item.get("updatedAt"))
+            max_added = _max(max_added, item.get("addedAt"))
+            if len(batch) >= self.batch_size:
+                written += await self.repository.upsert_items(section_key, batch, now)
+                batch = []
+        if batch:
+            written += await self.repository.upsert_items(section_key, batch, now)
+
+        deleted = await self.repository.delete_stale(section_key, before=now) if full else 0
+
+        fields: Dict[str, Any] = {
+            "title": library.get("title"),
+            "section_type": library.get("type"),
+            "max_updated_at": max_updated,
+            "max_added_at": max_added,
+            "item_count": await self.repository.count(section_key),
+            "last_sync_at": now,
+        }
+        if full:
+            fields["last_full_sync_at"] = now
+            self.full_syncs += 1
+        else:
+            self.delta_syncs += 1
+        await self.repository.save_sync_state(section_key, **fields)
+
+        self.items_written += written
+        self.items_deleted += deleted
+        logger.debug(
+            f"Plex section {section_key} synced ({'full' if full else 'delta'}): "
+            f"{written} written, {deleted} deleted"
+        )
+        return {
+            "section_key": section_key,
+            "mode": "full" if full else "delta",
+            "written": written,
+            "deleted": deleted,
+        }
+
+    def _needs_full_sync(self, state: Optional[PlexSyncState], now: datetime) -> bool:
+        """Whether a section is due for a full reconcile."""
+        if state is None or state.last_full_sync_at is None:
+            return True
+        return now - state.last_full_sync_at >= timedelta(seconds=self.full_reconcile_interval)
+
+    @staticmethod
+    def _delta_filters(
+        max_updated_at: Optional[int], max_added_at: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the Plex filter for items changed since the watermarks.
+
+        updatedAt covers both edits and new items; addedAt is the fallback for
+        sections whose items carry no updatedAt. The watermark is re-read
+        inclusively (one second back) since upserts are idempotent.
+
+        Returns:
+            Filter parameters, or None if no watermark is known
+        """
+        if max_updated_at is not None:
+            return {"updatedAt>>": max_updated_at - 1}
+        if max_added_at is not None:
+            return {"addedAt>>": max_added_at - 1}
+        return None
+
+    async def get_status(self) -> Dict[str, Any]:
+        """
+        Get sync status and per-section watermarks.
+
+        Returns:
+            Dict with loop state, counters and section states
+        """
+        states = await self.repository.get_sync_states()
+        return {
+            "running": self.is_running,
+            "interval_seconds": self.interval,
+            "full_reconcile_interval_seconds": self.full_reconcile_interval,
+            "passes": self.passes,
+            "full_syncs": self.full_syncs,
+            "delta_syncs": self.delta_syncs,
+            "items_written": self.items_written,
+            "items_deleted": self.items_deleted,
+            "last_pass_at": self.last_pass_at.isoformat() if self.last_pass_at else None,
+            "last_pass_duration_seconds": self.last_pass_duration,
+            "last_error": self.last_error,
+            "sections": [
+                {
+                    "section_key": state.section_key,
+                    "title": state.title,
+                    "type": state.section_type,
+                    "item_count": state.item_count,
+                    "max_updated_at": state.max_updated_at,
+                    "max_added_at": state.max_added_at,
+                    "last_sync_at": state.last_sync_at.isoformat() if state.last_sync_at else None,
+                    "last_full_sync_at": (
+                        state.last_full_sync_at.isoformat() if state.last_full_sync_at else None
+                    ),
+                }
+                for state in states
+            ],
+        }
+
+
+def _max(current: Optional[int], value: Any) -> Optional[int]:
+    """Fold a Plex timestamp (int or numeric string) into a running maximum."""
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return current
+    return value if current is None or value > current else current
+
+
+# Global sync service instance (initialized on startup)
+_sync_instance: Optional[PlexSyncService] = None
+
+
+def get_plex_sync_service() -> Optional[PlexSyncService]:
+    """
+    Get the global Plex sync service.
+
+    Returns:
+        Plex sync service or None if not initialized
+    """
+    return _sync_instance
+
+
+def set_plex_sync_service(service: Optional[PlexSyncService]) -> None:
+    """
+    Set the global Plex sync service.
+
+    Args:
+        service: Plex sync service (or None to clear)
+    """
+    global _sync_instance
+    _sync_instance = service
+
+
+async def get_local_library() -> Optional[PlexSyncService]:
+    """
+    Get the Plex sync service if its local library copy can serve queries.
+
+    Returns:
+        Plex sync service, or None if sync is disabled or has not stored any items yet
+    """
+    sync = get_plex_sync_service()
+    if sync is not None and await sync.has_data():
+        return sync
+    return None
+
+
+async def initialize_plex_sync(
+    db: Database,
+    provider: "PlexToolProvider",
+    interval: float = 300.0,
+    full_reconcile_interval: float = 86400.0,
+) -> PlexSyncService:
+    """
+    Create, start and register the Plex sync service.
+
+    Args:
+        db: Database instance
+        provider: Plex tool provider
+        interval: Seconds between sync passes
+        full_reconcile_interval: Seconds between full reconciles
+
+    Returns:
+        Started Plex sync service
+    """
+    service = PlexSyncService(
+        db, provider, interval=interval, full_reconcile_interval=full_reconcile_interval
+    )
+    service.start()
+    set_plex_sync_service(service)
+    return service
+
+
+async def shutdown_plex_sync() -> None:
+    """Stop the Plex sync service."""
+    service = get_plex_sync_service()
+    if service:
+        await service.stop()
+        set_plex_sync_service(None)
@@ -0,0 +1,327 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+On-demand sampling profiler for the running process.
+
+A profile runs for a fixed duration and combines two views of where the
+event loop spends its time:
+
+- StackSampler: a background thread reads the event loop thread's current
+  stack (sys._current_frames) at a fixed interval. The loop is never paused;
+  the sampler only holds the GIL while it walks one stack. Samples are
+  aggregated into collapsed stacks (``frame;frame;frame count`` per line),
+  the input format of flamegraph.pl, speedscope and inferno.
+- SlowCallbackRecorder: asyncio debug mode reports every callback or task
+  step that ran longer than ``loop.slow_callback_duration``. Debug mode is
+  switched on only for the duration of the profile and then restored.
+
+Only one profile can run at a time.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import CodeType, FrameType
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Frames kept per sampled stack (deeper stacks keep their innermost frames)
+MAX_STACK_DEPTH = 128
+
+# Distinct stacks kept per profile; later new stacks are counted as truncated
+MAX_STACKS = 20000
+
+TRUNCATED_STACK = "[truncated]"
+
+# Message asyncio logs in debug mode for slow callbacks (base_events._run_once)
+_SLOW_CALLBACK_MESSAGE = "Executing %s took %.3f seconds"
+
+# Volatile parts of handle descriptions (object addresses, task numbers)
+_ADDRESS_RE = re.compile(r" at 0x[0-9a-fA-F]+")
+_TASK_NAME_RE = re.compile(r"name='Task-\d+' ")
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+def _short_path(filename: str) -> str:
+    """Shorten a source path to the part below site-packages or from the autoarr package down."""
+    index = filename.rfind("site-packages" + os.sep)
+    if index != -1:
+        return filename[index + len("site-packages") + 1 :]
+    index = filename.rfind(os.sep + "autoarr" + os.sep)
+    if index != -1:
+        return filename[index + 1 :]
+    return os.path.basename(filename)
+
+
+class StackSampler:
+    """
+    Periodically samples a thread's stack from a background thread.
+
+    Args:
+        thread_id: Thread to sample (the event loop thread)
+        interval: Seconds between samples
+    """
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        """Initialize the sampler."""
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.sample_count = 0
+        self._labels: Dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread = threading.Thread(target=self._run, name="autoarr-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        next_sample = time.perf_counter()
+        while not self._stop.is_set():
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self._record(frame)
+            del frame
+            next_sample += self.interval
+            delay = next_sample - time.perf_counter()
+            if delay < 0:
+                # Fell behind (e.g. a long GIL hold); skip missed samples
+                next_sample = time.perf_counter()
+                delay = 0
+            self._stop.wait(delay)
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, "co_qualname", code.co_name)
+            label = f"{name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+            # ";" separates frames in the collapsed format
+            label = self._labels[code] = label.replace(";", ":")
+        return label
+
+    def _record(self, frame: Optional[FrameType]) -> None:
+        labels: List[str] = []
+        while frame is not None and len(labels) < MAX_STACK_DEPTH:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        stack = ";".join(reversed(labels))
+        if stack not in self.stacks and len(self.stacks) >= MAX_STACKS:
+            stack = TRUNCATED_STACK
+        self.stacks[stack] += 1
+        self.sample_count += 1
+
+
+@dataclass
+class SlowCallback:
+    """Callbacks/task steps with the same description that blocked the loop."""
+
+    callback: str
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class SlowCallbackRecorder(logging.Handler):
+    """
+    Collects asyncio debug-mode slow callback reports for one event loop.
+
+    Args:
+        threshold: Seconds a callback may run before it is reported
+        max_callbacks: Distinct callbacks kept; reports of further callbacks
+            are only counted in ``dropped``
+    """
+
+    def __init__(self, threshold: float, max_callbacks: int = 1000) -> None:
+        """Initialize the recorder."""
+        super().__init__(level=logging.WARNING)
+        self.threshold = threshold
+        self.max_callbacks = max_callbacks
+        self.callbacks: Dict[str, SlowCallback] = {}
+        self.dropped = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._saved_debug = False
+        self._saved_duration = 0.1
+        self._saved_level = logging.NOTSET
+
+    def install(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Enable slow callback reporting on the loop."""
+        self._loop = loop
+        self._saved_debug = loop.get_debug()
+        self._saved_duration = loop.slow_callback_duration
+        asyncio_logger = logging.getLogger("asyncio")
+        self._saved_level = asyncio_logger.level
+        if asyncio_logger.getEffectiveLevel() > logging.WARNING:
+            asyncio_logger.setLevel(logging.WARNING)
+        asyncio_logger.addHandler(self)
+        loop.slow_callback_duration = self.threshold
+        loop.set_debug(True)
+
+    def uninstall(self) -> None:
+        """Restore the loop's debug settings."""
+        if self._loop is None:
+            return
+        self._loop.set_debug(self._saved_debug)
+        self._loop.slow_callback_duration = self._saved_duration
+        asyncio_logger = logging.getLogger("asyncio")
+        asyncio_logger.removeHandler(self)
+        asyncio_logger.setLevel(self._saved_level)
+        self._loop = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Record a slow callback report."""
+        if record.msg != _SLOW_CALLBACK_MESSAGE or not isinstance(record.args, tuple):
+            return
+        description, seconds = record.args
+        self.record(str(description), seconds)
+
+    def record(self, description: str, seconds: float) -> None:
+        """
+        Add one slow callback.
+
+        Args:
+            description: asyncio's description of the handle or task
+            seconds: How long it blocked the loop
+        """
+        key = _TASK_NAME_RE.sub("", _ADDRESS_RE.sub("", description))
+        entry = self.callbacks.get(key)
+        if entry is None:
+            if len(self.callbacks) >= self.max_callbacks:
+                self.dropped += 1
+                return
+            entry = self.callbacks[key] = SlowCallback(callback=key)
+        entry.count += 1
+        entry.total_seconds += seconds
+        entry.max_seconds = max(entry.max_seconds, seconds)
+
+    def report(self) -> List[SlowCallback]:
+        """Slow callbacks, most total blocking time first."""
+        return sorted(self.callbacks.values(), key=lambda c: c.total_seconds, reverse=True)
+
+
+@dataclass
+class ProfileResult:
+    """Result of one profiling run."""
+
+    started_at: datetime
+    duration: float
+    interval: float
+    slow_callback_threshold: float
+    sample_count: int
+    stacks: Dict[str, int] = field(default_factory=dict)
+    slow_callbacks: List[SlowCallback] = field(default_factory=list)
+
+    def collapsed(self) -> str:
+        """Render the samples as collapsed stacks, heaviest first."""
+        lines = [
+            f"{stack} {count}"
+            for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1])
+        ]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def slow_callback_report(self) -> str:
+        """Render the slow callbacks as a plain text report."""
+        lines = [
+            f"Slow callbacks (> {self.slow_callback_threshold * 1000:.0f} ms) "
+            f"during a {self.duration:.1f}s profile started {self.started_at.isoformat()}Z",
+            "",
+        ]
+        if not self.slow_callbacks:
+            lines.append("None")
+        for entry in self.slow_callbacks:
+            lines.append(
+                f"{entry.count:5d}x  total {entry.total_seconds * 1000:8.1f} ms  "
+                f"max {entry.max_seconds * 1000:7.1f} ms  {entry.callback}"
+            )
+        return "\n".join(lines) + "\n"
+
+
+_profile_running = False
+
+
+async def run_profile(
+    duration: float,
+    interval: float = 0.01,
+    slow_callback_threshold: float = 0.1,
+) -> ProfileResult:
+    """
+    Profile the event loop thread for a fixed duration.
+
+    Args:
+        duration: Seconds to profile for
+        interval: Seconds between stack samples
+        slow_callback_threshold: Seconds a callback may block the loop before
+            it is reported
+
+    Returns:
+        Collapsed stacks and slow callbacks seen during the profile
+
+    Raises:
+        ProfilerBusyError: If another profile is running
+    """
+    global _profile_running
+    if _profile_running:
+        raise ProfilerBusyError("A profile is already running")
+    _profile_running = True
+
+    loop = asyncio.get_running_loop()
+    sampler = StackSampler(threading.get_ident(), interval)
+    recorder = SlowCallbackRecorder(slow_callback_threshold)
+    started_at = datetime.utcnow()
+    logger.info(f"Starting {duration:.1f}s sampling profile ({interval * 1000:.0f} ms interval)")
+    try:
+        recorder.install(loop)
+        sampler.start()
+        await asyncio.sleep(duration)
+    finally:
+        sampler.stop()
+        recorder.uninstall()
+        _profile_running = False
+
+    result = ProfileResult(
+        started_at=started_at,
+        duration=duration,
+        interval=interval,
+        slow_callback_threshold=slow_callback_threshold,
+        sample_count=sampler.sample_count,
+        stacks=dict(sampler.stacks),
+        slow_callbacks=recorder.report(),
+    )
+    logger.info(
+        f"Profile finished: {result.sample_count} samples, {len(result.stacks)} stacks, "
+        f"{len(result.slow_callbacks)} slow callbacks"
+    )
+    return result
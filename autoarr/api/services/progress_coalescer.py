@@ -0,0 +1,154 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Download Progress Coalescer.
+
+Sits between the EventBus and the WebSocketBridge and merges high-frequency
+DOWNLOAD_STATE_CHANGED events per nzo_id. Within each window, all updates for
+a download collapse into one delta event (first old_state, latest new_state,
+latest values for everything else). Terminal events (completed/failed) are
+never delayed: any pending delta for that download is flushed first so
+clients see events in order.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from .event_bus import Event, EventType
+
+logger = logging.getLogger(__name__)
+
+# Events that end a download's lifecycle and must be delivered immediately
+TERMINAL_EVENT_TYPES = frozenset(
+    {
+        EventType.DOWNLOAD_COMPLETED.value,
+        EventType.DOWNLOAD_FAILED.value,
+    }
+)
+
+
+class DownloadProgressCoalescer:
+    """
+    Merges download state changes per nzo_id within a time window.
+
+    Args:
+        emit: Callback invoked (on the event loop) with each event to deliver
+        window: Coalescing window in seconds
+    """
+
+    def __init__(self, emit: Callable[[Event], None], window: float = 1.0) -> None:
+        """Initialize the coalescer."""
+        self._emit = emit
+        self.window = window
+        self._pending: Dict[str, Event] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        # Statistics
+        self.events_received = 0
+        self.events_merged = 0
+        self.frames_emitted = 0
+
+    @property
+    def pending_count(self) -> int:
+        """Number of downloads with a delta waiting to be flushed."""
+        return len(self._pending)
+
+    def submit(self, event: Event) -> bool:
+        """
+        Offer an event to the coalescer.
+
+        Args:
+            event: Event from the event bus
+
+        Returns:
+            True if the event was absorbed (it will be emitted later as part of
+            a delta), False if the caller should deliver it now
+        """
+        nzo_id = event.data.get("nzo_id")
+        if nzo_id is None:
+            return False
+
+        if event.event_type in TERMINAL_EVENT_TYPES:
+            # Deliver any pending progress first so ordering is preserved
+            pending = self._pending.pop(nzo_id, None)
+            if pending is not None:
+                self._deliver(pending)
+            return False
+
+        if event.event_type != EventType.DOWNLOAD_STATE_CHANGED.value:
+            return False
+
+        self.events_received += 1
+        pending = self._pending.get(nzo_id)
+        if pending is None:
+            self._pending[nzo_id] = event.model_copy(
+                update={"data": {**event.data, "coalesced_updates": 1}}
+            )
+        else:
+            self._pending[nzo_id] = self._merge(pending, event)
+            self.events_merged += 1
+
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self.flush)
+        return True
+
+    def flush(self) -> None:
+        """Emit every pending delta now."""
+        self._timer = None
+        pending, self._pending = self._pending, {}
+        for event in pending.values():
+            self._deliver(event)
+
+    def close(self) -> None:
+        """Cancel the flush timer and discard pending deltas."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dict with received, merged and emitted counts
+        """
+        return {
+            "window_seconds": self.window,
+            "events_received": self.events_received,
+            "events_merged": self.events_merged,
+            "frames_emitted": self.frames_emitted,
+            "pending": self.pending_count,
+        }
+
+    def _deliver(self, event: Event) -> None:
+        """Emit one event, never letting a callback error escape."""
+        self.frames_emitted += 1
+        try:
+            self._emit(event)
+        except Exception as e:
+            logger.error(f"Error emitting coalesced event {event.event_type}: {e}")
+
+    @staticmethod
+    def _merge(pending: Event, update: Event) -> Event:
+        """Fold a newer state change into the pending delta."""
+        data = {**pending.data, **update.data}
+        data["old_state"] = pending.data.get("old_state", update.data.get("old_state"))
+        data["coalesced_updates"] = pending.data.get("coalesced_updates", 1) + 1
+        return update.model_copy(update={"data": data})
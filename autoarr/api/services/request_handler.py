@@ -23,16 +23,26 @@ This service provides intelligent content request processing including:
 - Content classification (movie vs TV show)
 - Metadata extraction from user queries
 - Integration with LLM for intelligent classification
+- Tiered classification (rules, memo, coalesced LLM) with hit-rate stats
 """
 
+import asyncio
+import logging
 import re
-from typing import Dict, List, Optional, cast
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, cast
 
 from pydantic import BaseModel, Field
 
 from autoarr.api.services.llm_agent import LLMAgent
 from autoarr.api.services.web_search_service import WebSearchService
 
+logger = logging.getLogger(__name__)
+
+# Classification tiers, in the order they are tried
+CLASSIFICATION_TIERS = ("rules", "cache", "coalesced", "llm", "fallback")
+
 
 class ContentRequest(BaseModel):
     """User content request model."""
@@ -80,6 +90,62 @@ class ContentSearchResult(BaseModel):
     match_confidence: float = Field(..., description="Match confidence (0.0-1.0)")
 
 
+class ClassificationStats:
+    """
+    Tracker for classification tier hits and latency.
+
+    Records which tier answered each classification and how long it took,
+    so the number of avoided LLM round-trips can be observed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize classification stats."""
+        self.counts: Dict[str, int] = {tier: 0 for tier in CLASSIFICATION_TIERS}
+        self.latency_ms: Dict[str, float] = {tier: 0.0 for tier in CLASSIFICATION_TIERS}
+
+    def record(self, tier: str, elapsed_ms: float) -> None:
+        """
+        Record a classification answered by a tier.
+
+        Args:
+            tier: Tier name (rules, cache, coalesced, llm, fallback)
+            elapsed_ms: Time spent classifying in milliseconds
+        """
+        self.counts[tier] = self.counts.get(tier, 0) + 1
+        self.latency_ms[tier] = self.latency_ms.get(tier, 0.0) + elapsed_ms
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get classification statistics.
+
+        Returns:
+            Dict with per-tier counts and latency, hit rates and avoided LLM calls
+        """
+        total = sum(self.counts.values())
+        tiers = {}
+        for tier, count in self.counts.items():
+            tiers[tier] = {
+                "count": count,
+                "hit_rate": count / total if total else 0.0,
+                "avg_latency_ms": self.latency_ms[tier] / count if count else 0.0,
+            }
+
+        return {
+            "total_classifications": total,
+            "llm_calls": self.counts["llm"],
+            "llm_calls_avoided": (
+                self.counts["rules"] + self.counts["cache"] + self.counts["coalesced"]
+            ),
+            "tiers": tiers,
+        }
+
+    def reset(self) -> None:
+        """Reset all statistics."""
+        for tier in self.counts:
+            self.counts[tier] = 0
+            self.latency_ms[tier] = 0.0
+
+
 class RequestHandler:
     """
     Request Handler for processing content requests.
@@ -87,9 +153,16 @@ class RequestHandler:
     This handler uses NLP techniques and LLM integration to intelligently
     classify and extract metadata from user content requests.
 
+    Classification is tiered: a compiled rule-based stage answers
+    high-confidence queries directly, a bounded LRU memo keyed on the
+    normalized query catches repeats, and only ambiguous queries reach the
+    LLM, with concurrent identical queries sharing a single call.
+
     Args:
         llm_agent: Optional LLM agent for intelligent classification
         web_search_service: Optional web search service for metadata lookup
+        rule_confidence_threshold: Minimum rule-based confidence to skip the LLM
+        cache_size: Maximum number of memoized LLM classifications
     """
 
     # Common filler words to remove during preprocessing
@@ -134,14 +207,35 @@ class RequestHandler:
     MOVIE_KEYWORDS = {"movie", "film", "cinema"}
     TV_KEYWORDS = {"series", "show", "season", "episode", "tv"}
 
+    # Precompiled patterns (compiled once at import time)
+    _QUALITY_REGEXES = [
+        (re.compile(pattern, re.IGNORECASE), quality)
+        for pattern, quality in QUALITY_PATTERNS.items()
+    ]
+    _TV_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in TV_PATTERNS]
+    _YEAR_REGEX = re.compile(r"\b(19\d{2}|20\d{2})\b")
+    _SEASON_EPISODE_REGEX = re.compile(r"s(\d{1,2})e(\d{1,2})", re.IGNORECASE)
+    _SEASON_REGEX = re.compile(r"season\s+(\d{1,2})")
+    _EPISODE_REGEX = re.compile(r"episode\s+(\d{1,3})")
+    _REQUEST_PHRASE_REGEX = re.compile(r"\b(add|download|get|find|the|new)\b", re.IGNORECASE)
+    _WHITESPACE_REGEX = re.compile(r"\s+")
+
     def __init__(
         self,
         llm_agent: Optional[LLMAgent] = None,
         web_search_service: Optional[WebSearchService] = None,
+        rule_confidence_threshold: float = 0.8,
+        cache_size: int = 512,
     ) -> None:
         """Initialize request handler."""
         self.llm_agent = llm_agent
         self.web_search_service = web_search_service
+        self.rule_confidence_threshold = rule_confidence_threshold
+        self.cache_size = cache_size
+
+        self.classification_stats = ClassificationStats()
+        self._classification_cache: "OrderedDict[str, ContentClassification]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Future[Optional[ContentClassification]]"] = {}
 
     def preprocess_query(self, query: str) -> str:
         """
@@ -159,7 +253,7 @@ class RequestHandler:
         processed = query.lower().strip()
 
         # Remove extra whitespace
-        processed = re.sub(r"\s+", " ", processed)
+        processed = self._WHITESPACE_REGEX.sub(" ", processed)
 
         # Remove filler words (but keep them in a separate list for context)
         words = processed.split()
@@ -183,8 +277,8 @@ class RequestHandler:
         """
         query_lower = query.lower()
 
-        for pattern, quality in self.QUALITY_PATTERNS.items():
-            if re.search(pattern, query_lower, re.IGNORECASE):
+        for regex, quality in self._QUALITY_REGEXES:
+            if regex.search(query_lower):
                 return quality
 
         return None
@@ -200,7 +294,7 @@ class RequestHandler:
             Year as integer or None if not found
         """
         # Look for 4-digit year (1900-2099)
-        year_match = re.search(r"\b(19\d{2}|20\d{2})\b", query)
+        year_match = self._YEAR_REGEX.search(query)
         if year_match:
             return int(year_match.group(1))
 
@@ -221,19 +315,19 @@ class RequestHandler:
         query_lower = query.lower()
 
         # Try S01E01 pattern
-        match = re.search(r"s(\d{1,2})e(\d{1,2})", query_lower, re.IGNORECASE)
+        match = self._SEASON_EPISODE_REGEX.search(query_lower)
         if match:
             metadata["season"] = int(match.group(1))
             metadata["episode"] = int(match.group(2))
             return metadata
 
         # Try season number
-        match = re.search(r"season\s+(\d{1,2})", query_lower)
+        match = self._SEASON_REGEX.search(query_lower)
         if match:
             metadata["season"] = int(match.group(1))
 
         # Try episode number
-        match = re.search(r"episode\s+(\d{1,3})", query_lower)
+        match = self._EPISODE_REGEX.search(query_lower)
         if match:
             metadata["episode"] = int(match.group(1))
 
@@ -254,21 +348,21 @@ class RequestHandler:
 
         if remove_metadata:
             # Remove quality indicators
-            for pattern in self.QUALITY_PATTERNS.keys():
-                title = re.sub(pattern, "", title, flags=re.IGNORECASE)
+            for regex, _ in self._QUALITY_REGEXES:
+                title = regex.sub("", title)
 
             # Remove TV patterns
-            for pattern in self.TV_PATTERNS:
-                title = re.sub(pattern, "", title, flags=re.IGNORECASE)
+            for regex in self._TV_REGEXES:
+                title = regex.sub("", title)
 
             # Remove year
-            title = re.sub(r"\b(19\d{2}|20\d{2})\b", "", title)
+            title = self._YEAR_REGEX.sub("", title)
 
             # Remove common request phrases
-            title = re.sub(r"\b(add|download|get|find|the|new)\b", "", title, flags=re.IGNORECASE)
+            title = self._REQUEST_PHRASE_REGEX.sub("", title)
 
         # Clean up whitespace
-        title = re.sub(r"\s+", " ", title).strip()
+        title = self._WHITESPACE_REGEX.sub(" ", title).strip()
 
         return title
 
@@ -320,11 +414,32 @@ class RequestHandler:
             confidence=confidence,
         )
 
+    def classify_content_rules(self, query: str) -> Optional[ContentClassification]:
+        """
+        Rule-based classification tier.
+
+        Answers only when the compiled rules are confident enough (e.g.
+        "The Office S03E04 1080p"); ambiguous queries return None.
+
+        Args:
+            query: User query
+
+        Returns:
+            ContentClassification if confident, otherwise None
+        """
+        classification = self.classify_content_simple(query)
+        if classification.title and classification.confidence >= self.rule_confidence_threshold:
+            return classification
+        return None
+
     async def classify_content(self, query: str) -> ContentClassification:
         """
         Classify content request using LLM (if available) or simple classification.
 
-        This is the main classification method that should be used.
+        This is the main classification method that should be used. Tiers are
+        tried in order: rules, memoized result, then (only when an LLM agent is
+        configured) an in-flight LLM call for the same normalized query or a new
+        LLM call. Anything left falls back to simple classification.
 
         Args:
             query: User query
@@ -338,19 +453,108 @@ class RequestHandler:
         if not query or not query.strip():
             raise ValueError("Query cannot be empty")
 
-        # Preprocess query
-        self.preprocess_query(query)
+        started = time.perf_counter()
+
+        # Preprocess query (normalized form is the memo key)
+        cache_key = self.preprocess_query(query)
+
+        # Confident rule matches never need the LLM
+        rule_result = self.classify_content_rules(query)
+        if rule_result is not None:
+            self._record_tier("rules", started)
+            return rule_result
+
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            self._record_tier("cache", started)
+            return cached
 
-        # If LLM agent is available, use it
+        # If LLM agent is available, only ambiguous queries reach it
         if self.llm_agent:
-            try:
-                return await self.classify_content_llm(query)
-            except Exception:
-                # Fall back to simple classification if LLM fails
-                pass
+            inflight = self._inflight.get(cache_key)
+            if inflight is not None:
+                shared = await asyncio.shield(inflight)
+                if shared is not None:
+                    self._record_tier("coalesced", started)
+                    return shared.model_copy()
+            else:
+                result = await self._classify_content_llm_once(cache_key, query)
+                if result is not None:
+                    self._record_tier("llm", started)
+                    return result
 
         # Fall back to simple classification
-        return self.classify_content_simple(query)
+        result = self.classify_content_simple(query)
+        self._record_tier("fallback", started)
+        return result
+
+    async def _classify_content_llm_once(
+        self, cache_key: str, query: str
+    ) -> Optional[ContentClassification]:
+        """
+        Run the LLM classification and share it with concurrent identical queries.
+
+        Args:
+            cache_key: Normalized query
+            query: Original user query
+
+        Returns:
+            ContentClassification, or None if the LLM call failed
+        """
+        future: "asyncio.Future[Optional[ContentClassification]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[cache_key] = future
+        result: Optional[ContentClassification] = None
+        try:
+            result = await self.classify_content_llm(query)
+            self._cache_put(cache_key, result)
+        except Exception as e:
+            # Fall back to simple classification if LLM fails
+            logger.debug(f"LLM classification failed, using rules: {e}")
+        finally:
+            self._inflight.pop(cache_key, None)
+            if not future.done():
+                future.set_result(result)
+        return result
+
+    def _cache_get(self, cache_key: str) -> Optional[ContentClassification]:
+        """Get a memoized classification and mark it as recently used."""
+        cached = self._classification_cache.get(cache_key)
+        if cached is None:
+            return None
+        self._classification_cache.move_to_end(cache_key)
+        return cached.model_copy()
+
+    def _cache_put(self, cache_key: str, classification: ContentClassification) -> None:
+        """Memoize a classification, evicting the least recently used entry."""
+        if self.cache_size <= 0:
+            return
+        self._classification_cache[cache_key] = classification.model_copy()
+        self._classification_cache.move_to_end(cache_key)
+        while len(self._classification_cache) > self.cache_size:
+            self._classification_cache.popitem(last=False)
+
+    def _record_tier(self, tier: str, started: float) -> None:
+        """Record which tier answered and how long it took."""
+        self.classification_stats.record(tier, (time.perf_counter() - started) * 1000)
+
+    def get_classification_stats(self) -> Dict[str, Any]:
+        """
+        Get classification tier statistics.
+
+        Returns:
+            Dict with per-tier counts, hit rates, latency and memo size
+        """
+        stats = self.classification_stats.get_stats()
+        stats["cache_size"] = len(self._classification_cache)
+        stats["cache_capacity"] = self.cache_size
+        stats["llm_configured"] = self.llm_agent is not None
+        return stats
+
+    def clear_classification_cache(self) -> None:
+        """Clear memoized classifications."""
+        self._classification_cache.clear()
 
     async def classify_content_llm(self, query: str) -> ContentClassification:
         """
@@ -0,0 +1,547 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Download lifecycle tracker for content requests.
+
+Once a request is confirmed and added to Radarr/Sonarr it is "searching".
+The tracker follows it from there to "available" without anyone polling:
+
+- periodic Radarr/Sonarr queue snapshots link each request to its download
+  (queue ``downloadId`` is the SABnzbd nzo_id) and tell downloading from
+  importing; a movie/series that has left the queue with files on disk is
+  available
+- SABnzbd monitoring events for an indexed nzo_id advance the request
+  between snapshots
+
+Requests only move forward (searching -> downloading -> importing ->
+available). Transitions are written to the database in batches and then
+published as REQUEST_STATUS_CHANGED events, which the WebSocket bridge pushes
+to clients.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+from autoarr.api.database import ContentRequest, ContentRequestRepository, Database
+from autoarr.api.services.event_bus import (
+    DispatchMode,
+    Event,
+    EventBus,
+    EventSubscription,
+    EventType,
+)
+
+if TYPE_CHECKING:
+    from autoarr.api.services.tool_providers import RadarrToolProvider, SonarrToolProvider
+
+logger = logging.getLogger(__name__)
+
+# Lifecycle order; a request never moves back to an earlier status
+STATUS_ORDER = {"searching": 0, "downloading": 1, "importing": 2, "available": 3}
+
+# Statuses the tracker keeps following
+TRACKED_STATUSES = ["searching", "downloading", "importing"]
+
+# *arr trackedDownloadState values that mean the download is being imported
+IMPORTING_STATES = {"importpending", "importing", "imported"}
+
+# Queue records fetched per snapshot
+QUEUE_PAGE_SIZE = 500
+
+
+@dataclass
+class TrackedRequest:
+    """In-memory view of a request being tracked."""
+
+    id: int
+    correlation_id: str
+    title: str
+    status: str
+    persisted_status: str
+    radarr_id: Optional[int] = None
+    sonarr_id: Optional[int] = None
+    season: Optional[int] = None
+
+    @classmethod
+    def from_model(cls, request: ContentRequest) -> "TrackedRequest":
+        """Build a tracked request from a database row."""
+        return cls(
+            id=request.id,
+            correlation_id=request.correlation_id,
+            title=request.title,
+            status=request.status,
+            persisted_status=request.status,
+            radarr_id=request.radarr_id,
+            sonarr_id=request.sonarr_id,
+            season=request.season,
+        )
+
+
+class RequestTracker:
+    """
+    Advances content requests through their download lifecycle.
+
+    Args:
+        db: Database holding content requests
+        event_bus: Event bus for monitoring events and status notifications
+        radarr_provider: Radarr tool provider (None to skip movies)
+        sonarr_provider: Sonarr tool provider (None to skip TV)
+        interval: Seconds between queue snapshots
+        flush_interval: Seconds transitions are collected before a batch write
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        event_bus: EventBus,
+        radarr_provider: Optional["RadarrToolProvider"] = None,
+        sonarr_provider: Optional["SonarrToolProvider"] = None,
+        interval: float = 60.0,
+        flush_interval: float = 2.0,
+    ) -> None:
+        """Initialize the tracker."""
+        self.repository = ContentRequestRepository(db)
+        self.event_bus = event_bus
+        self.radarr_provider = radarr_provider
+        self.sonarr_provider = sonarr_provider
+        self.interval = interval
+        self.flush_interval = flush_interval
+
+        # Indexes: request ID -> request, *arr/SABnzbd IDs -> request IDs
+        self._requests: Dict[int, TrackedRequest] = {}
+        self._by_radarr: Dict[int, Set[int]] = {}
+        self._by_sonarr: Dict[int, Set[int]] = {}
+        self._by_download: Dict[str, Set[int]] = {}
+
+        # Transitions waiting for the next batch write
+        self._pending: Dict[int, TrackedRequest] = {}
+        self._flush_wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+
+        self._subscriptions: List[EventSubscription] = []
+        self._tasks: List[asyncio.Task] = []
+
+        # Statistics
+        self.snapshots = 0
+        self.transitions = 0
+        self.last_snapshot_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background loops are running."""
+        return bool(self._tasks) and not all(task.done() for task in self._tasks)
+
+    def start(self) -> None:
+        """Subscribe to monitoring events and start the snapshot and flush loops."""
+        if self.is_running:
+            logger.warning("Request tracker already running")
+            return
+        for event_type in (
+            EventType.DOWNLOAD_STATE_CHANGED,
+            EventType.DOWNLOAD_COMPLETED,
+            EventType.DOWNLOAD_FAILED,
+        ):
+            self._subscriptions.append(
+                self.event_bus.subscribe(
+                    event_type, self._on_download_event, dispatch_mode=DispatchMode.INLINE
+                )
+            )
+        self._tasks = [
+            asyncio.create_task(self._snapshot_loop()),
+            asyncio.create_task(self._flush_loop()),
+        ]
+        logger.info(f"Request tracker started (interval: {self.interval}s)")
+
+    async def stop(self) -> None:
+        """Stop tracking and write any pending transitions."""
+        for subscription in self._subscriptions:
+            self.event_bus.unsubscribe(subscription)
+        self._subscriptions = []
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Failed to write pending request transitions: {e}")
+        logger.info("Request tracker stopped")
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def track(self, request: ContentRequest) -> None:
+        """
+        Start tracking a request (e.g. right after it was added to Radarr/Sonarr).
+
+        Args:
+            request: Content request linked to a Radarr movie or Sonarr series
+        """
+        if request.status not in TRACKED_STATUSES:
+            return
+        if request.radarr_id is None and request.sonarr_id is None:
+            return
+        self._index(TrackedRequest.from_model(request))
+
+    def _index(self, tracked: TrackedRequest) -> None:
+        """Add a request to the in-memory indexes."""
+        self._requests[tracked.id] = tracked
+        if tracked.radarr_id is not None:
+            self._by_radarr.setdefault(tracked.radarr_id, set()).add(tracked.id)
+        if tracked.sonarr_id is not None:
+            self._by_sonarr.setdefault(tracked.sonarr_id, set()).add(tracked.id)
+
+    def _untrack(self, request_id: int) -> None:
+        """Remove a request from every index."""
+        tracked = self._requests.pop(request_id, None)
+        if tracked is None:
+            return
+        for index in (self._by_radarr, self._by_sonarr, self._by_download):
+            for key in [key for key, ids in index.items() if request_id in ids]:
+                index[key].discard(request_id)
+                if not index[key]:
+                    del index[key]
+
+    async def refresh_index(self) -> None:
+        """
+        Reload tracked requests from the database.
+
+        Picks up requests confirmed by other workers and drops ones that were
+        deleted or changed elsewhere; known download links are kept.
+        """
+        rows = await self.repository.get_tracked(TRACKED_STATUSES)
+        downloads = self._by_download
+
+        self._requests, self._by_radarr, self._by_sonarr = {}, {}, {}
+        for row in rows:
+            tracked = TrackedRequest.from_model(row)
+            pending = self._pending.get(tracked.id)
+            if pending is not None:
+                # Not written yet - the in-memory status is newer
+                if pending.status == "available":
+                    continue
+                tracked.status = pending.status
+            self._index(tracked)
+
+        self._by_download = {}
+        for download_id, ids in downloads.items():
+            kept = {request_id for request_id in ids if request_id in self._requests}
+            if kept:
+                self._by_download[download_id] = kept
+
+    # ------------------------------------------------------------------
+    # Transitions
+    # ------------------------------------------------------------------
+
+    def _advance(self, request_id: int, status: str) -> bool:
+        """
+        Move a request forward to a new status.
+
+        Args:
+            request_id: Request ID
+            status: Target status
+
+        Returns:
+            True if the request moved
+        """
+        tracked = self._requests.get(request_id)
+        if tracked is None or STATUS_ORDER[status] <= STATUS_ORDER.get(tracked.status, -1):
+            return False
+
+        logger.info(f"Request {request_id} ({tracked.title}): {tracked.status} -> {status}")
+        tracked.status = status
+        self._pending[request_id] = tracked
+        self.transitions += 1
+        if status == "available":
+            self._untrack(request_id)
+        self._flush_wakeup.set()
+        return True
+
+    def _on_download_event(self, event: Event) -> None:
+        """Advance requests linked to the SABnzbd job in a monitoring event."""
+        nzo_id = event.data.get("nzo_id")
+        request_ids = self._by_download.get(nzo_id) if nzo_id else None
+        if not request_ids:
+            return
+
+        if event.event_type == EventType.DOWNLOAD_FAILED.value:
+            # Radarr/Sonarr will grab another release under a new download ID
+            self._by_download.pop(nzo_id, None)
+            return
+
+        if event.event_type == EventType.DOWNLOAD_COMPLETED.value:
+            status = "importing"
+        else:
+            new_state = event.data.get("new_state")
+            if new_state == "failed":
+                return
+            status = "importing" if new_state == "completed" else "downloading"
+
+        for request_id in list(request_ids):
+            self._advance(request_id, status)
+
+    async def flush(self) -> int:
+        """
+        Write pending transitions in one transaction and publish them.
+
+        Returns:
+            Number of requests updated
+        """
+        async with self._flush_lock:
+            self._flush_wakeup.clear()
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            statuses = {request_id: tracked.status for request_id, tracked in batch.items()}
+
+            try:
+                updated = await self.repository.update_statuses(statuses)
+            except Exception:
+                # Retry on the next flush unless a newer transition superseded it
+                for request_id, tracked in batch.items():
+                    self._pending.setdefault(request_id, tracked)
+                raise
+
+            for row in updated:
+                tracked = batch[row.id]
+                previous, tracked.persisted_status = tracked.persisted_status, statuses[row.id]
+                await self.event_bus.publish(
+                    Event(
+                        event_type=EventType.REQUEST_STATUS_CHANGED,
+                        data={
+                            "request_id": row.id,
+                            "title": row.title,
+                            "content_type": row.content_type,
+                            "status": row.status,
+                            "previous_status": previous,
+                            "service": "radarr" if row.radarr_id is not None else "sonarr",
+                            "external_id": row.external_id,
+                            "completed_at": (
+                                row.completed_at.isoformat() if row.completed_at else None
+                            ),
+                        },
+                        correlation_id=row.correlation_id,
+                        source="request_tracker",
+                    )
+                )
+            return len(updated)
+
+    async def _flush_loop(self) -> None:
+        """Write transitions a short while after the first one arrives."""
+        while True:
+            await self._flush_wakeup.wait()
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"Failed to write request transitions: {e}", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Queue snapshots
+    # ------------------------------------------------------------------
+
+    async def _snapshot_loop(self) -> None:
+        """Snapshot loop; errors are logged and retried on the next pass."""
+        while True:
+            try:
+                await self.snapshot()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"Request tracking snapshot failed: {e}", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+    async def snapshot(self) -> int:
+        """
+        Reconcile tracked requests against the Radarr/Sonarr queues.
+
+        Returns:
+            Number of transitions made
+        """
+        await self.refresh_index()
+        before = self.transitions
+        if self._requests:
+            await asyncio.gather(self._snapshot_radarr(), self._snapshot_sonarr())
+            await self.flush()
+        self.snapshots += 1
+        self.last_snapshot_at = datetime.utcnow()
+        return self.transitions - before
+
+    async def _snapshot_radarr(self) -> None:
+        """Apply a Radarr queue snapshot to movie requests."""
+        if self.radarr_provider is None or not self._by_radarr:
+            return
+        queued = await self._apply_queue(
+            self.radarr_provider, "radarr_get_queue", "movieId", self._by_radarr
+        )
+        idle = [movie_id for movie_id in self._by_radarr if movie_id not in queued]
+        movies = await asyncio.gather(
+            *(
+                self._fetch(self.radarr_provider, "radarr_get_movie_by_id", {"movie_id": movie_id})
+                for movie_id in idle
+            )
+        )
+        for movie_id, movie in zip(idle, movies):
+            if movie and movie.get("hasFile"):
+                for request_id in list(self._by_radarr.get(movie_id, ())):
+                    self._advance(request_id, "available")
+
+    async def _snapshot_sonarr(self) -> None:
+        """Apply a Sonarr queue snapshot to TV requests."""
+        if self.sonarr_provider is None or not self._by_sonarr:
+            return
+        queued = await self._apply_queue(
+            self.sonarr_provider, "sonarr_get_queue", "seriesId", self._by_sonarr
+        )
+        idle = [series_id for series_id in self._by_sonarr if series_id not in queued]
+        series_list = await asyncio.gather(
+            *(
+                self._fetch(
+                    self.sonarr_provider, "sonarr_get_series_by_id", {"series_id": series_id}
+                )
+                for series_id in idle
+            )
+        )
+        for series_id, series in zip(idle, series_list):
+            if not series:
+                continue
+            for request_id in list(self._by_sonarr.get(series_id, ())):
+                tracked = self._requests.get(request_id)
+                if tracked and _episode_file_count(series, tracked.season) > 0:
+                    self._advance(request_id, "available")
+
+    async def _apply_queue(
+        self,
+        provider: Any,
+        tool_name: str,
+        id_field: str,
+        index: Dict[int, Set[int]],
+    ) -> Set[int]:
+        """
+        Index download IDs and advance requests that appear in an *arr queue.
+
+        Args:
+            provider: Radarr or Sonarr tool provider
+            tool_name: Queue tool name
+            id_field: Record field holding the movie/series ID
+            index: Movie/series ID -> request IDs
+
+        Returns:
+            Movie/series IDs present in the queue
+        """
+        queue = await self._fetch(provider, tool_name, {"page_size": QUEUE_PAGE_SIZE})
+        queued: Set[int] = set()
+        for record in (queue or {}).get("records", []):
+            request_ids = index.get(record.get(id_field))
+            if not request_ids:
+                continue
+            queued.add(record[id_field])
+
+            download_id = record.get("downloadId")
+            if download_id:
+                self._by_download.setdefault(download_id, set()).update(request_ids)
+
+            state = str(record.get("trackedDownloadState") or "").lower()
+            status = "importing" if state in IMPORTING_STATES else "downloading"
+            for request_id in list(request_ids):
+                self._advance(request_id, status)
+        return queued
+
+    async def _fetch(
+        self, provider: Any, tool_name: str, arguments: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Run a provider tool, returning None (and logging) on failure."""
+        result = await provider.execute(tool_name, arguments)
+        if not result.success:
+            logger.debug(f"Request tracker call {tool_name} failed: {result.error}")
+            return None
+        return result.data  # type: ignore[no-any-return]
+
+
+def _episode_file_count(series: Dict[str, Any], season: Optional[int]) -> int:
+    """Episode files on disk for a whole series or one of its seasons."""
+    if season is not None:
+        for entry in series.get("seasons") or []:
+            if entry.get("seasonNumber") == season:
+                return int((entry.get("statistics") or {}).get("episodeFileCount") or 0)
+        return 0
+    return int((series.get("statistics") or {}).get("episodeFileCount") or 0)
+
+
+# Global tracker instance (initialized on startup)
+_tracker: Optional[RequestTracker] = None
+
+
+def get_request_tracker() -> Optional[RequestTracker]:
+    """
+    Get the global request tracker.
+
+    Returns:
+        Request tracker or None if not running in this worker
+    """
+    return _tracker
+
+
+async def initialize_request_tracker(
+    db: Database,
+    event_bus: EventBus,
+    radarr_provider: Optional["RadarrToolProvider"] = None,
+    sonarr_provider: Optional["SonarrToolProvider"] = None,
+    interval: float = 60.0,
+    flush_interval: float = 2.0,
+) -> RequestTracker:
+    """
+    Create, start and register the request tracker.
+
+    Args:
+        db: Database instance
+        event_bus: Event bus instance
+        radarr_provider: Radarr tool provider
+        sonarr_provider: Sonarr tool provider
+        interval: Seconds between queue snapshots
+        flush_interval: Seconds transitions are collected before a batch write
+
+    Returns:
+        Started request tracker
+    """
+    global _tracker
+    _tracker = RequestTracker(
+        db,
+        event_bus,
+        radarr_provider=radarr_provider,
+        sonarr_provider=sonarr_provider,
+        interval=interval,
+        flush_interval=flush_interval,
+    )
+    _tracker.start()
+    return _tracker
+
+
+async def shutdown_request_tracker() -> None:
+    """Stop the request tracker."""
+    global _tracker
+    if _tracker is not None:
+        await _tracker.stop()
+        _tracker = None
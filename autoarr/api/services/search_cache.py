@@ -0,0 +1,394 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tiered cache for web search and metadata lookups.
+
+Lookups go through up to three tiers, fastest first:
+- memory: in-process LRU bounded by entry count and total size, with
+  per-entry TTL (always on)
+- redis: shared cache, when a Redis client is configured
+- sqlite: on-disk cache that survives restarts, when a path is configured
+
+Values are serialized strings (JSON). A hit in a lower tier is promoted into
+the tiers above it with the TTL it has left there, so a promoted copy never
+outlives the original. Every tier honours the TTL passed by the caller, and
+failures in the optional tiers are logged and treated as misses.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+CACHE_TIERS = ("memory", "redis", "sqlite")
+
+
+class MemoryTTLCache:
+    """
+    Bounded LRU cache with per-entry expiry.
+
+    Sizes are value lengths (bytes for ASCII text such as JSON). A single
+    value larger than max_bytes is not kept in memory at all.
+
+    Args:
+        max_entries: Maximum number of entries before least recently used are evicted
+        max_bytes: Maximum total size of stored values before least recently used are evicted
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 32_000_000) -> None:
+        """Initialize the memory cache."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.size_bytes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Number of stored entries (including not yet purged expired ones)."""
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a value if present and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Serialized value
+            ttl: Time to live in seconds
+        """
+        self.delete(key)
+        if len(value) > self.max_bytes:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self.size_bytes += len(value)
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size_bytes -= len(evicted)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= len(entry[1])
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+        self.size_bytes = 0
+
+
+class SQLiteCacheTier:
+    """
+    On-disk cache tier backed by a single SQLite table.
+
+    Blocking sqlite3 calls run in a worker thread so the event loop is not
+    blocked by disk I/O.
+
+    Args:
+        path: Database file path (created if missing)
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the SQLite tier."""
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        # One connection shared across worker threads; serialize access to it
+        self._lock = asyncio.Lock()
+
+    def _get_sync(self, key: str) -> Optional[Tuple[str, float]]:
+        row = self._conn.execute(
+            "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if row[1] <= time.time():
+            self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+        return row[0], row[1] - time.time()
+
+    def _set_sync(self, key: str, value: str, ttl: float) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, time.time() + ttl),
+        )
+        self._conn.commit()
+
+    def _delete_sync(self, key: str) -> None:
+        self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        self._conn.commit()
+
+    def _purge_expired_sync(self) -> int:
+        cursor = self._conn.execute(
+            "DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),)
+        )
+        self._conn.commit()
+        return cursor.rowcount
+
+    async def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """
+        Get a value and its remaining TTL.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, remaining_ttl_seconds) or None if missing/expired
+        """
+        async with self._lock:
+            return await asyncio.to_thread(self._get_sync, key)
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Store a value with a TTL in seconds."""
+        async with self._lock:
+            await asyncio.to_thread(self._set_sync, key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        async with self._lock:
+            await asyncio.to_thread(self._delete_sync, key)
+
+    async def purge_expired(self) -> int:
+        """
+        Delete expired rows.
+
+        Returns:
+            Number of rows removed
+        """
+        async with self._lock:
+            return await asyncio.to_thread(self._purge_expired_sync)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class TieredCache:
+    """
+    Memory LRU/TTL cache in front of optional Redis and SQLite tiers.
+
+    Args:
+        max_entries: Capacity of the in-memory tier
+        redis_client: Optional Redis client (shared tier)
+        sqlite_path: Optional SQLite file path (persistent tier)
+        max_bytes: Total value size the in-memory tier may hold
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        redis_client: Optional["Redis"] = None,
+        sqlite_path: Optional[str] = None,
+        max_bytes: int = 32_000_000,
+    ) -> None:
+        """Initialize the tiered cache."""
+        self.memory = MemoryTTLCache(max_entries, max_bytes)
+        self.redis_client = redis_client
+        self.sqlite: Optional[SQLiteCacheTier] = None
+        if sqlite_path:
+            try:
+                self.sqlite = SQLiteCacheTier(sqlite_path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Disk cache disabled, cannot open {sqlite_path}: {e}")
+
+        self.hits: Dict[str, int] = {tier: 0 for tier in CACHE_TIERS}
+        self.misses = 0
+        self.errors = 0
+
+    async def get(self, key: str, ttl: float) -> Optional[str]:
+        """
+        Look a key up through the tiers, promoting lower-tier hits.
+
+        Args:
+            key: Cache key
+            ttl: TTL used when promoting a Redis hit that has no expiry
+
+        Returns:
+            Cached value or None on a miss
+        """
+        value = self.memory.get(key)
+        if value is not None:
+            self.hits["memory"] += 1
+            return value
+
+        if self.redis_client is not None:
+            try:
+                raw = await self.redis_client.get(key)
+            except Exception as e:
+                self.errors += 1
+                logger.debug(f"Redis cache read failed for {key}: {e}")
+                raw = None
+            if raw is not None:
+                value = raw.decode() if isinstance(raw, bytes) else str(raw)
+                self.hits["redis"] += 1
+                remaining = await self._redis_remaining_ttl(key, ttl)
+                if remaining > 0:
+                    self.memory.set(key, value, remaining)
+                return value
+
+        if self.sqlite is not None:
+            try:
+                found = await self.sqlite.get(key)
+            except Exception as e:
+                self.errors += 1
+                logger.debug(f"Disk cache read failed for {key}: {e}")
+                found = None
+            if found is not None:
+                value, remaining = found
+                self.hits["sqlite"] += 1
+                self.memory.set(key, value, remaining)
+                if self.redis_client is not None:
+                    await self._redis_set(key, value, remaining)
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """
+        Store a value in every configured tier.
+
+        Args:
+            key: Cache key
+            value: Serialized value
+            ttl: Time to live in seconds
+        """
+        self.memory.set(key, value, ttl)
+        if self.redis_client is not None:
+            await self._redis_set(key, value, ttl)
+        if self.sqlite is not None:
+            try:
+                await self.sqlite.set(key, value, ttl)
+            except Exception as e:
+                self.errors += 1
+                logger.debug(f"Disk cache write failed for {key}: {e}")
+
+    async def delete(self, key: str) -> None:
+        """
+        Remove a key from every tier.
+
+        Args:
+            key: Cache key
+        """
+        self.memory.delete(key)
+        if self.redis_client is not None:
+            try:
+                await self.redis_client.delete(key)
+            except Exception as e:
+                self.errors += 1
+                logger.debug(f"Redis cache delete failed for {key}: {e}")
+        if self.sqlite is not None:
+            try:
+                await self.sqlite.delete(key)
+            except Exception as e:
+                self.errors += 1
+                logger.debug(f"Disk cache delete failed for {key}: {e}")
+
+    async def _redis_remaining_ttl(self, key: str, default: float) -> float:
+        """
+        Get the seconds a Redis key has left (PTTL), for promoting it into memory.
+
+        Args:
+            key: Cache key
+            default: TTL to use when the key has no expiry
+
+        Returns:
+            Remaining seconds, or 0 if the key expired since it was read or
+            PTTL failed (the value is then not promoted)
+        """
+        try:
+            remaining_ms = int(await self.redis_client.pttl(key))  # type: ignore[union-attr]
+        except Exception as e:
+            self.errors += 1
+            logger.debug(f"Redis cache PTTL failed for {key}: {e}")
+            return 0.0
+        if remaining_ms == -1:
+            return default
+        return max(remaining_ms, 0) / 1000
+
+    async def _redis_set(self, key: str, value: str, ttl: float) -> None:
+        """Write to Redis, ignoring failures."""
+        try:
+            await self.redis_client.setex(key, max(1, int(ttl)), value)  # type: ignore[union-attr]
+        except Exception as e:
+            self.errors += 1
+            logger.debug(f"Redis cache write failed for {key}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters per tier.
+
+        Returns:
+            Dict with hits per tier, misses, hit rate and tier configuration
+        """
+        total_hits = sum(self.hits.values())
+        lookups = total_hits + self.misses
+        return {
+            "hits": dict(self.hits),
+            "misses": self.misses,
+            "hit_rate": total_hits / lookups if lookups else 0.0,
+            "errors": self.errors,
+            "memory_entries": len(self.memory),
+            "memory_capacity": self.memory.max_entries,
+            "memory_bytes": self.memory.size_bytes,
+            "memory_max_bytes": self.memory.max_bytes,
+            "memory_evictions": self.memory.evictions,
+            "redis_enabled": self.redis_client is not None,
+            "sqlite_enabled": self.sqlite is not None,
+        }
+
+    def close(self) -> None:
+        """Release the disk tier."""
+        if self.sqlite is not None:
+            self.sqlite.close()
+            self.sqlite = None
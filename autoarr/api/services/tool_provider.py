@@ -38,10 +38,13 @@ Example:
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from autoarr.shared.core.metrics import TOOL_CALL_DURATION, TOOL_CALLS_IN_FLIGHT
+
 logger = logging.getLogger(__name__)
 
 
@@ -422,13 +425,24 @@ class ToolRegistry:
             return ToolResult(success=False, error=f"Service {service_name} is not available")
 
         # Execute the tool
+        in_flight = TOOL_CALLS_IN_FLIGHT.labels(service_name)
+        in_flight.inc()
+        started = time.perf_counter()
+        outcome = "error"
         try:
             result = await provider.execute(tool_name, arguments)
+            if result.success:
+                outcome = "success"
             logger.info(f"Executed tool {tool_name}: success={result.success}")
             return result
         except Exception as e:
             logger.error(f"Tool execution failed: {tool_name}: {e}")
             return ToolResult(success=False, error=f"Tool execution failed: {str(e)}")
+        finally:
+            in_flight.dec()
+            TOOL_CALL_DURATION.labels(service_name, tool_name, outcome).observe(
+                time.perf_counter() - started
+            )
 
     def _get_service_for_tool(self, tool_name: str) -> Optional[str]:
         """
@@ -22,8 +22,9 @@ This module implements the BaseToolProvider interface for Plex,
 exposing Plex API operations as tools for the LLM.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from autoarr.api.services.tool_provider import (
     BaseToolProvider,
@@ -43,6 +44,9 @@ class PlexToolProvider(BaseToolProvider):
     Exposes Plex API operations as tools that can be called by the LLM.
     """
 
+    # Items requested per page when walking a library section
+    LIBRARY_PAGE_SIZE = 500
+
     def __init__(
         self,
         url: Optional[str] = None,
@@ -131,6 +135,17 @@ class PlexToolProvider(BaseToolProvider):
                             "type": "integer",
                             "description": "Maximum number of items to return",
                         },
+                        "offset": {
+                            "type": "integer",
+                            "description": "Number of items to skip",
+                        },
+                        "fields": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": (
+                                "Item fields to return (e.g. ['ratingKey', 'title', 'year'])"
+                            ),
+                        },
                     },
                     "required": ["library_id"],
                 },
@@ -318,6 +333,11 @@ class PlexToolProvider(BaseToolProvider):
         except Exception:
             return False
 
+    async def close(self) -> None:
+        """Close the underlying Plex client and its HTTP connection pool."""
+        if self._client is not None:
+            await self._client.close()
+
     async def get_service_info(self) -> ServiceInfo:
         """Get Plex service information."""
         client = await self._get_client()
@@ -352,6 +372,43 @@ class PlexToolProvider(BaseToolProvider):
                 healthy=False,
             )
 
+    async def iter_library_items(
+        self,
+        library_id: str,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream items in a library section page by page.
+
+        Args:
+            library_id: The library section ID
+            fields: Optional item fields to keep
+            limit: Maximum number of items to yield
+            offset: Number of items to skip
+            filters: Optional Plex filter parameters (e.g. {"updatedAt>>": ts})
+
+        Yields:
+            Media item dictionaries
+
+        Raises:
+            PlexClientError: If Plex is not configured
+        """
+        client = await self._get_client()
+        if not client:
+            raise PlexClientError("Plex is not configured. Please set up Plex in Settings first.")
+        async for item in client.iter_library_items(
+            library_id,
+            page_size=self.LIBRARY_PAGE_SIZE,
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            filters=filters,
+        ):
+            yield item
+
     # Handler methods
     async def _handle_get_libraries(
         self, client: PlexClient, args: Dict[str, Any]
@@ -367,7 +424,16 @@ class PlexToolProvider(BaseToolProvider):
         library_id = args.get("library_id")
         if not library_id:
             raise ValueError("library_id is required")
-        items = await client.get_library_items(library_id, limit=args.get("limit"))
+        items = [
+            item
+            async for item in client.iter_library_items(
+                library_id,
+                page_size=self.LIBRARY_PAGE_SIZE,
+                fields=args.get("fields"),
+                limit=args.get("limit"),
+                offset=args.get("offset") or 0,
+            )
+        ]
         return {"item_count": len(items), "items": items}
 
     async def _handle_get_recently_added(
@@ -429,28 +495,28 @@ class PlexToolProvider(BaseToolProvider):
         """
         checks: List[Dict[str, Any]] = []
 
+        # Fetch identity, libraries and sessions concurrently
+        identity, libraries, sessions = await asyncio.gather(
+            client.get_server_identity(),
+            client.get_libraries(),
+            client.get_sessions(),
+            return_exceptions=True,
+        )
+
         # Get server identity
-        try:
-            identity = await client.get_server_identity()
-            version = identity.get("version", "unknown")
-            server_name = identity.get("friendlyName", "Plex Server")
-        except Exception as e:
+        if isinstance(identity, BaseException):
             return {
                 "status": "error",
-                "error": f"Failed to get server identity: {e}",
+                "error": f"Failed to get server identity: {identity}",
                 "checks": [],
             }
+        version = identity.get("version", "unknown")
+        server_name = identity.get("friendlyName", "Plex Server")
 
-        # Get libraries
-        try:
-            libraries = await client.get_libraries()
-        except Exception:
+        # Libraries and sessions are optional
+        if isinstance(libraries, BaseException):
             libraries = []
-
-        # Get active sessions
-        try:
-            sessions = await client.get_sessions()
-        except Exception:
+        if isinstance(sessions, BaseException):
             sessions = []
 
         # ================================================================
@@ -535,15 +601,17 @@ class PlexToolProvider(BaseToolProvider):
                     }
                 )
 
-            # Check library sizes
-            for lib in libraries:
+            # Check library access (one single-item probe per library, concurrently)
+            probes = await asyncio.gather(
+                *(client.get_library_items(str(lib.get("key", "")), limit=1) for lib in libraries),
+                return_exceptions=True,
+            )
+            for lib, probe in zip(libraries, probes):
                 lib_name = lib.get("title", "Unknown")
                 lib_type = lib.get("type", "unknown")
 
-                # Get item count if available
-                try:
-                    await client.get_library_items(str(lib.get("key", "")), limit=1)
-                    # Note: We're just checking if we can access it
+                # Note: We're just checking if we can access it
+                if not isinstance(probe, BaseException):
                     checks.append(
                         {
                             "id": f"library_accessible_{lib.get('key', 0)}",
@@ -556,7 +624,7 @@ class PlexToolProvider(BaseToolProvider):
                             "auto_fix": False,
                         }
                     )
-                except Exception:
+                else:
                     checks.append(
                         {
                             "id": f"library_error_{lib.get('key', 0)}",
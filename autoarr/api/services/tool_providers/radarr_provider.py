@@ -22,6 +22,7 @@ This module implements the BaseToolProvider interface for Radarr,
 exposing Radarr API operations as tools for the LLM.
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -629,34 +630,52 @@ class RadarrToolProvider(BaseToolProvider):
         """
         checks: List[Dict[str, Any]] = []
 
+        # Fetch status, health and configuration concurrently
+        (
+            status,
+            health_issues,
+            indexers,
+            download_clients,
+            root_folders,
+            quality_profiles,
+            movies,
+        ) = await asyncio.gather(
+            client.get_system_status(),
+            client._request("GET", "health"),
+            client._request("GET", "indexer"),
+            client._request("GET", "downloadclient"),
+            client._request("GET", "rootfolder"),
+            client._request("GET", "qualityprofile"),
+            client.get_movies(),
+            return_exceptions=True,
+        )
+
         # Get system status
-        try:
-            status = await client.get_system_status()
-            version = status.get("version", "unknown")
-        except Exception as e:
+        if isinstance(status, BaseException):
             return {
                 "status": "error",
-                "error": f"Failed to get system status: {e}",
+                "error": f"Failed to get system status: {status}",
                 "checks": [],
             }
+        version = status.get("version", "unknown")
 
-        # Get health issues from Radarr's built-in health check
-        try:
-            health_issues = await client._request("GET", "health")
-        except Exception:
+        # Health issues from Radarr's built-in health check are optional
+        if isinstance(health_issues, BaseException):
             health_issues = []
 
-        # Get configuration data
-        try:
-            indexers = await client._request("GET", "indexer")
-            download_clients = await client._request("GET", "downloadclient")
-            root_folders = await client._request("GET", "rootfolder")
-            quality_profiles = await client._request("GET", "qualityprofile")
-            movies = await client.get_movies()
-        except Exception as e:
+        # Configuration data is required
+        config_error = next(
+            (
+                result
+                for result in (indexers, download_clients, root_folders, quality_profiles, movies)
+                if isinstance(result, BaseException)
+            ),
+            None,
+        )
+        if config_error is not None:
             return {
                 "status": "error",
-                "error": f"Failed to get configuration: {e}",
+                "error": f"Failed to get configuration: {config_error}",
                 "checks": [],
             }
 
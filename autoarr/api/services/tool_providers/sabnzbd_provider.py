@@ -22,6 +22,7 @@ This module implements the BaseToolProvider interface for SABnzbd,
 exposing SABnzbd API operations as tools for the LLM.
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -1173,9 +1174,18 @@ class SABnzbdToolProvider(BaseToolProvider):
         """
         checks: List[Dict[str, Any]] = []
 
+        # Fetch configuration, version and warnings concurrently
+        config, version_data, warnings_data = await asyncio.gather(
+            client.get_config(),
+            client.get_version(),
+            client._request("warnings"),
+            return_exceptions=True,
+        )
+
         # Get current configuration
         try:
-            config = await client.get_config()
+            if isinstance(config, BaseException):
+                raise config
             misc = config.get("config", {}).get("misc", {})
             servers = config.get("config", {}).get("servers", [])
         except Exception as e:
@@ -1187,22 +1197,18 @@ class SABnzbdToolProvider(BaseToolProvider):
 
         # Get version for version-specific checks
         try:
-            version_data = await client.get_version()
+            if isinstance(version_data, BaseException):
+                raise version_data
             version = version_data.get("version", "4.0.0")
             major_version = int(version.split(".")[0]) if version else 4
         except Exception:
             version = "unknown"
             major_version = 4
 
-        # Get status for runtime checks
-        try:
-            await client.get_status()
-        except Exception:
-            pass
-
         # Get warnings count
         try:
-            warnings_data = await client._request("warnings")
+            if isinstance(warnings_data, BaseException):
+                raise warnings_data
             warning_count = len(warnings_data.get("warnings", []))
         except Exception:
             warning_count = 0
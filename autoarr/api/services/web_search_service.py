@@ -23,15 +23,20 @@ content extraction from web pages, and best practices extraction.
 
 Features:
 - Brave Search API integration
-- Redis caching for search results and best practices
+- Tiered caching (in-memory LRU/TTL, optional Redis, optional SQLite) for
+  search results, TMDB lookups and best practices
 - HTML/Markdown content extraction
 - Best practices extraction and categorization
 - Search result scoring and ranking
 """
 
+import asyncio
 import hashlib
 import json
+import logging
 import re
+import time
+from collections import deque
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from urllib.parse import urlparse
 
@@ -40,9 +45,17 @@ from bs4 import BeautifulSoup
 from pydantic import BaseModel, Field, field_validator
 from redis.asyncio import Redis
 
+from autoarr.api.services.search_cache import TieredCache
+
+# BeautifulSoup parser; the stdlib one, so results do not depend on which
+# optional packages happen to be installed
+HTML_PARSER = "html.parser"
+
 if TYPE_CHECKING:
     from autoarr.api.services.request_handler import ContentSearchResult
 
+logger = logging.getLogger(__name__)
+
 
 class SearchQuery(BaseModel):
     """Search query model."""
@@ -110,6 +123,10 @@ class WebSearchService:
         redis_client: Optional Redis client for caching
         cache_ttl: Cache TTL for search results in seconds (default: 24 hours)
         best_practices_ttl: Cache TTL for best practices in seconds (default: 7 days)
+        memory_cache_size: Entries kept in the in-process cache tier
+        memory_cache_bytes: Total size of values kept in the in-process cache tier
+        cache_db_path: Optional SQLite file for a cache tier that survives restarts
+        content_fresh_ttl: Seconds extracted page text is served without revalidation
     """
 
     # Authoritative domains for each application
@@ -150,18 +167,46 @@ class WebSearchService:
         "low": ["optional", "consider", "may", "can", "nice to have"],
     }
 
+    # Elements stripped before extracting page text
+    BOILERPLATE_TAGS = ["script", "style", "noscript", "nav", "footer", "header", "aside", "form"]
+
+    # Main content containers, most specific first (MediaWiki, docs sites, generic)
+    MAIN_CONTENT_SELECTORS = [
+        "#mw-content-text",
+        "main",
+        "article",
+        "[role=main]",
+        "#content",
+        ".content",
+    ]
+
     def __init__(
         self,
         brave_api_key: str,
         redis_client: Optional[Redis] = None,
         cache_ttl: int = 86400,  # 24 hours
         best_practices_ttl: int = 604800,  # 7 days
+        memory_cache_size: int = 1024,
+        cache_db_path: Optional[str] = None,
+        content_fresh_ttl: int = 3600,  # 1 hour
+        max_content_bytes: int = 2_000_000,
+        memory_cache_bytes: int = 32_000_000,
     ) -> None:
         """Initialize the Web Search Service."""
         self.brave_api_key = brave_api_key
         self.redis_client = redis_client  # noqa: F841
+        self.cache = TieredCache(
+            max_entries=memory_cache_size,
+            redis_client=redis_client,
+            sqlite_path=cache_db_path,
+            max_bytes=memory_cache_bytes,
+        )
         self.cache_ttl = cache_ttl
         self.best_practices_ttl = best_practices_ttl
+        self.content_fresh_ttl = content_fresh_ttl
+        self.content_stats: Dict[str, int] = {"fresh": 0, "revalidated": 0, "fetched": 0}
+        self.max_content_bytes = max_content_bytes
+        self.extraction_timings: deque[Dict[str, Any]] = deque(maxlen=100)
         self.base_url = "https://api.search.brave.com/res/v1/web/search"
 
         # HTTP client for API requests
@@ -324,10 +369,11 @@ class WebSearchService:
         Extract text content from a URL.
 
         This method:
-        1. Fetches the page content
-        2. Parses HTML and extracts text
-        3. Removes scripts, styles, and navigation
-        4. Returns clean text content
+        1. Serves recently extracted text from the content cache
+        2. Otherwise fetches the page, revalidating a cached copy with
+           If-None-Match / If-Modified-Since when validators are known
+        3. Parses HTML and extracts text (scripts, styles, navigation removed)
+        4. Caches the text with the response's ETag / Last-Modified
 
         Args:
             url: URL to extract content from
@@ -338,26 +384,174 @@ class WebSearchService:
         Raises:
             Exception: If URL cannot be fetched
         """
+        cache_key = self._get_cache_key("content", url)
+        cached = await self._get_cached_content(cache_key)
+
+        headers: Dict[str, str] = {}
+        if cached is not None:
+            if time.time() - cached.get("fetched_at", 0) < self.content_fresh_ttl:
+                self.content_stats["fresh"] += 1
+                return str(cached["text"])
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        started = time.perf_counter()
         try:
-            response = await self.http_client.get(url, follow_redirects=True)
-            response.raise_for_status()
-
-            content_type = response.headers.get("content-type", "")
-
-            if "html" in content_type:
-                return self._parse_html(response.text)
-            elif "markdown" in content_type or url.endswith(".md"):
-                return self._parse_markdown(response.text)
-            else:
-                # Try to parse as HTML anyway
-                return self._parse_html(response.text)
+            async with self.http_client.stream(
+                "GET", url, follow_redirects=True, headers=headers or None
+            ) as response:
+                if response.status_code == 304 and cached is not None:
+                    self.content_stats["revalidated"] += 1
+                    cached["fetched_at"] = time.time()
+                    await self._cache_content(cache_key, cached)
+                    return str(cached["text"])
+
+                response.raise_for_status()
+                body, truncated = await self._read_capped(response)
+                encoding = response.encoding or "utf-8"
 
         except httpx.RequestError as e:
             raise Exception(f"Failed to fetch URL {url}: {str(e)}")
 
+        fetched = time.perf_counter()
+        content_type = response.headers.get("content-type", "")
+        document = body.decode(encoding, errors="replace")
+
+        # Parsing is CPU bound; keep it off the event loop
+        if "markdown" in content_type or ("html" not in content_type and url.endswith(".md")):
+            text = await asyncio.to_thread(self._parse_markdown, document)
+        else:
+            text = await asyncio.to_thread(self._parse_html, document)
+
+        self._record_extraction(
+            url, len(body), truncated, fetched - started, time.perf_counter() - fetched
+        )
+
+        self.content_stats["fetched"] += 1
+        await self._cache_content(
+            cache_key,
+            {
+                "text": text,
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+                "fetched_at": time.time(),
+            },
+        )
+        return text
+
+    async def _read_capped(self, response: httpx.Response) -> tuple[bytes, bool]:
+        """
+        Read a streamed response body up to max_content_bytes.
+
+        Args:
+            response: Streaming response
+
+        Returns:
+            Tuple of (body bytes, whether the body was truncated)
+        """
+        chunks: List[bytes] = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            remaining = self.max_content_bytes - size
+            if len(chunk) >= remaining:
+                chunks.append(chunk[:remaining])
+                return b"".join(chunks), True
+            chunks.append(chunk)
+            size += len(chunk)
+        return b"".join(chunks), False
+
+    def _record_extraction(
+        self, url: str, size: int, truncated: bool, fetch_seconds: float, parse_seconds: float
+    ) -> None:
+        """
+        Record download and parse timings for one extracted URL.
+
+        Args:
+            url: Extracted URL
+            size: Bytes downloaded
+            truncated: Whether the body hit max_content_bytes
+            fetch_seconds: Time spent downloading
+            parse_seconds: Time spent parsing
+        """
+        if truncated:
+            logger.warning(f"Content from {url} truncated at {self.max_content_bytes} bytes")
+        logger.debug(
+            f"Extracted {url}: {size} bytes, fetch {fetch_seconds * 1000:.1f}ms, "
+            f"parse {parse_seconds * 1000:.1f}ms"
+        )
+        self.extraction_timings.append(
+            {
+                "url": url,
+                "bytes": size,
+                "truncated": truncated,
+                "fetch_ms": round(fetch_seconds * 1000, 2),
+                "parse_ms": round(parse_seconds * 1000, 2),
+            }
+        )
+
+    def get_extraction_stats(self) -> Dict[str, Any]:
+        """
+        Get per-URL extraction timings.
+
+        Returns:
+            Dict with the parser in use, aggregate parse times and recent per-URL timings
+        """
+        timings = list(self.extraction_timings)
+        parse_times = [t["parse_ms"] for t in timings]
+        return {
+            "parser": HTML_PARSER,
+            "max_content_bytes": self.max_content_bytes,
+            "count": len(timings),
+            "truncated": sum(1 for t in timings if t["truncated"]),
+            "avg_parse_ms": sum(parse_times) / len(parse_times) if parse_times else 0.0,
+            "max_parse_ms": max(parse_times, default=0.0),
+            "recent": timings,
+        }
+
+    async def _get_cached_content(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached page text and its HTTP validators.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            Dict with text, etag, last_modified and fetched_at, or None
+        """
+        try:
+            cached_data = await self.cache.get(cache_key, self.best_practices_ttl)
+            if cached_data is None:
+                return None
+            data = json.loads(cached_data)
+            return data if isinstance(data, dict) and "text" in data else None
+        except Exception:
+            return None
+
+    async def _cache_content(self, cache_key: str, entry: Dict[str, Any]) -> None:
+        """
+        Cache extracted page text.
+
+        Entries are kept for the best-practices TTL; content_fresh_ttl decides
+        when they must be revalidated.
+
+        Args:
+            cache_key: Cache key
+            entry: Dict with text, etag, last_modified and fetched_at
+        """
+        try:
+            await self.cache.set(cache_key, json.dumps(entry), self.best_practices_ttl)
+        except Exception:
+            pass
+
     def _parse_html(self, html: str) -> str:
         """
-        Parse HTML content and extract text.
+        Parse HTML content and extract the main content text.
+
+        Uses the stdlib html.parser and restricts extraction to the page's
+        main content element when one is present.
+        Blocking; extract_content runs it in a worker thread.
 
         Args:
             html: HTML content string
@@ -365,14 +559,18 @@ class WebSearchService:
         Returns:
             Cleaned text content
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, HTML_PARSER)
 
-        # Remove script and style elements
-        for element in soup(["script", "style", "nav", "footer", "header"]):
+        # Remove script, style and page chrome elements
+        for element in soup(self.BOILERPLATE_TAGS):
             element.decompose()
 
+        root = next(
+            (node for node in map(soup.select_one, self.MAIN_CONTENT_SELECTORS) if node), soup
+        )
+
         # Get text content
-        text = soup.get_text()
+        text = root.get_text("\n")
 
         # Clean up whitespace
         lines = (line.strip() for line in text.splitlines())
@@ -567,7 +765,7 @@ class WebSearchService:
 
     async def _get_cached_results(self, cache_key: str) -> Optional[List[SearchResult]]:
         """
-        Get cached search results from Redis.
+        Get cached search results from the cache tiers.
 
         Args:
             cache_key: Cache key
@@ -575,11 +773,8 @@ class WebSearchService:
         Returns:
             List of SearchResult objects or None if not cached
         """
-        if self.redis_client is None:
-            return None
-
         try:
-            cached_data = await self.redis_client.get(cache_key)
+            cached_data = await self.cache.get(cache_key, self.cache_ttl)
             if cached_data is None:
                 return None
 
@@ -593,22 +788,19 @@ class WebSearchService:
 
     async def _cache_results(self, cache_key: str, results: List[SearchResult]) -> None:
         """
-        Cache search results in Redis.
+        Cache search results in the cache tiers.
 
         Args:
             cache_key: Cache key
             results: List of SearchResult objects to cache
         """
-        if self.redis_client is None:
-            return
-
         try:
             # Serialize to JSON
             data = [result.model_dump() for result in results]
             serialized = json.dumps(data)
 
             # Store with TTL
-            await self.redis_client.setex(cache_key, self.cache_ttl, serialized)
+            await self.cache.set(cache_key, serialized, self.cache_ttl)
 
         except Exception:
             # If cache write fails, continue without caching
@@ -616,22 +808,19 @@ class WebSearchService:
 
     async def _cache_best_practices(self, cache_key: str, practices: List[BestPractice]) -> None:
         """
-        Cache best practices in Redis with longer TTL.
+        Cache best practices in the cache tiers with longer TTL.
 
         Args:
             cache_key: Cache key
             practices: List of BestPractice objects to cache
         """
-        if self.redis_client is None:
-            return
-
         try:
             # Serialize to JSON
             data = [practice.model_dump() for practice in practices]
             serialized = json.dumps(data)
 
             # Store with longer TTL (7 days)
-            await self.redis_client.setex(cache_key, self.best_practices_ttl, serialized)
+            await self.cache.set(cache_key, serialized, self.best_practices_ttl)
 
         except Exception:
             pass
@@ -643,14 +832,8 @@ class WebSearchService:
         Args:
             query: Query string to invalidate
         """
-        if self.redis_client is None:
-            return
-
         cache_key = self._get_cache_key("search", query)
-        try:
-            await self.redis_client.delete(cache_key)
-        except Exception:
-            pass
+        await self.cache.delete(cache_key)
 
     def _get_cache_key(self, prefix: str, value: str) -> str:
         """
@@ -873,7 +1056,7 @@ class WebSearchService:
         self, cache_key: str
     ) -> Optional[List["ContentSearchResult"]]:
         """
-        Get cached TMDB results from Redis.
+        Get cached TMDB results from the cache tiers.
 
         Args:
             cache_key: Cache key
@@ -884,11 +1067,8 @@ class WebSearchService:
         # Import here to avoid circular dependency
         from autoarr.api.services.request_handler import ContentSearchResult
 
-        if self.redis_client is None:
-            return None
-
         try:
-            cached_data = await self.redis_client.get(cache_key)
+            cached_data = await self.cache.get(cache_key, self.cache_ttl)
             if cached_data is None:
                 return None
 
@@ -903,28 +1083,62 @@ class WebSearchService:
         self, cache_key: str, results: List["ContentSearchResult"]
     ) -> None:
         """
-        Cache TMDB results in Redis.
+        Cache TMDB results in the cache tiers.
 
         Args:
             cache_key: Cache key
             results: List of ContentSearchResult objects to cache
         """
-        if self.redis_client is None:
-            return
-
         try:
             # Serialize to JSON
             data = [result.model_dump() for result in results]
             serialized = json.dumps(data)
 
             # Store with TTL (24 hours)
-            await self.redis_client.setex(cache_key, self.cache_ttl, serialized)
+            await self.cache.set(cache_key, serialized, self.cache_ttl)
 
         except Exception:
             pass
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get cache hit/miss counters.
+
+        Returns:
+            Dict with hits per tier, misses, hit rate and page content counters
+        """
+        stats = self.cache.get_stats()
+        stats["content"] = dict(self.content_stats)
+        return stats
+
     async def close(self) -> None:
         """Close HTTP client and cleanup resources."""
         await self.http_client.aclose()
+        self.cache.close()
         if self.redis_client:
             await self.redis_client.close()
+
+
+# Service created by the chat agent on its first web search (read by health checks)
+_active_service: Optional[WebSearchService] = None
+
+
+def get_web_search_service() -> Optional[WebSearchService]:
+    """
+    Get the web search service in use.
+
+    Returns:
+        Web search service, or None if no web search has run yet
+    """
+    return _active_service
+
+
+def set_web_search_service(service: Optional[WebSearchService]) -> None:
+    """
+    Set the web search service in use.
+
+    Args:
+        service: Web search service (or None to clear)
+    """
+    global _active_service
+    _active_service = service
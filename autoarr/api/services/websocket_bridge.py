@@ -26,7 +26,15 @@ import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
-from .event_bus import Event, EventBus, EventSubscription, EventType
+from .event_bus import (
+    DispatchMode,
+    Event,
+    EventBus,
+    EventSubscription,
+    EventType,
+    OverflowPolicy,
+)
+from .progress_coalescer import DownloadProgressCoalescer
 
 logger = logging.getLogger(__name__)
 
@@ -35,23 +43,31 @@ class WebSocketBridge:
     """
     Bridges event bus events to WebSocket connections.
 
-    Subscribes to event bus topics and broadcasts events to WebSocket clients
-    with support for filtering by correlation ID and event type.
+    Subscribes to event bus topics and broadcasts events to WebSocket clients.
+    Each event carries its event type, correlation ID and service so the
+    connection manager only delivers it to clients subscribed to it.
     """
 
-    def __init__(self, event_bus: EventBus, connection_manager: Any):
+    def __init__(self, event_bus: EventBus, connection_manager: Any, progress_window: float = 1.0):
         """
         Initialize WebSocket bridge.
 
         Args:
             event_bus: Event bus instance to subscribe to
             connection_manager: WebSocket connection manager for broadcasting
+            progress_window: Window (seconds) for merging download state changes
+                per nzo_id; 0 disables coalescing
         """
         self.event_bus = event_bus
         self.connection_manager = connection_manager
         self._subscriptions: List[EventSubscription] = []
         self._running = False
         self._tasks: list[asyncio.Task] = []
+        self.progress_coalescer: Optional[DownloadProgressCoalescer] = (
+            DownloadProgressCoalescer(self._dispatch_event, window=progress_window)
+            if progress_window > 0
+            else None
+        )
 
     async def start(self) -> None:
         """
@@ -87,10 +103,18 @@ class WebSocketBridge:
             EventType.REQUEST_CREATED,
             EventType.REQUEST_PROCESSED,
             EventType.REQUEST_FAILED,
+            EventType.REQUEST_STATUS_CHANGED,
         ]
 
         for event_type in event_types:
-            subscription = self.event_bus.subscribe(event_type, self._handle_event_sync)
+            # One bounded queue for the bridge: the publisher never waits on
+            # broadcasts, and under overload the oldest pending events go first
+            subscription = self.event_bus.subscribe(
+                event_type,
+                self._handle_event,
+                dispatch_mode=DispatchMode.QUEUED,
+                overflow_policy=OverflowPolicy.DROP_OLDEST,
+            )
             self._subscriptions.append(subscription)
             logger.debug(f"Subscribed to event type: {event_type}")
 
@@ -117,6 +141,9 @@ class WebSocketBridge:
 
         self._subscriptions.clear()
 
+        if self.progress_coalescer is not None:
+            self.progress_coalescer.close()
+
         # Cancel all pending tasks
         for task in self._tasks:
             if not task.done():
@@ -128,11 +155,13 @@ class WebSocketBridge:
         self._tasks.clear()
         logger.info("WebSocket bridge stopped")
 
-    def _handle_event_sync(self, event: Event) -> None:
+    async def _handle_event(self, event: Event) -> None:
         """
-        Sync wrapper for handling events from the event bus.
+        Handle an event from the event bus.
 
-        Creates an async task to handle the event without blocking.
+        Registered as a QUEUED subscriber, so the bus's worker task for the
+        bridge delivers events one at a time, in order, without blocking the
+        publisher.
 
         Args:
             event: Event from the event bus
@@ -140,6 +169,22 @@ class WebSocketBridge:
         if not self._running:
             return
 
+        # High-frequency progress is merged and emitted later as a delta
+        if self.progress_coalescer is not None and self.progress_coalescer.submit(event):
+            return
+
+        await self._handle_event_async(event)
+
+    def _dispatch_event(self, event: Event) -> None:
+        """
+        Schedule delivery of a coalesced progress delta to WebSocket clients.
+
+        Args:
+            event: Event (or coalesced delta) to deliver
+        """
+        if not self._running:
+            return
+
         # Schedule the async handler as a task
         try:
             loop = asyncio.get_running_loop()
@@ -168,8 +213,19 @@ class WebSocketBridge:
             # Transform event to WebSocket message format
             message = self._event_to_websocket_message(event)
 
-            # Broadcast to all connected clients
-            await self.connection_manager.broadcast(message)
+            # Route to clients subscribed to this event type/correlation/service
+            nzo_id = event.data.get("nzo_id")
+            await self.connection_manager.broadcast(
+                message,
+                coalesce_key=(
+                    f"progress:{nzo_id}"
+                    if nzo_id and event.event_type == EventType.DOWNLOAD_STATE_CHANGED.value
+                    else None
+                ),
+                event_type=event.event_type,
+                correlation_id=event.correlation_id,
+                service=self._event_service(event),
+            )
 
             logger.debug(
                 f"Broadcasted event {event.event_type} (correlation_id: {event.correlation_id})"
@@ -178,6 +234,26 @@ class WebSocketBridge:
         except Exception as e:
             logger.error(f"Error handling event {event.event_type}: {e}", exc_info=True)
 
+    @staticmethod
+    def _event_service(event: Event) -> str:
+        """
+        Get the service an event belongs to, for subscription routing.
+
+        Uses an explicit "service" in the event data, otherwise the top-level
+        component of the event source (e.g. "recovery_service.retry" ->
+        "recovery_service").
+
+        Args:
+            event: Event from the event bus
+
+        Returns:
+            Service name
+        """
+        service = event.data.get("service")
+        if isinstance(service, str) and service:
+            return service
+        return event.source.split(".", 1)[0]
+
     def _event_to_websocket_message(self, event: Event) -> Dict[str, Any]:
         """
         Transform an event bus event into a WebSocket message.
@@ -249,7 +325,7 @@ def set_websocket_bridge(bridge: Optional[WebSocketBridge]) -> None:
 
 
 async def initialize_websocket_bridge(
-    event_bus: EventBus, connection_manager: Any
+    event_bus: EventBus, connection_manager: Any, progress_window: float = 1.0
 ) -> WebSocketBridge:
     """
     Initialize and start the WebSocket bridge.
@@ -257,11 +333,12 @@ async def initialize_websocket_bridge(
     Args:
         event_bus: Event bus instance
         connection_manager: WebSocket connection manager
+        progress_window: Download progress coalescing window (seconds)
 
     Returns:
         Initialized and started WebSocket bridge
     """
-    bridge = WebSocketBridge(event_bus, connection_manager)
+    bridge = WebSocketBridge(event_bus, connection_manager, progress_window=progress_window)
     await bridge.start()
     set_websocket_bridge(bridge)
     logger.info("WebSocket bridge initialized and started")
@@ -0,0 +1,678 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+WebSocket Manager for AutoArr.
+
+Non-blocking fan-out of real-time messages to connected dashboards:
+- Each message is serialized once per broadcast, not once per client
+- Every client has a bounded send queue drained by its own writer task,
+  so a slow client never delays delivery to the others
+- Pending messages that share a coalesce key are merged (latest wins)
+- Optional per-client frame rate bound; keyed messages keep merging while a
+  client is rate limited
+- Clients that fall too far behind are evicted (slow-consumer protection)
+- Per-connection lag and throughput metrics
+- Server-side topic subscriptions (event type, correlation ID, service) with
+  a per-connection subscription index, so events only reach interested sockets
+
+Subscription protocol (client -> server text frames):
+    {"action": "subscribe", "event_types": [...], "correlation_ids": [...], "services": [...]}
+    {"action": "unsubscribe", "event_types": [...]}   # omit all fields to clear everything
+    {"action": "list_subscriptions"}
+
+A connection with no subscriptions receives every event. Once it subscribes,
+an event is delivered only if it matches every dimension the connection has
+constrained (e.g. event type AND correlation ID).
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
+
+from fastapi import WebSocket
+
+from autoarr.shared.core.metrics import (
+    WEBSOCKET_CONNECTIONS,
+    WEBSOCKET_EVICTIONS,
+    WEBSOCKET_SEND_LAG,
+)
+
+from .event_bus import EventType
+
+logger = logging.getLogger(__name__)
+
+# Close code sent to evicted slow consumers ("Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+# Subscription dimensions a client can filter on
+SUBSCRIPTION_FIELDS = ("event_types", "correlation_ids", "services")
+
+_VALID_EVENT_TYPES = frozenset(e.value for e in EventType)
+
+
+def serialize_message(message: Dict[str, Any]) -> str:
+    """
+    Serialize a message to a JSON text frame.
+
+    Args:
+        message: Message dictionary
+
+    Returns:
+        JSON string (datetimes and other non-JSON values are stringified)
+    """
+    return json.dumps(message, default=str, separators=(",", ":"))
+
+
+@dataclass
+class _Frame:
+    """A serialized message waiting in a client's send queue."""
+
+    payload: str
+    enqueued_at: float
+    coalesce_key: Optional[str] = None
+
+
+class ClientConnection:
+    """
+    A connected WebSocket client with its own send queue and writer task.
+
+    Args:
+        websocket: Accepted WebSocket
+        manager: Owning WebSocketManager (notified on disconnect)
+        max_queue_size: Maximum number of pending frames
+        send_timeout: Maximum time a single send may take (seconds)
+        max_lag: Oldest pending frame age that triggers eviction (seconds)
+        max_frames_per_second: Frame rate bound (0 = unlimited)
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        manager: "WebSocketManager",
+        max_queue_size: int,
+        send_timeout: float,
+        max_lag: float,
+        max_frames_per_second: float = 0.0,
+    ) -> None:
+        """Initialize client connection."""
+        self.websocket = websocket
+        self.client_id = str(uuid.uuid4())
+        self.connected_at = time.time()
+        self._manager = manager
+        self._max_queue_size = max_queue_size
+        self._send_timeout = send_timeout
+        self._max_lag = max_lag
+        self._min_frame_interval = 1.0 / max_frames_per_second if max_frames_per_second else 0.0
+        self._last_send = 0.0
+
+        self._frames: Deque[_Frame] = deque()
+        self._pending_by_key: Dict[str, _Frame] = {}
+        self._ready = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+        self.closed = False
+
+        # Topic filters; an empty set means "not constrained"
+        self.subscriptions: Dict[str, Set[str]] = {f: set() for f in SUBSCRIPTION_FIELDS}
+
+        # Metrics
+        self.messages_sent = 0
+        self.bytes_sent = 0
+        self.messages_coalesced = 0
+        self.max_queue_depth = 0
+        self._lag_total = 0.0
+        self.max_send_lag_ms = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of frames waiting to be sent."""
+        return len(self._frames)
+
+    @property
+    def current_lag_ms(self) -> float:
+        """Age of the oldest pending frame in milliseconds."""
+        if not self._frames:
+            return 0.0
+        return (time.monotonic() - self._frames[0].enqueued_at) * 1000
+
+    def start(self) -> None:
+        """Start the writer task."""
+        self._writer = asyncio.get_running_loop().create_task(self._write_loop())
+
+    def enqueue(self, payload: str, coalesce_key: Optional[str] = None) -> bool:
+        """
+        Queue a serialized frame for sending without waiting.
+
+        Args:
+            payload: Serialized message
+            coalesce_key: Pending frames with the same key are replaced
+
+        Returns:
+            True if queued (or coalesced), False if the client was evicted or closed
+        """
+        if self.closed:
+            return False
+
+        if coalesce_key is not None:
+            pending = self._pending_by_key.get(coalesce_key)
+            if pending is not None:
+                # Replace in place: keeps queue position and original lag
+                pending.payload = payload
+                self.messages_coalesced += 1
+                return True
+
+        now = time.monotonic()
+        lagging = bool(self._frames) and now - self._frames[0].enqueued_at > self._max_lag
+        if len(self._frames) >= self._max_queue_size or lagging:
+            self._manager._evict(self, f"queue depth {len(self._frames)}")
+            return False
+
+        frame = _Frame(payload=payload, enqueued_at=now, coalesce_key=coalesce_key)
+        self._frames.append(frame)
+        if coalesce_key is not None:
+            self._pending_by_key[coalesce_key] = frame
+        self.max_queue_depth = max(self.max_queue_depth, len(self._frames))
+        self._ready.set()
+        return True
+
+    async def _write_loop(self) -> None:
+        """Send queued frames in order until closed."""
+        try:
+            while True:
+                await self._ready.wait()
+                while self._frames:
+                    if self._min_frame_interval:
+                        # Frames still queued during the wait can be coalesced
+                        delay = self._last_send + self._min_frame_interval - time.monotonic()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                            if not self._frames:
+                                break
+                    frame = self._frames.popleft()
+                    if frame.coalesce_key is not None:
+                        self._pending_by_key.pop(frame.coalesce_key, None)
+
+                    await asyncio.wait_for(
+                        self.websocket.send_text(frame.payload), timeout=self._send_timeout
+                    )
+
+                    self._last_send = time.monotonic()
+                    lag = self._last_send - frame.enqueued_at
+                    WEBSOCKET_SEND_LAG.observe(lag)
+                    lag_ms = lag * 1000
+                    self._lag_total += lag_ms
+                    self.max_send_lag_ms = max(self.max_send_lag_ms, lag_ms)
+                    self.messages_sent += 1
+                    self.bytes_sent += len(frame.payload)
+                self._ready.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"WebSocket send failed for client {self.client_id}: {e}")
+            self._manager.disconnect(self.websocket)
+
+    def stop(self) -> None:
+        """Cancel the writer task and drop pending frames."""
+        self.closed = True
+        self._frames.clear()
+        self._pending_by_key.clear()
+        if self._writer is not None and not self._writer.done():
+            self._writer.cancel()
+
+    async def close(self, code: int = 1000) -> None:
+        """Stop the writer and close the socket."""
+        self.stop()
+        try:
+            await self.websocket.close(code=code)
+        except Exception as e:
+            logger.debug(f"Error closing WebSocket {self.client_id}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get lag and throughput metrics for this connection.
+
+        Returns:
+            Dict with queue depth, counters and lag in milliseconds
+        """
+        return {
+            "client_id": self.client_id,
+            "connected_seconds": round(time.time() - self.connected_at, 1),
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "messages_sent": self.messages_sent,
+            "messages_coalesced": self.messages_coalesced,
+            "bytes_sent": self.bytes_sent,
+            "current_lag_ms": round(self.current_lag_ms, 2),
+            "avg_send_lag_ms": (
+                round(self._lag_total / self.messages_sent, 2) if self.messages_sent else 0.0
+            ),
+            "max_send_lag_ms": round(self.max_send_lag_ms, 2),
+            "subscriptions": self.get_subscriptions(),
+        }
+
+    def get_subscriptions(self) -> Dict[str, List[str]]:
+        """Get this connection's topic filters as sorted lists."""
+        return {field: sorted(values) for field, values in self.subscriptions.items()}
+
+
+class WebSocketManager:
+    """
+    Manages WebSocket connections and non-blocking broadcast.
+
+    broadcast() serializes a message once and puts it on each client's queue;
+    it never awaits a socket send, so delivery time is independent of the
+    slowest client.
+
+    Args:
+        max_queue_size: Per-client pending frame limit before eviction
+        send_timeout: Maximum time a single send may take (seconds)
+        max_lag: Oldest pending frame age that triggers eviction (seconds)
+        max_frames_per_second: Per-client frame rate bound (0 = unlimited)
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 256,
+        send_timeout: float = 10.0,
+        max_lag: float = 30.0,
+        max_frames_per_second: float = 0.0,
+    ) -> None:
+        """Initialize WebSocket manager."""
+        self.max_queue_size = max_queue_size
+        self.send_timeout = send_timeout
+        self.max_lag = max_lag
+        self.max_frames_per_second = max_frames_per_second
+        self._connections: Dict[WebSocket, ClientConnection] = {}
+
+        # Subscription index: field -> value -> clients, plus clients that do
+        # not constrain that field
+        self._index: Dict[str, Dict[str, Set[ClientConnection]]] = {
+            f: {} for f in SUBSCRIPTION_FIELDS
+        }
+        self._unconstrained: Dict[str, Set[ClientConnection]] = {
+            f: set() for f in SUBSCRIPTION_FIELDS
+        }
+
+        self.total_connections = 0
+        self.total_broadcasts = 0
+        self.evicted_connections = 0
+
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        """Currently connected WebSockets."""
+        return list(self._connections)
+
+    @property
+    def connection_count(self) -> int:
+        """Number of connected clients."""
+        return len(self._connections)
+
+    def get_connection(self, websocket: WebSocket) -> Optional[ClientConnection]:
+        """Get the client connection for a WebSocket, if connected."""
+        return self._connections.get(websocket)
+
+    async def connect(self, websocket: WebSocket) -> ClientConnection:
+        """
+        Accept a WebSocket and start its writer task.
+
+        Args:
+            websocket: Incoming WebSocket
+
+        Returns:
+            The new ClientConnection
+        """
+        await websocket.accept()
+        client = ClientConnection(
+            websocket,
+            self,
+            max_queue_size=self.max_queue_size,
+            send_timeout=self.send_timeout,
+            max_lag=self.max_lag,
+            max_frames_per_second=self.max_frames_per_second,
+        )
+        client.start()
+        self._connections[websocket] = client
+        for field in SUBSCRIPTION_FIELDS:
+            self._unconstrained[field].add(client)
+        self.total_connections += 1
+        logger.info(f"WebSocket connected. Active connections: {len(self._connections)}")
+        return client
+
+    def disconnect(self, websocket: WebSocket) -> None:
+        """
+        Remove a connection and stop its writer task.
+
+        Args:
+            websocket: WebSocket to remove
+        """
+        client = self._connections.pop(websocket, None)
+        if client is None:
+            return
+        self._remove_from_index(client)
+        client.stop()
+        logger.info(f"WebSocket disconnected. Active connections: {len(self._connections)}")
+
+    async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket) -> None:
+        """
+        Queue a message for one connection.
+
+        Args:
+            message: Message dictionary
+            websocket: Target WebSocket
+        """
+        client = self._connections.get(websocket)
+        if client is not None:
+            client.enqueue(serialize_message(message))
+
+    async def broadcast(
+        self,
+        message: Dict[str, Any],
+        coalesce_key: Optional[str] = None,
+        event_type: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        service: Optional[str] = None,
+    ) -> int:
+        """
+        Queue a message for interested connections without waiting for sends.
+
+        Messages without routing attributes go to every connection; event
+        messages go only to connections whose subscriptions match.
+
+        Args:
+            message: Message dictionary
+            coalesce_key: Optional key; a still-pending message with the same key
+                is replaced instead of queuing another frame
+            event_type: Event type used for subscription routing
+            correlation_id: Correlation ID used for subscription routing
+            service: Originating service used for subscription routing
+
+        Returns:
+            Number of clients the message was queued for
+        """
+        self.total_broadcasts += 1
+        if not self._connections:
+            return 0
+
+        if event_type is None and correlation_id is None and service is None:
+            targets: Iterable[ClientConnection] = list(self._connections.values())
+        else:
+            targets = self._route(event_type, correlation_id, service)
+            if not targets:
+                return 0
+
+        payload = serialize_message(message)
+        delivered = 0
+        for client in targets:
+            if client.enqueue(payload, coalesce_key):
+                delivered += 1
+        return delivered
+
+    def _route(
+        self,
+        event_type: Optional[str],
+        correlation_id: Optional[str],
+        service: Optional[str],
+    ) -> List[ClientConnection]:
+        """Find connections whose subscriptions match an event."""
+        targets: Optional[Set[ClientConnection]] = None
+        for field, value in zip(SUBSCRIPTION_FIELDS, (event_type, correlation_id, service)):
+            matches = self._unconstrained[field]
+            if value is not None:
+                subscribed = self._index[field].get(value)
+                if subscribed:
+                    matches = matches | subscribed
+            targets = set(matches) if targets is None else targets & matches
+            if not targets:
+                return []
+        return list(targets or ())
+
+    def subscribe(
+        self,
+        websocket: WebSocket,
+        event_types: Optional[Iterable[str]] = None,
+        correlation_ids: Optional[Iterable[str]] = None,
+        services: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Add topic filters for a connection.
+
+        Args:
+            websocket: Connection to update
+            event_types: Event types to receive
+            correlation_ids: Correlation IDs to receive
+            services: Originating services to receive
+
+        Returns:
+            The connection's subscriptions after the update
+
+        Raises:
+            ValueError: If an unknown event type is given or the socket is not connected
+        """
+        client = self._require_connection(websocket)
+        updates = self._normalize(event_types, correlation_ids, services)
+        for field, values in updates.items():
+            for value in values - client.subscriptions[field]:
+                self._index[field].setdefault(value, set()).add(client)
+            client.subscriptions[field] |= values
+            if client.subscriptions[field]:
+                self._unconstrained[field].discard(client)
+        return client.get_subscriptions()
+
+    def unsubscribe(
+        self,
+        websocket: WebSocket,
+        event_types: Optional[Iterable[str]] = None,
+        correlation_ids: Optional[Iterable[str]] = None,
+        services: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Remove topic filters for a connection.
+
+        With no filters given, every subscription is cleared and the
+        connection receives all events again.
+
+        Args:
+            websocket: Connection to update
+            event_types: Event types to stop receiving
+            correlation_ids: Correlation IDs to stop receiving
+            services: Originating services to stop receiving
+
+        Returns:
+            The connection's subscriptions after the update
+
+        Raises:
+            ValueError: If an unknown event type is given or the socket is not connected
+        """
+        client = self._require_connection(websocket)
+        if event_types is None and correlation_ids is None and services is None:
+            updates = {field: set(client.subscriptions[field]) for field in SUBSCRIPTION_FIELDS}
+        else:
+            updates = self._normalize(event_types, correlation_ids, services)
+
+        for field, values in updates.items():
+            for value in values & client.subscriptions[field]:
+                self._discard_index(field, value, client)
+            client.subscriptions[field] -= values
+            if not client.subscriptions[field]:
+                self._unconstrained[field].add(client)
+        return client.get_subscriptions()
+
+    async def handle_client_message(self, websocket: WebSocket, data: str) -> None:
+        """
+        Handle a text frame received from a client.
+
+        Subscription commands are applied and answered with the resulting
+        subscriptions; anything else is acknowledged.
+
+        Args:
+            websocket: Connection the frame arrived on
+            data: Raw text frame
+        """
+        try:
+            command = json.loads(data)
+        except ValueError:
+            command = None
+
+        action = command.get("action") if isinstance(command, dict) else None
+        if action not in ("subscribe", "unsubscribe", "list_subscriptions"):
+            await self.send_personal_message(
+                {"type": "ack", "message": "Message received"}, websocket
+            )
+            return
+
+        try:
+            if action == "list_subscriptions":
+                subscriptions = self._require_connection(websocket).get_subscriptions()
+            else:
+                handler = self.subscribe if action == "subscribe" else self.unsubscribe
+                subscriptions = handler(
+                    websocket,
+                    event_types=command.get("event_types"),
+                    correlation_ids=command.get("correlation_ids"),
+                    services=command.get("services"),
+                )
+        except (TypeError, ValueError) as e:
+            await self.send_personal_message({"type": "error", "message": str(e)}, websocket)
+            return
+
+        await self.send_personal_message(
+            {"type": "subscriptions", "action": action, "subscriptions": subscriptions},
+            websocket,
+        )
+
+    def _require_connection(self, websocket: WebSocket) -> ClientConnection:
+        """Get a connected client or raise ValueError."""
+        client = self._connections.get(websocket)
+        if client is None:
+            raise ValueError("WebSocket is not connected")
+        return client
+
+    @staticmethod
+    def _normalize(
+        event_types: Optional[Iterable[str]],
+        correlation_ids: Optional[Iterable[str]],
+        services: Optional[Iterable[str]],
+    ) -> Dict[str, Set[str]]:
+        """Validate subscription values and convert them to sets."""
+        updates: Dict[str, Set[str]] = {}
+        for field, values in zip(SUBSCRIPTION_FIELDS, (event_types, correlation_ids, services)):
+            if values is None:
+                continue
+            if isinstance(values, str):
+                values = [values]
+            updates[field] = {str(v) for v in values}
+
+        unknown = updates.get("event_types", set()) - _VALID_EVENT_TYPES
+        if unknown:
+            raise ValueError(f"Unknown event types: {', '.join(sorted(unknown))}")
+        return updates
+
+    def _discard_index(self, field: str, value: str, client: ClientConnection) -> None:
+        """Remove a client from one index entry, dropping empty entries."""
+        clients = self._index[field].get(value)
+        if clients is not None:
+            clients.discard(client)
+            if not clients:
+                del self._index[field][value]
+
+    def _remove_from_index(self, client: ClientConnection) -> None:
+        """Remove a client from every index entry."""
+        for field in SUBSCRIPTION_FIELDS:
+            self._unconstrained[field].discard(client)
+            for value in client.subscriptions[field]:
+                self._discard_index(field, value, client)
+
+    def _evict(self, client: ClientConnection, reason: str) -> None:
+        """Disconnect a slow consumer and close its socket in the background."""
+        if self._connections.get(client.websocket) is not client:
+            return
+        self.evicted_connections += 1
+        WEBSOCKET_EVICTIONS.inc()
+        logger.warning(f"Evicting slow WebSocket client {client.client_id}: {reason}")
+        del self._connections[client.websocket]
+        self._remove_from_index(client)
+        client.stop()
+        asyncio.get_running_loop().create_task(client.close(code=SLOW_CONSUMER_CLOSE_CODE))
+
+    async def close_all(self) -> None:
+        """Close every connection (used on shutdown)."""
+        clients = list(self._connections.values())
+        self._connections.clear()
+        for client in clients:
+            self._remove_from_index(client)
+        if clients:
+            await asyncio.gather(*(c.close() for c in clients), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get connection counts and per-connection lag metrics.
+
+        Returns:
+            Dict with totals and a list of per-connection statistics
+        """
+        connections = [c.get_stats() for c in self._connections.values()]
+        return {
+            "active_connections": len(connections),
+            "total_connections": self.total_connections,
+            "total_broadcasts": self.total_broadcasts,
+            "evicted_connections": self.evicted_connections,
+            "max_queue_size": self.max_queue_size,
+            "max_current_lag_ms": max((c["current_lag_ms"] for c in connections), default=0.0),
+            "connections": connections,
+        }
+
+
+# Global WebSocket manager instance
+_websocket_manager: Optional[WebSocketManager] = None
+
+
+def get_websocket_manager() -> WebSocketManager:
+    """
+    Get the global WebSocketManager instance.
+
+    Returns:
+        WebSocketManager singleton configured from settings
+    """
+    global _websocket_manager
+    if _websocket_manager is None:
+        from ..config import get_settings
+
+        settings = get_settings()
+        _websocket_manager = WebSocketManager(
+            max_queue_size=settings.websocket_send_queue_size,
+            send_timeout=settings.websocket_send_timeout,
+            max_lag=settings.websocket_max_lag,
+            max_frames_per_second=settings.websocket_max_frames_per_second,
+        )
+    return _websocket_manager
+
+
+# Connected clients of the global manager, read at scrape time
+WEBSOCKET_CONNECTIONS.set_function(
+    lambda: _websocket_manager.connection_count if _websocket_manager else 0
+)
+
+
+def reset_websocket_manager() -> None:
+    """Reset the global WebSocketManager (for testing)."""
+    global _websocket_manager
+    _websocket_manager = None
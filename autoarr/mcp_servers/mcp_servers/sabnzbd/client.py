@@ -25,7 +25,10 @@ It handles authentication, request formatting, response parsing, and error handl
 import json
 from typing import Any, Dict, List, Optional
 
-from httpx import AsyncClient, HTTPError
+from httpx import AsyncClient, HTTPError, TimeoutException
+
+from autoarr.shared.core.metrics import UPSTREAM_REQUEST_RETRIES, UPSTREAM_REQUEST_TIMEOUTS
+from autoarr.shared.core.request_timing import traced
 
 
 # Custom exceptions
@@ -172,6 +175,7 @@ class SABnzbdClient:
         query_string = urlencode(query_params)
         return f"{base}?{query_string}"
 
+    @traced("sabnzbd")
     async def _request(self, mode: str, max_retries: int = 3, **params: Any) -> Dict[str, Any]:
         """
         Make an API request to SABnzbd.
@@ -203,6 +207,7 @@ class SABnzbdClient:
                     # Service unavailable - retry
                     last_error = SABnzbdClientError("Server unavailable (503)")
                     if attempt < max_retries - 1:
+                        UPSTREAM_REQUEST_RETRIES.labels("sabnzbd").inc()
                         continue
                     raise SABnzbdClientError("Server unavailable after retries")
                 elif response.status_code >= 500:
@@ -224,8 +229,11 @@ class SABnzbdClient:
 
             except HTTPError as e:
                 last_error = e
+                if isinstance(e, TimeoutException):
+                    UPSTREAM_REQUEST_TIMEOUTS.labels("sabnzbd").inc()
                 # Retry on connection errors
                 if attempt < max_retries - 1:
+                    UPSTREAM_REQUEST_RETRIES.labels("sabnzbd").inc()
                     continue
                 raise SABnzbdConnectionError(f"Connection failed: {e}")
 
@@ -23,12 +23,17 @@ It handles authentication via X-Plex-Token header, request formatting, response
 and error handling.
 """
 
+import asyncio
 import json
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlencode
+from xml.parsers import expat
 
-from httpx import AsyncClient, HTTPError
+from httpx import AsyncClient, HTTPError, TimeoutException
+
+from autoarr.shared.core.metrics import UPSTREAM_REQUEST_RETRIES, UPSTREAM_REQUEST_TIMEOUTS
+from autoarr.shared.core.request_timing import traced
 
 
 # Custom exceptions
@@ -40,6 +45,10 @@ class PlexConnectionError(PlexClientError):
     """Exception raised when connection to Plex fails."""
 
 
+# Keys that hold media items inside a MediaContainer, in lookup order
+MEDIA_CONTAINER_ITEM_KEYS = ("Metadata", "Video", "Directory", "Track")
+
+
 class PlexClient:
     """
     Async client for Plex Media Server API.
@@ -215,6 +224,55 @@ class PlexClient:
 
         return result
 
+    @staticmethod
+    def _parse_xml_bytes(content: bytes) -> Dict[str, Any]:
+        """
+        Parse a raw XML response body to a dictionary in a single pass.
+
+        Produces the same structure as _parse_xml_to_dict on the root element,
+        but feeds the undecoded bytes to expat and builds each node's dict from
+        the start/end callbacks. No ElementTree is built, and each node's
+        bookkeeping is released as soon as its end tag is seen.
+
+        Args:
+            content: Raw XML bytes
+
+        Returns:
+            Dictionary representation of the root element
+
+        Raises:
+            ExpatError: If the XML is malformed
+        """
+        # (attributes dict, children grouped by tag) for each open element
+        stack: List[Tuple[Dict[str, Any], Dict[str, List[Any]]]] = []
+        result: Dict[str, Any] = {}
+
+        def start(tag: str, attrs: Dict[str, Any]) -> None:
+            stack.append((attrs, {}))
+
+        def end(tag: str) -> None:
+            nonlocal result
+            node, children = stack.pop()
+            for child_tag, items in children.items():
+                # If only one item, don't use a list
+                node[child_tag] = items if len(items) > 1 else items[0]
+            if stack:
+                siblings = stack[-1][1]
+                group = siblings.get(tag)
+                if group is None:
+                    siblings[tag] = [node]
+                else:
+                    group.append(node)
+            else:
+                result = node
+
+        parser = expat.ParserCreate()
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.Parse(content, True)
+        return result
+
+    @traced("plex")
     async def _request(  # noqa: C901
         self,
         method: str,
@@ -269,6 +327,7 @@ class PlexClient:
                     # Service unavailable - retry
                     last_error = PlexClientError("Server unavailable (503)")
                     if attempt < max_retries - 1:
+                        UPSTREAM_REQUEST_RETRIES.labels("plex").inc()
                         continue
                     raise PlexClientError("Server unavailable after retries (503)")
                 elif response.status_code >= 500:
@@ -283,7 +342,7 @@ class PlexClient:
                 # Parse response
                 if response.status_code == 200 or response.status_code == 201:
                     try:
-                        if not response.text:
+                        if not response.content:
                             return {}
 
                         # Check content type
@@ -297,29 +356,30 @@ class PlexClient:
                             or parse_xml
                         ):
                             # Parse XML to dict
-                            root = ET.fromstring(response.text)
-                            return self._parse_xml_to_dict(root)
+                            return self._parse_xml_bytes(response.content)
                         else:
                             # Try JSON first, fall back to XML
                             try:
                                 return response.json()
                             except json.JSONDecodeError:
                                 try:
-                                    root = ET.fromstring(response.text)
-                                    return self._parse_xml_to_dict(root)
-                                except ET.ParseError:
+                                    return self._parse_xml_bytes(response.content)
+                                except expat.ExpatError:
                                     raise PlexClientError(
                                         f"Invalid response format: {response.text[:100]}"
                                     )
-                    except (json.JSONDecodeError, ET.ParseError) as e:
+                    except (json.JSONDecodeError, expat.ExpatError) as e:
                         raise PlexClientError(f"Invalid response: {e}")
 
                 return {}
 
             except HTTPError as e:
                 last_error = e
+                if isinstance(e, TimeoutException):
+                    UPSTREAM_REQUEST_TIMEOUTS.labels("plex").inc()
                 # Retry on connection errors
                 if attempt < max_retries - 1:
+                    UPSTREAM_REQUEST_RETRIES.labels("plex").inc()
                     continue
                 raise PlexConnectionError(f"Connection failed: {e}")
 
@@ -410,17 +470,105 @@ class PlexClient:
             "GET", f"library/sections/{library_id}/all", **params
         )  # noqa: F841
 
-        # Extract Metadata or Video list from MediaContainer
-        if "MediaContainer" in result:
-            # Try different possible keys
-            for key in ["Metadata", "Video", "Directory", "Track"]:
-                items = result["MediaContainer"].get(key, [])
-                if items:
-                    if isinstance(items, dict):
-                        return [items]
-                    return items if isinstance(items, list) else []
+        return self._extract_items(result)
 
-        return []
+    async def get_library_page(
+        self,
+        library_id: str,
+        start: int,
+        size: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Get one page of library items.
+
+        Args:
+            library_id: The library section ID
+            start: Offset of the first item (X-Plex-Container-Start)
+            size: Page size (X-Plex-Container-Size)
+            filters: Optional Plex filter parameters (e.g. {"updatedAt>>": 1700000000})
+
+        Returns:
+            Tuple of (items, total item count in the section if reported)
+        """
+        result = await self._request(
+            "GET",
+            f"library/sections/{library_id}/all",
+            **(filters or {}),
+            **{"X-Plex-Container-Start": start, "X-Plex-Container-Size": size},
+        )
+        total = None
+        container = result.get("MediaContainer") if isinstance(result, dict) else None
+        if isinstance(container, dict) and container.get("totalSize") is not None:
+            try:
+                total = int(container["totalSize"])
+            except (TypeError, ValueError):
+                total = None
+        return self._extract_items(result), total
+
+    async def iter_library_items(
+        self,
+        library_id: str,
+        page_size: int = 500,
+        fields: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream items in a library one page at a time.
+
+        Pages are requested with X-Plex-Container-Start/Size, and the next page
+        is fetched while the current one is being consumed, so memory stays
+        bounded to about two pages regardless of section size.
+
+        Args:
+            library_id: The library section ID
+            page_size: Items per request
+            fields: Optional item keys to keep (e.g. ["ratingKey", "title"]);
+                everything else, including nested Media/Part data, is dropped
+            limit: Maximum number of items to yield (optional)
+            offset: Number of items to skip
+            filters: Optional Plex filter parameters, e.g. {"updatedAt>>": ts}
+                for items updated after ts
+
+        Yields:
+            Media item dictionaries
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        keep = frozenset(fields) if fields else None
+        remaining = limit
+        start = offset
+
+        def fetch() -> Tuple[asyncio.Task, int]:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page = self.get_library_page(library_id, start, size, filters=filters)
+            return asyncio.ensure_future(page), size
+
+        pending: Optional[asyncio.Task] = None
+        if remaining is None or remaining > 0:
+            pending, requested = fetch()
+        try:
+            while pending is not None:
+                items, total = await pending
+                items = items[:requested]
+                pending = None
+                start += len(items)
+                if remaining is not None:
+                    remaining -= len(items)
+
+                # A short page (or reaching totalSize) means the section is exhausted
+                exhausted = len(items) < requested or (total is not None and start >= total)
+                if not exhausted and (remaining is None or remaining > 0):
+                    # Prefetch the next page before handing out the current one
+                    pending, requested = fetch()
+
+                for item in items:
+                    yield item if keep is None else {k: v for k, v in item.items() if k in keep}
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
 
     async def get_recently_added(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -438,9 +586,21 @@ class PlexClient:
 
         result = await self._request("GET", "library/recentlyAdded", **params)  # noqa: F841
 
-        # Extract Metadata or Video list from MediaContainer
-        if "MediaContainer" in result:
-            for key in ["Metadata", "Video", "Directory", "Track"]:
+        return self._extract_items(result)
+
+    @staticmethod
+    def _extract_items(result: Any) -> List[Dict[str, Any]]:
+        """
+        Extract the media item list from a MediaContainer response.
+
+        Args:
+            result: Parsed Plex response
+
+        Returns:
+            List of media item dictionaries (empty if none)
+        """
+        if isinstance(result, dict) and "MediaContainer" in result:
+            for key in MEDIA_CONTAINER_ITEM_KEYS:
                 items = result["MediaContainer"].get(key, [])
                 if items:
                     if isinstance(items, dict):
@@ -27,7 +27,10 @@ import json
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlencode
 
-from httpx import AsyncClient, HTTPError
+from httpx import AsyncClient, HTTPError, TimeoutException
+
+from autoarr.shared.core.metrics import UPSTREAM_REQUEST_RETRIES, UPSTREAM_REQUEST_TIMEOUTS
+from autoarr.shared.core.request_timing import traced
 
 
 # Custom exceptions
@@ -180,6 +183,7 @@ class SonarrClient:
             "Content-Type": "application/json",
         }
 
+    @traced("sonarr")
     async def _request(  # noqa: C901
         self,
         method: str,
@@ -232,6 +236,7 @@ class SonarrClient:
                     # Service unavailable - retry
                     last_error = SonarrClientError("Server unavailable (503)")
                     if attempt < max_retries - 1:
+                        UPSTREAM_REQUEST_RETRIES.labels("sonarr").inc()
                         continue
                     raise SonarrClientError("Server unavailable after retries (503)")
                 elif response.status_code >= 500:
@@ -257,8 +262,11 @@ class SonarrClient:
 
             except HTTPError as e:
                 last_error = e
+                if isinstance(e, TimeoutException):
+                    UPSTREAM_REQUEST_TIMEOUTS.labels("sonarr").inc()
                 # Retry on connection errors
                 if attempt < max_retries - 1:
+                    UPSTREAM_REQUEST_RETRIES.labels("sonarr").inc()
                     continue
                 raise SonarrConnectionError(f"Connection failed: {e}")
 
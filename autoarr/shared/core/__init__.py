@@ -31,6 +31,8 @@ from .exceptions import (
     MCPToolError,
 )
 from .mcp_orchestrator import CircuitBreaker, MCPOrchestrator
+from .metrics import MetricsRegistry, get_metrics_registry
+from .request_timing import RequestTiming, span, traced
 
 __all__ = [
     # Main orchestrator
@@ -45,4 +47,11 @@ __all__ = [
     "MCPToolError",
     "MCPTimeoutError",
     "CircuitBreakerOpenError",
+    # Metrics
+    "MetricsRegistry",
+    "get_metrics_registry",
+    # Request timing
+    "RequestTiming",
+    "span",
+    "traced",
 ]
@@ -24,9 +24,11 @@ management, tool routing, parallel execution, error handling, and health monitor
 """
 
 import asyncio
+import json
+import logging
 import time
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from unittest.mock import AsyncMock
 
 from .config import MCPOrchestratorConfig, ServerConfig
@@ -37,6 +39,20 @@ from .exceptions import (
     MCPTimeoutError,
     MCPToolError,
 )
+from .metrics import (
+    CIRCUIT_BREAKER_STATE,
+    CIRCUIT_BREAKER_TRANSITIONS,
+    TOOL_CALL_DURATION,
+    TOOL_CALL_RETRIES,
+    TOOL_CALL_TIMEOUTS,
+    TOOL_CALLS_IN_FLIGHT,
+)
+from .request_timing import span
+
+logger = logging.getLogger(__name__)
+
+# Circuit breaker states as exported by the autoarr_circuit_breaker_state gauge
+_CIRCUIT_STATE_CODES = {"closed": 0, "half_open": 1, "open": 2}
 
 
 class CircuitBreaker:
@@ -54,6 +70,7 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         timeout: float = 60.0,
         success_threshold: int = 3,
+        name: Optional[str] = None,
     ) -> None:
         """
         Initialize circuit breaker.
@@ -62,22 +79,35 @@ class CircuitBreaker:
             failure_threshold: Number of failures before opening circuit
             timeout: Seconds to wait before transitioning to half-open
             success_threshold: Successes needed to close from half-open
+            name: Server name used to label state transition metrics
         """
         self.failure_threshold = failure_threshold
         self.timeout = timeout
         self.success_threshold = success_threshold
+        self.name = name
 
         self.failure_count = 0
         self.success_count = 0
         self.state = "closed"
         self.last_failure_time: Optional[float] = None
+        if name:
+            CIRCUIT_BREAKER_STATE.labels(name).set(0)
+
+    def _transition(self, state: str) -> None:
+        """Move to a new state, recording the change for named breakers."""
+        if state == self.state:
+            return
+        if self.name:
+            CIRCUIT_BREAKER_TRANSITIONS.labels(self.name, self.state, state).inc()
+            CIRCUIT_BREAKER_STATE.labels(self.name).set(_CIRCUIT_STATE_CODES[state])
+        self.state = state
 
     def get_state(self) -> Dict[str, Any]:
         """Get current circuit breaker state."""
         # Check if we should transition from open to half-open
         if self.state == "open" and self.last_failure_time:
             if time.time() - self.last_failure_time > self.timeout:
-                self.state = "half_open"
+                self._transition("half_open")
                 self.success_count = 0
 
         return {
@@ -127,7 +157,7 @@ class CircuitBreaker:
             self.success_count += 1
             if self.success_count >= self.success_threshold:
                 # Close the circuit
-                self.state = "closed"
+                self._transition("closed")
                 self.failure_count = 0
                 self.success_count = 0
         elif self.state == "closed":
@@ -140,12 +170,12 @@ class CircuitBreaker:
 
         if self.state == "half_open":
             # Failed in half-open, go back to open
-            self.state = "open"
+            self._transition("open")
             self.success_count = 0
         else:
             self.failure_count += 1
             if self.failure_count >= self.failure_threshold:
-                self.state = "open"
+                self._transition("open")
 
     def force_state(self, state: str) -> None:
         """
@@ -155,7 +185,7 @@ class CircuitBreaker:
             state: State to set (closed, open, half_open)
         """
         if state in ["closed", "open", "half_open"]:
-            self.state = state
+            self._transition(state)
             if state == "closed":
                 self.failure_count = 0
                 self.success_count = 0
@@ -237,6 +267,8 @@ class MCPOrchestrator:
         # Server status tracking
         self._server_status: Dict[str, Dict[str, Any]] = {}
         self._health_check_failures: Dict[str, int] = {}
+        # Result of the latest health check per server
+        self._health_snapshot: Dict[str, Dict[str, Any]] = {}
 
         # Pending tasks tracking
         self._pending_tasks: Set[asyncio.Task] = set()
@@ -408,6 +440,7 @@ class MCPOrchestrator:
                     failure_threshold=self.circuit_breaker_threshold,
                     timeout=self.circuit_breaker_timeout,
                     success_threshold=self.circuit_breaker_success_threshold,
+                    name=server_name,
                 )
 
             # Connect with retries
@@ -551,90 +584,111 @@ class MCPOrchestrator:
         # Execute with circuit breaker and retries
         async def _execute():
             """Execute the tool call."""
-            return await asyncio.wait_for(client.call_tool(tool, params), timeout=call_timeout)
+            with span("mcp", f"{server}.{tool}"):
+                return await asyncio.wait_for(client.call_tool(tool, params), timeout=call_timeout)
 
-        # Retry logic
-        last_error = None
-        for attempt in range(self.max_retries + 1):
-            try:
-                # Use circuit breaker if available
-                if circuit_breaker:
-                    result = await circuit_breaker.call(_execute)  # noqa: F841
-                else:
-                    result = await _execute()  # noqa: F841
+        in_flight = TOOL_CALLS_IN_FLIGHT.labels(server)
+        in_flight.inc()
+        outcome = "error"
+        try:
+            # Retry logic
+            last_error = None
+            for attempt in range(self.max_retries + 1):
+                try:
+                    # Use circuit breaker if available
+                    if circuit_breaker:
+                        result = await circuit_breaker.call(_execute)  # noqa: F841
+                    else:
+                        result = await _execute()  # noqa: F841
+
+                    outcome = "success"
+
+                    # Update stats
+                    self._stats["total_calls"] += 1
+                    self._stats["calls_per_server"][server] = (
+                        self._stats["calls_per_server"].get(server, 0) + 1
+                    )
 
-                # Update stats
-                self._stats["total_calls"] += 1
-                self._stats["calls_per_server"][server] = (
-                    self._stats["calls_per_server"].get(server, 0) + 1
-                )
+                    # Add metadata if requested
+                    if include_metadata:
+                        duration = time.time() - start_time
+                        return {
+                            "data": result,
+                            "metadata": {
+                                "server": server,
+                                "tool": tool,
+                                "duration": duration,
+                            },
+                        }
 
-                # Add metadata if requested
-                if include_metadata:
-                    duration = time.time() - start_time
-                    return {
-                        "data": result,
-                        "metadata": {
-                            "server": server,
-                            "tool": tool,
-                            "duration": duration,
-                        },
-                    }
+                    return result
+
+                except asyncio.TimeoutError:
+                    outcome = "timeout"
+                    TOOL_CALL_TIMEOUTS.labels(server, tool).inc()
+                    raise MCPTimeoutError(
+                        f"[{server}] Tool call timed out after {call_timeout}s",
+                        server=server,
+                        tool=tool,
+                        timeout=call_timeout,
+                    )
+                except CircuitBreakerOpenError:
+                    outcome = "circuit_open"
+                    raise
+                except MCPToolError:
+                    raise
+                except Exception as e:
+                    last_error = e
 
-                return result
+                    # Check if error is retryable
+                    is_retryable = any(
+                        isinstance(e, err_type) for err_type in self.retryable_errors
+                    )
 
-            except asyncio.TimeoutError:
-                raise MCPTimeoutError(
-                    f"[{server}] Tool call timed out after {call_timeout}s",
-                    server=server,
-                    tool=tool,
-                    timeout=call_timeout,
-                )
-            except CircuitBreakerOpenError:
-                raise
-            except MCPToolError:
-                raise
-            except Exception as e:
-                last_error = e
-
-                # Check if error is retryable
-                is_retryable = any(isinstance(e, err_type) for err_type in self.retryable_errors)
-
-                if not is_retryable:
-                    # Invoke error callback before raising
-                    if self.on_error:
-                        self.on_error(
-                            {"server": server, "tool": tool, "error": str(e), "attempt": attempt}
-                        )
-                    # Not retryable, raise immediately
-                    raise MCPOrchestratorError(f"[{server}] {str(e)}")
-
-                if attempt < self.max_retries:
-                    # Auto-reconnect if enabled
-                    if self.auto_reconnect and isinstance(e, ConnectionError):
-                        await self.reconnect(server)
-
-                    # Exponential backoff
-                    delay = (2**attempt) * 0.5
-                    await asyncio.sleep(delay)
-                    continue
+                    if not is_retryable:
+                        # Invoke error callback before raising
+                        if self.on_error:
+                            self.on_error(
+                                {
+                                    "server": server,
+                                    "tool": tool,
+                                    "error": str(e),
+                                    "attempt": attempt,
+                                }
+                            )
+                        # Not retryable, raise immediately
+                        raise MCPOrchestratorError(f"[{server}] {str(e)}")
+
+                    if attempt < self.max_retries:
+                        # Auto-reconnect if enabled
+                        if self.auto_reconnect and isinstance(e, ConnectionError):
+                            await self.reconnect(server)
 
-        # All retries exhausted - invoke error callback if set
-        if last_error:
-            if self.on_error:
-                self.on_error(
-                    {
-                        "server": server,
-                        "tool": tool,
-                        "error": str(last_error),
-                        "attempt": self.max_retries,
-                    }
-                )
-            if isinstance(last_error, ConnectionError):
-                raise MCPConnectionError(
-                    f"[{server}] {str(last_error)}", server=server, original_error=last_error
-                )
-            raise MCPOrchestratorError(f"[{server}] {str(last_error)}")
+                        # Exponential backoff
+                        TOOL_CALL_RETRIES.labels(server, tool).inc()
+                        delay = (2**attempt) * 0.5
+                        await asyncio.sleep(delay)
+                        continue
+
+            # All retries exhausted - invoke error callback if set
+            if last_error:
+                if self.on_error:
+                    self.on_error(
+                        {
+                            "server": server,
+                            "tool": tool,
+                            "error": str(last_error),
+                            "attempt": self.max_retries,
+                        }
+                    )
+                if isinstance(last_error, ConnectionError):
+                    raise MCPConnectionError(
+                        f"[{server}] {str(last_error)}", server=server, original_error=last_error
+                    )
+                raise MCPOrchestratorError(f"[{server}] {str(last_error)}")
+        finally:
+            in_flight.dec()
+            TOOL_CALL_DURATION.labels(server, tool, outcome).observe(time.time() - start_time)
 
     async def call_tools_parallel(
         self,
@@ -678,41 +732,114 @@ class MCPOrchestrator:
         tasks = [asyncio.create_task(_execute_call(call, i)) for i, call in enumerate(calls)]
 
         # Execute with optional timeout
-        if self.parallel_timeout:
-            try:
-                results = await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=True), timeout=self.parallel_timeout
-                )
-            except asyncio.TimeoutError:
-                if return_partial:
-                    # Get partial results
-                    results = []
-                    for task in tasks:
-                        if task.done():
-                            results.append(task.result())
-                        else:
-                            results.append({"success": False, "data": {}, "error": "Timeout"})
-                else:
-                    raise
-        else:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Sort results by index to maintain order
-        sorted_results = sorted(
-            [r for r in results if isinstance(r, dict)], key=lambda x: x.get("index", 0)
-        )
-
-        # Remove index from results
-        for result in sorted_results:
-            result.pop("index", None)
+        _, pending = await asyncio.wait(tasks, timeout=self.parallel_timeout or None)
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if not return_partial:
+                raise asyncio.TimeoutError()
+
+        # Collect results in input order; every call gets an entry, including
+        # those that timed out or raised
+        results = []
+        for task in tasks:
+            if task.cancelled():
+                results.append({"success": False, "data": {}, "error": "Timeout"})
+            elif task.exception() is not None:
+                results.append({"success": False, "data": {}, "error": str(task.exception())})
+            else:
+                result = task.result()
+                result.pop("index", None)
+                results.append(result)
 
         # Handle critical failures
         if self.cancel_on_critical_failure:
-            for result in sorted_results:
+            for result in results:
                 if not result["success"] and "Critical" in result.get("error", ""):
                     raise MCPOrchestratorError(f"Critical failure: {result['error']}")
 
-        return sorted_results
+        return results
+
+    @staticmethod
+    def _call_key(call: Any) -> Tuple[str, str, str]:
+        """Identity of a tool call, used to deduplicate calls within a batch."""
+        params = json.dumps(call.params, sort_keys=True, default=str)
+        return call.server, call.tool, params
+
+    async def iter_tools_parallel(
+        self,
+        calls: List[Any],
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Execute multiple tool calls in parallel, yielding each result as it completes.
+
+        Identical calls (same server, tool and params) in the batch are executed
+        once and their result is yielded for every index. When the deadline
+        passes, calls still running are cancelled and reported as failed.
+
+        Args:
+            calls: List of tool calls (MCPToolCall objects)
+            deadline: Optional time budget for the whole batch in seconds
+
+        Yields:
+            (index, result) pairs in completion order, where index is the
+            position of the call in ``calls``
+        """
+        if not calls:
+            return
+
+        semaphore = asyncio.Semaphore(self.max_parallel_calls)
+
+        async def _execute_call(call: Any) -> Dict[str, Any]:
+            """Execute a single call with semaphore."""
+            async with semaphore:
+                try:
+                    result = await self.call_tool(
+                        call.server, call.tool, call.params, timeout=getattr(call, "timeout", None)
+                    )
+                    return {"success": True, "data": result, "error": None}
+                except Exception as e:
+                    return {"success": False, "data": {}, "error": str(e)}
+
+        # One task per distinct call
+        indices: Dict["asyncio.Task[Dict[str, Any]]", List[int]] = {}
+        tasks_by_key: Dict[Tuple[str, str, str], "asyncio.Task[Dict[str, Any]]"] = {}
+        for index, call in enumerate(calls):
+            key = self._call_key(call)
+            task = tasks_by_key.get(key)
+            if task is None:
+                task = asyncio.create_task(_execute_call(call))
+                tasks_by_key[key] = task
+                indices[task] = []
+            indices[task].append(index)
+
+        loop = asyncio.get_running_loop()
+        ends_at = loop.time() + deadline if deadline else None
+        pending = set(indices)
+        try:
+            while pending:
+                timeout = None if ends_at is None else max(0.0, ends_at - loop.time())
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for task in done:
+                    for index in indices[task]:
+                        yield index, dict(task.result())
+
+            for task in pending:
+                for index in indices[task]:
+                    yield index, {
+                        "success": False,
+                        "data": {},
+                        "error": f"Batch deadline of {deadline}s exceeded",
+                    }
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def list_tools(self, server: str) -> List[str]:
         """
@@ -754,6 +881,8 @@ class MCPOrchestrator:
         """
         Check health of a specific server.
 
+        The result is recorded in the health snapshot (see get_health_snapshot).
+
         Args:
             server: Server name
 
@@ -762,6 +891,17 @@ class MCPOrchestrator:
         """
         server = self._resolve_server_name(server)
 
+        start_time = time.time()
+        is_healthy = await self._probe_health(server)
+        self._health_snapshot[server] = {
+            "healthy": is_healthy,
+            "latency_ms": round((time.time() - start_time) * 1000, 2),
+            "checked_at": time.time(),
+        }
+        return is_healthy
+
+    async def _probe_health(self, server: str) -> bool:
+        """Probe a server's health, updating failure tracking."""
         if not await self.is_connected(server):
             return False
 
@@ -801,11 +941,9 @@ class MCPOrchestrator:
         Returns:
             Dictionary mapping server names to health status
         """
-        results = {}
-
-        for server_name in self._clients:
-            is_healthy = await self.health_check(server_name)
-            results[server_name] = is_healthy
+        servers = list(self._clients)
+        healthy = await asyncio.gather(*(self.health_check(server) for server in servers))
+        results = dict(zip(servers, healthy))
 
         # Update stats
         self._stats["total_health_checks"] += len(results)
@@ -833,6 +971,30 @@ class MCPOrchestrator:
             "last_check_time": datetime.now().isoformat(),
         }
 
+    def get_health_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the latest health check result per server without probing.
+
+        Returns:
+            Dict mapping server names to {"healthy", "latency_ms", "checked_at"},
+            where checked_at is a Unix timestamp. Servers never checked are absent.
+        """
+        return {server: dict(entry) for server, entry in self._health_snapshot.items()}
+
+    def merge_health_snapshot(self, snapshot: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Merge health results checked elsewhere (e.g. by another worker).
+
+        Entries older than the ones already recorded are ignored.
+
+        Args:
+            snapshot: Dict in the format returned by get_health_snapshot()
+        """
+        for server, entry in snapshot.items():
+            current = self._health_snapshot.get(server)
+            if current is None or entry["checked_at"] > current["checked_at"]:
+                self._health_snapshot[server] = dict(entry)
+
     def get_circuit_breaker_state(self, server: str) -> Dict[str, Any]:
         """Get circuit breaker state for a server."""
         server = self._resolve_server_name(server)
@@ -852,18 +1014,34 @@ class MCPOrchestrator:
         """Get server status information."""
         return self._server_status.get(server, {"status": "unknown"})
 
-    def start_periodic_health_checks(self) -> None:
-        """Start periodic health checks in background."""
+    def start_periodic_health_checks(
+        self,
+        on_checked: Optional[Callable[[Dict[str, Dict[str, Any]]], Awaitable[None]]] = None,
+    ) -> None:
+        """
+        Start periodic health checks in background.
+
+        Args:
+            on_checked: Optional coroutine called with the health snapshot after each round
+        """
+        if self._health_check_task is not None and not self._health_check_task.done():
+            return
 
         async def _health_check_loop():
             while True:
                 try:
                     await self.health_check_all()
+                    if on_checked is not None:
+                        await on_checked(self.get_health_snapshot())
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.warning(f"Periodic health check failed: {e}")
+                # Sleep on every path so a failing check cannot spin the loop
+                try:
                     await asyncio.sleep(self.health_check_interval)
                 except asyncio.CancelledError:
                     break
-                except Exception:
-                    pass
 
         self._health_check_task = asyncio.create_task(_health_check_loop())
 
@@ -880,11 +1058,14 @@ class MCPOrchestrator:
             while True:
                 try:
                     await self.health_check_all()
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.warning(f"Keepalive health check failed: {e}")
+                try:
                     await asyncio.sleep(self.keepalive_interval)
                 except asyncio.CancelledError:
                     break
-                except Exception:
-                    pass
 
         self._keepalive_task = asyncio.create_task(_keepalive_loop())
 
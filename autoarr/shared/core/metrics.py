@@ -0,0 +1,490 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Runtime metrics in OpenMetrics format.
+
+A small counter/gauge/histogram registry rendered by the /metrics endpoint.
+Updates are plain attribute writes with no locks: instrumented code runs on
+the event loop thread, so recording a sample costs a dict lookup and a few
+additions. Each label combination's child is created once and cached.
+
+Every metric AutoArr exports is declared at the bottom of this module so
+names, labels and buckets live in one place. Values are per process; with
+several workers each one serves its own numbers.
+"""
+
+import bisect
+import math
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Label combinations kept per metric before new ones are folded into "other"
+MAX_LABEL_SETS = 2000
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Request/tool latency buckets (seconds)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# In-process work (event handlers, DB sessions, WebSocket sends) in seconds
+FAST_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+Sample = Tuple[str, Dict[str, str], float]
+GaugeFunction = Callable[[], Union[float, Dict[Tuple[str, ...], float]]]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _format_bound(bound: float) -> str:
+    # Bucket bounds keep their decimal point (le="1.0") so series match across scrapes
+    return "+Inf" if bound == math.inf else repr(float(bound))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class _CounterChild:
+    """Value of one counter label set."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter (amount must not be negative)."""
+        self.value += amount
+
+
+class _GaugeChild:
+    """Value of one gauge label set."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge."""
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge."""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge."""
+        self.value -= amount
+
+
+class _HistogramChild:
+    """Bucket counts, sum and count of one histogram label set."""
+
+    __slots__ = ("upper_bounds", "counts", "sum")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]) -> None:
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+
+
+class Metric:
+    """
+    Base class for a metric family.
+
+    Args:
+        name: Metric name (counters without the ``_total`` suffix)
+        documentation: Help text
+        labelnames: Label names, in the order values are passed to labels()
+    """
+
+    metric_type = "unknown"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize the metric family."""
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def labels(self, *values: str) -> Any:
+        """
+        Get the child for a label set, creating it on first use.
+
+        Args:
+            *values: Label values in labelnames order
+
+        Returns:
+            Child to record values on
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            if len(self._children) >= MAX_LABEL_SETS:
+                # Bound memory when a label is fed unexpected values
+                values = ("other",) * len(values)
+                child = self._children.get(values)
+                if child is not None:
+                    return child
+            child = self._children[values] = self._new_child()
+        return child
+
+    def clear(self) -> None:
+        """Drop every label set."""
+        self._children.clear()
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield (name, labels, value) samples for rendering."""
+        raise NotImplementedError
+
+    def _label_dict(self, values: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, values))
+
+
+class Counter(Metric):
+    """Monotonically increasing count, exported as ``<name>_total``."""
+
+    metric_type = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase an unlabelled counter."""
+        self.labels().inc(amount)
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield one ``_total`` sample per label set."""
+        for values, child in list(self._children.items()):
+            yield f"{self.name}_total", self._label_dict(values), child.value
+
+
+class Gauge(Metric):
+    """
+    Value that can go up and down.
+
+    A gauge can instead be backed by a function called at scrape time
+    (set_function), which avoids updating it on every change.
+    """
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialize the gauge."""
+        super().__init__(name, documentation, labelnames)
+        self._function: Optional[GaugeFunction] = None
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set an unlabelled gauge."""
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase an unlabelled gauge."""
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease an unlabelled gauge."""
+        self.labels().dec(amount)
+
+    def set_function(self, function: Optional[GaugeFunction]) -> None:
+        """
+        Compute the gauge at scrape time.
+
+        Args:
+            function: Returns the value (unlabelled) or a mapping of label
+                values to value; None removes the function
+        """
+        self._function = function
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield one sample per label set (from the function if one is set)."""
+        if self._function is None:
+            for values, child in list(self._children.items()):
+                yield self.name, self._label_dict(values), child.value
+            return
+        result = self._function()
+        if isinstance(result, dict):
+            for values, value in result.items():
+                yield self.name, self._label_dict(values), value
+        else:
+            yield self.name, {}, result
+
+
+class Histogram(Metric):
+    """
+    Distribution of observed values in cumulative buckets.
+
+    Args:
+        name: Metric name
+        documentation: Help text
+        labelnames: Label names
+        buckets: Upper bounds in increasing order (+Inf is implied)
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        """Initialize the histogram."""
+        super().__init__(name, documentation, labelnames)
+        self.upper_bounds = tuple(float(bound) for bound in buckets if bound != math.inf)
+        if list(self.upper_bounds) != sorted(self.upper_bounds):
+            raise ValueError(f"{name} buckets must be in increasing order")
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float) -> None:
+        """Record an observation on an unlabelled histogram."""
+        self.labels().observe(value)
+
+    def samples(self) -> Iterator[Sample]:
+        """Yield cumulative ``_bucket`` samples plus ``_count`` and ``_sum``."""
+        bounds = self.upper_bounds + (math.inf,)
+        for values, child in list(self._children.items()):
+            labels = self._label_dict(values)
+            cumulative = 0
+            for bound, count in zip(bounds, list(child.counts)):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, "le": _format_bound(bound)}, cumulative
+            yield f"{self.name}_count", labels, cumulative
+            yield f"{self.name}_sum", labels, child.sum
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Add a metric family.
+
+        Args:
+            metric: Metric to add
+
+        Returns:
+            The metric
+
+        Raises:
+            ValueError: If a metric with the same name is already registered
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a counter."""
+        metric = Counter(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Create and register a gauge."""
+        metric = Gauge(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self.register(metric)
+        return metric
+
+    def get(self, name: str) -> Optional[Metric]:
+        """Get a registered metric by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """
+        Render every metric in the OpenMetrics text format.
+
+        Returns:
+            Exposition text ending with ``# EOF``
+        """
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+            for name, labels, value in metric.samples():
+                if labels:
+                    rendered = ",".join(
+                        f'{key}="{_escape(str(val))}"' for key, val in labels.items()
+                    )
+                    lines.append(f"{name}{{{rendered}}} {_format_value(value)}")
+                else:
+                    lines.append(f"{name} {_format_value(value)}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+# ============================================================================
+# Global Registry
+# ============================================================================
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Get the global metrics registry.
+
+    Returns:
+        Registry rendered by the /metrics endpoint
+    """
+    return _registry
+
+
+# ============================================================================
+# AutoArr Metrics
+# ============================================================================
+
+# MCP orchestrator and tool registry calls
+TOOL_CALL_DURATION = _registry.histogram(
+    "autoarr_tool_call_duration_seconds",
+    "Tool call latency by server, tool and outcome (success, error, timeout, circuit_open)",
+    ["server", "tool", "outcome"],
+)
+TOOL_CALLS_IN_FLIGHT = _registry.gauge(
+    "autoarr_tool_calls_in_flight", "Tool calls currently running", ["server"]
+)
+TOOL_CALL_RETRIES = _registry.counter(
+    "autoarr_tool_call_retries",
+    "Tool call attempts retried after a retryable error",
+    ["server", "tool"],
+)
+TOOL_CALL_TIMEOUTS = _registry.counter(
+    "autoarr_tool_call_timeouts", "Tool calls that exceeded their timeout", ["server", "tool"]
+)
+CIRCUIT_BREAKER_TRANSITIONS = _registry.counter(
+    "autoarr_circuit_breaker_transitions",
+    "Circuit breaker state changes",
+    ["server", "from_state", "to_state"],
+)
+CIRCUIT_BREAKER_STATE = _registry.gauge(
+    "autoarr_circuit_breaker_state",
+    "Circuit breaker state (0 closed, 1 half open, 2 open)",
+    ["server"],
+)
+
+# HTTP requests made by the service clients
+UPSTREAM_REQUEST_RETRIES = _registry.counter(
+    "autoarr_upstream_request_retries",
+    "HTTP requests to a service retried after a 503 or connection error",
+    ["server"],
+)
+UPSTREAM_REQUEST_TIMEOUTS = _registry.counter(
+    "autoarr_upstream_request_timeouts", "HTTP requests to a service that timed out", ["server"]
+)
+
+# Event bus
+EVENTS_PUBLISHED = _registry.counter(
+    "autoarr_events_published", "Events published on the event bus", ["event_type"]
+)
+EVENT_HANDLER_DURATION = _registry.histogram(
+    "autoarr_event_handler_duration_seconds",
+    "Event handler run time by event type",
+    ["event_type"],
+    buckets=FAST_BUCKETS,
+)
+EVENT_HANDLER_FAILURES = _registry.counter(
+    "autoarr_event_handler_failures", "Event handlers that raised or timed out", ["event_type"]
+)
+EVENT_DEAD_LETTERS = _registry.gauge(
+    "autoarr_event_dead_letters", "Events in the event bus dead letter queue"
+)
+EVENT_SUBSCRIBER_QUEUE_DEPTH = _registry.gauge(
+    "autoarr_event_subscriber_queue_depth",
+    "Events waiting in a queued event bus subscriber's queue",
+    ["handler"],
+)
+
+# Event loop
+EVENT_LOOP_LAG = _registry.histogram(
+    "autoarr_event_loop_lag_seconds",
+    "Delay between when the event loop lag probe was due and when it ran",
+    buckets=FAST_BUCKETS,
+)
+EVENT_LOOP_SLOW_CALLBACKS = _registry.counter(
+    "autoarr_event_loop_slow_callbacks",
+    "Callbacks that blocked the event loop past the slow callback threshold (debug mode)",
+)
+
+# Monitoring service
+MONITORING_POLL_DURATION = _registry.histogram(
+    "autoarr_monitoring_poll_duration_seconds",
+    "Duration of one monitoring pass (queue poll and failure check)",
+)
+MONITORING_POLL_ERRORS = _registry.counter(
+    "autoarr_monitoring_poll_errors", "Monitoring passes that ended in an error"
+)
+
+# Database
+DB_SESSION_DURATION = _registry.histogram(
+    "autoarr_db_session_duration_seconds",
+    "Time database sessions are held, by outcome (commit, rollback)",
+    ["outcome"],
+    buckets=FAST_BUCKETS,
+)
+
+# WebSocket clients
+WEBSOCKET_CONNECTIONS = _registry.gauge(
+    "autoarr_websocket_connections", "Connected WebSocket clients"
+)
+WEBSOCKET_SEND_LAG = _registry.histogram(
+    "autoarr_websocket_send_lag_seconds",
+    "Time a message waits in a client's send queue before it is sent",
+    buckets=FAST_BUCKETS,
+)
+WEBSOCKET_EVICTIONS = _registry.counter(
+    "autoarr_websocket_evictions", "WebSocket clients evicted as slow consumers"
+)
@@ -0,0 +1,265 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Request-scoped timing spans.
+
+The API's RequestLoggingMiddleware binds a RequestTiming to the current
+request through a context variable. Database sessions, MCP tool calls,
+service client requests and LLM calls record spans into it with span() or
+the traced() decorator, and the middleware reports the breakdown in a
+Server-Timing header and in the slow request log. Outside a request, span()
+costs a single context variable lookup.
+
+Spans can also be exported to OpenTelemetry with enable_opentelemetry().
+This needs the opentelemetry-api package plus an SDK configured by the
+deployment; while it is disabled no OpenTelemetry code runs.
+"""
+
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Spans kept per request (a runaway loop must not grow a request's timing unbounded)
+MAX_SPANS_PER_REQUEST = 200
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+@dataclass
+class Span:
+    """A timed operation within a request."""
+
+    name: str
+    detail: Optional[str]
+    start_ms: float  # Offset from the start of the request
+    duration_ms: float
+
+
+class RequestTiming:
+    """Spans recorded while handling one request."""
+
+    def __init__(self) -> None:
+        """Start timing a request."""
+        self.started = time.perf_counter()
+        self.spans: List[Span] = []
+        self.dropped = 0
+
+    def add(self, name: str, detail: Optional[str], started: float, ended: float) -> None:
+        """
+        Record a finished span.
+
+        Args:
+            name: Span name (db, mcp, llm or a service name)
+            detail: Optional detail such as the tool name
+            started: perf_counter() value when the span started
+            ended: perf_counter() value when the span ended
+        """
+        if len(self.spans) >= MAX_SPANS_PER_REQUEST:
+            self.dropped += 1
+            return
+        self.spans.append(
+            Span(
+                name=name,
+                detail=detail,
+                start_ms=(started - self.started) * 1000,
+                duration_ms=(ended - started) * 1000,
+            )
+        )
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the request started."""
+        return (time.perf_counter() - self.started) * 1000
+
+    def summary(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Aggregate spans by name.
+
+        Returns:
+            Mapping of span name to (count, total milliseconds), in first-seen order
+        """
+        totals: Dict[str, Tuple[int, float]] = {}
+        for span in self.spans:
+            count, total = totals.get(span.name, (0, 0.0))
+            totals[span.name] = (count + 1, total + span.duration_ms)
+        return totals
+
+    def server_timing(self, total_ms: Optional[float] = None) -> str:
+        """
+        Format the breakdown as a Server-Timing header value.
+
+        Args:
+            total_ms: Total request time (defaults to the time elapsed so far)
+
+        Returns:
+            Header value, e.g. ``db;desc="2 calls";dur=4.1, total;dur=12.0``
+        """
+        parts = [
+            f'{name};desc="{count} call{"" if count == 1 else "s"}";dur={total:.1f}'
+            for name, (count, total) in self.summary().items()
+        ]
+        total = self.elapsed_ms() if total_ms is None else total_ms
+        parts.append(f"total;dur={total:.1f}")
+        return ", ".join(parts)
+
+
+_current_timing: ContextVar[Optional[RequestTiming]] = ContextVar(
+    "autoarr_request_timing", default=None
+)
+
+
+def start_request_timing() -> Tuple[RequestTiming, Token]:
+    """
+    Bind a new RequestTiming to the current context.
+
+    Returns:
+        The timing and the token to pass to end_request_timing()
+    """
+    timing = RequestTiming()
+    return timing, _current_timing.set(timing)
+
+
+def end_request_timing(token: Token) -> None:
+    """Unbind the RequestTiming bound by start_request_timing()."""
+    _current_timing.reset(token)
+
+
+def get_request_timing() -> Optional[RequestTiming]:
+    """Get the RequestTiming of the current request, if any."""
+    return _current_timing.get()
+
+
+# ============================================================================
+# OpenTelemetry export (optional)
+# ============================================================================
+
+_tracer: Any = None
+_error_status: Any = None
+
+
+def enable_opentelemetry() -> bool:
+    """
+    Export spans to OpenTelemetry.
+
+    Spans go to the globally configured tracer provider; without an SDK
+    installed they are no-ops.
+
+    Returns:
+        True if opentelemetry-api is available and export was enabled
+    """
+    global _tracer, _error_status
+    try:
+        from opentelemetry import trace
+        from opentelemetry.trace import Status, StatusCode
+    except ImportError:
+        logger.warning("OpenTelemetry export requested but opentelemetry-api is not installed")
+        return False
+    _tracer = trace.get_tracer("autoarr")
+    _error_status = Status(StatusCode.ERROR)
+    logger.info("OpenTelemetry span export enabled")
+    return True
+
+
+def disable_opentelemetry() -> None:
+    """Stop exporting spans to OpenTelemetry."""
+    global _tracer
+    _tracer = None
+
+
+@contextmanager
+def otel_request_span(name: str) -> Iterator[None]:
+    """
+    Make an OpenTelemetry span the current span for a request.
+
+    Spans recorded with span() while handling the request become its
+    children. Does nothing while OpenTelemetry export is disabled.
+
+    Args:
+        name: Span name, e.g. ``GET /api/v1/settings``
+    """
+    if _tracer is None:
+        yield
+        return
+    with _tracer.start_as_current_span(name):
+        yield
+
+
+# ============================================================================
+# Recording spans
+# ============================================================================
+
+
+@contextmanager
+def span(name: str, detail: Optional[str] = None) -> Iterator[None]:
+    """
+    Time the enclosed block as a span of the current request.
+
+    Args:
+        name: Span name (db, mcp, llm or a service name); used as the
+            Server-Timing metric name, so it must be a plain token
+        detail: Optional detail such as the tool name
+    """
+    timing = _current_timing.get()
+    tracer = _tracer
+    if timing is None and tracer is None:
+        yield
+        return
+
+    # Not made current: spans may be held across yields of async generators
+    otel_span = tracer.start_span(f"{name} {detail}" if detail else name) if tracer else None
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException as exc:
+        if otel_span is not None:
+            otel_span.record_exception(exc)
+            otel_span.set_status(_error_status)
+        raise
+    finally:
+        if timing is not None:
+            timing.add(name, detail, started, time.perf_counter())
+        if otel_span is not None:
+            otel_span.end()
+
+
+def traced(name: str, detail: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Record each call of a coroutine function as a span.
+
+    Args:
+        name: Span name
+        detail: Optional span detail
+
+    Returns:
+        Decorator for async functions
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name, detail):
+                return await func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
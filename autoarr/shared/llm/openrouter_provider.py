@@ -30,6 +30,8 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 import httpx
 from pydantic import BaseModel
 
+from autoarr.shared.core.request_timing import span
+
 from .base_provider import BaseLLMProvider, LLMMessage, LLMResponse
 
 logger = logging.getLogger(__name__)
@@ -169,7 +171,8 @@ class OpenRouterProvider(BaseLLMProvider):
         last_error = None
         for attempt in range(self.max_retries):
             try:
-                response = await client.post("/chat/completions", json=request_body)
+                with span("llm", use_model):
+                    response = await client.post("/chat/completions", json=request_body)
                 response.raise_for_status()
                 data = response.json()
 
@@ -271,7 +274,8 @@ class OpenRouterProvider(BaseLLMProvider):
         last_error = None
         for attempt in range(self.max_retries):
             try:
-                response = await client.post("/chat/completions", json=request_body)
+                with span("llm", use_model):
+                    response = await client.post("/chat/completions", json=request_body)
                 response.raise_for_status()
                 data = response.json()
 
@@ -372,30 +376,31 @@ class OpenRouterProvider(BaseLLMProvider):
             **kwargs,
         }
 
-        async with client.stream("POST", "/chat/completions", json=request_body) as response:
-            response.raise_for_status()
-
-            async for line in response.aiter_bytes():
-                line_str = line.decode("utf-8").strip()
-                if not line_str:
-                    continue
+        with span("llm", use_model):
+            async with client.stream("POST", "/chat/completions", json=request_body) as response:
+                response.raise_for_status()
 
-                # Parse SSE format
-                if line_str.startswith("data: "):
-                    data_str = line_str[6:]  # Remove "data: " prefix
-                    if data_str == "[DONE]":
-                        break
-
-                    try:
-                        data = json.loads(data_str)
-                        if "choices" in data and len(data["choices"]) > 0:
-                            delta = data["choices"][0].get("delta", {})
-                            content = delta.get("content", "")
-                            if content:
-                                yield content
-                    except json.JSONDecodeError:
+                async for line in response.aiter_bytes():
+                    line_str = line.decode("utf-8").strip()
+                    if not line_str:
                         continue
 
+                    # Parse SSE format
+                    if line_str.startswith("data: "):
+                        data_str = line_str[6:]  # Remove "data: " prefix
+                        if data_str == "[DONE]":
+                            break
+
+                        try:
+                            data = json.loads(data_str)
+                            if "choices" in data and len(data["choices"]) > 0:
+                                delta = data["choices"][0].get("delta", {})
+                                content = delta.get("content", "")
+                                if content:
+                                    yield content
+                        except json.JSONDecodeError:
+                            continue
+
     async def get_models(self) -> List[OpenRouterModel]:  # type: ignore[override]
         """
         Get list of available models from OpenRouter.
@@ -414,7 +419,8 @@ class OpenRouterProvider(BaseLLMProvider):
 
         try:
             client = self._get_client()
-            response = await client.get("/models")
+            with span("llm", "models"):
+                response = await client.get("/models")
             response.raise_for_status()
             data = response.json()
 
@@ -482,7 +488,8 @@ class OpenRouterProvider(BaseLLMProvider):
 
         try:
             client = self._get_client()
-            response = await client.get("/models")
+            with span("llm", "models"):
+                response = await client.get("/models")
             response.raise_for_status()
             return True
         except Exception as e:
@@ -506,7 +513,8 @@ class OpenRouterProvider(BaseLLMProvider):
         else:
             try:
                 client = self._get_client()
-                response = await client.get("/models")
+                with span("llm", "models"):
+                    response = await client.get("/models")
                 response.raise_for_status()
                 data = response.json()
                 available = True
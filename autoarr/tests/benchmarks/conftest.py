@@ -0,0 +1,202 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Microbenchmark configuration and baseline regression check.
+
+Benchmarks run with pytest-benchmark. Each benchmark's fastest round is
+compared with the checked-in baseline.json and the test fails if it is
+slower than the baseline by more than --regression-threshold. The fastest
+round is used rather than the median because it is far less sensitive to
+noisy neighbours on shared CI runners.
+
+Absolute timings differ between machines (and between moments on a busy
+machine), so a fixed pure-Python calibration workload is timed right after
+each benchmark. Baseline timings are stored relative to the calibration time
+measured next to them, and are scaled by the current calibration time before
+comparing.
+
+CI runs the check in the python-test job.
+
+Usage:
+    pytest autoarr/tests/benchmarks                       # check against baseline
+    pytest autoarr/tests/benchmarks --regression-threshold 0.2   # stricter, quiet machine
+    pytest autoarr/tests/benchmarks --update-baseline     # re-record baseline.json
+"""
+
+import json
+import platform
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import pytest
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError as e:  # pragma: no cover - dev dependency
+    # Fail loudly rather than skip, so the regression gate cannot silently stop running
+    raise ImportError("The benchmarks need pytest-benchmark (poetry install --with dev)") from e
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+FIXTURES_DIR = BENCHMARK_DIR / "fixtures"
+BASELINE_FILE = BENCHMARK_DIR / "baseline.json"
+
+# Allowed slowdown versus the (calibrated) baseline
+DEFAULT_REGRESSION_THRESHOLD = 0.5
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the baseline options."""
+    group = parser.getgroup("autoarr-benchmarks", "AutoArr benchmark baseline")
+    group.addoption(
+        "--regression-threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="Fail benchmarks more than this fraction slower than the baseline "
+        f"(default {DEFAULT_REGRESSION_THRESHOLD})",
+    )
+    group.addoption(
+        "--update-baseline",
+        action="store_true",
+        default=False,
+        help="Record this run's timings in baseline.json instead of checking them",
+    )
+    group.addoption(
+        "--baseline-file",
+        type=Path,
+        default=BASELINE_FILE,
+        help="Baseline file (default autoarr/tests/benchmarks/baseline.json)",
+    )
+
+
+def calibrate(repeat: int = 30) -> float:
+    """
+    Time the fixed calibration workload.
+
+    The workload mixes dict, string and list operations in roughly the
+    proportions the benchmarked code uses.
+
+    Args:
+        repeat: Number of timing runs (the fastest is kept)
+
+    Returns:
+        Seconds per workload run
+    """
+
+    def workload() -> int:
+        counts: Dict[str, int] = {}
+        words = []
+        for i in range(5000):
+            key = f"item-{i % 257}"
+            counts[key] = counts.get(key, 0) + 1
+            words.append(key.upper().replace("-", " "))
+        return len(" ".join(words).split()) + len(counts)
+
+    return min(timeit.repeat(workload, number=3, repeat=repeat)) / 3
+
+
+class Baseline:
+    """
+    Checks benchmark results against baseline.json (or records them).
+
+    Args:
+        path: Baseline file
+        threshold: Allowed slowdown as a fraction of the baseline time
+        update: Record results instead of checking them
+    """
+
+    def __init__(self, path: Path, threshold: float, update: bool) -> None:
+        """Load the baseline file."""
+        self.path = path
+        self.threshold = threshold
+        self.update = update
+        self.benchmarks: Dict[str, Dict[str, float]] = (
+            json.loads(path.read_text())["benchmarks"] if path.exists() else {}
+        )
+        self.recorded: Dict[str, Dict[str, float]] = {}
+
+    def check(self, benchmark: Any) -> None:
+        """
+        Compare a finished benchmark against its baseline.
+
+        Args:
+            benchmark: The pytest-benchmark fixture after it has run
+
+        Raises:
+            pytest.fail.Exception: If the benchmark regressed beyond the threshold
+                or the benchmark has no baseline entry
+        """
+        if benchmark.disabled or benchmark.stats is None:
+            return  # --benchmark-disable / --benchmark-skip: nothing was measured
+
+        name = benchmark.name
+        fastest = benchmark.stats.stats.min
+        relative = fastest / calibrate()
+        if self.update:
+            self.recorded[name] = {"min_seconds": fastest, "relative": relative}
+            return
+
+        entry = self.benchmarks.get(name)
+        if entry is None:
+            pytest.fail(f"{name} has no baseline; record one with --update-baseline")
+        slowdown = relative / entry["relative"] - 1
+        if slowdown > self.threshold:
+            pytest.fail(
+                f"{name} regressed {slowdown:.0%} ({relative:.2f}x the calibration "
+                f"workload, baseline {entry['relative']:.2f}x, threshold {self.threshold:.0%})"
+            )
+
+    def save(self) -> None:
+        """Write the recorded timings to the baseline file, keeping other entries."""
+        if not self.recorded:
+            return
+        benchmarks = {**self.benchmarks, **self.recorded}
+        data = {
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "benchmarks": dict(sorted(benchmarks.items())),
+        }
+        self.path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+@pytest.fixture(scope="session")
+def baseline(request: pytest.FixtureRequest) -> Iterator[Baseline]:
+    """Session-wide baseline checker; saves recorded timings at the end with --update-baseline."""
+    # Options are only registered when this conftest is loaded at startup
+    config = request.config
+    checker = Baseline(
+        path=config.getoption("--baseline-file", default=BASELINE_FILE),
+        threshold=config.getoption("--regression-threshold", default=DEFAULT_REGRESSION_THRESHOLD),
+        update=config.getoption("--update-baseline", default=False),
+    )
+    yield checker
+    if checker.update:
+        checker.save()
+
+
+@pytest.fixture(scope="session")
+def fixture_path() -> Any:
+    """Return the path of a recorded fixture file."""
+
+    def _path(name: str) -> Path:
+        return FIXTURES_DIR / name
+
+    return _path
@@ -0,0 +1,125 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Microbenchmarks for parsing and text-matching hot paths.
+
+Covers PlexClient XML parsing, LogBuffer.get_recent with a search term,
+WebSearchService._parse_html and RequestHandler.classify_content_simple.
+"""
+
+import json
+import xml.etree.ElementTree as ET  # nosec B405 - parses a checked-in fixture
+
+import pytest
+
+from autoarr.api.routers.logs import LogBuffer, LogEntry
+from autoarr.api.services.request_handler import RequestHandler
+from autoarr.api.services.web_search_service import WebSearchService
+from autoarr.mcp_servers.plex.client import PlexClient
+
+# ============================================================================
+# PlexClient XML parsing
+# ============================================================================
+
+
+@pytest.fixture(scope="module")
+def plex_xml(fixture_path) -> bytes:
+    """Recorded /library/sections/1/all response (80 movies)."""
+    return fixture_path("plex_library_movies.xml").read_bytes()
+
+
+def test_plex_parse_xml_to_dict(benchmark, baseline, plex_xml) -> None:
+    """Convert a parsed library section to dicts."""
+    client = PlexClient("http://plex:32400", "token")
+    root = ET.fromstring(plex_xml)  # nosec B314
+
+    result = benchmark(client._parse_xml_to_dict, root)
+
+    assert len(result["Video"]) == 80
+    baseline.check(benchmark)
+
+
+def test_plex_parse_xml_bytes(benchmark, baseline, plex_xml) -> None:
+    """Parse a raw library section response body in one pass."""
+    result = benchmark(PlexClient._parse_xml_bytes, plex_xml)
+
+    assert len(result["Video"]) == 80
+    baseline.check(benchmark)
+
+
+# ============================================================================
+# LogBuffer.get_recent
+# ============================================================================
+
+
+@pytest.fixture(scope="module")
+def log_buffer(fixture_path) -> LogBuffer:
+    """Full log buffer built from recorded log lines."""
+    lines = fixture_path("log_entries.jsonl").read_text().splitlines()
+    buffer = LogBuffer()
+    for i in range(1000):
+        buffer.add(LogEntry(**json.loads(lines[i % len(lines)])))
+    return buffer
+
+
+@pytest.mark.parametrize(
+    "search, level",
+    [
+        ("sonarr", None),  # matches a few entries, scans the whole buffer
+        ("no such message", None),  # no matches
+        ("failed", "WARNING"),  # search combined with a level filter
+    ],
+)
+def test_log_buffer_get_recent_search(benchmark, baseline, log_buffer, search, level) -> None:
+    """Search the full log buffer the way the logs UI does."""
+    benchmark(log_buffer.get_recent, limit=100, level=level, search=search)
+    baseline.check(benchmark)
+
+
+# ============================================================================
+# WebSearchService._parse_html
+# ============================================================================
+
+
+def test_web_search_parse_html(benchmark, baseline, fixture_path) -> None:
+    """Extract the article text from a recorded documentation page."""
+    service = WebSearchService(brave_api_key="benchmark")
+    html = fixture_path("sabnzbd_guide.html").read_text()
+
+    text = benchmark(service._parse_html, html)
+
+    assert "Direct Unpack" in text
+    assert "googletagmanager" not in text
+    baseline.check(benchmark)
+
+
+# ============================================================================
+# RequestHandler.classify_content_simple
+# ============================================================================
+
+
+def test_classify_content_simple(benchmark, baseline, fixture_path) -> None:
+    """Classify a batch of recorded user requests."""
+    handler = RequestHandler()
+    queries = json.loads(fixture_path("request_queries.json").read_text())
+
+    def classify_all() -> int:
+        return sum(handler.classify_content_simple(query).content_type == "tv" for query in queries)
+
+    assert benchmark(classify_all) > 0
+    baseline.check(benchmark)
@@ -0,0 +1,195 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Microbenchmarks for service hot paths.
+
+Covers EventBus.publish fan-out, MonitoringService.analyze_failure_pattern
+over large failure histories and ConfigurationManager.compare_configuration
+with the seeded best practices.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from autoarr.api.database import BestPractice
+from autoarr.api.services.configuration_manager import ConfigurationManager
+from autoarr.api.services.event_bus import DispatchMode, Event, EventBus, EventType
+from autoarr.api.services.monitoring_service import FailurePattern, MonitoringService
+
+# Events published per benchmark round
+EVENTS_PER_ROUND = 200
+
+# Failure history sizes (the recorded 120 slots are repeated to fill them)
+HISTORY_SIZES = [500, 5000]
+
+
+@pytest.fixture(scope="module")
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Event loop for driving async code from synchronous benchmarks."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def failed_slots(fixture_path) -> List[Dict[str, Any]]:
+    """Recorded SABnzbd failed history slots."""
+    return json.loads(fixture_path("sabnzbd_failed_history.json").read_text())["history"]["slots"]
+
+
+def _history(slots: List[Dict[str, Any]], size: int) -> List[Dict[str, Any]]:
+    return [slots[i % len(slots)] for i in range(size)]
+
+
+# ============================================================================
+# EventBus.publish
+# ============================================================================
+
+
+@pytest.fixture
+def bus() -> EventBus:
+    """Bus with the mix of subscribers the running app registers."""
+    bus = EventBus()
+    delivered = [0]
+
+    async def awaited(event: Event) -> None:
+        delivered[0] += 1
+
+    def inline(event: Event) -> None:
+        delivered[0] += 1
+
+    for event_type in (
+        EventType.DOWNLOAD_FAILED,
+        EventType.DOWNLOAD_STATE_CHANGED,
+        EventType.REQUEST_STATUS_CHANGED,
+        EventType.CONFIG_AUDIT_COMPLETED,
+    ):
+        # Activity log, WebSocket bridge, notifications, recovery
+        bus.subscribe(event_type, awaited, priority=2)
+        bus.subscribe(event_type, inline, dispatch_mode=DispatchMode.INLINE)
+        bus.subscribe(
+            event_type,
+            inline,
+            event_filter=lambda event: event.source == "sabnzbd",
+            dispatch_mode=DispatchMode.INLINE,
+        )
+    bus.subscribe_all(inline, dispatch_mode=DispatchMode.INLINE)
+    bus.subscribe_all(awaited)
+    return bus
+
+
+def test_event_bus_publish_fan_out(benchmark, baseline, bus, loop) -> None:
+    """Publish a burst of monitoring/request events to the app's subscribers."""
+    event_types = [
+        EventType.DOWNLOAD_STATE_CHANGED,
+        EventType.DOWNLOAD_FAILED,
+        EventType.REQUEST_STATUS_CHANGED,
+        EventType.SYSTEM_WARNING,
+    ]
+    events = [
+        Event(
+            event_type=event_types[i % len(event_types)],
+            data={"nzo_id": f"SABnzbd_nzo_{i:06d}", "status": "Downloading", "percentage": i % 100},
+            correlation_id=f"poll-{i // 20}",
+            source="sabnzbd" if i % 3 else "monitoring",
+        )
+        for i in range(EVENTS_PER_ROUND)
+    ]
+
+    async def publish_all() -> None:
+        for event in events:
+            await bus.publish(event)
+
+    benchmark(lambda: loop.run_until_complete(publish_all()))
+    baseline.check(benchmark)
+
+
+# ============================================================================
+# MonitoringService.analyze_failure_pattern
+# ============================================================================
+
+
+@pytest.mark.parametrize("size", HISTORY_SIZES)
+def test_analyze_failure_pattern_recurring(benchmark, baseline, failed_slots, size) -> None:
+    """Analyze a history where the same episodes keep failing."""
+    service = MonitoringService(orchestrator=None, event_bus=EventBus())
+    history = _history(failed_slots, size)
+
+    result = benchmark(service.analyze_failure_pattern, history)
+
+    assert result.pattern_type == FailurePattern.RECURRING_SAME_CONTENT
+    baseline.check(benchmark)
+
+
+@pytest.mark.parametrize("size", HISTORY_SIZES)
+def test_analyze_failure_pattern_by_reason(benchmark, baseline, failed_slots, size) -> None:
+    """Analyze a history of distinct releases, classified by failure reason."""
+    service = MonitoringService(orchestrator=None, event_bus=EventBus())
+    history = [
+        {**slot, "name": f"Release.{i}.1080p.WEB-DL"}
+        for i, slot in enumerate(_history(failed_slots, size))
+    ]
+
+    result = benchmark(service.analyze_failure_pattern, history)
+
+    assert result is not None
+    baseline.check(benchmark)
+
+
+# ============================================================================
+# ConfigurationManager.compare_configuration
+# ============================================================================
+
+
+class _PracticesRepo:
+    """Serves the recorded best practices without a database round trip."""
+
+    def __init__(self, practices: List[BestPractice]) -> None:
+        self.practices = practices
+
+    async def get_by_application(
+        self, application: str, enabled_only: bool = False
+    ) -> List[BestPractice]:
+        return [
+            practice
+            for practice in self.practices
+            if practice.application == application and (practice.enabled or not enabled_only)
+        ]
+
+
+def test_compare_configuration(benchmark, baseline, fixture_path, loop) -> None:
+    """Compare all four services' recorded configurations with the best practices."""
+    practices = [
+        BestPractice(**row) for row in json.loads(fixture_path("best_practices.json").read_text())
+    ]
+    configs = json.loads(fixture_path("service_configs.json").read_text())
+    manager = ConfigurationManager(
+        orchestrator=None, best_practices_repo=_PracticesRepo(practices), audit_repo=None
+    )
+
+    async def compare_all() -> int:
+        total = 0
+        for application, config in configs.items():
+            total += len(await manager.compare_configuration(application, config))
+        return total
+
+    assert benchmark(lambda: loop.run_until_complete(compare_all())) > 0
+    baseline.check(benchmark)
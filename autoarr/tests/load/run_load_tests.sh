@@ -255,6 +255,8 @@ Commands:
     websocket       Run WebSocket load test (8 min, 50 connections)
     all             Run all tests sequentially
     ui              Run Locust with web UI
+    offline PROFILE Run a profile against AutoArr and the upstream simulators
+                    (no running services needed; see run_offline.py --help)
     validate        Validate API is accessible
     summary         Generate summary report from latest tests
 
@@ -264,6 +266,7 @@ Environment Variables:
 Examples:
     $0 baseline                          # Run only baseline test
     $0 all                               # Run all tests
+    $0 offline normal --duration 120 --series 10000 --history 50000
     AUTOARR_BASE_URL=http://api:8088 $0 peak  # Custom API URL
 
 Results:
@@ -279,6 +282,13 @@ EOF
 main() {
     print_header "AutoArr API Load Testing Suite"
 
+    # Offline runs boot their own AutoArr and simulators
+    if [ "${1:-}" = "offline" ]; then
+        shift
+        poetry run python "$SCRIPT_DIR/run_offline.py" "$@"
+        exit $?
+    fi
+
     print_info "API URL: $AUTOARR_URL"
     print_info "Results Directory: $RESULTS_DIR"
     print_info "Command: ${1:-all}"
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Offline load test harness.
+
+Runs a load test profile end to end without any real media servers:
+
+1. Starts the SABnzbd/Sonarr/Radarr/Plex simulators (autoarr.tests.simulators)
+2. Boots AutoArr with a throwaway SQLite database, wired to the simulators
+3. Runs the profile's Locust users headless (profiles from test_profiles.py)
+4. Checks p95/p99 against the budgets in analyze_results.py
+
+Exits non-zero if any endpoint is over budget.
+
+Usage:
+    python autoarr/tests/load/run_offline.py baseline
+    python autoarr/tests/load/run_offline.py normal --duration 120 --series 10000 \\
+        --history 50000 --latency-ms 20 --error-rate 0.01 --storm-every 60 --storm-duration 5
+
+Options not listed in --help are passed to the simulators
+(see ``python -m autoarr.tests.simulators --help``).
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+LOAD_DIR = Path(__file__).resolve().parent
+REPO_ROOT = LOAD_DIR.parents[2]
+
+# Allow running as a script from anywhere
+if str(LOAD_DIR) not in sys.path:
+    sys.path.insert(0, str(LOAD_DIR))
+
+from analyze_results import LoadTestAnalyzer  # noqa: E402
+from test_profiles import PROFILES, get_profile  # noqa: E402
+
+# Environment variable prefix per simulated service
+SERVICE_ENV = {
+    "sabnzbd": ("SABNZBD_URL", "SABNZBD_API_KEY"),
+    "sonarr": ("SONARR_URL", "SONARR_API_KEY"),
+    "radarr": ("RADARR_URL", "RADARR_API_KEY"),
+    "plex": ("PLEX_URL", "PLEX_TOKEN"),
+}
+
+
+def _log(message: str) -> None:
+    print(f"[offline-load] {message}", flush=True)
+
+
+def start_simulators(
+    base_port: int, simulator_args: List[str]
+) -> Tuple[subprocess.Popen, Dict[str, str], str]:
+    """
+    Start the simulators and wait for their URLs.
+
+    Args:
+        base_port: First simulator port
+        simulator_args: Extra options for the simulators
+
+    Returns:
+        (process, service -> URL, API key)
+    """
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "autoarr.tests.simulators",
+            "--base-port",
+            str(base_port),
+            *simulator_args,
+        ],
+        cwd=REPO_ROOT,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    assert process.stdout is not None
+    line = process.stdout.readline()
+    if not line:
+        raise RuntimeError(f"Simulators exited with code {process.wait()}")
+    info = json.loads(line)
+    return process, info["urls"], info["api_key"]
+
+
+def start_autoarr(
+    port: int,
+    urls: Dict[str, str],
+    api_key: str,
+    data_dir: Path,
+    keep_rate_limits: bool,
+) -> subprocess.Popen:
+    """
+    Start AutoArr wired to the simulators.
+
+    Args:
+        port: Port to listen on
+        urls: Simulator URLs per service
+        api_key: Simulator API key/token
+        data_dir: Directory for the throwaway database
+        keep_rate_limits: Leave API rate limiting on (all Locust users share one IP)
+
+    Returns:
+        AutoArr process
+    """
+    env = dict(os.environ)
+    for service, (url_var, key_var) in SERVICE_ENV.items():
+        env[url_var] = urls[service]
+        env[key_var] = api_key
+    env["DATABASE_URL"] = f"sqlite+aiosqlite:///{data_dir / 'autoarr.db'}"
+    env["LOG_LEVEL"] = env.get("LOG_LEVEL", "WARNING")
+    if not keep_rate_limits:
+        env["RATE_LIMIT_ENABLED"] = "false"
+    # AutoArr runs from the data directory (so no stray .env is picked up)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "autoarr.api.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=data_dir,
+        env=env,
+    )
+
+
+def wait_until_healthy(base_url: str, process: subprocess.Popen, timeout: float = 90.0) -> None:
+    """
+    Wait for AutoArr's /health to answer.
+
+    Raises:
+        RuntimeError: If AutoArr exits or does not answer in time
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"AutoArr exited with code {process.returncode}")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=5).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"AutoArr did not become healthy within {timeout:.0f}s")
+
+
+def configure_services(base_url: str, urls: Dict[str, str], api_key: str) -> None:
+    """
+    Save the simulator connections in AutoArr's settings database.
+
+    Tool providers read their connection from the database, so the
+    environment variables alone only cover the MCP orchestrator.
+    """
+    for service, url in urls.items():
+        response = httpx.put(
+            f"{base_url}/api/v1/settings/{service}",
+            json={"enabled": True, "url": url, "api_key_or_token": api_key, "timeout": 30.0},
+            timeout=30,
+        )
+        response.raise_for_status()
+
+
+def run_locust(
+    profile_name: str,
+    base_url: str,
+    csv_prefix: Path,
+    duration: Optional[int],
+    users: Optional[int],
+) -> int:
+    """
+    Run a profile's Locust users headless.
+
+    Args:
+        profile_name: Profile from test_profiles.PROFILES
+        base_url: AutoArr URL
+        csv_prefix: Locust --csv prefix
+        duration: Override the profile's duration (seconds)
+        users: Override the profile's total user count
+
+    Returns:
+        Locust exit code
+    """
+    profile = get_profile(profile_name)
+    total_users = users or profile.max_users
+    run_time = duration or profile.duration_seconds
+    ramp_up = min(profile.ramp_up_seconds, max(1, run_time // 4))
+    spawn_rate = max(1, total_users // max(1, ramp_up))
+
+    command = [
+        sys.executable,
+        "-m",
+        "locust",
+        "-f",
+        str(LOAD_DIR / "locustfile.py"),
+        "--host",
+        base_url,
+        "--headless",
+        "--only-summary",
+        "--users",
+        str(total_users),
+        "--spawn-rate",
+        str(spawn_rate),
+        "--run-time",
+        f"{run_time}s",
+        "--stop-timeout",
+        str(profile.ramp_down_seconds),
+        "--csv",
+        str(csv_prefix),
+        *profile.user_classes.keys(),
+    ]
+    _log(
+        f"Running profile '{profile.name}': {total_users} users, "
+        f"spawn rate {spawn_rate}/s, {run_time}s"
+    )
+    return subprocess.call(command, cwd=LOAD_DIR, env={**os.environ, "AUTOARR_BASE_URL": base_url})
+
+
+def _stop(process: Optional[subprocess.Popen]) -> None:
+    if process is None or process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the harness; returns the process exit code."""
+    parser = argparse.ArgumentParser(
+        description="Run a load test profile against AutoArr and the upstream simulators",
+        epilog="Unrecognised options are passed to the simulators.",
+    )
+    parser.add_argument("profile", choices=sorted(PROFILES), help="Profile from test_profiles.py")
+    parser.add_argument("--duration", type=int, help="Override the profile duration (seconds)")
+    parser.add_argument("--users", type=int, help="Override the profile's total users")
+    parser.add_argument("--port", type=int, default=18088, help="AutoArr port")
+    parser.add_argument("--simulator-port", type=int, default=18080, help="First simulator port")
+    parser.add_argument("--results-dir", type=Path, default=LOAD_DIR / "results")
+    parser.add_argument(
+        "--keep-rate-limits",
+        action="store_true",
+        help="Leave AutoArr's per-IP rate limits on (Locust users share one IP)",
+    )
+    args, simulator_args = parser.parse_known_args(argv)
+
+    args.results_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    csv_prefix = args.results_dir / f"offline_{args.profile}_{timestamp}"
+    base_url = f"http://127.0.0.1:{args.port}"
+
+    simulators: Optional[subprocess.Popen] = None
+    autoarr: Optional[subprocess.Popen] = None
+    with tempfile.TemporaryDirectory(prefix="autoarr-load-") as data_dir:
+        try:
+            simulators, urls, api_key = start_simulators(args.simulator_port, simulator_args)
+            _log(f"Simulators up: {urls}")
+
+            autoarr = start_autoarr(args.port, urls, api_key, Path(data_dir), args.keep_rate_limits)
+            wait_until_healthy(base_url, autoarr)
+            configure_services(base_url, urls, api_key)
+            _log(f"AutoArr up at {base_url}")
+
+            locust_code = run_locust(args.profile, base_url, csv_prefix, args.duration, args.users)
+        finally:
+            _stop(autoarr)
+            _stop(simulators)
+
+    stats_file = Path(f"{csv_prefix}_stats.csv")
+    if not stats_file.exists():
+        _log(f"Locust produced no results (exit code {locust_code})")
+        return locust_code or 1
+
+    passed = LoadTestAnalyzer(stats_file).generate_report()
+    _log(f"Results: {stats_file}")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Hermetic simulators of the upstream services AutoArr talks to.
+
+SABnzbd, Sonarr, Radarr and Plex are served from one synthetic library of
+configurable size, with injectable latency, error rates and 503 storms.
+They let the load tests (and anyone debugging performance) run without
+real media servers.
+
+Usage:
+    # All four simulators on ports 18080-18083
+    python -m autoarr.tests.simulators --series 10000 --history 50000
+
+    # In-process, e.g. from a test
+    library = SyntheticLibrary(LibrarySizes(series=100))
+    app = arr.create_app(library, "sonarr")
+"""
+
+from .faults import FaultConfig, FaultInjector
+from .library import LibrarySizes, SyntheticLibrary
+from .server import SERVICES, SimulatorCluster
+
+__all__ = [
+    "FaultConfig",
+    "FaultInjector",
+    "LibrarySizes",
+    "SERVICES",
+    "SimulatorCluster",
+    "SyntheticLibrary",
+]
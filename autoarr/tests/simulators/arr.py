@@ -0,0 +1,268 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Sonarr and Radarr API v3 simulators.
+
+Both services share most of their API (system status, queue, commands,
+quality profiles, root folders, wanted/missing), so one app factory serves
+either, with the series/episode or movie resources on top.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from .faults import FaultInjector
+from .library import SyntheticLibrary
+
+VERSIONS = {"sonarr": "4.0.10.2544", "radarr": "5.14.0.9383"}
+
+# Series scanned for calendar entries (keeps calendar requests bounded)
+CALENDAR_SCAN_LIMIT = 200
+
+
+def _paged(request: Request, records: List[Any], total: Optional[int] = None) -> Dict[str, Any]:
+    """Wrap records in the *arr paging envelope."""
+    page = max(1, int(request.query_params.get("page", 1)))
+    page_size = max(1, int(request.query_params.get("pageSize", 10)))
+    start = (page - 1) * page_size
+    return {
+        "page": page,
+        "pageSize": page_size,
+        "sortKey": request.query_params.get("sortKey", "timeleft"),
+        "sortDirection": "ascending",
+        "totalRecords": len(records) if total is None else total,
+        "records": records[start : start + page_size] if total is None else records,
+    }
+
+
+def _missing_episodes(library: SyntheticLibrary, request: Request) -> Dict[str, Any]:
+    """Build one page of Sonarr wanted/missing without generating every episode."""
+    page = max(1, int(request.query_params.get("page", 1)))
+    page_size = max(1, int(request.query_params.get("pageSize", 10)))
+    start, end = (page - 1) * page_size, page * page_size
+    per_season = library.sizes.episodes_per_season
+
+    records: List[Dict[str, Any]] = []
+    total = 0
+    for series in library.series:
+        for season in series.get("seasons", []):
+            files = season["statistics"]["episodeFileCount"]
+            missing = per_season - files
+            if missing <= 0:
+                continue
+            if total + missing > start and len(records) < page_size:
+                for number in range(files + 1, per_season + 1):
+                    position = total + number - files - 1
+                    if start <= position < end:
+                        records.append(
+                            {
+                                "id": series["id"] * 10_000 + season["seasonNumber"] * 100 + number,
+                                "seriesId": series["id"],
+                                "seasonNumber": season["seasonNumber"],
+                                "episodeNumber": number,
+                                "title": f"Episode {number}",
+                                "hasFile": False,
+                                "monitored": True,
+                                "series": {"id": series["id"], "title": series["title"]},
+                            }
+                        )
+            total += missing
+    envelope = _paged(request, records, total)
+    envelope["sortKey"] = "airDateUtc"
+    return envelope
+
+
+def create_app(
+    library: SyntheticLibrary,
+    service: str,
+    api_key: str = "simulator",
+    faults: Optional[FaultInjector] = None,
+) -> FastAPI:
+    """
+    Create a Sonarr or Radarr simulator app.
+
+    Args:
+        library: Shared synthetic library
+        service: "sonarr" or "radarr"
+        api_key: API key clients must send (X-Api-Key header or apikey param)
+        faults: Fault injector (a no-op one is created if omitted)
+
+    Returns:
+        FastAPI app
+
+    Raises:
+        ValueError: If service is not sonarr or radarr
+    """
+    if service not in VERSIONS:
+        raise ValueError(f"Unknown service: {service}")
+
+    app = FastAPI(title=f"{service.capitalize()} simulator")
+    injector = faults or FaultInjector()
+    injector.install(app)
+    router = APIRouter(prefix="/api/v3")
+
+    @app.middleware("http")
+    async def check_api_key(request: Request, call_next: Any) -> Any:
+        if request.url.path.startswith("/api/"):
+            sent = request.headers.get("X-Api-Key") or request.query_params.get("apikey")
+            if sent != api_key:
+                return JSONResponse({"message": "Unauthorized"}, status_code=401)
+        return await call_next(request)
+
+    @router.get("/system/status")
+    async def system_status() -> Any:
+        return {
+            "appName": service.capitalize(),
+            "version": VERSIONS[service],
+            "isDocker": True,
+            "osName": "ubuntu",
+            "startTime": "2024-01-01T00:00:00Z",
+        }
+
+    @router.get("/health")
+    async def health() -> Any:
+        return []
+
+    @router.get("/qualityprofile")
+    async def quality_profiles() -> Any:
+        return [
+            {"id": 1, "name": "HD-1080p", "upgradeAllowed": True, "cutoff": 7},
+            {"id": 2, "name": "Ultra-HD", "upgradeAllowed": True, "cutoff": 19},
+        ]
+
+    @router.get("/rootfolder")
+    async def root_folders() -> Any:
+        path = "/tv" if service == "sonarr" else "/movies"
+        return [{"id": 1, "path": path, "accessible": True, "freeSpace": 4_000_000_000_000}]
+
+    @router.get("/queue")
+    async def queue(request: Request) -> Any:
+        return _paged(request, library.arr_queue(service))
+
+    @router.post("/command")
+    async def command(request: Request) -> Any:
+        return library.command(await request.json())
+
+    @router.get("/command/{command_id}")
+    async def command_status(command_id: int) -> Any:
+        return {"id": command_id, "status": "completed"}
+
+    if service == "sonarr":
+        _add_sonarr_routes(router, library)
+    else:
+        _add_radarr_routes(router, library)
+
+    app.include_router(router)
+    return app
+
+
+def _not_found() -> JSONResponse:
+    return JSONResponse({"message": "NotFound"}, status_code=404)
+
+
+def _add_sonarr_routes(router: APIRouter, library: SyntheticLibrary) -> None:
+    """Series and episode resources."""
+
+    @router.get("/series")
+    async def series() -> Any:
+        return library.series
+
+    @router.get("/series/lookup")
+    async def series_lookup(term: str = "") -> Any:
+        return library.lookup("sonarr", term)
+
+    @router.get("/series/{series_id}")
+    async def series_by_id(series_id: int) -> Any:
+        return library.series_by_id.get(series_id) or _not_found()
+
+    @router.post("/series", status_code=201)
+    async def add_series(request: Request) -> Any:
+        return library.add("sonarr", await request.json())
+
+    @router.delete("/series/{series_id}")
+    async def delete_series(series_id: int) -> Any:
+        item = library.series_by_id.pop(series_id, None)
+        if item is not None:
+            library.series.remove(item)
+        return {}
+
+    @router.get("/episode")
+    async def episodes(seriesId: int = 0, seasonNumber: Optional[int] = None) -> Any:
+        result = library.episodes(seriesId)
+        if seasonNumber is not None:
+            result = [e for e in result if e["seasonNumber"] == seasonNumber]
+        return result
+
+    @router.get("/episode/{episode_id}")
+    async def episode(episode_id: int) -> Any:
+        for entry in library.episodes(episode_id // 10_000):
+            if entry["id"] == episode_id:
+                return entry
+        return _not_found()
+
+    @router.get("/calendar")
+    async def calendar(start: str = "", end: str = "") -> Any:
+        entries = []
+        for series in library.series[:CALENDAR_SCAN_LIMIT]:
+            for entry in library.episodes(series["id"]):
+                if (not start or entry["airDate"] >= start[:10]) and (
+                    not end or entry["airDate"] <= end[:10]
+                ):
+                    entries.append(entry)
+        return entries
+
+    @router.get("/wanted/missing")
+    async def missing(request: Request) -> Any:
+        return _missing_episodes(library, request)
+
+
+def _add_radarr_routes(router: APIRouter, library: SyntheticLibrary) -> None:
+    """Movie resources."""
+
+    @router.get("/movie")
+    async def movies() -> Any:
+        return library.movies
+
+    @router.get("/movie/lookup")
+    async def movie_lookup(term: str = "") -> Any:
+        return library.lookup("radarr", term)
+
+    @router.get("/movie/{movie_id}")
+    async def movie_by_id(movie_id: int) -> Any:
+        return library.movies_by_id.get(movie_id) or _not_found()
+
+    @router.post("/movie", status_code=201)
+    async def add_movie(request: Request) -> Any:
+        return library.add("radarr", await request.json())
+
+    @router.delete("/movie/{movie_id}")
+    async def delete_movie(movie_id: int) -> Any:
+        item = library.movies_by_id.pop(movie_id, None)
+        if item is not None:
+            library.movies.remove(item)
+        return {}
+
+    @router.get("/calendar")
+    async def calendar() -> Any:
+        return [movie for movie in library.movies if not movie["hasFile"]][:50]
+
+    @router.get("/wanted/missing")
+    async def missing(request: Request) -> Any:
+        return _paged(request, [movie for movie in library.movies if not movie["hasFile"]])
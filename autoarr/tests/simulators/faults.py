@@ -0,0 +1,162 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Latency and error injection for the upstream simulators.
+
+Every simulator app gets a FaultInjector middleware that can delay
+responses, fail a fraction of them, and run periodic 503 "storms" (the
+whole service answering 503 for a few seconds, like an *arr restarting).
+The settings can be changed while a load test runs via the /_sim/faults
+control endpoint.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+
+CONTROL_PREFIX = "/_sim"
+
+
+@dataclass
+class FaultConfig:
+    """
+    Fault injection settings.
+
+    Args:
+        latency_ms: Added delay per request
+        jitter_ms: Random extra delay (0..jitter_ms) per request
+        error_rate: Fraction of requests answered with error_status
+        error_status: Status code for injected errors
+        storm_every: Seconds between 503 storms (0 disables storms)
+        storm_duration: Seconds each storm lasts
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    storm_every: float = 0.0
+    storm_duration: float = 0.0
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """
+        Update settings from a dict, ignoring unknown keys.
+
+        Args:
+            values: Setting name -> value
+
+        Raises:
+            ValueError: If a value has the wrong type
+        """
+        for field in fields(self):
+            if field.name in values:
+                caster = int if field.name == "error_status" else float
+                setattr(self, field.name, caster(values[field.name]))
+
+
+class FaultInjector:
+    """
+    Applies a FaultConfig to an app's requests.
+
+    Args:
+        config: Fault settings (shared and mutable)
+        seed: Random seed for reproducible error sequences
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        config: Optional[FaultConfig] = None,
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the injector."""
+        self.config = config or FaultConfig()
+        self._rng = random.Random(seed)
+        self._clock = clock
+        self._started = clock()
+        self.stats: Dict[str, int] = {"requests": 0, "errors": 0, "storm_rejections": 0}
+
+    def in_storm(self) -> bool:
+        """Whether a 503 storm is currently running."""
+        every, duration = self.config.storm_every, self.config.storm_duration
+        if every <= 0 or duration <= 0:
+            return False
+        # Storms start at the end of each interval: [every, every + duration), ...
+        elapsed = self._clock() - self._started
+        return elapsed >= every and (elapsed % every) < duration
+
+    async def apply(self) -> Optional[int]:
+        """
+        Delay the current request and decide whether it fails.
+
+        Returns:
+            Status code to fail the request with, or None to serve it
+        """
+        self.stats["requests"] += 1
+        if self.in_storm():
+            self.stats["storm_rejections"] += 1
+            return 503
+
+        delay = self.config.latency_ms
+        if self.config.jitter_ms > 0:
+            delay += self._rng.uniform(0, self.config.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        if self.config.error_rate > 0 and self._rng.random() < self.config.error_rate:
+            self.stats["errors"] += 1
+            return self.config.error_status
+        return None
+
+    def install(self, app: FastAPI) -> None:
+        """
+        Add the fault middleware and /_sim control endpoints to an app.
+
+        Args:
+            app: Simulator app
+        """
+
+        @app.middleware("http")
+        async def inject_faults(
+            request: Request, call_next: Callable[[Request], Awaitable[Response]]
+        ) -> Response:
+            if request.url.path.startswith(CONTROL_PREFIX):
+                return await call_next(request)
+            status_code = await self.apply()
+            if status_code is not None:
+                return JSONResponse({"error": "Injected fault"}, status_code=status_code)
+            return await call_next(request)
+
+        @app.get(f"{CONTROL_PREFIX}/faults")
+        async def get_faults() -> Any:
+            return asdict(self.config)
+
+        @app.put(f"{CONTROL_PREFIX}/faults")
+        async def put_faults(request: Request) -> Any:
+            self.config.update(await request.json())
+            return asdict(self.config)
+
+        @app.get(f"{CONTROL_PREFIX}/stats")
+        async def get_stats() -> Any:
+            return {**self.stats, "in_storm": self.in_storm()}
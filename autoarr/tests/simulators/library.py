@@ -0,0 +1,361 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Synthetic media library shared by the upstream simulators.
+
+Generates deterministic (seeded) series, movies, SABnzbd queue and history
+slots so that every simulator describes the same library: a queue slot's
+nzo_id matches the downloadId of a Sonarr/Radarr queue record, Plex sections
+list the series and movies with files, and so on.
+
+Episodes are generated per series on demand, so libraries with tens of
+thousands of series stay cheap to build.
+"""
+
+import random
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+_ADJECTIVES = [
+    "Silent", "Broken", "Hidden", "Golden", "Crimson", "Lost", "Final", "Dark",
+    "Electric", "Frozen", "Wild", "Last", "Iron", "Distant", "Burning", "Quiet",
+]  # fmt: skip
+_NOUNS = [
+    "Empire", "Harbor", "Signal", "Frontier", "Garden", "Protocol", "Kingdom",
+    "Shadow", "Orbit", "Valley", "Witness", "Machine", "River", "Crown", "Station",
+]  # fmt: skip
+_QUALITIES = ["HDTV-720p", "WEBDL-1080p", "Bluray-1080p", "WEBDL-2160p"]
+_TRACKED_STATES = ["downloading", "downloading", "downloading", "importPending", "importing"]
+
+
+@dataclass
+class LibrarySizes:
+    """
+    Sizes of the synthetic library.
+
+    Args:
+        series: Number of Sonarr series
+        seasons_per_series: Maximum seasons per series
+        episodes_per_season: Episodes per season
+        movies: Number of Radarr movies
+        queue_slots: Active SABnzbd downloads (split between Sonarr and Radarr)
+        history_slots: SABnzbd history entries
+        failed_ratio: Fraction of history entries that failed
+        seed: Random seed (same seed, same library)
+    """
+
+    series: int = 500
+    seasons_per_series: int = 5
+    episodes_per_season: int = 10
+    movies: int = 2000
+    queue_slots: int = 25
+    history_slots: int = 1000
+    failed_ratio: float = 0.05
+    seed: int = 42
+
+
+class SyntheticLibrary:
+    """
+    Deterministic library served by the simulators.
+
+    Args:
+        sizes: Library sizes
+    """
+
+    def __init__(self, sizes: Optional[LibrarySizes] = None) -> None:
+        """Generate the library."""
+        self.sizes = sizes or LibrarySizes()
+        self._rng = random.Random(self.sizes.seed)
+        self._epoch = datetime(2024, 1, 1)
+
+        self.series: List[Dict[str, Any]] = [
+            self._make_series(i) for i in range(1, self.sizes.series + 1)
+        ]
+        self.series_by_id = {s["id"]: s for s in self.series}
+        self.movies: List[Dict[str, Any]] = [
+            self._make_movie(i) for i in range(1, self.sizes.movies + 1)
+        ]
+        self.movies_by_id = {m["id"]: m for m in self.movies}
+
+        has_items = bool(self.series or self.movies)
+        self.queue: List[Dict[str, Any]] = [
+            self._make_queue_slot(i) for i in range(self.sizes.queue_slots if has_items else 0)
+        ]
+        self.history: List[Dict[str, Any]] = [
+            self._make_history_slot(i) for i in range(self.sizes.history_slots)
+        ]
+        self._next_id = {"series": len(self.series) + 1, "movie": len(self.movies) + 1}
+        self._commands = 0
+
+    # ------------------------------------------------------------------
+    # Generation
+    # ------------------------------------------------------------------
+
+    def _title(self) -> str:
+        return f"The {self._rng.choice(_ADJECTIVES)} {self._rng.choice(_NOUNS)}"
+
+    def _make_series(self, series_id: int) -> Dict[str, Any]:
+        seasons = self._rng.randint(1, self.sizes.seasons_per_series)
+        episodes = self.sizes.episodes_per_season
+        season_list = []
+        total_files = 0
+        for number in range(1, seasons + 1):
+            files = episodes if number < seasons else self._rng.randint(0, episodes)
+            total_files += files
+            season_list.append(
+                {
+                    "seasonNumber": number,
+                    "monitored": True,
+                    "statistics": {"episodeFileCount": files, "episodeCount": episodes},
+                }
+            )
+        title = f"{self._title()} {series_id}"
+        return {
+            "id": series_id,
+            "title": title,
+            "sortTitle": title.lower(),
+            "year": 1990 + self._rng.randint(0, 34),
+            "tvdbId": 100000 + series_id,
+            "imdbId": f"tt{2000000 + series_id}",
+            "status": self._rng.choice(["continuing", "ended"]),
+            "monitored": self._rng.random() > 0.1,
+            "qualityProfileId": 1,
+            "path": f"/tv/{title}",
+            "seasons": season_list,
+            "statistics": {
+                "seasonCount": seasons,
+                "episodeFileCount": total_files,
+                "episodeCount": seasons * episodes,
+                "totalEpisodeCount": seasons * episodes,
+                "sizeOnDisk": total_files * 1_500_000_000,
+            },
+            "added": (self._epoch + timedelta(hours=series_id)).isoformat() + "Z",
+        }
+
+    def _make_movie(self, movie_id: int) -> Dict[str, Any]:
+        has_file = self._rng.random() > 0.15
+        title = f"{self._title()} {movie_id}"
+        return {
+            "id": movie_id,
+            "title": title,
+            "sortTitle": title.lower(),
+            "year": 1970 + self._rng.randint(0, 54),
+            "tmdbId": 500000 + movie_id,
+            "imdbId": f"tt{5000000 + movie_id}",
+            "monitored": self._rng.random() > 0.1,
+            "hasFile": has_file,
+            "isAvailable": True,
+            "qualityProfileId": 1,
+            "path": f"/movies/{title}",
+            "sizeOnDisk": 8_000_000_000 if has_file else 0,
+            "added": (self._epoch + timedelta(hours=movie_id)).isoformat() + "Z",
+        }
+
+    def _make_queue_slot(self, index: int) -> Dict[str, Any]:
+        is_movie = bool(self.movies) and (index % 2 == 0 or not self.series)
+        item = self._rng.choice(self.movies) if is_movie else self._rng.choice(self.series)
+        size_mb = self._rng.randint(700, 20000)
+        done = self._rng.random()
+        return {
+            "index": index,
+            "nzo_id": f"SABnzbd_nzo_{index:06d}",
+            "filename": f"{item['title']}.{item['year']}.1080p.WEB-DL",
+            "cat": "movies" if is_movie else "tv",
+            "status": "Downloading" if index == 0 else "Queued",
+            "priority": "Normal",
+            "mb": f"{size_mb:.2f}",
+            "mbleft": f"{size_mb * (1 - done):.2f}",
+            "percentage": str(int(done * 100)),
+            "timeleft": "0:12:34",
+            # Link back to the *arr item that grabbed it
+            "_service": "radarr" if is_movie else "sonarr",
+            "_item_id": item["id"],
+            "_tracked_state": self._rng.choice(_TRACKED_STATES),
+        }
+
+    def _make_history_slot(self, index: int) -> Dict[str, Any]:
+        failed = self._rng.random() < self.sizes.failed_ratio
+        completed = self._epoch + timedelta(minutes=index * 17)
+        name = f"{self._title()}.S0{self._rng.randint(1, 9)}E{self._rng.randint(1, 20):02d}"
+        return {
+            "nzo_id": f"SABnzbd_nzo_h{index:07d}",
+            "name": name,
+            "category": self._rng.choice(["tv", "movies"]),
+            "status": "Failed" if failed else "Completed",
+            "fail_message": "Unpacking failed, CRC error" if failed else "",
+            "bytes": self._rng.randint(700, 20000) * 1_048_576,
+            "completed": int(completed.timestamp()),
+            "download_time": self._rng.randint(60, 3600),
+            "storage": f"/downloads/complete/{name}",
+        }
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def episodes(self, series_id: int) -> List[Dict[str, Any]]:
+        """
+        Generate a series' episodes (deterministic per series).
+
+        Args:
+            series_id: Series ID
+
+        Returns:
+            Episode dicts, empty if the series does not exist
+        """
+        series = self.series_by_id.get(series_id)
+        if series is None:
+            return []
+        rng = random.Random(self.sizes.seed * 1_000_003 + series_id)
+        episodes = []
+        for season in series["seasons"]:
+            files = season["statistics"]["episodeFileCount"]
+            for number in range(1, self.sizes.episodes_per_season + 1):
+                episode_id = series_id * 10_000 + season["seasonNumber"] * 100 + number
+                air_date = self._epoch + timedelta(days=rng.randint(0, 700))
+                episodes.append(
+                    {
+                        "id": episode_id,
+                        "seriesId": series_id,
+                        "seasonNumber": season["seasonNumber"],
+                        "episodeNumber": number,
+                        "title": f"Episode {number}",
+                        "airDate": air_date.date().isoformat(),
+                        "airDateUtc": air_date.isoformat() + "Z",
+                        "hasFile": number <= files,
+                        "monitored": series["monitored"],
+                    }
+                )
+        return episodes
+
+    def arr_queue(self, service: str) -> List[Dict[str, Any]]:
+        """
+        Sonarr/Radarr queue records for the SABnzbd slots they grabbed.
+
+        Args:
+            service: "sonarr" or "radarr"
+
+        Returns:
+            Queue records
+        """
+        id_field = "seriesId" if service == "sonarr" else "movieId"
+        records = []
+        for slot in self.queue:
+            if slot["_service"] != service:
+                continue
+            mb = float(slot["mb"])
+            records.append(
+                {
+                    "id": slot["index"] + 1,
+                    id_field: slot["_item_id"],
+                    "title": slot["filename"],
+                    "downloadId": slot["nzo_id"],
+                    "protocol": "usenet",
+                    "downloadClient": "SABnzbd",
+                    "status": "downloading",
+                    "trackedDownloadStatus": "ok",
+                    "trackedDownloadState": slot["_tracked_state"],
+                    "size": mb * 1_048_576,
+                    "sizeleft": float(slot["mbleft"]) * 1_048_576,
+                    "timeleft": slot["timeleft"],
+                    "quality": {"quality": {"name": _QUALITIES[slot["index"] % len(_QUALITIES)]}},
+                }
+            )
+        return records
+
+    def lookup(self, service: str, term: str) -> List[Dict[str, Any]]:
+        """
+        Search the catalogue the way the *arr lookup endpoints do.
+
+        Library items match by title; anything else gets one synthetic
+        result so adds always have something to add.
+
+        Args:
+            service: "sonarr" or "radarr"
+            term: Search term
+
+        Returns:
+            Up to 10 lookup results
+        """
+        items = self.series if service == "sonarr" else self.movies
+        needle = term.lower().strip()
+        results = [item for item in items if needle and needle in item["sortTitle"]][:10]
+        if results:
+            return results
+        offset = zlib.crc32(needle.encode()) % 100000
+        if service == "sonarr":
+            return [{"title": term, "year": 2020, "tvdbId": 900000 + offset, "seasons": []}]
+        return [{"title": term, "year": 2020, "tmdbId": 900000 + offset}]
+
+    def add(self, service: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add a series/movie to the library.
+
+        Args:
+            service: "sonarr" or "radarr"
+            payload: POST body
+
+        Returns:
+            Created library item
+        """
+        kind = "series" if service == "sonarr" else "movie"
+        item_id = self._next_id[kind]
+        self._next_id[kind] += 1
+        title = payload.get("title") or f"Added {kind} {item_id}"
+        item: Dict[str, Any] = {
+            "id": item_id,
+            "title": title,
+            "sortTitle": title.lower(),
+            "year": payload.get("year", 2020),
+            "monitored": payload.get("monitored", True),
+            "qualityProfileId": payload.get("qualityProfileId", 1),
+            "path": f"{payload.get('rootFolderPath', '/media')}/{title}",
+            "added": datetime.utcnow().isoformat() + "Z",
+        }
+        if kind == "series":
+            item.update(tvdbId=payload.get("tvdbId"), seasons=[], statistics={})
+            self.series.append(item)
+            self.series_by_id[item_id] = item
+        else:
+            item.update(tmdbId=payload.get("tmdbId"), hasFile=False, sizeOnDisk=0)
+            self.movies.append(item)
+            self.movies_by_id[item_id] = item
+        return item
+
+    def command(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Accept a *arr command (always reported as completed).
+
+        Args:
+            payload: Command body
+
+        Returns:
+            Command resource
+        """
+        self._commands += 1
+        now = datetime.utcnow().isoformat() + "Z"
+        return {
+            "id": self._commands,
+            "name": payload.get("name", "Unknown"),
+            "status": "completed",
+            "queued": now,
+            "started": now,
+            "ended": now,
+        }
@@ -0,0 +1,203 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Plex Media Server API simulator.
+
+Answers with a MediaContainer as JSON when the client sends
+``Accept: application/json`` (as PlexClient does) and as XML otherwise,
+like a real server. Section 1 holds the library's movies with files and
+section 2 its series; both page with X-Plex-Container-Start/Size.
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+
+from .faults import FaultInjector
+from .library import SyntheticLibrary
+
+MACHINE_IDENTIFIER = "autoarr-simulator"
+VERSION = "1.41.3.9314"
+
+
+def _movie_metadata(movie: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "ratingKey": str(movie["id"]),
+        "key": f"/library/metadata/{movie['id']}",
+        "guid": f"plex://movie/{movie['tmdbId']}",
+        "type": "movie",
+        "title": movie["title"],
+        "year": movie["year"],
+        "librarySectionID": 1,
+        "addedAt": 1704067200 + movie["id"] * 3600,
+        "updatedAt": 1704067200 + movie["id"] * 3600,
+    }
+
+
+def _show_metadata(series: Dict[str, Any]) -> Dict[str, Any]:
+    # Offset keys so show ratingKeys never collide with movie ratingKeys
+    rating_key = 1_000_000 + series["id"]
+    return {
+        "ratingKey": str(rating_key),
+        "key": f"/library/metadata/{rating_key}/children",
+        "guid": f"plex://show/{series['tvdbId']}",
+        "type": "show",
+        "title": series["title"],
+        "year": series["year"],
+        "librarySectionID": 2,
+        "leafCount": series.get("statistics", {}).get("episodeFileCount", 0),
+        "childCount": len(series.get("seasons", [])),
+        "addedAt": 1704067200 + series["id"] * 3600,
+        "updatedAt": 1704067200 + series["id"] * 3600,
+    }
+
+
+def _render(
+    request: Request,
+    items: List[Dict[str, Any]],
+    tag: str = "Metadata",
+    **attributes: Any,
+) -> Response:
+    """Render a MediaContainer as JSON or XML depending on the Accept header."""
+    attributes.setdefault("size", len(items))
+    if "application/json" in request.headers.get("accept", ""):
+        container: Dict[str, Any] = {**attributes}
+        if items:
+            container[tag] = items
+        return JSONResponse({"MediaContainer": container})
+
+    root = ET.Element("MediaContainer", {k: str(v) for k, v in attributes.items()})
+    xml_tag = "Video" if tag == "Metadata" else tag
+    for item in items:
+        element_tag = "Directory" if item.get("type") == "show" else xml_tag
+        ET.SubElement(root, element_tag, {k: str(v) for k, v in item.items()})
+    return Response(ET.tostring(root, xml_declaration=True), media_type="application/xml")
+
+
+def create_app(
+    library: SyntheticLibrary,
+    token: str = "simulator",
+    faults: Optional[FaultInjector] = None,
+) -> FastAPI:
+    """
+    Create the Plex simulator app.
+
+    Args:
+        library: Shared synthetic library
+        token: X-Plex-Token clients must send
+        faults: Fault injector (a no-op one is created if omitted)
+
+    Returns:
+        FastAPI app
+    """
+    app = FastAPI(title="Plex simulator")
+    injector = faults or FaultInjector()
+    injector.install(app)
+
+    def movies() -> List[Dict[str, Any]]:
+        return [_movie_metadata(m) for m in library.movies if m.get("hasFile")]
+
+    def shows() -> List[Dict[str, Any]]:
+        return [
+            _show_metadata(s)
+            for s in library.series
+            if s.get("statistics", {}).get("episodeFileCount")
+        ]
+
+    sections = {"1": ("movie", "Movies", movies), "2": ("show", "TV Shows", shows)}
+
+    @app.middleware("http")
+    async def check_token(request: Request, call_next: Any) -> Any:
+        if not request.url.path.startswith("/_sim"):
+            sent = request.headers.get("X-Plex-Token") or request.query_params.get("X-Plex-Token")
+            if sent != token:
+                return Response("Unauthorized", status_code=401)
+        return await call_next(request)
+
+    @app.get("/")
+    async def identity(request: Request) -> Response:
+        return _render(
+            request,
+            [],
+            machineIdentifier=MACHINE_IDENTIFIER,
+            version=VERSION,
+            friendlyName="AutoArr Simulator",
+        )
+
+    @app.get("/identity")
+    async def identity_alias(request: Request) -> Response:
+        return await identity(request)
+
+    @app.get("/library/sections")
+    async def library_sections(request: Request) -> Response:
+        directories = [
+            {"key": key, "type": kind, "title": title, "agent": "tv.plex.agents." + kind}
+            for key, (kind, title, _) in sections.items()
+        ]
+        return _render(request, directories, tag="Directory")
+
+    @app.get("/library/sections/{section_id}/all")
+    async def section_items(request: Request, section_id: str) -> Response:
+        if section_id not in sections:
+            return Response(status_code=404)
+        items = sections[section_id][2]()
+        params = request.query_params
+        updated_after = params.get("updatedAt>>") or params.get("updatedAt>")
+        if updated_after:
+            items = [item for item in items if item["updatedAt"] > int(updated_after)]
+        total = len(items)
+        start = int(params.get("X-Plex-Container-Start", 0))
+        size = params.get("X-Plex-Container-Size")
+        page = items[start : start + int(size)] if size else items[start:]
+        return _render(request, page, offset=start, totalSize=total, size=len(page))
+
+    @app.get("/library/sections/{section_id}/refresh")
+    async def refresh_section(section_id: str) -> Response:
+        return Response(status_code=200)
+
+    @app.get("/library/recentlyAdded")
+    async def recently_added(request: Request) -> Response:
+        items = sorted(movies(), key=lambda item: item["addedAt"], reverse=True)
+        limit = int(request.query_params.get("X-Plex-Container-Size", 50))
+        return _render(request, items[:limit])
+
+    @app.get("/library/onDeck")
+    async def on_deck(request: Request) -> Response:
+        return _render(request, shows()[:10])
+
+    @app.get("/status/sessions")
+    async def sessions(request: Request) -> Response:
+        return _render(request, movies()[:2])
+
+    @app.get("/status/sessions/history/all")
+    async def watch_history(request: Request) -> Response:
+        limit = int(request.query_params.get("X-Plex-Container-Size", 100))
+        return _render(request, movies()[:limit])
+
+    @app.get("/search")
+    async def search(
+        request: Request, query: str = "", limit: int = 50, sectionId: Optional[str] = None
+    ) -> Response:
+        candidates = sections[sectionId][2]() if sectionId in sections else movies() + shows()
+        needle = query.lower()
+        matches = [item for item in candidates if needle in item["title"].lower()]
+        return _render(request, matches[:limit])
+
+    return app
@@ -0,0 +1,187 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+SABnzbd API simulator.
+
+Serves the single /api endpoint (dispatching on ``mode``) that
+SABnzbdClient uses: queue, history, pause/resume, retry, version,
+fullstatus and get_config/set_config.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from .faults import FaultInjector
+from .library import SyntheticLibrary
+
+VERSION = "4.3.2"
+
+
+def _public(slot: Dict[str, Any]) -> Dict[str, Any]:
+    """Strip the simulator's private linkage fields from a queue slot."""
+    return {key: value for key, value in slot.items() if not key.startswith("_")}
+
+
+def _page(items: List[Any], start: Optional[str], limit: Optional[str]) -> List[Any]:
+    offset = int(start or 0)
+    if limit:
+        return items[offset : offset + int(limit)]
+    return items[offset:]
+
+
+def create_app(
+    library: SyntheticLibrary,
+    api_key: str = "simulator",
+    faults: Optional[FaultInjector] = None,
+) -> FastAPI:
+    """
+    Create the SABnzbd simulator app.
+
+    Args:
+        library: Shared synthetic library
+        api_key: API key clients must send
+        faults: Fault injector (a no-op one is created if omitted)
+
+    Returns:
+        FastAPI app
+    """
+    app = FastAPI(title="SABnzbd simulator")
+    injector = faults or FaultInjector()
+    injector.install(app)
+    state: Dict[str, Any] = {
+        "paused": False,
+        "config": {
+            "misc": {
+                "cache_limit": "1G",
+                "complete_dir": "/downloads/complete",
+                "download_dir": "/downloads/incomplete",
+                "direct_unpack": 1,
+                "pre_check": 0,
+            },
+            "servers": [
+                {"name": "news.example.com", "host": "news.example.com", "port": 563,
+                 "ssl": 1, "connections": 20, "enable": 1},
+            ],
+            "categories": [{"name": "tv", "dir": "tv"}, {"name": "movies", "dir": "movies"}],
+        },
+    }  # fmt: skip
+
+    def queue(params: Dict[str, str]) -> Dict[str, Any]:
+        name, value = params.get("name"), params.get("value")
+        if name in ("pause", "resume") and value:
+            for slot in library.queue:
+                if slot["nzo_id"] == value:
+                    slot["status"] = "Paused" if name == "pause" else "Queued"
+            return {"status": True, "nzo_ids": [value]}
+        if name == "delete" and value:
+            library.queue[:] = [s for s in library.queue if s["nzo_id"] != value]
+            return {"status": True, "nzo_ids": [value]}
+
+        slots = [_public(slot) for slot in library.queue]
+        mbleft = sum(float(slot["mbleft"]) for slot in library.queue)
+        return {
+            "queue": {
+                "status": "Paused" if state["paused"] else "Downloading",
+                "paused": state["paused"],
+                "speed": "0 " if state["paused"] else "25.0 M",
+                "kbpersec": "0.00" if state["paused"] else "25600.00",
+                "mbleft": f"{mbleft:.2f}",
+                "mb": f"{sum(float(slot['mb']) for slot in library.queue):.2f}",
+                "noofslots": len(slots),
+                "noofslots_total": len(slots),
+                "slots": _page(slots, params.get("start"), params.get("limit")),
+                "diskspace1": "1500.00",
+                "version": VERSION,
+            }
+        }
+
+    def history(params: Dict[str, str]) -> Dict[str, Any]:
+        slots = library.history
+        if params.get("failed_only") == "1":
+            slots = [slot for slot in slots if slot["status"] == "Failed"]
+        if params.get("category"):
+            slots = [slot for slot in slots if slot["category"] == params["category"]]
+        return {
+            "history": {
+                "noofslots": len(slots),
+                "total_size": f"{sum(slot['bytes'] for slot in slots) / 1e12:.1f} T",
+                "slots": _page(slots, params.get("start"), params.get("limit")),
+            }
+        }
+
+    def retry(params: Dict[str, str]) -> Dict[str, Any]:
+        value = params.get("value")
+        for slot in library.history:
+            if slot["nzo_id"] == value:
+                slot["status"], slot["fail_message"] = "Queued", ""
+                return {"status": True}
+        return {"status": False, "error": "Item not found"}
+
+    def set_pause(paused: bool) -> Dict[str, Any]:
+        state["paused"] = paused
+        return {"status": True}
+
+    def get_config(params: Dict[str, str]) -> Dict[str, Any]:
+        section = params.get("section")
+        if section:
+            return {"config": {section: state["config"].get(section, {})}}
+        return {"config": state["config"]}
+
+    def set_config(params: Dict[str, str]) -> Dict[str, Any]:
+        section = state["config"].setdefault(params.get("section", "misc"), {})
+        if isinstance(section, dict) and params.get("keyword"):
+            section[params["keyword"]] = params.get("value")
+        return {"status": True}
+
+    def fullstatus(params: Dict[str, str]) -> Dict[str, Any]:
+        return {
+            "status": {
+                "version": VERSION,
+                "paused": state["paused"],
+                "uptime": "3d",
+                "loadavg": "0.42 | 0.38 | 0.35",
+                "cache_art": "0",
+                "servers": [{"servername": s["name"]} for s in state["config"]["servers"]],
+            }
+        }
+
+    handlers = {
+        "queue": queue,
+        "history": history,
+        "retry": retry,
+        "pause": lambda params: set_pause(True),
+        "resume": lambda params: set_pause(False),
+        "version": lambda params: {"version": VERSION},
+        "fullstatus": fullstatus,
+        "get_config": get_config,
+        "set_config": set_config,
+    }
+
+    @app.get("/api")
+    async def api(request: Request) -> Any:
+        params = dict(request.query_params)
+        if params.get("apikey") != api_key:
+            return JSONResponse({"status": False, "error": "API Key Incorrect"}, status_code=401)
+        handler = handlers.get(params.get("mode", ""))
+        if handler is None:
+            return {"status": False, "error": "not implemented"}
+        return handler(params)
+
+    return app
@@ -0,0 +1,232 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Run all four upstream simulators.
+
+Usage:
+    python -m autoarr.tests.simulators --series 10000 --history 50000 \\
+        --latency-ms 20 --jitter-ms 30 --error-rate 0.01 \\
+        --storm-every 120 --storm-duration 5 --fault sonarr.latency_ms=250
+
+Each simulator listens on its own port (base port + 0..3 for SABnzbd,
+Sonarr, Radarr and Plex). The URLs and API key are printed as JSON on
+stdout once every server is up, so a harness can wire AutoArr to them.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI
+
+from . import arr, plex, sabnzbd
+from .faults import FaultConfig, FaultInjector
+from .library import LibrarySizes, SyntheticLibrary
+
+logger = logging.getLogger(__name__)
+
+SERVICES = ("sabnzbd", "sonarr", "radarr", "plex")
+
+
+@dataclass
+class SimulatorCluster:
+    """
+    The four simulators sharing one synthetic library.
+
+    Args:
+        sizes: Library sizes
+        faults: Default fault settings for every service
+        service_faults: Per-service overrides (service -> setting -> value)
+        host: Interface to listen on
+        base_port: Port of the first simulator; the others follow
+        api_key: API key/token every simulator expects
+    """
+
+    sizes: LibrarySizes = field(default_factory=LibrarySizes)
+    faults: FaultConfig = field(default_factory=FaultConfig)
+    service_faults: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    host: str = "127.0.0.1"
+    base_port: int = 18080
+    api_key: str = "simulator"
+
+    def __post_init__(self) -> None:
+        """Build the library, injectors and apps."""
+        self.library = SyntheticLibrary(self.sizes)
+        self.injectors: Dict[str, FaultInjector] = {}
+        for index, service in enumerate(SERVICES):
+            config = FaultConfig(**vars(self.faults))
+            config.update(self.service_faults.get(service, {}))
+            self.injectors[service] = FaultInjector(config, seed=self.sizes.seed + index)
+
+        self.apps: Dict[str, FastAPI] = {
+            "sabnzbd": sabnzbd.create_app(self.library, self.api_key, self.injectors["sabnzbd"]),
+            "sonarr": arr.create_app(
+                self.library, "sonarr", self.api_key, self.injectors["sonarr"]
+            ),
+            "radarr": arr.create_app(
+                self.library, "radarr", self.api_key, self.injectors["radarr"]
+            ),
+            "plex": plex.create_app(self.library, self.api_key, self.injectors["plex"]),
+        }
+        self._servers: List[uvicorn.Server] = []
+
+    @property
+    def urls(self) -> Dict[str, str]:
+        """Service name -> base URL."""
+        return {
+            service: f"http://{self.host}:{self.base_port + index}"
+            for index, service in enumerate(SERVICES)
+        }
+
+    async def serve(self, started: Optional[asyncio.Event] = None) -> None:
+        """
+        Serve every simulator until cancelled.
+
+        Args:
+            started: Set once all servers accept connections
+        """
+        self._servers = [
+            uvicorn.Server(
+                uvicorn.Config(
+                    self.apps[service],
+                    host=self.host,
+                    port=self.base_port + index,
+                    log_level="warning",
+                    access_log=False,
+                )
+            )
+            for index, service in enumerate(SERVICES)
+        ]
+        tasks = [asyncio.create_task(server.serve()) for server in self._servers]
+        while not all(server.started for server in self._servers):
+            if any(task.done() for task in tasks):
+                # A server failed to start (e.g. port in use); surface its error
+                await asyncio.gather(*tasks)
+                raise RuntimeError("A simulator exited during startup")
+            await asyncio.sleep(0.05)
+        if started is not None:
+            started.set()
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for server in self._servers:
+                server.should_exit = True
+
+    def stop(self) -> None:
+        """Ask every server to exit."""
+        for server in self._servers:
+            server.should_exit = True
+
+
+def _parse_fault(value: str) -> tuple:
+    """Parse ``service.setting=value``."""
+    try:
+        target, number = value.split("=", 1)
+        service, setting = target.split(".", 1)
+        if service not in SERVICES:
+            raise ValueError
+        return service, setting, float(number)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Expected service.setting=value with service in {', '.join(SERVICES)}: {value}"
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command line options for the simulators."""
+    parser = argparse.ArgumentParser(description="Run SABnzbd/Sonarr/Radarr/Plex simulators")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--base-port", type=int, default=18080)
+    parser.add_argument("--api-key", default="simulator")
+    parser.add_argument("--series", type=int, default=LibrarySizes.series)
+    parser.add_argument("--movies", type=int, default=LibrarySizes.movies)
+    parser.add_argument("--queue", type=int, default=LibrarySizes.queue_slots)
+    parser.add_argument("--history", type=int, default=LibrarySizes.history_slots)
+    parser.add_argument("--seed", type=int, default=LibrarySizes.seed)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--storm-every", type=float, default=0.0, help="Seconds between 503 storms")
+    parser.add_argument("--storm-duration", type=float, default=0.0)
+    parser.add_argument(
+        "--fault",
+        type=_parse_fault,
+        action="append",
+        default=[],
+        metavar="SERVICE.SETTING=VALUE",
+        help="Per-service fault override, e.g. sonarr.error_rate=0.2 (repeatable)",
+    )
+    return parser
+
+
+def cluster_from_args(args: argparse.Namespace) -> SimulatorCluster:
+    """
+    Build a cluster from parsed command line options.
+
+    Args:
+        args: Options from build_parser()
+
+    Returns:
+        SimulatorCluster
+    """
+    service_faults: Dict[str, Dict[str, float]] = {}
+    for service, setting, value in args.fault:
+        service_faults.setdefault(service, {})[setting] = value
+    return SimulatorCluster(
+        sizes=LibrarySizes(
+            series=args.series,
+            movies=args.movies,
+            queue_slots=args.queue,
+            history_slots=args.history,
+            seed=args.seed,
+        ),
+        faults=FaultConfig(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            storm_every=args.storm_every,
+            storm_duration=args.storm_duration,
+        ),
+        service_faults=service_faults,
+        host=args.host,
+        base_port=args.base_port,
+        api_key=args.api_key,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point for ``python -m autoarr.tests.simulators``."""
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    cluster = cluster_from_args(build_parser().parse_args(argv))
+
+    async def run() -> None:
+        started = asyncio.Event()
+        serving = asyncio.create_task(cluster.serve(started))
+        await started.wait()
+        print(json.dumps({"urls": cluster.urls, "api_key": cluster.api_key}), flush=True)
+        await serving
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
@@ -25,11 +25,38 @@ This module tests the request handler service including:
 - LLM integration
 """
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from autoarr.api.services.request_handler import ContentClassification, RequestHandler
 
 
+def _llm_agent(classification: ContentClassification, delay: float = 0.0) -> MagicMock:
+    """Build a mock LLM agent returning a fixed classification."""
+
+    async def classify(query: str) -> ContentClassification:
+        if delay:
+            await asyncio.sleep(delay)
+        return classification.model_copy()
+
+    agent = MagicMock()
+    agent.classify_content_request = AsyncMock(side_effect=classify)
+    return agent
+
+
+INCEPTION = ContentClassification(
+    content_type="movie",
+    title="Inception",
+    year=2010,
+    quality=None,
+    season=None,
+    episode=None,
+    confidence=0.95,
+)
+
+
 class TestPreprocessing:
     """Test NLP preprocessing functionality."""
 
@@ -359,3 +386,100 @@ class TestDisambiguationQuestions:
 
         # Should have no or minimal questions
         assert len(questions) == 0
+
+
+@pytest.mark.asyncio
+class TestTieredClassification:
+    """Test rule, memo and coalescing tiers in front of the LLM."""
+
+    async def test_rules_answer_high_confidence_queries_without_llm(self):
+        """Test that SxxEyy queries never reach the LLM."""
+        agent = _llm_agent(INCEPTION)
+        handler = RequestHandler(llm_agent=agent)
+
+        result = await handler.classify_content("The Office S03E04 1080p")
+
+        assert result.content_type == "tv"
+        assert result.season == 3
+        assert result.episode == 4
+        agent.classify_content_request.assert_not_called()
+        assert handler.get_classification_stats()["tiers"]["rules"]["count"] == 1
+
+    async def test_rules_tier_runs_without_llm(self):
+        """Test that the rules tier answers even when no LLM is configured."""
+        handler = RequestHandler()
+
+        result = await handler.classify_content("The Office S03E04 1080p")
+
+        assert result.content_type == "tv"
+        stats = handler.get_classification_stats()
+        assert stats["tiers"]["rules"]["count"] == 1
+        assert stats["tiers"]["fallback"]["count"] == 0
+
+    async def test_ambiguous_queries_use_llm_then_memo(self):
+        """Test that repeated ambiguous queries are served from the memo."""
+        agent = _llm_agent(INCEPTION)
+        handler = RequestHandler(llm_agent=agent)
+
+        first = await handler.classify_content("Inception")
+        second = await handler.classify_content("please get me   inception")
+
+        assert first.title == "Inception"
+        assert second.title == "Inception"
+        assert agent.classify_content_request.call_count == 1
+        stats = handler.get_classification_stats()
+        assert stats["llm_calls"] == 1
+        assert stats["tiers"]["cache"]["count"] == 1
+        assert stats["llm_calls_avoided"] == 1
+
+    async def test_memo_returns_copies(self):
+        """Test that callers cannot mutate memoized classifications."""
+        handler = RequestHandler(llm_agent=_llm_agent(INCEPTION))
+
+        first = await handler.classify_content("Inception")
+        first.title = "Changed"
+        second = await handler.classify_content("Inception")
+
+        assert second.title == "Inception"
+
+    async def test_memo_is_bounded_lru(self):
+        """Test that the least recently used entry is evicted."""
+        handler = RequestHandler(llm_agent=_llm_agent(INCEPTION), cache_size=2)
+
+        await handler.classify_content("one")
+        await handler.classify_content("two")
+        await handler.classify_content("one")
+        await handler.classify_content("three")
+
+        assert list(handler._classification_cache.keys()) == ["one", "three"]
+
+    async def test_concurrent_identical_queries_are_coalesced(self):
+        """Test that concurrent identical queries share one LLM call."""
+        agent = _llm_agent(INCEPTION, delay=0.05)
+        handler = RequestHandler(llm_agent=agent)
+
+        results = await asyncio.gather(*(handler.classify_content("Inception") for _ in range(5)))
+
+        assert all(r.title == "Inception" for r in results)
+        assert agent.classify_content_request.call_count == 1
+        stats = handler.get_classification_stats()
+        assert stats["tiers"]["coalesced"]["count"] == 4
+
+    async def test_llm_failure_falls_back_to_rules_for_all_waiters(self):
+        """Test that an LLM failure falls back to simple classification."""
+        agent = MagicMock()
+
+        async def fail(query: str) -> ContentClassification:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("LLM down")
+
+        agent.classify_content_request = AsyncMock(side_effect=fail)
+        handler = RequestHandler(llm_agent=agent)
+
+        results = await asyncio.gather(
+            handler.classify_content("Inception"), handler.classify_content("Inception")
+        )
+
+        assert all(r.title == "Inception" for r in results)
+        assert handler.get_classification_stats()["tiers"]["fallback"]["count"] == 2
+        assert handler.get_classification_stats()["cache_size"] == 0
@@ -27,7 +27,7 @@ Following TDD (Red-Green-Refactor):
 import json
 import re
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -494,6 +494,47 @@ class TestContentExtraction:
         assert "console.log" not in content
         assert ".test { color: red; }" not in content
 
+    def test_parse_html_prefers_main_content(self) -> None:
+        """Test that page chrome outside the main content element is dropped."""
+        html_content = """
+        <html><body>
+            <div class="sidebar">Sidebar links</div>
+            <main><h1>Download Folders</h1><p>Use a fast disk.</p></main>
+            <aside>Related pages</aside>
+        </body></html>
+        """
+        service = WebSearchService(brave_api_key="test_key")
+
+        content = service._parse_html(html_content)
+
+        assert "Download Folders" in content
+        assert "Use a fast disk." in content
+        assert "Sidebar links" not in content
+        assert "Related pages" not in content
+
+    @pytest.mark.asyncio
+    async def test_extract_content_caps_download_size(self, httpx_mock: Any) -> None:
+        """Test that oversized pages are truncated and timings are recorded."""
+        body = "<html><body><p>" + "x" * 5000 + "</p></body></html>"
+        httpx_mock.add_response(
+            url="https://example.com/huge",
+            text=body,
+            headers={"content-type": "text/html"},
+        )
+        service = WebSearchService(brave_api_key="test_key", max_content_bytes=1000)
+
+        content = await service.extract_content("https://example.com/huge")
+
+        assert 0 < len(content) <= 1000
+        stats = service.get_extraction_stats()
+        assert stats["parser"] == "html.parser"
+        assert stats["count"] == 1
+        assert stats["truncated"] == 1
+        assert stats["recent"][0]["url"] == "https://example.com/huge"
+        assert stats["recent"][0]["bytes"] == 1000
+        assert stats["recent"][0]["parse_ms"] >= 0
+        await service.close()
+
 
 class TestBestPracticesExtraction:
     """Test extraction of best practices from content."""
@@ -833,3 +874,194 @@ class TestWebSearchServiceIntegration:
             await service.search(query)
 
         assert "rate" in str(exc_info.value).lower() or "429" in str(exc_info.value)
+
+
+class TestTieredCache:
+    """Test the in-process and disk cache tiers."""
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_caches_without_redis(self, httpx_mock: Any) -> None:
+        """Test that repeated searches are served from memory when Redis is absent."""
+        httpx_mock.add_response(
+            json={
+                "web": {
+                    "results": [
+                        {
+                            "title": "SABnzbd Wiki",
+                            "url": "https://sabnzbd.org/wiki",
+                            "description": "Configuration guide",
+                        }
+                    ]
+                }
+            }
+        )
+        service = WebSearchService(brave_api_key="test_key")
+
+        first = await service.search(SearchQuery(query="sabnzbd config"))
+        second = await service.search(SearchQuery(query="sabnzbd config"))
+
+        assert [r.url for r in second] == [r.url for r in first]
+        assert len(httpx_mock.get_requests()) == 1
+        stats = service.get_cache_stats()
+        assert stats["hits"]["memory"] == 1
+        assert stats["misses"] == 1
+        assert stats["redis_enabled"] is False
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_is_promoted_to_memory(self) -> None:
+        """Test that a Redis hit is served from memory the next time."""
+        mock_redis = AsyncMock()
+        cached = [
+            {
+                "title": "Cached",
+                "url": "https://cached.com",
+                "snippet": "cached",
+                "relevance_score": 0.9,
+                "source": "cached.com",
+            }
+        ]
+        mock_redis.get.return_value = json.dumps(cached).encode()
+        mock_redis.pttl.return_value = 60_000
+        service = WebSearchService(brave_api_key="test_key", redis_client=mock_redis)
+
+        await service._get_cached_results("key")
+        results = await service._get_cached_results("key")
+
+        assert results[0].title == "Cached"
+        mock_redis.get.assert_called_once()
+        assert service.get_cache_stats()["hits"] == {"memory": 1, "redis": 1, "sqlite": 0}
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_is_promoted_with_remaining_ttl(self) -> None:
+        """Test that a promoted Redis entry expires from memory when it expires in Redis."""
+        from autoarr.api.services.search_cache import TieredCache
+
+        mock_redis = AsyncMock()
+        mock_redis.get.return_value = b"value"
+        mock_redis.pttl.return_value = 1_500
+        cache = TieredCache(redis_client=mock_redis)
+
+        with patch("autoarr.api.services.search_cache.time.monotonic", return_value=100.0):
+            assert await cache.get("key", ttl=3600) == "value"
+        with patch("autoarr.api.services.search_cache.time.monotonic", return_value=101.0):
+            assert cache.memory.get("key") == "value"
+        with patch("autoarr.api.services.search_cache.time.monotonic", return_value=102.0):
+            assert cache.memory.get("key") is None
+
+        # Expired in Redis between GET and PTTL: served once, not promoted
+        mock_redis.pttl.return_value = -2
+        assert await cache.get("other", ttl=3600) == "value"
+        assert cache.memory.get("other") is None
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_expires_entries(self) -> None:
+        """Test that memory entries expire after their TTL."""
+        from autoarr.api.services.search_cache import MemoryTTLCache
+
+        cache = MemoryTTLCache(max_entries=2)
+        cache.set("a", "1", ttl=0)
+        cache.set("b", "2", ttl=60)
+        cache.set("c", "3", ttl=60)
+        cache.set("d", "4", ttl=60)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is None  # Evicted as least recently used
+        assert cache.get("d") == "4"
+        assert cache.evictions == 2
+
+    def test_memory_tier_is_bounded_by_size(self) -> None:
+        """Test that large values evict by total size and oversized ones skip memory."""
+        from autoarr.api.services.search_cache import MemoryTTLCache
+
+        cache = MemoryTTLCache(max_entries=100, max_bytes=10)
+        cache.set("a", "x" * 4, ttl=60)
+        cache.set("b", "x" * 4, ttl=60)
+        cache.set("c", "x" * 4, ttl=60)
+        cache.set("huge", "x" * 11, ttl=60)
+
+        assert cache.get("a") is None  # Evicted to stay within max_bytes
+        assert cache.get("c") == "xxxx"
+        assert cache.get("huge") is None
+        assert cache.size_bytes == 8
+
+        cache.set("b", "x", ttl=60)  # Replacing a value frees the old size
+        assert cache.size_bytes == 5
+
+    @pytest.mark.asyncio
+    async def test_sqlite_tier_survives_restart(self, tmp_path: Any) -> None:
+        """Test that the disk tier serves entries to a new service instance."""
+        db_path = str(tmp_path / "search_cache.db")
+        results = [
+            SearchResult(
+                title="Persisted",
+                url="https://persisted.com",
+                snippet="persisted",
+                relevance_score=0.8,
+                source="persisted.com",
+            )
+        ]
+
+        first = WebSearchService(brave_api_key="test_key", cache_db_path=db_path)
+        await first._cache_results("search:abc", results)
+        await first.close()
+
+        second = WebSearchService(brave_api_key="test_key", cache_db_path=db_path)
+        cached = await second._get_cached_results("search:abc")
+
+        assert cached is not None
+        assert cached[0].title == "Persisted"
+        assert second.get_cache_stats()["hits"]["sqlite"] == 1
+        await second.close()
+
+
+class TestContentCache:
+    """Test caching and conditional revalidation of extracted page content."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_content_served_from_cache(self, httpx_mock: Any) -> None:
+        """Test that a recently extracted page is not fetched again."""
+        httpx_mock.add_response(
+            url="https://wiki.sabnzbd.org/cache",
+            text="<html><body><p>Article cache</p></body></html>",
+            headers={"content-type": "text/html"},
+        )
+        service = WebSearchService(brave_api_key="test_key")
+
+        first = await service.extract_content("https://wiki.sabnzbd.org/cache")
+        second = await service.extract_content("https://wiki.sabnzbd.org/cache")
+
+        assert first == second == "Article cache"
+        assert len(httpx_mock.get_requests()) == 1
+        assert service.content_stats == {"fresh": 1, "revalidated": 0, "fetched": 1}
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_content_revalidated_with_etag(self, httpx_mock: Any) -> None:
+        """Test that stale entries send validators and reuse text on 304."""
+        url = "https://wiki.servarr.com/sonarr/quality"
+        httpx_mock.add_response(
+            url=url,
+            text="<html><body><p>Quality profiles</p></body></html>",
+            headers={
+                "content-type": "text/html",
+                "etag": '"v1"',
+                "last-modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+            },
+        )
+        httpx_mock.add_response(
+            url=url,
+            status_code=304,
+            match_headers={
+                "If-None-Match": '"v1"',
+                "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+            },
+        )
+        service = WebSearchService(brave_api_key="test_key", content_fresh_ttl=0)
+
+        first = await service.extract_content(url)
+        second = await service.extract_content(url)
+
+        assert first == second == "Quality profiles"
+        assert service.content_stats["revalidated"] == 1
+        await service.close()
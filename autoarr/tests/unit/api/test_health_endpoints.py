@@ -22,6 +22,7 @@ This module tests the health check API endpoints for overall system health
 and individual service health monitoring.
 """
 
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -82,7 +83,7 @@ class TestHealthEndpoints:
         override_orchestrator(mock_orchestrator)
 
         # Make request
-        response = client.get("/health")
+        response = client.get("/health?deep=true")
 
         # Assertions
         assert response.status_code == 200
@@ -107,7 +108,7 @@ class TestHealthEndpoints:
         mock_orchestrator.health_check.side_effect = health_check_side_effect
         override_orchestrator(mock_orchestrator)
 
-        response = client.get("/health")
+        response = client.get("/health?deep=true")
 
         assert response.status_code == 200
         data = response.json()
@@ -115,6 +116,60 @@ class TestHealthEndpoints:
         assert data["services"]["sabnzbd"]["healthy"] is True
         assert data["services"]["sonarr"]["healthy"] is False
 
+    @pytest.mark.asyncio
+    async def test_overall_health_check_uses_cached_snapshot(
+        self, client, mock_orchestrator, override_orchestrator
+    ):
+        """Test that the default health check reads the snapshot without probing."""
+        checked_at = time.time() - 30
+        mock_orchestrator.get_health_snapshot = MagicMock(
+            return_value={
+                "sabnzbd": {"healthy": True, "latency_ms": 12.5, "checked_at": checked_at},
+                "sonarr": {"healthy": False, "latency_ms": 5000.0, "checked_at": checked_at},
+            }
+        )
+        override_orchestrator(mock_orchestrator)
+
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "degraded"
+        assert data["services"]["sabnzbd"]["latency_ms"] == 12.5
+        assert data["services"]["sonarr"]["healthy"] is False
+        assert data["services"]["sabnzbd"]["stale_seconds"] >= 30
+        mock_orchestrator.health_check.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_overall_health_check_before_first_snapshot(
+        self, client, mock_orchestrator, override_orchestrator
+    ):
+        """Test that services not checked yet are reported without probing."""
+        mock_orchestrator.get_health_snapshot = MagicMock(return_value={})
+        override_orchestrator(mock_orchestrator)
+
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "unknown"
+        assert data["services"]["sabnzbd"]["last_check"] is None
+        mock_orchestrator.health_check.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_liveness_never_touches_orchestrator(
+        self, client, mock_orchestrator, override_orchestrator
+    ):
+        """Test that the liveness probe is constant and does no upstream I/O."""
+        override_orchestrator(mock_orchestrator)
+
+        response = client.get("/health/live")
+
+        assert response.status_code == 200
+        assert response.json() == {"alive": True}
+        mock_orchestrator.get_connected_servers.assert_not_called()
+        mock_orchestrator.health_check.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_overall_health_check_no_services(self, client, override_orchestrator):
         """Test overall health check when no services are connected (fresh install)."""
@@ -299,6 +354,62 @@ class TestHealthEndpoints:
         assert data["error"] is not None
 
 
+class TestWorkersHealthEndpoint:
+    """Test the multi-worker status endpoint."""
+
+    def test_workers_health_reports_queued_subscribers(self, client):
+        """Test that queued event bus subscribers are listed with their queue stats."""
+        from autoarr.api.services.event_bus import DispatchMode, EventBus, EventType
+
+        async def slow_handler(event):
+            pass
+
+        event_bus = EventBus()
+        event_bus.subscribe(
+            EventType.DOWNLOAD_FAILED, slow_handler, dispatch_mode=DispatchMode.QUEUED
+        )
+
+        with patch("autoarr.api.services.event_bus.get_event_bus", return_value=event_bus):
+            response = client.get("/health/workers")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["leader_election"] is None
+        [subscriber] = data["event_subscribers"]
+        assert subscriber["handler"] == "slow_handler"
+        assert subscriber["depth"] == 0
+
+
+class TestWebSearchHealthEndpoint:
+    """Test the web search cache statistics endpoint."""
+
+    def test_web_search_health_before_first_search(self, client):
+        """Test that the endpoint reports disabled until a web search service exists."""
+        response = client.get("/health/web-search")
+
+        assert response.status_code == 200
+        assert response.json() == {"enabled": False}
+
+    def test_web_search_health_reports_cache_stats(self, client):
+        """Test that the active service's cache and extraction statistics are returned."""
+        from autoarr.api.services.web_search_service import set_web_search_service
+
+        service = MagicMock()
+        service.get_cache_stats.return_value = {"hits": {"memory": 3}, "misses": 1}
+        service.get_extraction_stats.return_value = {"parser": "html.parser", "count": 2}
+        set_web_search_service(service)
+        try:
+            response = client.get("/health/web-search")
+        finally:
+            set_web_search_service(None)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["enabled"] is True
+        assert data["cache"] == {"hits": {"memory": 3}, "misses": 1}
+        assert data["extraction"] == {"parser": "html.parser", "count": 2}
+
+
 class TestDatabaseHealthEndpoint:
     """Test database health check endpoint."""
 
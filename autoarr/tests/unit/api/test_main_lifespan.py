@@ -341,6 +341,51 @@ class TestLifespanFullCycle:
                                 pass
 
 
+class TestSharedHealthChecks:
+    """Test sharing the leader's health snapshot between workers."""
+
+    @pytest.mark.asyncio
+    async def test_workers_merge_published_snapshots_with_fanout(self):
+        """Test that with fan-out a worker merges published snapshots instead of polling."""
+        from autoarr.api.main import _publish_health_snapshot, _start_health_checks
+        from autoarr.api.services.event_bus import EventBus
+
+        orchestrator = MagicMock()
+
+        async def fake_get_orchestrator():
+            yield orchestrator
+
+        snapshot = {"plex": {"healthy": True, "latency_ms": 4.0, "checked_at": 100.0}}
+        with (
+            patch("autoarr.api.main.get_orchestrator", fake_get_orchestrator),
+            patch("autoarr.api.main.get_event_bus", return_value=EventBus()),
+            patch("autoarr.api.services.event_fanout.get_event_fanout", return_value=MagicMock()),
+        ):
+            await _start_health_checks()
+            await _publish_health_snapshot(snapshot)
+
+        orchestrator.start_periodic_health_checks.assert_not_called()
+        orchestrator.merge_health_snapshot.assert_called_once_with(snapshot)
+
+    @pytest.mark.asyncio
+    async def test_workers_poll_for_themselves_without_fanout(self):
+        """Test that without fan-out every worker runs its own health checks."""
+        from autoarr.api.main import _start_health_checks
+
+        orchestrator = MagicMock()
+
+        async def fake_get_orchestrator():
+            yield orchestrator
+
+        with (
+            patch("autoarr.api.main.get_orchestrator", fake_get_orchestrator),
+            patch("autoarr.api.services.event_fanout.get_event_fanout", return_value=None),
+        ):
+            await _start_health_checks()
+
+        orchestrator.start_periodic_health_checks.assert_called_once_with()
+
+
 class TestAppConfiguration:
     """Test FastAPI app configuration."""
 
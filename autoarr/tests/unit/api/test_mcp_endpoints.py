@@ -22,6 +22,7 @@ This module tests the MCP proxy API endpoints for calling tools,
 batch operations, and tool discovery.
 """
 
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -206,6 +207,41 @@ class TestMCPEndpoints:
         assert data[1]["success"] is False
         assert data[1]["error"] is not None
 
+    @pytest.mark.asyncio
+    async def test_batch_stream_emits_indexed_ndjson(self, client, mock_orchestrator):
+        """Test that the streaming batch emits one tagged line per call."""
+
+        async def iter_results(calls, deadline=None):
+            yield 1, {"success": True, "data": {"series": []}, "error": None}
+            yield 0, {"success": False, "data": {}, "error": "Batch deadline of 5.0s exceeded"}
+
+        mock_orchestrator.iter_tools_parallel = MagicMock(side_effect=iter_results)
+
+        async def override_get_orchestrator():
+            yield mock_orchestrator
+
+        app.dependency_overrides[get_orchestrator] = override_get_orchestrator
+
+        response = client.post(
+            "/api/v1/mcp/batch/stream",
+            json={
+                "calls": [
+                    {"server": "sabnzbd", "tool": "get_queue", "params": {}},
+                    {"server": "sonarr", "tool": "get_series", "params": {}},
+                ],
+                "deadline": 5.0,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["index"] for line in lines] == [1, 0]
+        assert lines[0]["success"] is True
+        assert lines[0]["metadata"] == {"server": "sonarr", "tool": "get_series"}
+        assert lines[1]["success"] is False
+        assert mock_orchestrator.iter_tools_parallel.call_args.kwargs["deadline"] == 5.0
+
     @pytest.mark.asyncio
     async def test_list_all_tools(self, client, mock_orchestrator):
         """Test listing all available tools."""
@@ -33,6 +33,8 @@ from autoarr.api.middleware import (
     RequestLoggingMiddleware,
     add_security_headers,
 )
+from autoarr.api.routers import logs
+from autoarr.api.routers.logs import get_slow_request_buffer
 from autoarr.shared.core.exceptions import (
     CircuitBreakerOpenError,
     MCPConnectionError,
@@ -40,6 +42,7 @@ from autoarr.shared.core.exceptions import (
     MCPTimeoutError,
     MCPToolError,
 )
+from autoarr.shared.core.request_timing import span
 
 # Create test app
 app = FastAPI()
@@ -332,3 +335,77 @@ class TestMiddlewareIntegration:
 
         # Check that error was logged
         mock_logger.exception.assert_called_once()
+
+
+# Test app with request timing and a slow request threshold every request exceeds
+timing_app = FastAPI()
+
+
+@timing_app.get("/timed")
+async def timed_endpoint():
+    """Endpoint that records a database and an upstream span."""
+    with span("db"):
+        pass
+    with span("sonarr", "/api/v3/series"):
+        pass
+    return {"message": "success"}
+
+
+timing_app.include_router(logs.router, prefix="/logs")
+timing_app.add_middleware(RequestLoggingMiddleware, slow_request_threshold=1e-9)
+
+
+class TestRequestTiming:
+    """Test Server-Timing header and slow request log."""
+
+    @pytest.fixture
+    def timing_client(self):
+        """Create a test client with an empty slow request log."""
+        get_slow_request_buffer().clear()
+        yield TestClient(timing_app)
+        get_slow_request_buffer().clear()
+
+    def test_adds_server_timing_header(self, timing_client):
+        """Spans recorded by the handler are reported in Server-Timing."""
+        response = timing_client.get("/timed")
+
+        server_timing = response.headers["Server-Timing"]
+        assert 'db;desc="1 call";dur=' in server_timing
+        assert 'sonarr;desc="1 call";dur=' in server_timing
+        assert "total;dur=" in server_timing
+
+    def test_server_timing_can_be_disabled(self):
+        """No Server-Timing header when it is turned off."""
+        quiet_app = FastAPI()
+        quiet_app.get("/timed")(timed_endpoint)
+        quiet_app.add_middleware(RequestLoggingMiddleware, server_timing=False)
+
+        response = TestClient(quiet_app).get("/timed")
+
+        assert "Server-Timing" not in response.headers
+
+    def test_slow_request_is_logged(self, timing_client):
+        """Requests over the threshold appear in the slow request log."""
+        timing_client.get("/timed", headers={"X-Request-ID": "slow-1"})
+
+        response = timing_client.get("/logs/slow-requests")
+
+        assert response.status_code == 200
+        entries = [e for e in response.json()["requests"] if e["request_id"] == "slow-1"]
+        assert len(entries) == 1
+        entry = entries[0]
+        assert entry["path"] == "/timed"
+        assert entry["status_code"] == 200
+        assert set(entry["breakdown"]) == {"db", "sonarr"}
+        assert [s["name"] for s in entry["spans"]] == ["db", "sonarr"]
+        assert entry["spans"][1]["detail"] == "/api/v3/series"
+
+    def test_clear_slow_requests(self, timing_client):
+        """The slow request log can be cleared."""
+        timing_client.get("/timed")
+
+        response = timing_client.delete("/logs/slow-requests")
+
+        assert response.status_code == 200
+        assert response.json()["cleared_count"] >= 1
+        assert len(get_slow_request_buffer()) <= 1  # Only the DELETE itself
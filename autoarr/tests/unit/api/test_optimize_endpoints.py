@@ -0,0 +1,134 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the optimization assessment endpoints.
+
+Tests that services are assessed concurrently, that results are cached, and
+that the cache is invalidated by applied fixes and CONFIG_CHANGED events.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from autoarr.api.routers import optimize
+from autoarr.api.routers.optimize import ApplyFixRequest, AssessmentCache
+from autoarr.api.services.event_bus import Event, EventBus, EventType
+from autoarr.api.services.tool_provider import ToolResult
+
+ASSESS_DELAY = 0.2
+
+
+def _fake_provider(name: str, calls: List[str], available: bool = True) -> type:
+    """Build a provider class whose assessment takes ASSESS_DELAY seconds."""
+
+    class FakeProvider:
+        async def is_available(self) -> bool:
+            return available
+
+        async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> ToolResult:
+            calls.append(tool_name)
+            if tool_name.endswith("_assess_optimization"):
+                await asyncio.sleep(ASSESS_DELAY)
+                return ToolResult(
+                    success=True,
+                    data={
+                        "service": name,
+                        "version": "1.0",
+                        "overall_status": "good",
+                        "overall_score": 90,
+                        "summary": {"total_checks": 0},
+                        "checks": [],
+                    },
+                )
+            return ToolResult(success=True, data={})
+
+    return FakeProvider
+
+
+@pytest.fixture
+def calls(monkeypatch) -> List[str]:
+    """Swap in fake providers, a fresh cache and a fresh event bus."""
+    recorded: List[str] = []
+    services = {
+        name: (_fake_provider(name, recorded), f"{name}_assess_optimization")
+        for name in ("sabnzbd", "sonarr", "radarr")
+    }
+    services["plex"] = (_fake_provider("plex", recorded, available=False), "plex_assess")
+    bus = EventBus()
+    monkeypatch.setattr(optimize, "SERVICE_ASSESSMENTS", services)
+    monkeypatch.setattr(optimize, "_assessment_cache", AssessmentCache(ttl=60))
+    monkeypatch.setattr(optimize, "get_event_bus", lambda: bus)
+    return recorded
+
+
+@pytest.mark.asyncio
+async def test_assess_all_runs_services_concurrently(calls) -> None:
+    """Test that total latency is that of the slowest service, not the sum."""
+    started = time.perf_counter()
+    result = await optimize.assess_all_services()
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < ASSESS_DELAY * 2
+    assert [s.service for s in result.services] == ["sabnzbd", "sonarr", "radarr", "plex"]
+    assert result.services[3].overall_status == "not_connected"
+    assert result.overall_score == 90
+    assert result.overall_status == "good"
+
+
+@pytest.mark.asyncio
+async def test_assessments_are_cached(calls) -> None:
+    """Test that repeated and concurrent requests reuse one assessment."""
+    await asyncio.gather(optimize.assess_service("sonarr"), optimize.assess_service("sonarr"))
+    await optimize.assess_all_services()
+
+    assert calls.count("sonarr_assess_optimization") == 1
+
+    await optimize.assess_service("sonarr", refresh=True)
+    assert calls.count("sonarr_assess_optimization") == 2
+
+
+@pytest.mark.asyncio
+async def test_apply_fix_invalidates_service(calls) -> None:
+    """Test that a successful fix drops only that service's cached result."""
+    await optimize.assess_all_services()
+
+    response = await optimize.apply_fix(
+        ApplyFixRequest(service="sonarr", check_id="x", fix_action="sonarr_fix")
+    )
+    await optimize.assess_all_services()
+
+    assert response.success
+    assert calls.count("sonarr_assess_optimization") == 2
+    assert calls.count("radarr_assess_optimization") == 1
+
+
+@pytest.mark.asyncio
+async def test_config_changed_event_invalidates_cache(calls) -> None:
+    """Test that CONFIG_CHANGED without a service drops every cached result."""
+    await optimize.assess_all_services()
+
+    await optimize.get_event_bus().publish(
+        Event(event_type=EventType.CONFIG_CHANGED, data={"service": None}, source="test")
+    )
+    await optimize.assess_all_services()
+
+    assert calls.count("sabnzbd_assess_optimization") == 2
+    assert calls.count("radarr_assess_optimization") == 2
@@ -22,6 +22,7 @@ This module tests the service-specific API endpoints for Downloads (SABnzbd),
 Shows (Sonarr), Movies (Radarr), and Media (Plex).
 """
 
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -328,6 +329,101 @@ class TestMediaEndpoints:
         data = response.json()
         assert "sessions" in data
 
+    def test_stream_library_items(self, client, monkeypatch):
+        """Test streaming library items as NDJSON with field projection."""
+        from autoarr.api.services.tool_providers import PlexToolProvider
+
+        async def fake_iter(self, library_id, fields=None, limit=None, offset=0):
+            for i in range(3):
+                item = {"ratingKey": str(i), "title": f"Movie {i}", "Media": [{}]}
+                yield {k: v for k, v in item.items() if not fields or k in fields}
+
+        monkeypatch.setattr(PlexToolProvider, "is_available", AsyncMock(return_value=True))
+        monkeypatch.setattr(PlexToolProvider, "iter_library_items", fake_iter)
+
+        response = client.get("/api/v1/media/libraries/1/items?fields=ratingKey,title")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == [{"ratingKey": str(i), "title": f"Movie {i}"} for i in range(3)]
+
+    def test_stream_library_items_reports_errors(self, client, monkeypatch):
+        """Test that a mid-stream Plex failure ends with an error record and closes the client."""
+        from autoarr.api.services.tool_providers import PlexToolProvider
+
+        async def failing_iter(self, library_id, fields=None, limit=None, offset=0):
+            yield {"ratingKey": "1"}
+            raise RuntimeError("Plex went away")
+
+        close = AsyncMock()
+        monkeypatch.setattr(PlexToolProvider, "is_available", AsyncMock(return_value=True))
+        monkeypatch.setattr(PlexToolProvider, "iter_library_items", failing_iter)
+        monkeypatch.setattr(PlexToolProvider, "close", close)
+
+        response = client.get("/api/v1/media/libraries/1/items")
+
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == [{"ratingKey": "1"}, {"error": "Plex went away"}]
+        close.assert_awaited_once()
+
+    def test_recently_added_uses_live_plex_when_synced(
+        self, client, mock_orchestrator, override_orchestrator, monkeypatch
+    ):
+        """Test that recently-added asks Plex even when the local copy has data."""
+        from autoarr.api.services import plex_sync
+
+        sync = MagicMock()
+        sync.has_data = AsyncMock(return_value=True)
+        sync.repository.get_recently_added = AsyncMock(return_value=[])
+        monkeypatch.setattr(plex_sync, "get_plex_sync_service", lambda: sync)
+        mock_orchestrator.call_tool.return_value = [{"ratingKey": "7", "title": "S01E01"}]
+        override_orchestrator(mock_orchestrator)
+
+        response = client.get("/api/v1/media/recently-added?limit=5")
+
+        assert response.status_code == 200
+        assert response.json() == {"items": [{"ratingKey": "7", "title": "S01E01"}], "total": 1}
+        mock_orchestrator.call_tool.assert_awaited_once_with(
+            "plex", "get_recently_added", {"limit": 5}
+        )
+        sync.repository.get_recently_added.assert_not_awaited()
+
+    def test_browse_served_from_local_sync(self, client, monkeypatch):
+        """Test that browsing reads the synced local copy."""
+        from autoarr.api.services import plex_sync
+
+        row = MagicMock()
+        row.data = {"ratingKey": "12", "title": "Alien"}
+        sync = MagicMock()
+        sync.has_data = AsyncMock(return_value=True)
+        sync.repository.browse = AsyncMock(return_value=[row])
+        sync.repository.count = AsyncMock(return_value=1)
+        monkeypatch.setattr(plex_sync, "get_plex_sync_service", lambda: sync)
+
+        response = client.get("/api/v1/media/libraries/1/browse?limit=5")
+
+        assert response.status_code == 200
+        assert response.json()["items"] == [{"ratingKey": "12", "title": "Alien"}]
+        assert response.json()["total"] == 1
+
+    def test_browse_requires_synced_library(self, client):
+        """Test that browsing returns 503 before the first sync."""
+        response = client.get("/api/v1/media/libraries/1/browse")
+
+        assert response.status_code == 503
+
+    def test_stream_library_items_plex_unavailable(self, client, monkeypatch):
+        """Test that streaming returns 503 when Plex is not configured."""
+        from autoarr.api.services.tool_providers import PlexToolProvider
+
+        monkeypatch.setattr(PlexToolProvider, "is_available", AsyncMock(return_value=False))
+
+        response = client.get("/api/v1/media/libraries/1/items")
+
+        assert response.status_code == 503
+
 
 class TestRootEndpoints:
     """Test root API endpoints."""
@@ -42,6 +42,7 @@ The orchestrator hasn't been implemented yet - these tests will drive the implem
 """
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -938,6 +939,124 @@ class TestOrchestratorParallelExecution:
             assert len(progress_updates) > 0
             assert progress_updates[-1] == (5, 5)  # Final update
 
+    @pytest.mark.asyncio
+    async def test_call_tools_parallel_partial_results_keep_every_call(
+        self, orchestrator, mock_clients, mcp_tool_call_factory
+    ):
+        """Test that calls cut off by the batch timeout are reported, not dropped."""
+        # Arrange
+        orchestrator.parallel_timeout = 0.1
+        calls = [  # noqa: F841
+            mcp_tool_call_factory("sabnzbd", "get_queue"),
+            mcp_tool_call_factory("sonarr", "get_series"),
+        ]
+
+        async def slow_call(tool, params):
+            await asyncio.sleep(1.0)
+            return {}
+
+        mock_clients["sonarr"].call_tool = slow_call
+
+        with patch.object(orchestrator, "_create_client") as mock_create:
+            mock_create.side_effect = lambda name: mock_clients[name]
+            await orchestrator.connect_all()
+
+            # Act
+            results = await orchestrator.call_tools_parallel(calls, return_partial=True)
+
+            # Assert
+            assert len(results) == 2
+            assert results[0]["success"] is True
+            assert results[1] == {"success": False, "data": {}, "error": "Timeout"}
+
+    @pytest.mark.asyncio
+    async def test_iter_tools_parallel_yields_in_completion_order(
+        self, orchestrator, mock_clients, mcp_tool_call_factory
+    ):
+        """Test that streamed results arrive as they complete, tagged by index."""
+        # Arrange
+        calls = [  # noqa: F841
+            mcp_tool_call_factory("sabnzbd", "get_queue"),
+            mcp_tool_call_factory("radarr", "get_movies"),
+        ]
+
+        async def delayed_call(tool, params):
+            await asyncio.sleep({"get_queue": 0.2, "get_movies": 0.01}[tool])
+            return {"tool": tool}
+
+        for client in mock_clients.values():
+            client.call_tool = delayed_call
+
+        with patch.object(orchestrator, "_create_client") as mock_create:
+            mock_create.side_effect = lambda name: mock_clients[name]
+            await orchestrator.connect_all()
+
+            # Act
+            results = [item async for item in orchestrator.iter_tools_parallel(calls)]
+
+            # Assert
+            assert [index for index, _ in results] == [1, 0]
+            assert results[0][1]["data"] == {"tool": "get_movies"}
+
+    @pytest.mark.asyncio
+    async def test_iter_tools_parallel_deduplicates_identical_calls(
+        self, orchestrator, mock_clients, mcp_tool_call_factory
+    ):
+        """Test that identical calls in one batch execute once."""
+        # Arrange
+        calls = [  # noqa: F841
+            mcp_tool_call_factory("sabnzbd", "get_queue", params={"a": 1, "b": 2}),
+            mcp_tool_call_factory("sabnzbd", "get_queue", params={"b": 2, "a": 1}),
+            mcp_tool_call_factory("sabnzbd", "get_history"),
+        ]
+        mock_clients["sabnzbd"].call_tool = AsyncMock(return_value={"ok": True})
+
+        with patch.object(orchestrator, "_create_client") as mock_create:
+            mock_create.side_effect = lambda name: mock_clients[name]
+            await orchestrator.connect_all()
+
+            # Act
+            results = dict([item async for item in orchestrator.iter_tools_parallel(calls)])
+
+            # Assert
+            assert sorted(results) == [0, 1, 2]
+            assert all(r["success"] for r in results.values())
+            assert mock_clients["sabnzbd"].call_tool.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_tools_parallel_deadline_returns_partial_results(
+        self, orchestrator, mock_clients, mcp_tool_call_factory
+    ):
+        """Test that calls still running at the deadline are reported as failed."""
+        # Arrange
+        calls = [  # noqa: F841
+            mcp_tool_call_factory("sabnzbd", "get_queue"),
+            mcp_tool_call_factory("sonarr", "get_series"),
+        ]
+
+        async def slow_call(tool, params):
+            await asyncio.sleep(5.0)
+            return {}
+
+        mock_clients["sonarr"].call_tool = slow_call
+
+        with patch.object(orchestrator, "_create_client") as mock_create:
+            mock_create.side_effect = lambda name: mock_clients[name]
+            await orchestrator.connect_all()
+
+            # Act
+            start = time.monotonic()
+            results = dict(
+                [item async for item in orchestrator.iter_tools_parallel(calls, deadline=0.1)]
+            )
+            elapsed = time.monotonic() - start
+
+            # Assert
+            assert elapsed < 1.0
+            assert results[0]["success"] is True
+            assert results[1]["success"] is False
+            assert "deadline" in results[1]["error"]
+
 
 # ============================================================================
 # 4. ERROR HANDLING AND CIRCUIT BREAKER TESTS (12 tests)
@@ -1396,6 +1515,60 @@ class TestOrchestratorHealthChecks:
             # Assert - Health checks should have been called multiple times
             assert mock_clients["sabnzbd"].health_check.call_count >= 2
 
+    @pytest.mark.asyncio
+    async def test_periodic_health_checks_sleep_after_failures(self, orchestrator):
+        """Test that a failing health check waits for the interval instead of spinning."""
+        # Arrange
+        orchestrator.health_check_interval = 0.1  # 100ms
+        failing = AsyncMock(side_effect=RuntimeError("server unreachable"))
+
+        with patch.object(orchestrator, "health_check_all", failing):
+            # Act
+            orchestrator.start_periodic_health_checks()
+            await asyncio.sleep(0.25)
+            orchestrator.stop_periodic_health_checks()
+
+        # Assert - one check per interval, not a busy loop
+        assert 2 <= failing.call_count <= 4
+
+    @pytest.mark.asyncio
+    async def test_periodic_health_checks_report_snapshot(self, orchestrator):
+        """Test that each round of periodic health checks hands its snapshot to on_checked."""
+        # Arrange
+        orchestrator.health_check_interval = 0.1  # 100ms
+        on_checked = AsyncMock()
+        snapshot = {"plex": {"healthy": True, "latency_ms": 3.0, "checked_at": 1.0}}
+        orchestrator._health_snapshot = dict(snapshot)
+
+        with patch.object(orchestrator, "health_check_all", AsyncMock(return_value={})):
+            # Act
+            orchestrator.start_periodic_health_checks(on_checked=on_checked)
+            await asyncio.sleep(0.05)
+            orchestrator.stop_periodic_health_checks()
+
+        # Assert
+        on_checked.assert_awaited_once_with(snapshot)
+
+    def test_merge_health_snapshot_keeps_newest_entry(self, orchestrator):
+        """Test that merged health results never replace newer local ones."""
+        # Arrange
+        orchestrator._health_snapshot = {
+            "plex": {"healthy": True, "latency_ms": 3.0, "checked_at": 200.0},
+        }
+
+        # Act
+        orchestrator.merge_health_snapshot(
+            {
+                "plex": {"healthy": False, "latency_ms": 9.0, "checked_at": 100.0},
+                "sonarr": {"healthy": True, "latency_ms": 5.0, "checked_at": 150.0},
+            }
+        )
+
+        # Assert
+        snapshot = orchestrator.get_health_snapshot()
+        assert snapshot["plex"]["checked_at"] == 200.0
+        assert snapshot["sonarr"]["healthy"] is True
+
     @pytest.mark.asyncio
     async def test_health_check_includes_detailed_diagnostics(self, orchestrator, mock_clients):
         """Test that health check results include diagnostic information."""
@@ -0,0 +1,141 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the in-process metrics registry and the /metrics endpoint.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from autoarr.api.main import app
+from autoarr.shared.core.mcp_orchestrator import CircuitBreaker
+from autoarr.shared.core.metrics import (
+    CIRCUIT_BREAKER_STATE,
+    CIRCUIT_BREAKER_TRANSITIONS,
+    MAX_LABEL_SETS,
+    OPENMETRICS_CONTENT_TYPE,
+    MetricsRegistry,
+)
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    """Empty registry per test."""
+    return MetricsRegistry()
+
+
+class TestMetricsRegistry:
+    """Tests for metric families and OpenMetrics rendering."""
+
+    def test_render_counter_and_gauge(self, registry: MetricsRegistry) -> None:
+        """Counters get a _total suffix, label values are escaped and output ends with EOF."""
+        calls = registry.counter("test_calls", "Calls made", ["server"])
+        calls.labels("sonarr").inc()
+        calls.labels("sonarr").inc(2)
+        calls.labels('say "hi"').inc()
+        registry.gauge("test_depth", "Queue depth").set(7)
+
+        text = registry.render()
+
+        assert "# TYPE test_calls counter\n" in text
+        assert "# HELP test_calls Calls made\n" in text
+        assert 'test_calls_total{server="sonarr"} 3\n' in text
+        assert 'test_calls_total{server="say \\"hi\\""} 1\n' in text
+        assert "test_depth 7\n" in text
+        assert text.endswith("# EOF\n")
+
+    def test_histogram_buckets_are_cumulative(self, registry: MetricsRegistry) -> None:
+        """Each bucket counts observations at or below its bound; +Inf equals _count."""
+        latency = registry.histogram("test_latency_seconds", "Latency", buckets=(0.5, 1.0))
+        for value in (0.25, 0.5, 0.75, 3.0):
+            latency.observe(value)
+
+        text = registry.render()
+
+        assert 'test_latency_seconds_bucket{le="0.5"} 2\n' in text
+        assert 'test_latency_seconds_bucket{le="1.0"} 3\n' in text
+        assert 'test_latency_seconds_bucket{le="+Inf"} 4\n' in text
+        assert "test_latency_seconds_count 4\n" in text
+        assert "test_latency_seconds_sum 4.5\n" in text
+
+    def test_gauge_function_is_read_at_render_time(self, registry: MetricsRegistry) -> None:
+        """A function-backed gauge reports the current value on each render."""
+        connections = []
+        registry.gauge("test_connections", "Connections").set_function(lambda: len(connections))
+
+        assert "test_connections 0\n" in registry.render()
+        connections.append(object())
+        assert "test_connections 1\n" in registry.render()
+
+    def test_label_sets_are_capped(self, registry: MetricsRegistry) -> None:
+        """Label sets beyond the cap are folded into a single "other" child."""
+        calls = registry.counter("test_calls", "Calls", ["tool"])
+        for i in range(MAX_LABEL_SETS + 10):
+            calls.labels(f"tool_{i}").inc()
+
+        assert len(calls._children) == MAX_LABEL_SETS + 1
+        assert 'test_calls_total{tool="other"} 10\n' in registry.render()
+
+    def test_wrong_label_count_raises(self, registry: MetricsRegistry) -> None:
+        """Passing the wrong number of label values is an error."""
+        calls = registry.counter("test_calls", "Calls", ["server", "tool"])
+
+        with pytest.raises(ValueError):
+            calls.labels("sonarr")
+
+    def test_duplicate_registration_raises(self, registry: MetricsRegistry) -> None:
+        """Metric names are unique within a registry."""
+        registry.counter("test_calls", "Calls")
+
+        with pytest.raises(ValueError):
+            registry.gauge("test_calls", "Calls again")
+
+
+class TestCircuitBreakerMetrics:
+    """Tests for circuit breaker transition metrics."""
+
+    def test_transitions_are_counted(self) -> None:
+        """Opening and closing a named breaker records each transition and the state."""
+        breaker = CircuitBreaker(failure_threshold=2, name="metrics-test")
+        opened = CIRCUIT_BREAKER_TRANSITIONS.labels("metrics-test", "closed", "open")
+        before = opened.value
+
+        breaker.on_failure()
+        assert opened.value == before
+        breaker.on_failure()
+
+        assert opened.value == before + 1
+        assert CIRCUIT_BREAKER_STATE.labels("metrics-test").value == 2
+
+        breaker.force_state("closed")
+        assert CIRCUIT_BREAKER_STATE.labels("metrics-test").value == 0
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /metrics."""
+
+    def test_metrics_endpoint(self) -> None:
+        """The endpoint serves OpenMetrics text with the application's metrics."""
+        response = TestClient(app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == OPENMETRICS_CONTENT_TYPE
+        assert "# TYPE autoarr_tool_call_duration_seconds histogram" in response.text
+        assert "# TYPE autoarr_websocket_connections gauge" in response.text
+        assert "# TYPE autoarr_event_subscriber_queue_depth gauge" in response.text
+        assert response.text.endswith("# EOF\n")
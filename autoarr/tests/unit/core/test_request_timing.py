@@ -0,0 +1,152 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for request-scoped timing spans.
+"""
+
+import asyncio
+
+import pytest
+
+from autoarr.shared.core import request_timing
+from autoarr.shared.core.request_timing import (
+    MAX_SPANS_PER_REQUEST,
+    RequestTiming,
+    disable_opentelemetry,
+    enable_opentelemetry,
+    end_request_timing,
+    get_request_timing,
+    span,
+    start_request_timing,
+    traced,
+)
+
+
+@pytest.fixture
+def timing():
+    """Bind a RequestTiming for the duration of a test."""
+    timing, token = start_request_timing()
+    yield timing
+    end_request_timing(token)
+
+
+class TestSpans:
+    """Tests for recording spans."""
+
+    def test_span_outside_request_is_a_no_op(self) -> None:
+        """Without a bound timing nothing is recorded and nothing fails."""
+        assert get_request_timing() is None
+        with span("db"):
+            pass
+
+    def test_span_records_into_current_request(self, timing: RequestTiming) -> None:
+        """Spans are recorded with their name, detail and offsets."""
+        with span("db"):
+            pass
+        with span("mcp", "sonarr.get_series"):
+            pass
+
+        assert [(s.name, s.detail) for s in timing.spans] == [
+            ("db", None),
+            ("mcp", "sonarr.get_series"),
+        ]
+        assert timing.spans[1].start_ms >= timing.spans[0].start_ms
+        assert all(s.duration_ms >= 0 for s in timing.spans)
+
+    def test_span_is_recorded_when_the_block_raises(self, timing: RequestTiming) -> None:
+        """Failed operations still count towards the request's time."""
+        with pytest.raises(RuntimeError):
+            with span("llm"):
+                raise RuntimeError("boom")
+
+        assert [s.name for s in timing.spans] == ["llm"]
+
+    def test_spans_per_request_are_capped(self, timing: RequestTiming) -> None:
+        """Spans beyond the cap are counted but not kept."""
+        for _ in range(MAX_SPANS_PER_REQUEST + 5):
+            with span("db"):
+                pass
+
+        assert len(timing.spans) == MAX_SPANS_PER_REQUEST
+        assert timing.dropped == 5
+
+    @pytest.mark.asyncio
+    async def test_traced_decorator(self, timing: RequestTiming) -> None:
+        """Each call of a traced coroutine function is a span."""
+
+        @traced("radarr")
+        async def request(endpoint: str) -> str:
+            await asyncio.sleep(0)
+            return endpoint
+
+        assert await request("/movie") == "/movie"
+        assert await request("/queue") == "/queue"
+        assert request.__name__ == "request"
+        assert timing.summary()["radarr"][0] == 2
+
+    @pytest.mark.asyncio
+    async def test_spans_from_child_tasks_reach_the_request(self, timing: RequestTiming) -> None:
+        """Tasks started while handling a request record into the same timing."""
+
+        async def lookup() -> None:
+            with span("plex"):
+                await asyncio.sleep(0)
+
+        await asyncio.gather(lookup(), lookup())
+
+        assert timing.summary()["plex"][0] == 2
+
+
+class TestServerTiming:
+    """Tests for the Server-Timing header value."""
+
+    def test_server_timing_aggregates_by_name(self) -> None:
+        """Spans with the same name are summed and counted."""
+        timing = RequestTiming()
+        timing.add("db", None, timing.started, timing.started + 0.002)
+        timing.add("db", None, timing.started, timing.started + 0.003)
+        timing.add("llm", "model", timing.started, timing.started + 0.5)
+
+        assert timing.server_timing(total_ms=600) == (
+            'db;desc="2 calls";dur=5.0, llm;desc="1 call";dur=500.0, total;dur=600.0'
+        )
+
+    def test_server_timing_without_spans(self) -> None:
+        """Only the total is reported when nothing was timed."""
+        assert RequestTiming().server_timing(total_ms=1.25) == "total;dur=1.2"
+
+
+class TestOpenTelemetry:
+    """Tests for the optional OpenTelemetry export."""
+
+    def test_export_is_off_by_default(self) -> None:
+        """No tracer is configured unless export is enabled."""
+        assert request_timing._tracer is None
+
+    def test_enable_and_disable(self) -> None:
+        """Spans go through the OpenTelemetry API once enabled."""
+        pytest.importorskip("opentelemetry")
+        try:
+            assert enable_opentelemetry() is True
+            assert request_timing._tracer is not None
+            with request_timing.otel_request_span("GET /test"):
+                with span("db"):
+                    pass
+        finally:
+            disable_opentelemetry()
+        assert request_timing._tracer is None
@@ -32,6 +32,9 @@ Test Coverage Strategy:
 Target Coverage: 90%+ for the Plex client class
 """
 
+import asyncio
+import xml.etree.ElementTree as ET
+
 import pytest
 from httpx import HTTPError
 from pytest_httpx import HTTPXMock
@@ -66,6 +69,24 @@ def plex_client(plex_url: str, plex_token: str):
     return PlexClient(url=plex_url, token=plex_token)
 
 
+def _library_section_xml(count: int) -> bytes:
+    """Build a library section response shaped like Plex's /library/sections/{id}/all."""
+    items = "".join(
+        f'<Video ratingKey="{i}" key="/library/metadata/{i}" type="movie" '
+        f'title="Movie {i}" year="{1980 + i % 40}" addedAt="{1600000000 + i}" '
+        f'updatedAt="{1600000000 + i}" duration="7200000">'
+        f'<Media id="{i}" videoResolution="1080" container="mkv">'
+        f'<Part id="{i}" file="/movies/Movie {i}.mkv" size="8589934592" /></Media>'
+        f'<Genre tag="Drama" /><Genre tag="Action" /><Director tag="Someone" /></Video>'
+        for i in range(count)
+    )
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<MediaContainer size="{count}" totalSize="{count}" librarySectionID="1">'
+        f"{items}</MediaContainer>"
+    ).encode()
+
+
 # ============================================================================
 # Connection and Initialization Tests
 # ============================================================================
@@ -255,6 +276,78 @@ class TestPlexClientLibraryOperations:
         assert "X-Plex-Container-Size=5" in str(request.url)
         assert "X-Plex-Container-Start=10" in str(request.url)
 
+    @pytest.mark.asyncio
+    async def test_iter_library_items_pages_through_section(
+        self, httpx_mock: HTTPXMock, plex_client
+    ) -> None:
+        """Test that iter_library_items requests pages until totalSize is reached."""
+        for start in (0, 2, 4):
+            count = min(2, 5 - start)
+            httpx_mock.add_response(
+                json={
+                    "MediaContainer": {
+                        "totalSize": 5,
+                        "Metadata": [
+                            {"ratingKey": str(start + i), "title": f"Movie {start + i}"}
+                            for i in range(count)
+                        ],
+                    }
+                }
+            )
+
+        items = [item async for item in plex_client.iter_library_items("1", page_size=2)]
+
+        assert [item["ratingKey"] for item in items] == ["0", "1", "2", "3", "4"]
+        starts = [
+            request.url.params["X-Plex-Container-Start"] for request in httpx_mock.get_requests()
+        ]
+        assert starts == ["0", "2", "4"]
+        assert all(
+            request.url.params["X-Plex-Container-Size"] == "2"
+            for request in httpx_mock.get_requests()
+        )
+
+    @pytest.mark.asyncio
+    async def test_iter_library_items_prefetches_next_page(self, plex_client) -> None:
+        """Test that the next page is requested before the current page is consumed."""
+        requested = []
+
+        async def fake_page(library_id, start, size, filters=None):
+            requested.append(start)
+            if start >= 4:
+                return [], 4
+            return [{"ratingKey": str(start + i)} for i in range(size)], 4
+
+        plex_client.get_library_page = fake_page
+        iterator = plex_client.iter_library_items("1", page_size=2)
+
+        first = await iterator.__anext__()
+        await asyncio.sleep(0)
+
+        assert first == {"ratingKey": "0"}
+        assert requested == [0, 2]
+        await iterator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_iter_library_items_projects_fields_and_limits(
+        self, httpx_mock: HTTPXMock, plex_client, plex_media_item_factory: callable
+    ) -> None:
+        """Test field projection and limit/offset handling."""
+        items = [plex_media_item_factory(title=f"Movie {i}") for i in range(3)]
+        httpx_mock.add_response(json={"MediaContainer": {"totalSize": 100, "Metadata": items}})
+
+        result = [
+            item
+            async for item in plex_client.iter_library_items(
+                "1", page_size=50, fields=["title"], limit=3, offset=10
+            )
+        ]
+
+        assert result == [{"title": f"Movie {i}"} for i in range(3)]
+        request = httpx_mock.get_request()
+        assert request.url.params["X-Plex-Container-Start"] == "10"
+        assert request.url.params["X-Plex-Container-Size"] == "3"
+
     @pytest.mark.asyncio
     async def test_get_recently_added_returns_recent_content(
         self, httpx_mock: HTTPXMock, plex_client, plex_media_item_factory: callable
@@ -540,6 +633,14 @@ class TestPlexClientResponseParsing:
         assert len(result) == 1
         assert result[0]["title"] == "Movies"
 
+    def test_parse_xml_bytes_matches_tree_converter(self, plex_client) -> None:
+        """Test that the single-pass parser produces the same dict as the tree converter."""
+        xml_response = _library_section_xml(25)
+
+        expected = plex_client._parse_xml_to_dict(ET.fromstring(xml_response))
+
+        assert plex_client._parse_xml_bytes(xml_response) == expected
+
     @pytest.mark.asyncio
     async def test_client_handles_empty_response(self, httpx_mock: HTTPXMock, plex_client) -> None:
         """Test that client handles empty responses."""
@@ -0,0 +1,321 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Unit tests for the bulk content import pipeline.
+
+Tests CSV/JSON parsing, the classify -> lookup -> dedupe -> add stages
+against fake Radarr/Sonarr providers, resuming an interrupted job, the
+progress stream and stage rate limiting.
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+import pytest_asyncio
+
+from autoarr.api.database import ContentRequestRepository, Database
+from autoarr.api.services.bulk_import import (
+    BulkImportService,
+    RateLimiter,
+    StageLimit,
+    parse_import,
+)
+from autoarr.api.services.request_handler import RequestHandler
+from autoarr.api.services.tool_provider import ToolResult
+
+
+class FakeArrProvider:
+    """Radarr/Sonarr stand-in with a lookup catalogue and a library."""
+
+    def __init__(self, id_field: str, library_key: str, catalogue: Dict[str, Dict]) -> None:
+        self.id_field = id_field
+        self.library_key = library_key
+        self.catalogue = catalogue
+        self.library: List[Dict[str, Any]] = []
+        self.added: List[Dict[str, Any]] = []
+
+    async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> ToolResult:
+        if tool_name.endswith("_lookup") or tool_name.endswith("_search_series"):
+            term = arguments["term"].lower()
+            results = [entry for key, entry in self.catalogue.items() if key in term]
+            return ToolResult(success=True, data={"results": results})
+        if tool_name.endswith(("_get_movies", "_get_series")):
+            return ToolResult(success=True, data={self.library_key: self.library})
+        if tool_name.endswith("_quality_profiles"):
+            return ToolResult(success=True, data={"profiles": [{"id": 4}]})
+        if tool_name.endswith("_root_folders"):
+            return ToolResult(success=True, data={"folders": [{"path": "/media"}]})
+        if tool_name.endswith(("_add_movie", "_add_series")):
+            self.added.append(arguments)
+            entry = {"id": 100 + len(self.added), self.id_field: arguments.get("tmdb_id")}
+            self.library.append(entry)
+            return ToolResult(success=True, data=entry)
+        return ToolResult(success=False, error=f"Unexpected tool {tool_name}")
+
+
+@pytest_asyncio.fixture
+async def database(tmp_path) -> AsyncIterator[Database]:
+    """Create a file database (jobs run in their own sessions alongside the test's)."""
+    db = Database(f"sqlite+aiosqlite:///{tmp_path / 'autoarr.db'}")
+    await db.init_db()
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+def radarr() -> FakeArrProvider:
+    """Create a fake Radarr that knows The Matrix and already has Inception."""
+    fake = FakeArrProvider(
+        "tmdbId",
+        "movies",
+        {
+            "matrix": {"title": "The Matrix", "year": 1999, "tmdbId": 603},
+            "inception": {"title": "Inception", "year": 2010, "tmdbId": 27205},
+        },
+    )
+    fake.library = [{"id": 1, "tmdbId": 27205}]
+    return fake
+
+
+@pytest.fixture
+def sonarr() -> FakeArrProvider:
+    """Create a fake Sonarr that knows Breaking Bad."""
+    return FakeArrProvider(
+        "tvdbId",
+        "series",
+        {"breaking bad": {"title": "Breaking Bad", "year": 2008, "tvdbId": 81189}},
+    )
+
+
+def _service(database: Database, radarr: Any, sonarr: Any) -> BulkImportService:
+    return BulkImportService(
+        database,
+        RequestHandler(),
+        radarr_provider=radarr,
+        sonarr_provider=sonarr,
+        stage_limits={stage: StageLimit(concurrency=2) for stage in ("classify", "lookup")},
+        batch_size=2,
+    )
+
+
+async def _wait(service: BulkImportService, job_id: int) -> Dict[str, Any]:
+    task = service._tasks.get(job_id)
+    if task is not None:
+        await task
+    return await service.get_job_status(job_id)
+
+
+def test_parse_csv_and_json() -> None:
+    """Test header CSV, headerless CSV and JSON inputs."""
+    csv_items = parse_import("Title,Type,Year\nThe Matrix,movie,1999\nBreaking Bad,tv,\n", "csv")
+    assert csv_items[0]["query"] == "The Matrix 1999"
+    assert csv_items[0]["content_type"] == "movie" and csv_items[0]["year"] == 1999
+    assert csv_items[1]["content_type"] == "tv" and csv_items[1]["year"] is None
+
+    assert [i["query"] for i in parse_import("Dune\nAlien\n", "csv")] == ["Dune", "Alien"]
+
+    json_items = parse_import(json.dumps(["Dune", {"title": "Alien", "tmdb_id": "348"}]), "json")
+    assert json_items[1]["tmdb_id"] == 348
+
+    with pytest.raises(ValueError):
+        parse_import("{}", "json")
+    with pytest.raises(ValueError):
+        parse_import(json.dumps(["a", "b"]), "json", max_items=1)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_classifies_looks_up_dedupes_and_adds(database, radarr, sonarr) -> None:
+    """Test each outcome of the staged pipeline."""
+    service = _service(database, radarr, sonarr)
+    content = json.dumps(
+        [
+            "The Matrix 1999",
+            "Breaking Bad season 2",
+            {"title": "Inception", "type": "movie", "tmdb_id": 27205},
+            {"title": "The Matrix", "type": "movie"},
+            "Nonexistent Film",
+        ]
+    )
+
+    job = await service.create_job(content, "json")
+    status = await _wait(service, job.id)
+
+    assert status["status"] == "completed"
+    assert status["progress"] == {
+        "total": 5,
+        "done": 5,
+        "added": 2,
+        "duplicate": 2,
+        "not_found": 1,
+        "failed": 0,
+    }
+    assert [a["tmdb_id"] for a in radarr.added] == [603]
+    assert radarr.added[0]["quality_profile_id"] == 4
+    assert [a["tvdb_id"] for a in sonarr.added] == [81189]
+
+    items = await service.repository.get_items(job.id)
+    assert [item.outcome for item in items[1:3]] == ["added", "duplicate"]
+    assert items[2].error == "Already in Radarr"
+    assert items[4].outcome == "not_found"
+
+    # Both Matrix rows resolve to the same movie; whichever is deduped first wins
+    matrix = sorted([items[0], items[3]], key=lambda item: item.outcome)
+    assert [item.outcome for item in matrix] == ["added", "duplicate"]
+    assert matrix[1].error.startswith("Same title as row")
+
+    request = await ContentRequestRepository(database).get_by_id(matrix[0].request_id)
+    assert request.status == "searching"
+    assert request.radarr_id == 101
+
+
+@pytest.mark.asyncio
+async def test_lookup_rejects_results_that_only_resemble_the_title(
+    database, radarr, sonarr
+) -> None:
+    """Test that a loose lookup hit finishes as not_found instead of being added."""
+    radarr.catalogue["breaking bad"] = {
+        "title": "El Camino: A Breaking Bad Movie",
+        "year": 2019,
+        "tmdbId": 559969,
+    }
+    service = _service(database, radarr, sonarr)
+    content = json.dumps(["Breaking Bad", {"title": "The Matrix", "type": "movie", "year": 2003}])
+
+    job = await service.create_job(content, "json")
+    status = await _wait(service, job.id)
+
+    assert status["progress"]["not_found"] == 2
+    assert radarr.added == []
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_finished_items_and_does_not_re_add(database, radarr, sonarr) -> None:
+    """Test that a resumed job only processes unfinished items."""
+    service = _service(database, radarr, sonarr)
+    job = await service.repository.create_job(
+        "json",
+        [
+            {"query": "Inception", "content_type": "movie", "title": "Inception"},
+            {"query": "The Matrix", "content_type": "movie", "title": "The Matrix"},
+        ],
+    )
+    items = await service.repository.get_items(job.id)
+    # Before the restart: item 0 finished; item 1 was added but not yet recorded
+    items[0].stage, items[0].outcome = "done", "added"
+    items[1].stage, items[1].tmdb_id = "add", 603
+    radarr.library.append({"id": 7, "tmdbId": 603})
+    await service.repository.save_items(items)
+
+    assert await service.resume_incomplete() == [job.id]
+    status = await _wait(service, job.id)
+
+    assert status["progress"]["added"] == 1
+    assert status["progress"]["duplicate"] == 1
+    assert radarr.added == []
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_jobs_a_live_worker_owns(database, radarr, sonarr) -> None:
+    """Test that only jobs with a stale heartbeat are taken over."""
+    service = _service(database, radarr, sonarr)
+    items = [{"query": "The Matrix", "content_type": "movie", "title": "The Matrix"}]
+    live = await service.repository.create_job("json", items, owner="other-worker")
+    dead = await service.repository.create_job("json", items, owner="dead-worker")
+    await service.repository.update_job(live.id, status="running")
+    await service.repository.update_job(
+        dead.id, status="running", heartbeat_at=datetime.utcnow() - timedelta(minutes=5)
+    )
+
+    assert await service.resume_incomplete() == [dead.id]
+    await _wait(service, dead.id)
+
+    assert not await service.resume(live.id)
+    assert (await service.repository.get_job(live.id)).owner == "other-worker"
+    assert (await service.repository.get_job(dead.id)).owner == service.owner
+    assert [a["tmdb_id"] for a in radarr.added] == [603]
+
+
+@pytest.mark.asyncio
+async def test_job_stops_when_another_worker_takes_it_over(database, radarr, sonarr) -> None:
+    """Test that a worker whose heartbeat was lost stops instead of finishing the job."""
+    service = _service(database, radarr, sonarr)
+    service.heartbeat_interval = 0.2
+    job = await service.repository.create_job(
+        "json",
+        [{"query": "The Matrix", "content_type": "movie", "title": "The Matrix"}],
+        owner=service.owner,
+    )
+
+    started = asyncio.Event()
+    original = radarr.execute
+
+    async def stall(tool_name: str, arguments: Dict[str, Any]) -> ToolResult:
+        started.set()
+        await asyncio.sleep(5)
+        return await original(tool_name, arguments)
+
+    radarr.execute = stall
+    service.start(job.id)
+    task = service._tasks[job.id]
+    await asyncio.wait_for(started.wait(), timeout=2)
+
+    # Another worker claims the job while the pipeline is stalled
+    await service.repository.update_job(job.id, owner="other-worker")
+    await asyncio.wait([task], timeout=2)
+
+    assert task.cancelled()
+    assert (await service.get_job_status(job.id))["status"] == "running"
+    assert (await service.repository.get_job(job.id)).owner == "other-worker"
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_items_then_job(database, radarr, sonarr) -> None:
+    """Test that the progress stream ends with the job's final status."""
+    service = _service(database, radarr, sonarr)
+    job = await service.repository.create_job(
+        "json", [{"query": "The Matrix 1999"}, {"query": "Nonexistent Film"}]
+    )
+
+    messages: List[Dict[str, Any]] = []
+
+    async def consume() -> None:
+        async for message in service.stream(job.id):
+            messages.append(message)
+
+    service.start(job.id)
+    await asyncio.wait_for(consume(), timeout=5)
+
+    assert messages[0]["type"] == "job"
+    assert messages[-1]["type"] == "job" and messages[-1]["status"] == "completed"
+    finished = [m for m in messages if m["type"] == "item" and m["stage"] == "done"]
+    assert sorted(m["outcome"] for m in finished) == ["added", "not_found"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_calls() -> None:
+    """Test that the limiter allows at most `rate` calls per second."""
+    limiter = RateLimiter(rate=20)
+
+    started = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+    assert time.monotonic() - started >= 0.14
@@ -22,6 +22,7 @@ This module tests the chat agent's ability to classify queries, generate respons
 fetch documentation, check service status, and handle tool calls.
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -40,6 +41,7 @@ from autoarr.api.services.chat_agent import (
     get_random_success,
     get_random_troubleshoot_intro,
 )
+from autoarr.api.services.web_search_service import get_web_search_service
 from autoarr.shared.llm import LLMMessage, LLMResponse, LLMResponseWithTools, ToolCall
 
 
@@ -270,9 +272,14 @@ class TestChatAgentProviderInit:
         with patch("autoarr.api.services.web_search_service.WebSearchService") as mock_web_search:
             mock_search = MagicMock()
             mock_web_search.return_value = mock_search
+            mock_search.close = AsyncMock()
             agent = ChatAgent(brave_api_key="brave-key")
             search = await agent._ensure_web_search()
             assert search == mock_search
+            assert get_web_search_service() is mock_search
+
+            await agent.close()
+            assert get_web_search_service() is None
 
     async def test_ensure_web_search_without_brave_key(self) -> None:
         """Test web search initialization without Brave API key."""
@@ -638,6 +645,42 @@ class TestDocumentationFetching:
         assert len(docs) == 1
         assert docs[0].content == "Test snippet"
 
+    async def test_fetch_documentation_concurrent_with_deadline(self) -> None:
+        """Test that pages are fetched concurrently and slow ones fall back to snippets."""
+        results = []
+        for name in ("fast", "slow", "other"):
+            result = MagicMock()
+            result.source = name
+            result.url = f"https://wiki.sabnzbd.org/{name}"
+            result.snippet = f"{name} snippet"
+            result.relevance_score = 0.9
+            results.append(result)
+
+        async def extract(url: str) -> str:
+            if url.endswith("slow"):
+                await asyncio.sleep(10)
+            await asyncio.sleep(0.05)
+            return f"{url} content"
+
+        mock_search = MagicMock()
+        mock_search.search = AsyncMock(return_value=results)
+        mock_search.extract_content = AsyncMock(side_effect=extract)
+
+        agent = ChatAgent(brave_api_key="test-key")
+        agent._web_search = mock_search
+        agent.DOC_FETCH_TIMEOUT = 0.2
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        docs = await agent._fetch_documentation(QueryTopic.SABNZBD, "test", {})
+        elapsed = loop.time() - start
+
+        assert [d.source for d in docs] == ["fast", "slow", "other"]
+        assert docs[0].content == "https://wiki.sabnzbd.org/fast content"
+        assert docs[1].content == "slow snippet"
+        assert docs[2].content == "https://wiki.sabnzbd.org/other content"
+        assert elapsed < 1.0
+
 
 @pytest.mark.asyncio
 class TestToolIntegration:
@@ -764,6 +807,65 @@ class TestToolIntegration:
                     response = await agent.chat_with_tools("Check queue")
                     mock_chat.assert_called_once()
 
+    async def test_chat_with_tools_compacts_consumed_tool_results(self) -> None:
+        """Test that tool results are summarized after the LLM has consumed them."""
+        with patch.object(ChatAgent, "_ensure_tools") as mock_ensure_tools:
+            mock_registry = MagicMock()
+            mock_registry.get_available_tools = AsyncMock(return_value=["sabnzbd_get_queue"])
+            mock_registry.get_tools_openai_format = MagicMock(
+                return_value=[{"type": "function", "function": {"name": "sabnzbd_get_queue"}}]
+            )
+            big_result = MagicMock()
+            big_result.success = True
+            big_result.data = {"slots": [{"name": f"item-{i}"} for i in range(200)]}
+            big_result.error = None
+            big_result.to_dict.return_value = {"success": True, "data": big_result.data}
+            mock_registry.execute_tool = AsyncMock(return_value=big_result)
+            mock_ensure_tools.return_value = mock_registry
+
+            sent_payloads = []
+
+            def tool_call_response(call_id: str) -> LLMResponseWithTools:
+                return LLMResponseWithTools(
+                    content="",
+                    model="test-model",
+                    provider="test-provider",
+                    usage={"prompt_tokens": 100, "completion_tokens": 10},
+                    tool_calls=[ToolCall(id=call_id, name="sabnzbd_get_queue", arguments={})],
+                )
+
+            responses = [
+                tool_call_response("call_1"),
+                tool_call_response("call_2"),
+                LLMResponseWithTools(
+                    content="Done.",
+                    model="test-model",
+                    provider="test-provider",
+                    usage={"prompt_tokens": 100, "completion_tokens": 10},
+                ),
+            ]
+
+            async def complete_with_tools(messages, **kwargs):
+                sent_payloads.append([m.content for m in messages if m.role == "tool"])
+                return responses.pop(0)
+
+            with patch.object(ChatAgent, "_ensure_provider") as mock_ensure_provider:
+                mock_provider = MagicMock()
+                mock_provider.complete_with_tools = complete_with_tools
+                mock_ensure_provider.return_value = mock_provider
+
+                agent = ChatAgent()
+                response = await agent.chat_with_tools("What's in the queue?")
+
+            assert response.message == "Done."
+            # Third call: first result compacted, second still sent in full
+            first, second = sent_payloads[2]
+            assert json.loads(first)["compacted"] is True
+            assert "item-199" in second
+            assert response.token_usage["total_requests"] == 3
+            assert response.token_usage["compacted_messages"] == 1
+            assert agent.get_token_usage_stats()["total_input_tokens"] == 300
+
 
 @pytest.mark.asyncio
 class TestCloseMethod:
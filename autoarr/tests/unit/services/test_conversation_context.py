@@ -0,0 +1,219 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Unit tests for the conversation context manager.
+
+Tests token estimation, budget-aware history selection, tool result
+compaction and per-request token accounting.
+"""
+
+import json
+
+from autoarr.api.services.conversation_context import (
+    ContextBudget,
+    ConversationContextManager,
+    estimate_message_tokens,
+    estimate_tokens,
+    summarize_tool_result,
+)
+from autoarr.api.services.llm_agent import TokenUsageTracker
+from autoarr.shared.llm import LLMMessage
+
+
+def _tool_message(call_id: str, items: int) -> LLMMessage:
+    """Build a tool result message with a large payload."""
+    payload = {"success": True, "data": {"slots": [{"name": f"item-{i}"} for i in range(items)]}}
+    msg = LLMMessage(role="tool", content=json.dumps(payload))
+    msg.tool_call_id = call_id
+    msg.name = "sabnzbd_get_queue"
+    return msg
+
+
+class TestTokenEstimation:
+    """Tests for token estimation helpers."""
+
+    def test_estimate_tokens_empty(self) -> None:
+        """Test that empty text has no tokens."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens(None) == 0
+
+    def test_estimate_tokens_rounds_up(self) -> None:
+        """Test that partial tokens round up."""
+        assert estimate_tokens("abcde") == 2
+
+    def test_estimate_message_tokens_includes_tool_calls(self) -> None:
+        """Test that tool call payloads count towards the estimate."""
+        plain = LLMMessage(role="assistant", content="ok")
+        with_calls = LLMMessage(
+            role="assistant",
+            content="ok",
+            tool_calls=[{"id": "1", "function": {"name": "x", "arguments": "{}"}}],
+        )
+        assert estimate_message_tokens(with_calls) > estimate_message_tokens(plain)
+
+
+class TestHistorySelection:
+    """Tests for budget-aware history selection."""
+
+    def test_select_history_keeps_most_recent_in_order(self) -> None:
+        """Test that the newest messages are kept in chronological order."""
+        manager = ConversationContextManager("system", budget=ContextBudget(max_history_messages=2))
+        history = [
+            {"role": "user", "content": "first"},
+            {"role": "assistant", "content": "second"},
+            {"role": "user", "content": "third"},
+        ]
+        selected = manager.select_history(history)
+        assert [m.content for m in selected] == ["second", "third"]
+
+    def test_select_history_respects_token_budget(self) -> None:
+        """Test that history stops once the token budget is exhausted."""
+        manager = ConversationContextManager("system", budget=ContextBudget(max_history_tokens=50))
+        history = [
+            {"role": "user", "content": "x" * 400},
+            {"role": "assistant", "content": "short answer"},
+        ]
+        selected = manager.select_history(history)
+        assert [m.content for m in selected] == ["short answer"]
+
+    def test_select_history_skips_empty_messages(self) -> None:
+        """Test that empty history entries are ignored."""
+        manager = ConversationContextManager("system")
+        selected = manager.select_history([{"role": "user", "content": ""}, {"role": "user"}])
+        assert selected == []
+
+    def test_build_messages_prefix(self) -> None:
+        """Test that the prefix is system, history, then the query."""
+        manager = ConversationContextManager("system prompt")
+        messages = manager.build_messages("query", [{"role": "user", "content": "hi"}])
+        assert [m.role for m in messages] == ["system", "user", "user"]
+        assert messages[0].content == "system prompt"
+        assert messages[-1].content == "query"
+        assert manager.prefix_length == 3
+
+
+class TestToolResultCompaction:
+    """Tests for compaction of consumed tool results."""
+
+    def test_pending_tool_results_are_sent_in_full(self) -> None:
+        """Test that results the LLM has not seen yet are not compacted."""
+        manager = ConversationContextManager("system")
+        manager.build_messages("query")
+        manager.prepare_request()
+        manager.mark_consumed()
+
+        tool_msg = _tool_message("call_1", 50)
+        manager.add_message(LLMMessage(role="assistant", content=""))
+        manager.add_message(tool_msg)
+
+        messages = manager.prepare_request()
+        assert messages[-1].content == tool_msg.content
+        assert manager.compacted_messages == 0
+
+    def test_consumed_tool_results_are_compacted(self) -> None:
+        """Test that results from earlier rounds are summarized."""
+        manager = ConversationContextManager("system")
+        manager.build_messages("query")
+        manager.prepare_request()
+        manager.mark_consumed()
+
+        original = _tool_message("call_1", 50)
+        manager.add_message(LLMMessage(role="assistant", content=""))
+        manager.add_message(original)
+        manager.prepare_request()
+        manager.mark_consumed()
+
+        manager.add_message(LLMMessage(role="assistant", content=""))
+        manager.add_message(_tool_message("call_2", 5))
+        messages = manager.prepare_request()
+
+        compacted = messages[manager.prefix_length + 1]
+        assert compacted.role == "tool"
+        assert compacted.tool_call_id == "call_1"
+        assert compacted.name == "sabnzbd_get_queue"
+        assert len(compacted.content) < len(original.content)
+        assert json.loads(compacted.content)["compacted"] is True
+        assert manager.compacted_messages == 1
+        assert manager.tokens_saved > 0
+
+    def test_prefix_is_never_rewritten(self) -> None:
+        """Test that compaction leaves the stable prefix untouched."""
+        manager = ConversationContextManager("system")
+        prefix = [m.model_copy() for m in manager.build_messages("query")]
+        manager.prepare_request()
+        manager.mark_consumed()
+        manager.add_message(_tool_message("call_1", 50))
+        manager.prepare_request()
+        manager.mark_consumed()
+        messages = manager.prepare_request()
+        assert messages[: manager.prefix_length] == prefix
+
+    def test_over_budget_compacts_pending_results(self) -> None:
+        """Test that pending results are compacted when the budget is exceeded."""
+        manager = ConversationContextManager("system", budget=ContextBudget(max_context_tokens=100))
+        manager.build_messages("query")
+        manager.prepare_request()
+        manager.mark_consumed()
+        manager.add_message(_tool_message("call_1", 200))
+
+        manager.prepare_request()
+        assert manager.compacted_messages == 1
+
+    def test_summarize_tool_result_shapes(self) -> None:
+        """Test summaries for dict data, list data, errors and non-JSON content."""
+        dict_summary = json.loads(
+            summarize_tool_result(json.dumps({"success": True, "data": {"a": 1}}))
+        )
+        assert dict_summary["data_keys"] == ["a"]
+
+        list_summary = json.loads(
+            summarize_tool_result(json.dumps({"success": True, "data": [1, 2]}))
+        )
+        assert list_summary["data_items"] == 2
+
+        error_summary = json.loads(
+            summarize_tool_result(json.dumps({"success": False, "error": "boom"}))
+        )
+        assert error_summary["success"] is False
+        assert error_summary["error"] == "boom"
+
+        raw_summary = json.loads(summarize_tool_result("not json" * 100, max_chars=10))
+        assert raw_summary["preview"] == "not jsonno"
+
+
+class TestTokenAccounting:
+    """Tests for per-request token accounting."""
+
+    def test_record_usage_updates_request_and_shared_trackers(self) -> None:
+        """Test that usage is recorded per request and on the shared tracker."""
+        shared = TokenUsageTracker()
+        manager = ConversationContextManager("system", usage_tracker=shared)
+        manager.record_usage({"prompt_tokens": 100, "completion_tokens": 20})
+        manager.record_usage({"prompt_tokens": 150, "completion_tokens": 30})
+
+        stats = manager.get_stats()
+        assert stats["total_input_tokens"] == 250
+        assert stats["total_output_tokens"] == 50
+        assert stats["total_requests"] == 2
+        assert shared.total_input_tokens == 250
+
+    def test_record_usage_ignores_missing_usage(self) -> None:
+        """Test that a missing usage dict is ignored."""
+        manager = ConversationContextManager("system")
+        manager.record_usage(None)
+        assert manager.get_stats()["total_requests"] == 0
@@ -40,11 +40,17 @@ Test Strategy:
 import asyncio
 from datetime import datetime
 from typing import Any, Dict
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from autoarr.api.services.event_bus import Event, EventBus, EventType
+from autoarr.api.services.event_bus import (
+    DispatchMode,
+    Event,
+    EventBus,
+    EventType,
+    OverflowPolicy,
+)
 
 # ============================================================================
 # Test Fixtures
@@ -967,3 +973,285 @@ async def test_concurrent_publish_to_same_handler(event_bus):
 
     # Assert - All events should be handled
     assert handler_call_count == 20
+
+
+# ============================================================================
+# Queued Dispatch Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_queued_publish_does_not_wait_for_slow_handler(event_bus):
+    """Test that publish returns once a queued event is enqueued."""
+    release = asyncio.Event()
+    received = []
+
+    async def slow_handler(event: Event):
+        await release.wait()
+        received.append(event)
+
+    fast_handler = AsyncMock()
+    event_bus.subscribe(EventType.DOWNLOAD_FAILED, slow_handler, dispatch_mode=DispatchMode.QUEUED)
+    event_bus.subscribe(EventType.DOWNLOAD_FAILED, fast_handler)
+
+    await asyncio.wait_for(event_bus.publish(create_event(EventType.DOWNLOAD_FAILED)), 0.1)
+    fast_handler.assert_called_once()
+    assert received == []
+
+    release.set()
+    await event_bus.drain(timeout=1.0)
+    assert len(received) == 1
+    await event_bus.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queued_delivery_orders_by_priority(event_bus):
+    """Test that pending events are delivered highest priority first."""
+    gate = asyncio.Event()
+    order = []
+
+    async def handler(event: Event):
+        await gate.wait()
+        order.append(event.event_type)
+
+    event_bus.subscribe(
+        EventType.DOWNLOAD_COMPLETED, handler, priority=1, dispatch_mode=DispatchMode.QUEUED
+    )
+    event_bus.subscribe(
+        EventType.DOWNLOAD_FAILED, handler, priority=10, dispatch_mode=DispatchMode.QUEUED
+    )
+
+    # First event occupies the worker, the rest wait in the queue
+    await event_bus.publish(create_event(EventType.DOWNLOAD_COMPLETED))
+    await asyncio.sleep(0)
+    await event_bus.publish(create_event(EventType.DOWNLOAD_COMPLETED))
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+
+    gate.set()
+    await event_bus.drain(timeout=1.0)
+    assert order == [
+        EventType.DOWNLOAD_COMPLETED.value,
+        EventType.DOWNLOAD_FAILED.value,
+        EventType.DOWNLOAD_COMPLETED.value,
+    ]
+    await event_bus.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queued_drop_oldest_policy(event_bus):
+    """Test that drop-oldest discards the oldest pending event when full."""
+    gate = asyncio.Event()
+    seen = []
+
+    async def handler(event: Event):
+        await gate.wait()
+        seen.append(event.data["n"])
+
+    event_bus.subscribe(
+        EventType.DOWNLOAD_FAILED,
+        handler,
+        dispatch_mode=DispatchMode.QUEUED,
+        queue_size=2,
+        overflow_policy=OverflowPolicy.DROP_OLDEST,
+    )
+
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED, data={"n": 0}))
+    await asyncio.sleep(0)
+    for n in range(1, 4):
+        await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED, data={"n": n}))
+
+    gate.set()
+    await event_bus.drain(timeout=1.0)
+    assert seen == [0, 2, 3]
+    assert event_bus.get_subscriber_stats()[0]["dropped"] == 1
+    await event_bus.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queued_dead_letter_policy(event_bus):
+    """Test that the dead-letter policy diverts overflow to the DLQ."""
+    gate = asyncio.Event()
+
+    async def handler(event: Event):
+        await gate.wait()
+
+    event_bus.subscribe(
+        EventType.DOWNLOAD_FAILED,
+        handler,
+        dispatch_mode=DispatchMode.QUEUED,
+        queue_size=1,
+        overflow_policy=OverflowPolicy.DEAD_LETTER,
+    )
+
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+    await asyncio.sleep(0)
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+
+    dlq = event_bus.get_dead_letter_queue()
+    assert len(dlq) == 1
+    assert "queue full" in dlq[0].error
+
+    gate.set()
+    await event_bus.drain(timeout=1.0)
+    await event_bus.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queued_block_policy_applies_backpressure(event_bus):
+    """Test that the block policy makes the publisher wait for room."""
+    gate = asyncio.Event()
+
+    async def handler(event: Event):
+        await gate.wait()
+
+    event_bus.subscribe(
+        EventType.DOWNLOAD_FAILED,
+        handler,
+        dispatch_mode=DispatchMode.QUEUED,
+        queue_size=1,
+        overflow_policy=OverflowPolicy.BLOCK,
+    )
+
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+    await asyncio.sleep(0)
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+
+    blocked = asyncio.create_task(event_bus.publish(create_event(EventType.DOWNLOAD_FAILED)))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    gate.set()
+    await asyncio.wait_for(blocked, 1.0)
+    await event_bus.drain(timeout=1.0)
+    assert event_bus.get_subscriber_stats()[0]["processed"] == 3
+    await event_bus.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queued_handler_failure_goes_to_dead_letter_queue(event_bus):
+    """Test that queued handler errors are dead-lettered and counted."""
+    handler = AsyncMock(side_effect=ValueError("boom"))
+    event_bus.subscribe(EventType.DOWNLOAD_FAILED, handler, dispatch_mode=DispatchMode.QUEUED)
+
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+    await event_bus.drain(timeout=1.0)
+
+    dlq = event_bus.get_dead_letter_queue()
+    assert len(dlq) == 1
+    stats = event_bus.get_subscriber_stats()[0]
+    assert stats["failed"] == 1
+    assert stats["depth"] == 0
+    await event_bus.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_last_queued_subscription_stops_worker(event_bus):
+    """Test that removing the last queued subscription removes its queue."""
+    handler = AsyncMock()
+    sub = event_bus.subscribe(EventType.DOWNLOAD_FAILED, handler, dispatch_mode=DispatchMode.QUEUED)
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+    await event_bus.drain(timeout=1.0)
+
+    event_bus.unsubscribe(sub)
+    assert event_bus.get_subscriber_stats() == []
+
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+    handler.assert_called_once()
+
+
+# ============================================================================
+# Dispatch Table and Inline Fast Path Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_inline_handler_runs_on_event_loop(event_bus):
+    """Test that inline handlers run on the loop thread and can schedule tasks."""
+    seen = []
+
+    def inline_handler(event: Event):
+        # Raises RuntimeError if called from an executor thread
+        asyncio.get_running_loop()
+        seen.append(event.event_type)
+
+    event_bus.subscribe(
+        EventType.DOWNLOAD_FAILED, inline_handler, dispatch_mode=DispatchMode.INLINE
+    )
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+
+    assert seen == [EventType.DOWNLOAD_FAILED.value]
+    assert event_bus.get_dead_letter_queue() == []
+
+
+@pytest.mark.asyncio
+async def test_inline_handler_failure_goes_to_dead_letter_queue(event_bus):
+    """Test that inline handler errors are dead-lettered."""
+    handler = Mock(side_effect=ValueError("boom"))
+    event_bus.subscribe(EventType.DOWNLOAD_FAILED, handler, dispatch_mode=DispatchMode.INLINE)
+
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+
+    dlq = event_bus.get_dead_letter_queue()
+    assert len(dlq) == 1
+    assert dlq[0].error == "boom"
+
+
+@pytest.mark.asyncio
+async def test_dispatch_table_tracks_subscribe_and_unsubscribe(event_bus):
+    """Test that cached dispatch lists are refreshed on (un)subscribe."""
+    order = []
+    low = event_bus.subscribe(
+        EventType.DOWNLOAD_FAILED,
+        lambda e: order.append("low"),
+        priority=1,
+        dispatch_mode=DispatchMode.INLINE,
+    )
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+
+    event_bus.subscribe_all(
+        lambda e: order.append("wildcard"), priority=5, dispatch_mode=DispatchMode.INLINE
+    )
+    event_bus.subscribe(
+        EventType.DOWNLOAD_FAILED,
+        lambda e: order.append("high"),
+        priority=10,
+        dispatch_mode=DispatchMode.INLINE,
+    )
+    order.clear()
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+    assert order == ["high", "wildcard", "low"]
+
+    event_bus.unsubscribe(low)
+    order.clear()
+    await event_bus.publish(create_event(EventType.DOWNLOAD_FAILED))
+    assert order == ["high", "wildcard"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_table_built_once_and_reused_across_publishes():
+    """Test that publishing reuses the cached dispatch table instead of rebuilding it."""
+    bus = EventBus()
+    for _ in range(50):
+        bus.subscribe(EventType.DOWNLOAD_FAILED, lambda e: None, dispatch_mode=DispatchMode.INLINE)
+    # Unrelated subscribers never appear in the table
+    for _ in range(50):
+        bus.subscribe(EventType.DOWNLOAD_COMPLETED, AsyncMock())
+    event = create_event(EventType.DOWNLOAD_FAILED)
+
+    with patch.object(bus, "_build_dispatch_table", wraps=bus._build_dispatch_table) as build:
+        for _ in range(20):
+            await bus.publish(event)
+        assert build.call_count == 1
+        assert len(bus._dispatch_tables[EventType.DOWNLOAD_FAILED]) == 50
+
+        # Subscribing to another event type keeps this table
+        bus.subscribe(EventType.DOWNLOAD_COMPLETED, AsyncMock())
+        await bus.publish(event)
+        assert build.call_count == 1
+
+        # Subscribing to this event type rebuilds it once
+        bus.subscribe(EventType.DOWNLOAD_FAILED, lambda e: None, dispatch_mode=DispatchMode.INLINE)
+        await bus.publish(event)
+        await bus.publish(event)
+        assert build.call_count == 2
@@ -0,0 +1,215 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Unit tests for cross-worker event fan-out.
+
+Tests that local events are published to Redis, that events from other
+workers reach the local bus exactly once without being forwarded again, and
+that the Redis subscription is re-established after an error.
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Callable, Dict, List
+
+import pytest
+
+from autoarr.api.services.event_bus import Event, EventBus, EventType
+from autoarr.api.services.event_fanout import EventFanout
+
+CHANNEL = "autoarr:events"
+
+
+class FakeBroker:
+    """In-memory stand-in for a Redis server's pub/sub."""
+
+    def __init__(self) -> None:
+        self.subscribers: Dict[str, List[asyncio.Queue]] = {}
+        self.failing_subscribes = 0
+
+    def client(self) -> "FakeRedis":
+        return FakeRedis(self)
+
+    def disconnect(self) -> None:
+        """Break every open subscription, as a dropped Redis connection would."""
+        for queues in self.subscribers.values():
+            for queue in queues:
+                queue.put_nowait(ConnectionError("Connection closed by server"))
+
+
+class FakePubSub:
+    def __init__(self, broker: FakeBroker) -> None:
+        self.broker = broker
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel: str) -> None:
+        if self.broker.failing_subscribes:
+            self.broker.failing_subscribes -= 1
+            raise ConnectionError("Connection refused")
+        self.broker.subscribers.setdefault(channel, []).append(self.queue)
+
+    async def listen(self) -> AsyncIterator[Dict[str, Any]]:
+        while True:
+            message = await self.queue.get()
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+    async def unsubscribe(self, channel: str) -> None:
+        self.broker.subscribers[channel].remove(self.queue)
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeRedis:
+    def __init__(self, broker: FakeBroker) -> None:
+        self.broker = broker
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(self.broker)
+
+    async def publish(self, channel: str, message: str) -> None:
+        for queue in self.broker.subscribers.get(channel, []):
+            queue.put_nowait({"type": "message", "data": message})
+
+
+async def wait_until(condition: Callable[[], bool], timeout: float = 1.0) -> None:
+    """Poll until condition() holds, failing the test after timeout seconds."""
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+def download_failed(nzo_id: str) -> Event:
+    return Event(event_type=EventType.DOWNLOAD_FAILED, data={"nzo_id": nzo_id}, source="test")
+
+
+def remote_message(event: Event, worker: str = "other-worker") -> str:
+    return json.dumps({"worker": worker, "event": event.model_dump(mode="json")})
+
+
+@pytest.mark.asyncio
+async def test_local_events_are_published_to_redis() -> None:
+    """Test that an event published on the local bus is sent to the Redis channel."""
+    broker = FakeBroker()
+    listener = broker.client().pubsub()
+    await listener.subscribe(CHANNEL)
+    fanout = EventFanout(EventBus(), broker.client(), channel=CHANNEL)
+    await fanout.start()
+    try:
+        await fanout.event_bus.publish(download_failed("1"))
+        await wait_until(lambda: fanout.sent == 1)
+    finally:
+        await fanout.stop()
+
+    payload = json.loads(listener.queue.get_nowait()["data"])
+    assert payload["worker"] == fanout.worker_id
+    assert payload["event"]["event_type"] == EventType.DOWNLOAD_FAILED.value
+    assert payload["event"]["data"] == {"nzo_id": "1"}
+
+
+@pytest.mark.asyncio
+async def test_inbound_events_are_published_locally_without_echo() -> None:
+    """Test that events from other workers reach the local bus but are not forwarded."""
+    broker = FakeBroker()
+    bus = EventBus()
+    seen: List[Dict] = []
+    bus.subscribe(EventType.DOWNLOAD_FAILED, lambda e: seen.append(e.data))
+    fanout = EventFanout(bus, broker.client(), channel=CHANNEL)
+    await fanout.start()
+    try:
+        await broker.client().publish(CHANNEL, remote_message(download_failed("2")))
+        await wait_until(lambda: fanout.received == 1)
+        await asyncio.sleep(0.05)
+    finally:
+        await fanout.stop()
+
+    assert seen == [{"nzo_id": "2"}]
+    assert fanout.sent == 0
+    assert fanout.get_stats()["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_event_fanout_delivers_across_workers_once() -> None:
+    """Test that events reach other workers' buses without echoing back."""
+    broker = FakeBroker()
+    bus_a, bus_b = EventBus(), EventBus()
+    seen_a: List[Dict] = []
+    seen_b: List[Dict] = []
+    bus_a.subscribe(EventType.DOWNLOAD_FAILED, lambda e: seen_a.append(e.data))
+    bus_b.subscribe(EventType.DOWNLOAD_FAILED, lambda e: seen_b.append(e.data))
+
+    fanout_a = EventFanout(bus_a, broker.client())
+    fanout_b = EventFanout(bus_b, broker.client())
+    await fanout_a.start()
+    await fanout_b.start()
+    try:
+        await bus_a.publish(
+            Event(event_type=EventType.DOWNLOAD_FAILED, data={"nzo_id": "1"}, source="test")
+        )
+        await asyncio.sleep(0.05)
+    finally:
+        await fanout_a.stop()
+        await fanout_b.stop()
+
+    assert seen_a == [{"nzo_id": "1"}]
+    assert seen_b == [{"nzo_id": "1"}]
+    assert fanout_a.sent == 1 and fanout_b.sent == 0
+    assert fanout_b.received == 1 and fanout_a.received == 0
+
+
+@pytest.mark.asyncio
+async def test_malformed_messages_are_counted_and_skipped() -> None:
+    """Test that an undecodable message is counted as an error without stopping the loop."""
+    broker = FakeBroker()
+    fanout = EventFanout(EventBus(), broker.client(), channel=CHANNEL)
+    await fanout.start()
+    try:
+        await broker.client().publish(CHANNEL, "not json")
+        await broker.client().publish(CHANNEL, remote_message(download_failed("3")))
+        await wait_until(lambda: fanout.received == 1)
+    finally:
+        await fanout.stop()
+
+    assert fanout.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_resubscribes_after_pubsub_error() -> None:
+    """Test that a dropped Redis subscription is re-established and delivery resumes."""
+    broker = FakeBroker()
+    bus = EventBus()
+    seen: List[Dict] = []
+    bus.subscribe(EventType.DOWNLOAD_FAILED, lambda e: seen.append(e.data))
+    fanout = EventFanout(bus, broker.client(), channel=CHANNEL, reconnect_delay=0.01)
+    await fanout.start()
+    try:
+        # The connection drops and the first resubscribe attempt is refused
+        broker.failing_subscribes = 1
+        broker.disconnect()
+        await wait_until(lambda: fanout.reconnects == 1)
+
+        await broker.client().publish(CHANNEL, remote_message(download_failed("4")))
+        await wait_until(lambda: fanout.received == 1)
+    finally:
+        await fanout.stop()
+
+    assert seen == [{"nzo_id": "4"}]
+    assert fanout.errors == 2
+    assert len(broker.subscribers[CHANNEL]) == 0
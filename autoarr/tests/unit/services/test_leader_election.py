@@ -0,0 +1,118 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Unit tests for multi-worker leader election.
+
+Tests that only one lease holder exists at a time and that a follower takes
+over when the leader releases.
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from autoarr.api.services.leader_election import (
+    FCNTL_AVAILABLE,
+    FileLease,
+    LeaderElector,
+    PostgresAdvisoryLease,
+    create_lease,
+)
+
+requires_flock = pytest.mark.skipif(not FCNTL_AVAILABLE, reason="flock not available")
+
+
+@requires_flock
+@pytest.mark.asyncio
+async def test_file_lease_is_exclusive(tmp_path) -> None:
+    """Test that only one holder gets the lock file lease."""
+    path = str(tmp_path / "leader.lock")
+    first, second = FileLease(path), FileLease(path)
+
+    assert await first.acquire()
+    assert not await second.acquire()
+
+    await first.release()
+    assert await second.acquire()
+    await second.release()
+
+
+@requires_flock
+@pytest.mark.asyncio
+async def test_follower_takes_over_when_leader_stops(tmp_path) -> None:
+    """Test that a follower is elected once the leader releases the lease."""
+    path = str(tmp_path / "leader.lock")
+    started: List[str] = []
+
+    def elector(name: str) -> LeaderElector:
+        async def on_elected() -> None:
+            started.append(name)
+
+        return LeaderElector(FileLease(path), on_elected, retry_interval=0.05)
+
+    leader, follower = elector("leader"), elector("follower")
+    await leader.start()
+    await follower.start()
+
+    assert leader.is_leader and not follower.is_leader
+    assert started == ["leader"]
+
+    await leader.stop()
+    await asyncio.sleep(0.2)
+
+    assert follower.is_leader
+    assert started == ["leader", "follower"]
+    await follower.stop()
+
+
+@requires_flock
+@pytest.mark.asyncio
+async def test_lease_is_held_until_services_have_stopped(tmp_path) -> None:
+    """Test that a follower cannot take over while the leader is still stopping services."""
+    path = str(tmp_path / "leader.lock")
+
+    async def on_elected() -> None:
+        pass
+
+    leader = LeaderElector(FileLease(path), on_elected, retry_interval=0.05)
+    follower = LeaderElector(FileLease(path), on_elected, retry_interval=0.05)
+    await leader.start()
+    await follower.start()
+
+    async def stop_services() -> None:
+        await asyncio.sleep(0.2)
+        assert not follower.is_leader
+
+    await leader.stop(before_release=stop_services)
+    await asyncio.sleep(0.2)
+
+    assert follower.is_leader
+    await follower.stop()
+
+
+def test_create_lease_picks_backend() -> None:
+    """Test that PostgreSQL uses an advisory lock and SQLite a sibling lock file."""
+    engine = object()
+
+    postgres = create_lease("postgresql+asyncpg://db/autoarr", engine)
+    sqlite = create_lease("sqlite+aiosqlite:////data/autoarr.db")
+
+    assert isinstance(postgres, PostgresAdvisoryLease)
+    assert isinstance(sqlite, FileLease)
+    assert sqlite.path == "/data/autoarr.db.leader.lock"
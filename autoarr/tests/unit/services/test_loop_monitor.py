@@ -0,0 +1,156 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the event loop lag monitor.
+"""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from autoarr.api.services import loop_monitor
+from autoarr.api.services.loop_monitor import LoopLagMonitor
+from autoarr.shared.core.metrics import EVENT_LOOP_LAG, EVENT_LOOP_SLOW_CALLBACKS
+
+
+def busy_wait(seconds: float) -> None:
+    """Block the calling thread without sleeping."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class TestLoopLagMonitor:
+    """Tests for LoopLagMonitor."""
+
+    def test_percentiles_use_nearest_rank(self) -> None:
+        """Percentiles are reported in milliseconds over the recent samples."""
+        monitor = LoopLagMonitor(window=100)
+        for ms in range(1, 101):
+            monitor.record(ms / 1000)
+
+        assert monitor.percentiles() == {"p50": 50.0, "p90": 90.0, "p99": 99.0, "max": 100.0}
+
+    def test_percentiles_only_cover_the_window(self) -> None:
+        """Old samples fall out of the window but still count towards the max since start."""
+        monitor = LoopLagMonitor(window=10)
+        monitor.record(2.0)
+        for _ in range(10):
+            monitor.record(0.001)
+
+        assert monitor.percentiles()["max"] == 1.0
+        assert monitor.get_status()["max_lag_ms_since_start"] == 2000.0
+        assert monitor.sample_count == 11
+
+    def test_no_samples(self) -> None:
+        """Percentiles are zero before the first sample."""
+        assert LoopLagMonitor().percentiles() == {"p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+
+    def test_samples_are_exported_as_metrics(self) -> None:
+        """Every sample is observed in the lag histogram."""
+        before = sum(EVENT_LOOP_LAG.labels().counts)
+
+        LoopLagMonitor().record(0.002)
+
+        assert sum(EVENT_LOOP_LAG.labels().counts) == before + 1
+
+    @pytest.mark.asyncio
+    async def test_measures_blocking_code(self) -> None:
+        """Blocking the loop shows up as lag."""
+        monitor = LoopLagMonitor(interval=0.01)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.03)
+            busy_wait(0.1)
+            await asyncio.sleep(0.03)
+        finally:
+            await monitor.stop()
+
+        assert not monitor.is_running
+        assert monitor.max_lag >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_debug_mode_reports_slow_callbacks(self) -> None:
+        """In debug mode the blocking call site is reported and debug mode is restored."""
+        loop = asyncio.get_running_loop()
+        debug = loop.get_debug()
+        slow_before = EVENT_LOOP_SLOW_CALLBACKS.labels().value
+
+        async def parse_large_document() -> None:
+            busy_wait(0.06)
+
+        monitor = LoopLagMonitor(interval=0.01, debug=True, slow_callback_threshold=0.03)
+        monitor.start()
+        try:
+            assert loop.get_debug() is True
+            await asyncio.create_task(parse_large_document())
+            await asyncio.sleep(0.02)
+            status = monitor.get_status()
+        finally:
+            await monitor.stop()
+
+        assert loop.get_debug() == debug
+        callbacks = [entry["callback"] for entry in status["slow_callbacks"]]
+        assert any("parse_large_document" in callback for callback in callbacks)
+        assert status["slow_callback_threshold_ms"] == 30.0
+        assert EVENT_LOOP_SLOW_CALLBACKS.labels().value > slow_before
+
+    @pytest.mark.asyncio
+    async def test_global_monitor_lifecycle(self) -> None:
+        """start_loop_monitor registers the monitor and stop_loop_monitor removes it."""
+        monitor = loop_monitor.start_loop_monitor(interval=0.01)
+        try:
+            assert loop_monitor.get_loop_monitor() is monitor
+            assert monitor.is_running
+        finally:
+            await loop_monitor.stop_loop_monitor()
+
+        assert loop_monitor.get_loop_monitor() is None
+
+
+class TestMonitoringHealthEndpoint:
+    """Tests for the event loop section of /health/monitoring."""
+
+    def test_includes_event_loop_lag(self) -> None:
+        """The endpoint reports the loop monitor's percentiles."""
+        from autoarr.api.main import app
+
+        monitor = LoopLagMonitor()
+        monitor.record(0.004)
+        service = MagicMock()
+        service.get_health_status.return_value = {"is_running": True}
+
+        async def mock_get_monitoring_service():
+            yield service
+
+        with (
+            patch.object(loop_monitor, "_loop_monitor", monitor),
+            patch(
+                "autoarr.api.dependencies.get_monitoring_service",
+                side_effect=mock_get_monitoring_service,
+            ),
+        ):
+            response = TestClient(app).get("/health/monitoring")
+
+        data = response.json()
+        assert data["is_running"] is True
+        assert data["event_loop"]["lag_ms"]["max"] == 4.0
+        assert data["event_loop"]["sample_count"] == 1
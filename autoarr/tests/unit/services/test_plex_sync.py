@@ -0,0 +1,202 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Unit tests for the Plex library sync service.
+
+Tests full and delta sync passes against an in-memory database, watermark
+tracking, deletion sweeps on full reconcile, and local query serving.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import pytest
+import pytest_asyncio
+
+from autoarr.api.database import Database
+from autoarr.api.services.plex_sync import PlexSyncService
+from autoarr.api.services.tool_provider import ToolResult
+
+
+class FakePlexProvider:
+    """Minimal PlexToolProvider stand-in backed by in-memory sections."""
+
+    def __init__(self) -> None:
+        self.sections: Dict[str, List[Dict[str, Any]]] = {}
+        self.filters_seen: List[Optional[Dict[str, Any]]] = []
+
+    async def is_available(self) -> bool:
+        return True
+
+    async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> ToolResult:
+        libraries = [{"key": key, "title": f"Section {key}"} for key in self.sections]
+        return ToolResult(success=True, data={"libraries": libraries})
+
+    async def iter_library_items(
+        self,
+        library_id: str,
+        fields: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        self.filters_seen.append(filters)
+        threshold = None
+        if filters and "updatedAt>>" in filters:
+            threshold = filters["updatedAt>>"]
+        for item in self.sections[library_id]:
+            if threshold is not None and item["updatedAt"] <= threshold:
+                continue
+            yield {k: v for k, v in item.items() if not fields or k in fields}
+
+
+def _item(rating_key: str, title: str, added: int, updated: Optional[int] = None) -> Dict:
+    return {
+        "ratingKey": rating_key,
+        "type": "movie",
+        "title": title,
+        "year": "1999",
+        "addedAt": added,
+        "updatedAt": updated if updated is not None else added,
+        "Media": [{"Part": {"file": "/movies/x.mkv"}}],
+    }
+
+
+@pytest_asyncio.fixture
+async def database() -> AsyncIterator[Database]:
+    """Create an in-memory database."""
+    db = Database("sqlite+aiosqlite:///:memory:")
+    await db.init_db()
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+def provider() -> FakePlexProvider:
+    """Create a fake Plex provider with one movie section."""
+    fake = FakePlexProvider()
+    fake.sections["1"] = [
+        _item("10", "The Matrix", 1000),
+        _item("11", "Inception", 2000),
+        _item("12", "Alien", 3000),
+    ]
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_first_sync_is_full_and_sets_watermarks(database, provider) -> None:
+    """Test that the first pass walks the whole section and records watermarks."""
+    sync = PlexSyncService(database, provider)
+
+    result = await sync.sync()
+
+    assert result["sections"] == [{"section_key": "1", "mode": "full", "written": 3, "deleted": 0}]
+    assert provider.filters_seen == [None]
+    state = await sync.repository.get_sync_state("1")
+    assert state.max_updated_at == 3000
+    assert state.max_added_at == 3000
+    assert state.item_count == 3
+    assert await sync.has_data()
+
+
+@pytest.mark.asyncio
+async def test_second_sync_only_pulls_changes(database, provider) -> None:
+    """Test that later passes request only items updated since the watermark."""
+    sync = PlexSyncService(database, provider)
+    await sync.sync()
+
+    provider.sections["1"][0]["title"] = "The Matrix (Remastered)"
+    provider.sections["1"][0]["updatedAt"] = 4000
+    provider.sections["1"].append(_item("13", "Heat", 5000))
+
+    result = await sync.sync()
+
+    assert result["sections"][0]["mode"] == "delta"
+    # Two changed items plus the one sitting on the (inclusive) watermark
+    assert result["sections"][0]["written"] == 3
+    assert provider.filters_seen[-1] == {"updatedAt>>": 2999}
+    state = await sync.repository.get_sync_state("1")
+    assert state.max_updated_at == 5000
+    titles = [row.title for row in await sync.repository.search("matrix")]
+    assert titles == ["The Matrix (Remastered)"]
+
+
+@pytest.mark.asyncio
+async def test_full_reconcile_removes_deleted_items(database, provider) -> None:
+    """Test that a full reconcile sweeps items no longer in Plex."""
+    sync = PlexSyncService(database, provider, full_reconcile_interval=3600)
+    await sync.sync()
+
+    del provider.sections["1"][1]
+    # A delta pass cannot see the deletion
+    await sync.sync()
+    assert await sync.repository.count("1") == 3
+
+    # Make the section due for a full reconcile
+    await sync.repository.save_sync_state(
+        "1", last_full_sync_at=datetime.utcnow() - timedelta(hours=2)
+    )
+    result = await sync.sync()
+
+    assert result["sections"][0]["mode"] == "full"
+    assert result["sections"][0]["deleted"] == 1
+    assert await sync.repository.count("1") == 2
+
+
+@pytest.mark.asyncio
+async def test_removed_section_is_dropped(database, provider) -> None:
+    """Test that sections deleted in Plex are removed locally."""
+    provider.sections["2"] = [_item("20", "Friends", 100)]
+    sync = PlexSyncService(database, provider)
+    await sync.sync()
+
+    del provider.sections["2"]
+    await sync.sync()
+
+    assert await sync.repository.count("2") == 0
+    assert [s.section_key for s in await sync.repository.get_sync_states()] == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_local_queries(database, provider) -> None:
+    """Test browse, search and recently-added against the local copy."""
+    sync = PlexSyncService(database, provider)
+    await sync.sync()
+
+    recent = await sync.repository.get_recently_added(limit=2)
+    by_title = await sync.repository.browse("1", limit=10)
+
+    assert [row.title for row in recent] == ["Alien", "Inception"]
+    assert [row.title for row in by_title] == ["Alien", "Inception", "The Matrix"]
+    # Nested media data is projected away
+    assert "Media" not in recent[0].data
+    assert recent[0].data["ratingKey"] == "12"
+    assert recent[0].year == 1999
+
+
+@pytest.mark.asyncio
+async def test_status_reports_sections(database, provider) -> None:
+    """Test that get_status reports counters and watermarks."""
+    sync = PlexSyncService(database, provider)
+    await sync.sync()
+
+    status = await sync.get_status()
+
+    assert status["passes"] == 1
+    assert status["full_syncs"] == 1
+    assert status["sections"][0]["max_updated_at"] == 3000
+    assert status["sections"][0]["item_count"] == 3
@@ -0,0 +1,154 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the sampling profiler and the admin-only profile endpoint.
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from autoarr.api.config import get_settings
+from autoarr.api.routers import logs
+from autoarr.api.services import profiler
+from autoarr.api.services.profiler import ProfilerBusyError, run_profile
+
+
+def busy_wait(seconds: float) -> None:
+    """Block the calling thread without sleeping."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class TestRunProfile:
+    """Tests for run_profile."""
+
+    @pytest.mark.asyncio
+    async def test_samples_the_event_loop_thread(self) -> None:
+        """Code blocking the loop shows up in the collapsed stacks."""
+
+        async def blocker() -> None:
+            await asyncio.sleep(0.02)
+            busy_wait(0.2)
+
+        task = asyncio.create_task(blocker())
+        result = await run_profile(0.4, interval=0.002)
+        await task
+
+        assert result.sample_count > 0
+        busy_samples = sum(count for stack, count in result.stacks.items() if "busy_wait" in stack)
+        assert busy_samples > 0
+
+        line = next(line for line in result.collapsed().splitlines() if "busy_wait" in line)
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        assert stack.split(";")[-1].startswith("busy_wait (")
+
+    @pytest.mark.asyncio
+    async def test_reports_slow_callbacks(self) -> None:
+        """Task steps blocking the loop past the threshold are reported."""
+        loop = asyncio.get_running_loop()
+        debug = loop.get_debug()
+
+        async def blocker() -> None:
+            await asyncio.sleep(0.02)
+            busy_wait(0.06)
+
+        task = asyncio.create_task(blocker())
+        result = await run_profile(0.2, slow_callback_threshold=0.03)
+        await task
+
+        assert any("blocker" in entry.callback for entry in result.slow_callbacks)
+        entry = next(entry for entry in result.slow_callbacks if "blocker" in entry.callback)
+        assert entry.count == 1
+        assert entry.max_seconds >= 0.05
+        assert "blocker" in result.slow_callback_report()
+
+        # Debug mode is restored afterwards
+        assert loop.get_debug() == debug
+
+    @pytest.mark.asyncio
+    async def test_one_profile_at_a_time(self) -> None:
+        """A second profile while one is running is rejected."""
+        first = asyncio.create_task(run_profile(0.1))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ProfilerBusyError):
+            await run_profile(0.1)
+
+        await first
+        assert profiler._profile_running is False
+
+
+class TestProfileEndpoint:
+    """Tests for POST /logs/profile."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Test client with the admin token set to "secret"."""
+        monkeypatch.setattr(get_settings(), "admin_token", "secret")
+        app = FastAPI()
+        app.include_router(logs.router, prefix="/logs")
+        return TestClient(app)
+
+    def test_requires_admin_token(self, client) -> None:
+        """Requests without the right token are rejected."""
+        assert client.post("/logs/profile?duration=0.05").status_code == 401
+
+        response = client.post("/logs/profile?duration=0.05", headers={"X-Admin-Token": "wrong"})
+        assert response.status_code == 401
+
+    def test_disabled_without_admin_token(self, client, monkeypatch) -> None:
+        """The endpoint is off when no admin token is configured."""
+        monkeypatch.setattr(get_settings(), "admin_token", "")
+
+        response = client.post("/logs/profile?duration=0.05", headers={"X-Admin-Token": ""})
+
+        assert response.status_code == 403
+
+    def test_returns_profile(self, client) -> None:
+        """An admin gets the collapsed stacks and slow callback report."""
+        response = client.post(
+            "/logs/profile?duration=0.1&interval=0.005", headers={"X-Admin-Token": "secret"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["sample_count"] > 0
+        assert data["stack_count"] == len(data["collapsed"].splitlines())
+        assert data["slow_callback_report"].startswith("Slow callbacks")
+
+    def test_download_collapsed_stacks(self, client) -> None:
+        """format=collapsed returns the flamegraph input as an attachment."""
+        response = client.post(
+            "/logs/profile?duration=0.1&format=collapsed", headers={"X-Admin-Token": "secret"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.headers["content-disposition"].endswith('.folded"')
+
+    def test_rejects_long_profiles(self, client) -> None:
+        """Profiles are bounded to a minute."""
+        response = client.post("/logs/profile?duration=600", headers={"X-Admin-Token": "secret"})
+
+        assert response.status_code == 422
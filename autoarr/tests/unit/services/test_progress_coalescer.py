@@ -0,0 +1,192 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Unit tests for download progress coalescing.
+
+Tests merging of DOWNLOAD_STATE_CHANGED events per nzo_id, immediate
+delivery of terminal events, and the WebSocketBridge integration.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from autoarr.api.services.event_bus import Event, EventBus, EventType
+from autoarr.api.services.progress_coalescer import DownloadProgressCoalescer
+from autoarr.api.services.websocket_bridge import WebSocketBridge
+
+
+def _state_event(nzo_id: str, old: str, new: str, **extra: Any) -> Event:
+    """Create a DOWNLOAD_STATE_CHANGED event."""
+    data: Dict[str, Any] = {"nzo_id": nzo_id, "old_state": old, "new_state": new, **extra}
+    return Event(
+        event_type=EventType.DOWNLOAD_STATE_CHANGED,
+        data=data,
+        timestamp=datetime.now(),
+        source="monitoring_service",
+    )
+
+
+def _terminal_event(nzo_id: str) -> Event:
+    """Create a DOWNLOAD_COMPLETED event."""
+    return Event(
+        event_type=EventType.DOWNLOAD_COMPLETED,
+        data={"nzo_id": nzo_id, "old_state": "downloading", "new_state": "completed"},
+        source="monitoring_service",
+    )
+
+
+class TestDownloadProgressCoalescer:
+    """Tests for DownloadProgressCoalescer."""
+
+    @pytest.mark.asyncio
+    async def test_merges_updates_per_nzo_id_within_window(self) -> None:
+        """Test that updates for one download collapse into one delta."""
+        emitted = []
+        coalescer = DownloadProgressCoalescer(emitted.append, window=0.01)
+
+        assert coalescer.submit(_state_event("a", "queued", "downloading", percentage=10))
+        assert coalescer.submit(_state_event("a", "downloading", "paused", percentage=40))
+        assert coalescer.submit(_state_event("b", "queued", "downloading"))
+        assert emitted == []
+
+        await asyncio.sleep(0.03)
+
+        assert len(emitted) == 2
+        delta = next(e for e in emitted if e.data["nzo_id"] == "a")
+        assert delta.data["old_state"] == "queued"
+        assert delta.data["new_state"] == "paused"
+        assert delta.data["percentage"] == 40
+        assert delta.data["coalesced_updates"] == 2
+        assert coalescer.events_merged == 1
+        assert coalescer.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_terminal_event_passes_through_after_pending_delta(self) -> None:
+        """Test that completion is not delayed and flushes pending progress first."""
+        emitted = []
+        coalescer = DownloadProgressCoalescer(emitted.append, window=10.0)
+
+        coalescer.submit(_state_event("a", "queued", "downloading"))
+        coalescer.submit(_state_event("b", "queued", "downloading"))
+
+        assert coalescer.submit(_terminal_event("a")) is False
+        assert [e.data["nzo_id"] for e in emitted] == ["a"]
+        assert coalescer.pending_count == 1
+        coalescer.close()
+
+    @pytest.mark.asyncio
+    async def test_unrelated_events_are_not_absorbed(self) -> None:
+        """Test that other event types and events without nzo_id pass through."""
+        coalescer = DownloadProgressCoalescer(lambda e: None, window=10.0)
+
+        assert not coalescer.submit(
+            Event(event_type=EventType.CONFIG_AUDIT_STARTED, data={}, source="test")
+        )
+        assert not coalescer.submit(
+            Event(event_type=EventType.DOWNLOAD_STATE_CHANGED, data={"state": "x"}, source="test")
+        )
+        assert coalescer.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_emit_errors_are_contained(self) -> None:
+        """Test that a failing emit callback does not break flushing."""
+        emit = MagicMock(side_effect=[RuntimeError("boom"), None])
+        coalescer = DownloadProgressCoalescer(emit, window=10.0)
+        coalescer.submit(_state_event("a", "queued", "downloading"))
+        coalescer.submit(_state_event("b", "queued", "downloading"))
+
+        coalescer.flush()
+
+        assert emit.call_count == 2
+        assert coalescer.get_stats()["frames_emitted"] == 2
+
+
+class TestBridgeCoalescing:
+    """Tests for coalescing in the WebSocketBridge."""
+
+    @pytest.mark.asyncio
+    async def test_bridge_sends_one_frame_per_download_per_window(self) -> None:
+        """Test that a burst of progress events becomes one keyed broadcast."""
+        event_bus = EventBus()
+        manager = MagicMock()
+        manager.broadcast = AsyncMock()
+        bridge = WebSocketBridge(event_bus, manager, progress_window=0.01)
+        await bridge.start()
+
+        for percent in range(0, 100, 10):
+            await event_bus.publish(_state_event("a", "queued", "downloading", percentage=percent))
+        await event_bus.publish(_terminal_event("b"))
+        await asyncio.sleep(0.05)
+
+        calls = manager.broadcast.await_args_list
+        assert len(calls) == 2
+        progress = next(c for c in calls if c.kwargs["event_type"] == "download_state_changed")
+        assert progress.args[0]["data"]["percentage"] == 90
+        assert progress.kwargs["coalesce_key"] == "progress:a"
+        await bridge.stop()
+
+    @pytest.mark.asyncio
+    async def test_bridge_without_coalescing(self) -> None:
+        """Test that a zero window delivers every event."""
+        event_bus = EventBus()
+        manager = MagicMock()
+        manager.broadcast = AsyncMock()
+        bridge = WebSocketBridge(event_bus, manager, progress_window=0)
+        await bridge.start()
+
+        for _ in range(3):
+            await event_bus.publish(_state_event("a", "queued", "downloading"))
+        await asyncio.sleep(0.01)
+
+        assert bridge.progress_coalescer is None
+        assert manager.broadcast.await_count == 3
+        await bridge.stop()
+
+    @pytest.mark.asyncio
+    async def test_bridge_delivers_through_one_queued_subscriber(self) -> None:
+        """Test that the bridge is a single queued subscriber and the publisher does not wait."""
+        event_bus = EventBus()
+        manager = MagicMock()
+        released = asyncio.Event()
+
+        async def slow_broadcast(*args: Any, **kwargs: Any) -> int:
+            await released.wait()
+            return 1
+
+        manager.broadcast = AsyncMock(side_effect=slow_broadcast)
+        bridge = WebSocketBridge(event_bus, manager, progress_window=0)
+        await bridge.start()
+
+        await asyncio.wait_for(event_bus.publish(_terminal_event("a")), timeout=0.1)
+        await asyncio.wait_for(event_bus.publish(_terminal_event("b")), timeout=0.1)
+        await asyncio.sleep(0.01)
+        [stats] = event_bus.get_subscriber_stats()
+        assert stats["handler"] == "_handle_event"
+        assert stats["overflow_policy"] == "drop_oldest"
+        assert stats["depth"] == 1
+
+        released.set()
+        await event_bus.drain(timeout=1)
+        assert manager.broadcast.await_count == 2
+        await bridge.stop()
+        assert event_bus.get_subscriber_stats() == []
@@ -0,0 +1,195 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Unit tests for the content request lifecycle tracker.
+
+Tests queue snapshot reconciliation, SABnzbd event handling via the
+download ID index, forward-only transitions, batched writes and the
+status change events pushed to WebSocket clients.
+"""
+
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+import pytest_asyncio
+
+from autoarr.api.database import ContentRequestRepository, Database
+from autoarr.api.services.event_bus import Event, EventBus, EventType
+from autoarr.api.services.request_tracker import RequestTracker
+from autoarr.api.services.tool_provider import ToolResult
+
+
+class FakeArrProvider:
+    """Radarr/Sonarr provider stand-in serving a queue and library items."""
+
+    def __init__(self) -> None:
+        self.queue: List[Dict[str, Any]] = []
+        self.items: Dict[int, Dict[str, Any]] = {}
+        self.calls: List[str] = []
+
+    async def execute(self, tool_name: str, arguments: Dict[str, Any]) -> ToolResult:
+        self.calls.append(tool_name)
+        if tool_name.endswith("_get_queue"):
+            return ToolResult(success=True, data={"records": self.queue})
+        item_id = arguments.get("movie_id", arguments.get("series_id"))
+        return ToolResult(success=True, data=self.items.get(item_id, {}))
+
+
+@pytest_asyncio.fixture
+async def database() -> AsyncIterator[Database]:
+    """Create an in-memory database."""
+    db = Database("sqlite+aiosqlite:///:memory:")
+    await db.init_db()
+    yield db
+    await db.close()
+
+
+async def _create(db: Database, external_id: str, content_type: str = "movie") -> int:
+    """Create a request that confirm_request has added to Radarr/Sonarr."""
+    repository = ContentRequestRepository(db)
+    request = await repository.create(
+        correlation_id=f"req_{external_id}",
+        query="test",
+        content_type=content_type,
+        title=f"Title {external_id}",
+    )
+    await repository.update_status(request.id, "searching", external_id=external_id)
+    return request.id
+
+
+@pytest.mark.asyncio
+async def test_snapshot_advances_through_lifecycle(database) -> None:
+    """Test downloading -> importing -> available from successive queue snapshots."""
+    request_id = await _create(database, "radarr_7")
+    radarr = FakeArrProvider()
+    bus = EventBus()
+    events: List[Event] = []
+    bus.subscribe(EventType.REQUEST_STATUS_CHANGED, events.append)
+    tracker = RequestTracker(database, bus, radarr_provider=radarr)
+    repository = ContentRequestRepository(database)
+
+    radarr.queue = [{"movieId": 7, "downloadId": "SAB_1", "trackedDownloadState": "downloading"}]
+    await tracker.snapshot()
+    assert (await repository.get_by_id(request_id)).status == "downloading"
+
+    radarr.queue[0]["trackedDownloadState"] = "importPending"
+    await tracker.snapshot()
+    assert (await repository.get_by_id(request_id)).status == "importing"
+
+    radarr.queue = []
+    radarr.items[7] = {"id": 7, "hasFile": True}
+    await tracker.snapshot()
+    request = await repository.get_by_id(request_id)
+    assert request.status == "available"
+    assert request.completed_at is not None
+
+    assert [(e.data["previous_status"], e.data["status"]) for e in events] == [
+        ("searching", "downloading"),
+        ("downloading", "importing"),
+        ("importing", "available"),
+    ]
+    assert all(e.correlation_id == request.correlation_id for e in events)
+    assert events[0].data["external_id"] == "radarr_7"
+
+
+@pytest.mark.asyncio
+async def test_download_events_use_nzo_index_and_batch_writes(database) -> None:
+    """Test that SABnzbd events advance linked requests in one batched write."""
+    movie_id = await _create(database, "radarr_1")
+    show_id = await _create(database, "sonarr_2", "tv")
+    radarr, sonarr = FakeArrProvider(), FakeArrProvider()
+    radarr.queue = [{"movieId": 1, "downloadId": "SAB_A", "trackedDownloadState": "downloading"}]
+    sonarr.queue = [{"seriesId": 2, "downloadId": "SAB_B", "trackedDownloadState": "downloading"}]
+    bus = EventBus()
+    tracker = RequestTracker(
+        database, bus, radarr_provider=radarr, sonarr_provider=sonarr, flush_interval=60
+    )
+    await tracker.snapshot()
+    tracker.start()
+
+    calls = []
+    update_statuses = tracker.repository.update_statuses
+
+    async def recording_update(updates: Dict[int, str]) -> Any:
+        calls.append(dict(updates))
+        return await update_statuses(updates)
+
+    tracker.repository.update_statuses = recording_update  # type: ignore[method-assign]
+
+    for nzo_id in ("SAB_A", "SAB_B", "SAB_unknown"):
+        await bus.publish(
+            Event(
+                event_type=EventType.DOWNLOAD_COMPLETED,
+                data={"nzo_id": nzo_id},
+                source="monitoring_service",
+            )
+        )
+    assert await tracker.flush() == 2
+    await tracker.stop()
+
+    assert calls == [{movie_id: "importing", show_id: "importing"}]
+
+
+@pytest.mark.asyncio
+async def test_status_never_moves_backwards(database) -> None:
+    """Test that a stale downloading state does not undo importing."""
+    request_id = await _create(database, "radarr_3")
+    radarr = FakeArrProvider()
+    radarr.queue = [{"movieId": 3, "downloadId": "SAB_3", "trackedDownloadState": "importing"}]
+    bus = EventBus()
+    tracker = RequestTracker(database, bus, radarr_provider=radarr, flush_interval=60)
+    await tracker.snapshot()
+    tracker.start()
+
+    await bus.publish(
+        Event(
+            event_type=EventType.DOWNLOAD_STATE_CHANGED,
+            data={"nzo_id": "SAB_3", "old_state": "queued", "new_state": "downloading"},
+            source="monitoring_service",
+        )
+    )
+    assert await tracker.flush() == 0
+    await tracker.stop()
+
+    request = await ContentRequestRepository(database).get_by_id(request_id)
+    assert request.status == "importing"
+
+
+@pytest.mark.asyncio
+async def test_season_request_waits_for_season_files(database) -> None:
+    """Test that a season request is only available once that season has files."""
+    repository = ContentRequestRepository(database)
+    request = await repository.create(
+        correlation_id="req_season", query="show s2", content_type="tv", title="Show", season=2
+    )
+    await repository.update_status(request.id, "searching", external_id="sonarr_9")
+    sonarr = FakeArrProvider()
+    sonarr.items[9] = {
+        "statistics": {"episodeFileCount": 10},
+        "seasons": [
+            {"seasonNumber": 1, "statistics": {"episodeFileCount": 10}},
+            {"seasonNumber": 2, "statistics": {"episodeFileCount": 0}},
+        ],
+    }
+    tracker = RequestTracker(database, EventBus(), sonarr_provider=sonarr)
+
+    assert await tracker.snapshot() == 0
+
+    sonarr.items[9]["seasons"][1]["statistics"]["episodeFileCount"] = 8
+    assert await tracker.snapshot() == 1
+    assert (await repository.get_by_id(request.id)).status == "available"
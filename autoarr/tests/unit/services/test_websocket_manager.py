@@ -15,19 +15,52 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-"""
-Unit tests for WebSocket Manager service.
 
-NOTE: WebSocketManager service is not yet implemented.
-All tests are skipped pending implementation.
+"""
+Unit tests for the WebSocket Manager service.
 
-See Sprint documentation for planned WebSocketManager features.
+Tests non-blocking broadcast, per-client send queues, message coalescing,
+slow-consumer eviction and connection statistics.
 """
 
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
-# Skip all tests in this module since WebSocketManager is not yet implemented
-pytestmark = pytest.mark.skip(reason="WebSocketManager service not yet implemented")
+from autoarr.api.services.websocket_manager import (
+    SLOW_CONSUMER_CLOSE_CODE,
+    WebSocketManager,
+    get_websocket_manager,
+    reset_websocket_manager,
+    serialize_message,
+)
+
+
+def _websocket(send_delay: float = 0.0, gate: asyncio.Event = None) -> MagicMock:
+    """Create a mock WebSocket that records sent text frames."""
+    ws = MagicMock()
+    ws.accept = AsyncMock()
+    ws.close = AsyncMock()
+    ws.sent = []
+
+    async def send_text(payload: str) -> None:
+        if gate is not None:
+            await gate.wait()
+        if send_delay:
+            await asyncio.sleep(send_delay)
+        ws.sent.append(json.loads(payload))
+
+    ws.send_text = AsyncMock(side_effect=send_text)
+    return ws
+
+
+async def _flush() -> None:
+    """Let writer tasks run."""
+    for _ in range(20):
+        await asyncio.sleep(0)
 
 
 class TestWebSocketManagerInitialization:
@@ -35,76 +68,368 @@ class TestWebSocketManagerInitialization:
 
     def test_manager_initialization(self) -> None:
         """Test that WebSocketManager initializes correctly."""
-        # Skipped - awaiting implementation
+        manager = WebSocketManager(max_queue_size=10)
+        assert manager.connection_count == 0
+        assert manager.active_connections == []
+        assert manager.max_queue_size == 10
 
     def test_manager_singleton_pattern(self) -> None:
         """Test singleton pattern implementation."""
-        # Skipped - awaiting implementation
+        reset_websocket_manager()
+        try:
+            assert get_websocket_manager() is get_websocket_manager()
+        finally:
+            reset_websocket_manager()
 
 
 class TestConnectionManagement:
     """Tests for WebSocket connection management."""
 
+    @pytest.mark.asyncio
     async def test_connect_client(self) -> None:
         """Test connecting a client."""
-        # Skipped - awaiting implementation
+        manager = WebSocketManager()
+        ws = _websocket()
+        client = await manager.connect(ws)
 
+        ws.accept.assert_awaited_once()
+        assert manager.active_connections == [ws]
+        assert manager.get_connection(ws) is client
+        await manager.close_all()
+
+    @pytest.mark.asyncio
     async def test_disconnect_client(self) -> None:
         """Test disconnecting a client."""
-        # Skipped - awaiting implementation
+        manager = WebSocketManager()
+        ws = _websocket()
+        await manager.connect(ws)
+
+        manager.disconnect(ws)
+        manager.disconnect(ws)  # Idempotent
+
+        assert manager.connection_count == 0
 
 
 class TestEventBroadcasting:
     """Tests for event broadcasting."""
 
+    @pytest.mark.asyncio
     async def test_broadcast_to_all_clients(self) -> None:
         """Test broadcasting to all connected clients."""
-        # Skipped - awaiting implementation
-
-    async def test_broadcast_to_specific_client(self) -> None:
-        """Test broadcasting to specific client."""
-        # Skipped - awaiting implementation
-
-
-class TestSubscriptionManagement:
-    """Tests for subscription management."""
+        manager = WebSocketManager()
+        sockets = [_websocket() for _ in range(3)]
+        for ws in sockets:
+            await manager.connect(ws)
 
-    async def test_subscribe_to_event_type(self) -> None:
-        """Test subscribing to specific event types."""
-        # Skipped - awaiting implementation
-
-    async def test_unsubscribe_from_event_type(self) -> None:
-        """Test unsubscribing from event types."""
-        # Skipped - awaiting implementation
+        delivered = await manager.broadcast({"type": "event", "n": 1})
+        await _flush()
 
+        assert delivered == 3
+        for ws in sockets:
+            assert ws.sent == [{"type": "event", "n": 1}]
+        await manager.close_all()
 
-class TestReconnectionHandling:
-    """Tests for reconnection handling."""
-
-    async def test_handle_client_reconnect(self) -> None:
-        """Test handling client reconnection."""
-        # Skipped - awaiting implementation
+    @pytest.mark.asyncio
+    async def test_broadcast_to_specific_client(self) -> None:
+        """Test sending a personal message to one client."""
+        manager = WebSocketManager()
+        target, other = _websocket(), _websocket()
+        await manager.connect(target)
+        await manager.connect(other)
+
+        await manager.send_personal_message({"type": "ack"}, target)
+        await _flush()
+
+        assert target.sent == [{"type": "ack"}]
+        assert other.sent == []
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self) -> None:
+        """Test that broadcast returns before a stalled client sends."""
+        manager = WebSocketManager()
+        gate = asyncio.Event()
+        slow, fast = _websocket(gate=gate), _websocket()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        await asyncio.wait_for(manager.broadcast({"n": 1}), timeout=0.1)
+        await _flush()
+
+        assert fast.sent == [{"n": 1}]
+        assert slow.sent == []
+        gate.set()
+        await _flush()
+        assert slow.sent == [{"n": 1}]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_coalesces_pending_messages_with_same_key(self) -> None:
+        """Test that a pending frame is replaced by a newer one with the same key."""
+        manager = WebSocketManager()
+        gate = asyncio.Event()
+        ws = _websocket(gate=gate)
+        client = await manager.connect(ws)
+
+        await manager.broadcast({"n": 0})
+        await _flush()  # Writer is now blocked sending n=0
+        await manager.broadcast({"progress": 10}, coalesce_key="nzo_1")
+        await manager.broadcast({"other": True})
+        await manager.broadcast({"progress": 50}, coalesce_key="nzo_1")
+
+        gate.set()
+        await _flush()
+
+        assert ws.sent == [{"n": 0}, {"progress": 50}, {"other": True}]
+        assert client.messages_coalesced == 1
+        await manager.close_all()
+
+    def test_serialize_message_handles_non_json_values(self) -> None:
+        """Test that datetimes and similar values are stringified."""
+        from datetime import datetime
+
+        payload = serialize_message({"at": datetime(2025, 1, 1)})
+        assert json.loads(payload) == {"at": "2025-01-01 00:00:00"}
 
 
 class TestErrorHandling:
     """Tests for error handling."""
 
+    @pytest.mark.asyncio
     async def test_handle_websocket_send_error(self) -> None:
-        """Test handling send errors."""
-        # Skipped - awaiting implementation
+        """Test that a failing socket is disconnected by its writer."""
+        manager = WebSocketManager()
+        ws = _websocket()
+        ws.send_text = AsyncMock(side_effect=RuntimeError("socket closed"))
+        await manager.connect(ws)
+
+        await manager.broadcast({"n": 1})
+        await _flush()
+
+        assert manager.connection_count == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_is_evicted_when_queue_full(self) -> None:
+        """Test that a client exceeding its queue limit is evicted."""
+        manager = WebSocketManager(max_queue_size=2)
+        gate = asyncio.Event()
+        slow, fast = _websocket(gate=gate), _websocket()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        for n in range(4):
+            await manager.broadcast({"n": n})
+            await _flush()
+
+        assert manager.active_connections == [fast]
+        assert manager.evicted_connections == 1
+        slow.close.assert_awaited_once_with(code=SLOW_CONSUMER_CLOSE_CODE)
+        assert len(fast.sent) == 4
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_lagging_consumer_is_evicted(self) -> None:
+        """Test that a client whose oldest pending frame is too old is evicted."""
+        manager = WebSocketManager(max_lag=0.01)
+        gate = asyncio.Event()
+        ws = _websocket(gate=gate)
+        await manager.connect(ws)
+
+        await manager.broadcast({"n": 0})
+        await _flush()
+        await manager.broadcast({"n": 1})
+        await asyncio.sleep(0.02)
+        await manager.broadcast({"n": 2})
+
+        assert manager.connection_count == 0
+        gate.set()
 
 
 class TestPerformance:
     """Tests for performance."""
 
+    @pytest.mark.asyncio
     async def test_broadcast_performance(self) -> None:
-        """Test broadcast performance."""
-        # Skipped - awaiting implementation
+        """Test that broadcast cost does not include socket send time."""
+        manager = WebSocketManager()
+        for _ in range(50):
+            await manager.connect(_websocket(send_delay=0.05))
+
+        start = time.perf_counter()
+        for n in range(20):
+            await manager.broadcast({"n": n})
+        elapsed = time.perf_counter() - start
+
+        # 50 clients x 20 messages x 50ms would take 50s if sends were awaited
+        assert elapsed < 0.5
+        await manager.close_all()
+
+
+class TestFrameRateLimit:
+    """Tests for the per-client frame rate bound."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_client_coalesces_keyed_frames(self) -> None:
+        """Test that keyed frames merge while a client waits for its next slot."""
+        manager = WebSocketManager(max_frames_per_second=20)
+        ws = _websocket()
+        await manager.connect(ws)
+
+        await manager.broadcast({"n": 0})
+        await _flush()
+        for percent in range(10):
+            await manager.broadcast({"progress": percent}, coalesce_key="nzo_1")
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0.1)
+
+        assert ws.sent == [{"n": 0}, {"progress": 9}]
+        await manager.close_all()
 
 
 class TestConnectionStatistics:
     """Tests for connection statistics."""
 
+    @pytest.mark.asyncio
     async def test_get_connection_count(self) -> None:
-        """Test getting connection count."""
+        """Test connection counts and per-connection lag metrics."""
+        manager = WebSocketManager()
+        ws = _websocket()
+        await manager.connect(ws)
+        await manager.broadcast({"n": 1})
+        await _flush()
+
+        stats = manager.get_stats()
+        assert stats["active_connections"] == 1
+        assert stats["total_broadcasts"] == 1
+        connection = stats["connections"][0]
+        assert connection["messages_sent"] == 1
+        assert connection["queue_depth"] == 0
+        assert connection["bytes_sent"] > 0
+        assert "avg_send_lag_ms" in connection
+        await manager.close_all()
+
+
+class TestSubscriptionManagement:
+    """Tests for subscription management."""
+
+    @pytest.mark.asyncio
+    async def test_subscribe_to_event_type(self) -> None:
+        """Test that a subscribed client only receives matching event types."""
+        manager = WebSocketManager()
+        watcher, everyone = _websocket(), _websocket()
+        await manager.connect(watcher)
+        await manager.connect(everyone)
+        manager.subscribe(watcher, event_types=["download_failed"])
+
+        await manager.broadcast({"n": 1}, event_type="download_failed", service="sabnzbd")
+        await manager.broadcast({"n": 2}, event_type="download_completed", service="sabnzbd")
+        await _flush()
+
+        assert watcher.sent == [{"n": 1}]
+        assert everyone.sent == [{"n": 1}, {"n": 2}]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_from_event_type(self) -> None:
+        """Test that unsubscribing restores delivery of all events."""
+        manager = WebSocketManager()
+        ws = _websocket()
+        await manager.connect(ws)
+        manager.subscribe(ws, event_types=["download_failed"])
+
+        subscriptions = manager.unsubscribe(ws, event_types=["download_failed"])
+        await manager.broadcast({"n": 1}, event_type="download_completed")
+        await _flush()
+
+        assert subscriptions["event_types"] == []
+        assert ws.sent == [{"n": 1}]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_filters_combine_across_dimensions(self) -> None:
+        """Test that type, correlation ID and service filters must all match."""
+        manager = WebSocketManager()
+        ws = _websocket()
+        await manager.connect(ws)
+        manager.subscribe(
+            ws,
+            event_types=["download_state_changed"],
+            correlation_ids=["req-1"],
+            services=["monitoring_service"],
+        )
+
+        await manager.broadcast(
+            {"n": 1},
+            event_type="download_state_changed",
+            correlation_id="req-1",
+            service="monitoring_service",
+        )
+        await manager.broadcast(
+            {"n": 2},
+            event_type="download_state_changed",
+            correlation_id="req-2",
+            service="monitoring_service",
+        )
+        await manager.broadcast({"n": 3}, event_type="download_state_changed")
+        await manager.broadcast({"type": "custom"})
+        await _flush()
+
+        assert ws.sent == [{"n": 1}, {"type": "custom"}]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_subscription_commands_over_socket(self) -> None:
+        """Test the JSON subscribe/unsubscribe protocol."""
+        manager = WebSocketManager()
+        ws = _websocket()
+        await manager.connect(ws)
+
+        await manager.handle_client_message(
+            ws, json.dumps({"action": "subscribe", "correlation_ids": ["req-1"]})
+        )
+        await manager.handle_client_message(ws, json.dumps({"action": "unsubscribe"}))
+        await manager.handle_client_message(ws, "hello")
+        await _flush()
+
+        assert ws.sent[0]["type"] == "subscriptions"
+        assert ws.sent[0]["subscriptions"]["correlation_ids"] == ["req-1"]
+        assert ws.sent[1]["subscriptions"]["correlation_ids"] == []
+        assert ws.sent[2] == {"type": "ack", "message": "Message received"}
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_unknown_event_type_is_rejected(self) -> None:
+        """Test that invalid subscriptions return an error frame."""
+        manager = WebSocketManager()
+        ws = _websocket()
+        await manager.connect(ws)
+
+        await manager.handle_client_message(
+            ws, json.dumps({"action": "subscribe", "event_types": ["not.a.type"]})
+        )
+        await _flush()
+
+        assert ws.sent == [{"type": "error", "message": "Unknown event types: not.a.type"}]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_removes_client_from_index(self) -> None:
+        """Test that disconnected clients leave no index entries behind."""
+        manager = WebSocketManager()
+        ws = _websocket()
+        await manager.connect(ws)
+        manager.subscribe(ws, event_types=["download_failed"], services=["sabnzbd"])
+
+        manager.disconnect(ws)
+
+        assert manager._index == {f: {} for f in ("event_types", "correlation_ids", "services")}
+        assert all(not clients for clients in manager._unconstrained.values())
+
+
+@pytest.mark.skip(reason="WebSocket reconnection handling not yet implemented")
+class TestReconnectionHandling:
+    """Tests for reconnection handling."""
+
+    async def test_handle_client_reconnect(self) -> None:
+        """Test handling client reconnection."""
         # Skipped - awaiting implementation
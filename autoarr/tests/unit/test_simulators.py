@@ -0,0 +1,152 @@
+# Copyright (C) 2025 AutoArr Contributors
+#
+# This file is part of AutoArr.
+#
+# AutoArr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# AutoArr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Unit tests for the upstream simulators used by the offline load tests.
+
+Drives the real SABnzbd/Sonarr/Radarr/Plex clients against the simulator
+apps in-process to keep the simulated APIs in step with what the clients
+expect, and checks error rates and 503 storms.
+"""
+
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from autoarr.mcp_servers.plex.client import PlexClient
+from autoarr.mcp_servers.radarr.client import RadarrClient
+from autoarr.mcp_servers.sabnzbd.client import SABnzbdClient
+from autoarr.mcp_servers.sonarr.client import SonarrClient, SonarrClientError
+from autoarr.tests.simulators import (
+    FaultConfig,
+    FaultInjector,
+    LibrarySizes,
+    SimulatorCluster,
+    SyntheticLibrary,
+)
+
+API_KEY = "simulator"
+
+
+def _wire(client: Any, app: Any) -> Any:
+    """Route a client's HTTP traffic into a simulator app."""
+    client._client = AsyncClient(transport=ASGITransport(app=app), base_url=client.url)
+    return client
+
+
+@pytest.fixture
+def cluster() -> SimulatorCluster:
+    """Create a small simulator cluster (apps only, nothing listening)."""
+    return SimulatorCluster(
+        sizes=LibrarySizes(series=40, movies=60, queue_slots=6, history_slots=30),
+        api_key=API_KEY,
+    )
+
+
+def test_library_is_deterministic_and_linked() -> None:
+    """Test that a seed reproduces the library and queue slots link to *arr items."""
+    sizes = LibrarySizes(series=20, movies=20, queue_slots=8)
+    first, second = SyntheticLibrary(sizes), SyntheticLibrary(sizes)
+
+    assert first.series == second.series
+    assert first.history == second.history
+
+    radarr_queue = first.arr_queue("radarr")
+    sonarr_queue = first.arr_queue("sonarr")
+    assert len(radarr_queue) + len(sonarr_queue) == 8
+    assert {r["downloadId"] for r in radarr_queue} <= {s["nzo_id"] for s in first.queue}
+    assert all(r["movieId"] in first.movies_by_id for r in radarr_queue)
+
+
+@pytest.mark.asyncio
+async def test_clients_read_simulated_services(cluster) -> None:
+    """Test each real client against its simulator."""
+    sabnzbd = _wire(SABnzbdClient(cluster.urls["sabnzbd"], API_KEY), cluster.apps["sabnzbd"])
+    sonarr = _wire(SonarrClient(cluster.urls["sonarr"], API_KEY), cluster.apps["sonarr"])
+    radarr = _wire(RadarrClient(cluster.urls["radarr"], API_KEY), cluster.apps["radarr"])
+    plex = _wire(PlexClient(cluster.urls["plex"], API_KEY), cluster.apps["plex"])
+
+    queue = await sabnzbd.get_queue()
+    assert len(queue["queue"]["slots"]) == 6
+    history = await sabnzbd.get_history(limit=10)
+    assert history["history"]["noofslots"] == 30 and len(history["history"]["slots"]) == 10
+    assert await sabnzbd.health_check()
+
+    assert len(await sonarr.get_series()) == 40
+    missing = await sonarr.get_wanted_missing(page=2, page_size=5)
+    assert missing["page"] == 2 and len(missing["records"]) == 5
+    assert (await sonarr.get_system_status())["version"]
+
+    added = await radarr._request("POST", "movie", json_data={"title": "New", "tmdbId": 1})
+    assert added["id"] == 61
+    assert len(await radarr.get_movies()) == 61
+
+    items, total = await plex.get_library_page("1", start=0, size=5)
+    assert len(items) == 5
+    assert total == sum(1 for m in cluster.library.movies if m["hasFile"])
+    assert {lib["title"] for lib in await plex.get_libraries()} == {"Movies", "TV Shows"}
+
+    for client in (sabnzbd, sonarr, radarr, plex):
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_plex_simulator_serves_xml_without_json_accept(cluster) -> None:
+    """Test that Plex answers XML unless JSON is asked for, like a real server."""
+    async with AsyncClient(
+        transport=ASGITransport(app=cluster.apps["plex"]), base_url="http://plex"
+    ) as http:
+        response = await http.get(
+            "/library/sections/2/all",
+            params={"X-Plex-Container-Size": 3},
+            headers={"X-Plex-Token": API_KEY},
+        )
+
+    assert response.headers["content-type"].startswith("application/xml")
+    parsed = PlexClient._parse_xml_bytes(response.content)
+    assert len(parsed["Directory"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_injected_errors_reach_the_client() -> None:
+    """Test that an error rate of 1 fails every request after the client's retries."""
+    cluster = SimulatorCluster(
+        sizes=LibrarySizes(series=5, movies=5),
+        service_faults={"sonarr": {"error_rate": 1.0, "error_status": 503}},
+    )
+    sonarr = _wire(SonarrClient(cluster.urls["sonarr"], API_KEY), cluster.apps["sonarr"])
+
+    with pytest.raises(SonarrClientError, match="503"):
+        await sonarr.get_series()
+    await sonarr.close()
+
+    assert cluster.injectors["sonarr"].stats["errors"] == 3
+    assert cluster.injectors["radarr"].stats["errors"] == 0
+
+
+def test_storms_follow_the_schedule() -> None:
+    """Test that storms start every storm_every seconds and last storm_duration."""
+    now = [0.0]
+    injector = FaultInjector(FaultConfig(storm_every=10, storm_duration=2), clock=lambda: now[0])
+
+    states = []
+    for t in (5, 10, 11.5, 12, 20.5, 23):
+        now[0] = t
+        states.append(injector.in_storm())
+
+    assert states == [False, True, True, False, True, False]
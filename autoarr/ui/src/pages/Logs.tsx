@@ -13,6 +13,7 @@ import {
   Info,
   Bug,
   AlertTriangle,
+  Flame,
 } from 'lucide-react';
 
 interface LogEntry {
@@ -50,6 +51,22 @@ const LEVEL_ICONS: Record<string, React.ComponentType<{ className?: string }>> =
   CRITICAL: AlertCircle,
 };
 
+// Duration of a profile started from the logs page
+const PROFILE_SECONDS = 10;
+
+// Admin token for the profiler, kept for the browser session
+const ADMIN_TOKEN_KEY = 'autoarr-admin-token';
+
+const downloadText = (content: string, filename: string) => {
+  const blob = new Blob([content], { type: 'text/plain' });
+  const url = URL.createObjectURL(blob);
+  const a = document.createElement('a');
+  a.href = url;
+  a.download = filename;
+  a.click();
+  URL.revokeObjectURL(url);
+};
+
 export const Logs = () => {
   const [logs, setLogs] = useState<LogEntry[]>([]);
   const [isPaused, setIsPaused] = useState(false);
@@ -59,6 +76,7 @@ export const Logs = () => {
   const [currentLogLevel, setCurrentLogLevel] = useState('INFO');
   const [isClearing, setIsClearing] = useState(false);
   const [isChangingLevel, setIsChangingLevel] = useState(false);
+  const [isProfiling, setIsProfiling] = useState(false);
 
   const logsEndRef = useRef<HTMLDivElement>(null);
   const logsContainerRef = useRef<HTMLDivElement>(null);
@@ -254,13 +272,37 @@ export const Logs = () => {
       .map((log) => `[${log.timestamp}] [${log.level}] ${log.logger_name}: ${log.message}`)
       .join('\n');
 
-    const blob = new Blob([content], { type: 'text/plain' });
-    const url = URL.createObjectURL(blob);
-    const a = document.createElement('a');
-    a.href = url;
-    a.download = `autoarr-logs-${new Date().toISOString().split('T')[0]}.txt`;
-    a.click();
-    URL.revokeObjectURL(url);
+    downloadText(content, `autoarr-logs-${new Date().toISOString().split('T')[0]}.txt`);
+  };
+
+  // Run a sampling profile and download the flamegraph stacks and slow callback report
+  const handleProfile = async () => {
+    const token =
+      sessionStorage.getItem(ADMIN_TOKEN_KEY) ||
+      window.prompt('Admin token (ADMIN_TOKEN) required to run the profiler');
+    if (!token) return;
+
+    setIsProfiling(true);
+    try {
+      const response = await fetch(`/api/v1/logs/profile?duration=${PROFILE_SECONDS}`, {
+        method: 'POST',
+        headers: { 'X-Admin-Token': token },
+      });
+      if (response.ok) {
+        sessionStorage.setItem(ADMIN_TOKEN_KEY, token);
+        const data = await response.json();
+        const stamp = data.started_at.replace(/[:.]/g, '-');
+        downloadText(data.collapsed, `autoarr-profile-${stamp}.folded`);
+        downloadText(data.slow_callback_report, `autoarr-profile-${stamp}-slow-callbacks.txt`);
+      } else {
+        if (response.status === 401) sessionStorage.removeItem(ADMIN_TOKEN_KEY);
+        const data = await response.json().catch(() => ({}));
+        alert(`Profiling failed: ${data.detail ?? response.statusText}`);
+      }
+    } catch (error) {
+      console.error('Failed to run profile:', error);
+    }
+    setIsProfiling(false);
   };
 
   // Filter logs for display
@@ -385,6 +427,16 @@ export const Logs = () => {
             <Download className="w-4 h-4" />
           </button>
 
+          <button
+            onClick={handleProfile}
+            disabled={isProfiling}
+            className="flex items-center gap-1.5 px-3 py-2 text-sm bg-gray-700 hover:bg-gray-600 text-white rounded-md transition-colors disabled:opacity-50"
+            title={`Profile the server for ${PROFILE_SECONDS}s and download a flamegraph`}
+          >
+            <Flame className="w-4 h-4" />
+            {isProfiling ? 'Profiling...' : 'Profile'}
+          </button>
+
           <button
             onClick={handleClearLogs}
             disabled={isClearing}